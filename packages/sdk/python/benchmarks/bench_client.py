@@ -0,0 +1,55 @@
+import json
+
+import httpx
+import pytest
+from conftest import load, throughput
+
+from opencode_ai import OpenCodeClient
+from opencode_ai.recording import replay_transport
+
+
+def _client(transport: httpx.BaseTransport, **kwargs) -> OpenCodeClient:
+    w = OpenCodeClient(base_url="http://bench", **kwargs)
+    w.client.set_httpx_client(httpx.Client(base_url="http://bench", transport=transport))
+    return w
+
+
+def bench_get_config(benchmark) -> None:
+    """A full wrapper call: request building, MockTransport round trip, JSON decode and Config construction."""
+    benchmark.group = "client"
+    body = json.dumps(load("config.json")).encode()
+    w = _client(
+        httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        )
+    )
+    assert benchmark(w.get_config) is not None
+
+
+@pytest.mark.parametrize("parse_mode", ["dict", "bytes"])
+def bench_get_config_unparsed(benchmark, parse_mode) -> None:
+    """get_config without model construction, as a proxy forwarding the JSON would call it."""
+    benchmark.group = "client"
+    body = json.dumps(load("config.json")).encode()
+    w = _client(httpx.MockTransport(lambda request: httpx.Response(200, content=body)), parse_mode=parse_mode)
+    assert benchmark(w.get_config) is not None
+
+
+def bench_get_path_overhead(benchmark) -> None:
+    """Client overhead on a tiny response, where the SDK's own per-call cost dominates."""
+    benchmark.group = "client"
+    body = b'{"state":"/s","config":"/c","worktree":"/w","directory":"/d"}'
+    w = _client(httpx.MockTransport(lambda request: httpx.Response(200, content=body)))
+    assert benchmark(w.get_path) is not None
+
+
+def bench_subscribe_events_replay(benchmark, recording, sse_payload) -> None:
+    """End-to-end `subscribe_events` over the recorded session, replayed without delays."""
+    benchmark.group = "sse"
+    w = _client(replay_transport(recording, speed=None))
+
+    def run():
+        return sum(1 for _ in w.subscribe_events())
+
+    count = benchmark(run)
+    throughput(benchmark, len(sse_payload), count)
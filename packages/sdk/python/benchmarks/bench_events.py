@@ -0,0 +1,44 @@
+from conftest import throughput
+
+from opencode_ai import codec
+from opencode_ai.models._discriminators import EVENT
+from opencode_ai.sse import SSEDecoder
+
+CHUNK = 64 * 1024
+
+
+def bench_event_dispatch(benchmark, recording) -> None:
+    """Decode every recorded event dict into its typed model via the discriminator table."""
+    benchmark.group = "events"
+    events = [event for _, event in recording if event["type"] in EVENT]
+
+    def run():
+        return [EVENT.decode(event) for event in events]
+
+    assert len(benchmark(run)) == len(events)
+
+
+def bench_sse_parse(benchmark, sse_payload) -> None:
+    """Split the raw stream into SSE messages, fed in 64 KiB chunks."""
+    benchmark.group = "sse"
+    chunks = [sse_payload[i : i + CHUNK] for i in range(0, len(sse_payload), CHUNK)]
+
+    def run():
+        decoder = SSEDecoder()
+        return sum(len(decoder.feed(chunk)) for chunk in chunks)
+
+    count = benchmark(run)
+    throughput(benchmark, len(sse_payload), count)
+
+
+def bench_sse_parse_and_decode(benchmark, sse_payload) -> None:
+    """SSE parsing plus JSON decoding of every payload, as `subscribe_events` does."""
+    benchmark.group = "sse"
+    chunks = [sse_payload[i : i + CHUNK] for i in range(0, len(sse_payload), CHUNK)]
+
+    def run():
+        decoder = SSEDecoder()
+        return sum(1 for chunk in chunks for sse in decoder.feed(chunk) if codec.loads(sse.data))
+
+    count = benchmark(run)
+    throughput(benchmark, len(sse_payload), count)
@@ -0,0 +1,31 @@
+import pytest
+from conftest import load
+
+from opencode_ai.models.assistant_message import AssistantMessage
+from opencode_ai.models.config import Config
+from opencode_ai.models.keybinds_config import KeybindsConfig
+from opencode_ai.models.tool_part import ToolPart
+
+MODELS = [
+    (Config, "config.json"),
+    (AssistantMessage, "assistant_message.json"),
+    (ToolPart, "tool_part.json"),
+    (KeybindsConfig, "keybinds_config.json"),
+]
+IDS = [model.__name__ for model, _ in MODELS]
+
+
+@pytest.mark.parametrize("model,fixture", MODELS, ids=IDS)
+def bench_decode(benchmark, model, fixture) -> None:
+    benchmark.group = "model decode"
+    data = load(fixture)
+    result = benchmark(model.from_dict, data)
+    assert isinstance(result, model)
+
+
+@pytest.mark.parametrize("model,fixture", MODELS, ids=IDS)
+def bench_encode(benchmark, model, fixture) -> None:
+    benchmark.group = "model encode"
+    data = load(fixture)
+    obj = model.from_dict(data)
+    assert benchmark(obj.to_dict) == data
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from opencode_ai.recording import load_recording
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text())
+
+
+@pytest.fixture(scope="session")
+def recording() -> list:
+    """(time, event) pairs of the recorded `/event` session."""
+    return load_recording(FIXTURES / "events.ndjson.gz")
+
+
+@pytest.fixture(scope="session")
+def sse_payload(recording) -> bytes:
+    """The recorded session as the raw text/event-stream body the server sends."""
+    return b"".join(b"data: " + json.dumps(event, separators=(",", ":")).encode() + b"\n\n" for _, event in recording)
+
+
+def throughput(benchmark, size: int, events: int) -> None:
+    """Record MB/s and events/s of the last benchmark next to its timings."""
+    if benchmark.stats is None:  # --benchmark-disable
+        return
+    mean = benchmark.stats.stats.mean
+    benchmark.extra_info["MB/s"] = round(size / mean / 1e6, 2)
+    benchmark.extra_info["events/s"] = round(events / mean)
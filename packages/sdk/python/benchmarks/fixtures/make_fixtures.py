@@ -0,0 +1,173 @@
+"""Regenerate the benchmark fixtures.
+
+The fixtures are synthetic, not captured traffic. The payloads mirror what a busy opencode server
+returns: a config with several providers, agents, MCP servers and LSPs, a finished assistant
+message, a completed tool call with a large output, and an `/event` session streaming a long answer,
+written with EventRecorder. Replace `events.ndjson.gz` with a real capture
+(`python -m opencode_ai.recording record ...`) to benchmark against production traffic.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from opencode_ai.models.assistant_message import AssistantMessage
+from opencode_ai.models.config import Config
+from opencode_ai.models.keybinds_config import KeybindsConfig
+from opencode_ai.models.tool_part import ToolPart
+from opencode_ai.recording import EventRecorder
+
+HERE = Path(__file__).parent
+SESSION = "ses_6f1c2a9e0ffeW1xQm3Zb7Kq2Lt"
+MESSAGE = "msg_9a8b7c6d5e4fAbCdEfGhIjKlMn"
+
+
+def keybinds() -> dict:
+    names = [name for name in KeybindsConfig.__annotations__ if not name.startswith("_")]
+    return {name: f"<leader>{name[:1]}" for name in names}
+
+
+def config() -> dict:
+    models = {
+        f"model-{i}": {
+            "id": f"model-{i}",
+            "name": f"Model {i}",
+            "release_date": "2025-06-01",
+            "attachment": i % 2 == 0,
+            "reasoning": i % 3 == 0,
+            "temperature": True,
+            "tool_call": True,
+            "cost": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
+            "limit": {"context": 200000, "output": 64000},
+            "options": {"thinking": {"type": "enabled", "budgetTokens": 16000}},
+        }
+        for i in range(12)
+    }
+    return {
+        "$schema": "https://opencode.ai/config.json",
+        "theme": "opencode",
+        "keybinds": keybinds(),
+        "tui": {"scroll_speed": 3},
+        "plugin": ["opencode-openai-codex-auth", "opencode-notify"],
+        "snapshot": True,
+        "share": "manual",
+        "autoupdate": True,
+        "disabled_providers": ["vertex"],
+        "model": "anthropic/model-1",
+        "small_model": "anthropic/model-2",
+        "username": "bench",
+        "agent": {
+            "build": {"model": "anthropic/model-1", "temperature": 0.2, "tools": {"write": True, "bash": True}},
+            "plan": {"model": "anthropic/model-3", "tools": {"write": False, "edit": False}},
+            "general": {"description": "General purpose agent", "prompt": "You are helpful. " * 40},
+        },
+        "provider": {
+            name: {"name": name.title(), "npm": f"@ai-sdk/{name}", "env": [f"{name.upper()}_API_KEY"], "models": models}
+            for name in ("anthropic", "openai", "openrouter")
+        },
+        "mcp": {
+            **{
+                f"local-{i}": {
+                    "type": "local",
+                    "command": ["npx", "-y", f"mcp-server-{i}"],
+                    "environment": {"DEBUG": "1"},
+                }
+                for i in range(4)
+            },
+            "remote": {
+                "type": "remote",
+                "url": "https://mcp.example.com/sse",
+                "headers": {"Authorization": "Bearer x"},
+            },
+        },
+        "formatter": {
+            "prettier": {"command": ["prettier", "--write", "$FILE"], "extensions": [".ts", ".tsx", ".json", ".md"]},
+            "ruff": {"command": ["ruff", "format", "$FILE"], "extensions": [".py"]},
+        },
+        "lsp": {
+            "pyright": {"command": ["pyright-langserver", "--stdio"], "extensions": [".py"]},
+            "gopls": {"disabled": True},
+        },
+        "instructions": ["AGENTS.md", "docs/**/*.md"],
+        "permission": {"edit": "ask", "bash": "ask", "webfetch": "ask"},
+        "tools": {"bash": True, "webfetch": False},
+    }
+
+
+def assistant_message() -> dict:
+    return {
+        "id": MESSAGE,
+        "sessionID": SESSION,
+        "role": "assistant",
+        "time": {"created": 1727000000000, "completed": 1727000042000},
+        "system": ["You are opencode, an interactive CLI tool. " * 60, "Project instructions. " * 40],
+        "modelID": "model-1",
+        "providerID": "anthropic",
+        "mode": "build",
+        "path": {"cwd": "/home/bench/project", "root": "/home/bench/project"},
+        "cost": 0.0421,
+        "tokens": {"input": 18234, "output": 1290, "reasoning": 512, "cache": {"read": 16000, "write": 2234}},
+    }
+
+
+def tool_part() -> dict:
+    output = "\n".join(f"src/module_{i}.py:{i * 7}: def handler_{i}(request, *args, **kwargs):" for i in range(600))
+    return {
+        "id": "prt_1a2b3c4d5e6fGhIjKlMnOpQrSt",
+        "sessionID": SESSION,
+        "messageID": MESSAGE,
+        "type": "tool",
+        "callID": "toolu_01ABCDEFGHIJKLMNOPQRSTUV",
+        "tool": "grep",
+        "state": {
+            "status": "completed",
+            "input": {"pattern": "def handler_", "path": "src", "include": "*.py"},
+            "output": output,
+            "title": "def handler_",
+            "metadata": {"matches": 600, "truncated": False},
+            "time": {"start": 1727000001000, "end": 1727000001450},
+        },
+    }
+
+
+def events() -> list:
+    """A session streaming a long answer: many text deltas plus watcher noise, with 5-40 ms gaps."""
+    rng = random.Random(1)
+    out = [(0.0, {"type": "server.connected", "properties": {}})]
+    t = 0.0
+    text = ""
+    for i in range(1500):
+        t += rng.uniform(0.005, 0.04)
+        text += rng.choice(["the ", "event ", "stream ", "parser ", "handles ", "tokens ", "quickly. "])
+        part = {"id": "prt_text", "sessionID": SESSION, "messageID": MESSAGE, "type": "text", "text": text}
+        out.append((t, {"type": "message.part.updated", "properties": {"part": part}}))
+        if i % 25 == 0:
+            out.append((t, {"type": "file.watcher.updated", "properties": {"file": f"/p/src/f{i}.py", "event": "add"}}))
+        if i % 300 == 0:
+            out.append((t, {"type": "message.updated", "properties": {"info": assistant_message()}}))
+    out.append((t + 0.01, {"type": "message.part.updated", "properties": {"part": tool_part()}}))
+    out.append((t + 0.02, {"type": "session.idle", "properties": {"sessionID": SESSION}}))
+    return out
+
+
+def main() -> None:
+    for name, data, model in (
+        ("config.json", config(), Config),
+        ("assistant_message.json", assistant_message(), AssistantMessage),
+        ("tool_part.json", tool_part(), ToolPart),
+        ("keybinds_config.json", keybinds(), KeybindsConfig),
+    ):
+        assert model.from_dict(data).to_dict() == data, name
+        (HERE / name).write_text(json.dumps(data, indent=1) + "\n")
+    path = HERE / "events.ndjson.gz"
+    path.unlink(missing_ok=True)
+    records = events()
+    times = iter([0.0] + [t for t, _ in records])
+    with EventRecorder(path, clock=lambda: next(times)) as rec:
+        rec.record(event for _, event in records)
+
+
+if __name__ == "__main__":
+    main()
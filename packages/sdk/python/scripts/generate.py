@@ -6,11 +6,13 @@ Steps:
 - Generate OpenAPI JSON from the local CLI (bun dev generate)
 - Run openapi-python-client (via `uvx` if available, else fallback to PATH)
 - Copy the generated module into src/opencode_ai
+- Post-process it with scripts/postprocess.py
 
 Requires:
 - Bun installed (for `bun dev generate`)
 - uv installed (recommended) to run `uvx openapi-python-client`
 """
+
 from __future__ import annotations
 
 import argparse
@@ -21,6 +23,45 @@ import sys
 from pathlib import Path
 from urllib.request import urlopen
 
+# (module, name) pairs re-exported from the package __init__
+PUBLIC_EXPORTS = [
+    ("buffering", "EventBuffer"),
+    ("client", "AuthenticatedClient"),
+    ("client", "Client"),
+    ("coalesce", "PartCoalescer"),
+    ("events", "EventEnvelope"),
+    ("extras", "AsyncOpenCodeClient"),
+    ("extras", "OpenCodeClient"),
+    ("mux", "EventMux"),
+    ("server", "LocalServer"),
+    ("store", "SessionStore"),
+]
+
+INIT_DOC = '''"""A client library for accessing opencode
+
+This package is generated by openapi-python-client.
+A thin convenience wrapper `OpenCodeClient` is also provided.
+
+The names below are imported on first attribute access (PEP 562), so importing the package does not
+load asyncio, subprocess or concurrent.futures until something that needs them is used.
+"""
+
+'''
+INIT_LAZY = """
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
+
+"""
+
 
 def run(cmd: list[str], cwd: Path | None = None) -> subprocess.CompletedProcess:
     print("$", " ".join(cmd))
@@ -65,6 +106,11 @@ def main() -> int:
         action="store_true",
         help="Only fetch and write the OpenAPI spec without generating the client",
     )
+    parser.add_argument(
+        "--no-compact-models",
+        action="store_true",
+        help="Keep an always-allocated additional_properties dict on every model",
+    )
     args = parser.parse_args()
 
     script_dir = Path(__file__).resolve().parent
@@ -168,31 +214,46 @@ def main() -> int:
         shutil.rmtree(out_pkg_dir)
     shutil.copytree(generated_module, out_pkg_dir)
 
-    # Inject local extras from template if present
-    extras_template = sdk_dir / "templates" / "extras.py"
-    if extras_template.exists():
-        (out_pkg_dir / "extras.py").write_text(extras_template.read_text())
+    # Inject the hand-written modules (OpenCodeClient and its helpers) from templates/
+    for template in sorted((sdk_dir / "templates").glob("*.py")):
+        (out_pkg_dir / template.name).write_text(template.read_text())
 
-    # Patch __init__ to export OpenCodeClient if present
+    # Patch __init__ to export OpenCodeClient and friends if present, imported on first access
     init_path = out_pkg_dir / "__init__.py"
     if init_path.exists() and (out_pkg_dir / "extras.py").exists():
+        exports = [(module, name) for module, name in PUBLIC_EXPORTS if (out_pkg_dir / f"{module}.py").exists()]
+        modules = {name: module for module, name in exports}
+        by_module: dict[str, list[str]] = {}
+        for module, name in exports:
+            by_module.setdefault(module, []).append(name)
         init_text = (
-            '"""A client library for accessing opencode\n\n'
-            "This package is generated by openapi-python-client.\n"
-            "A thin convenience wrapper `OpenCodeClient` is also provided.\n"
-            '"""\n\n'
-            "from .client import AuthenticatedClient, Client\n"
-            "from .extras import OpenCodeClient\n\n"
-            "__all__ = (\n"
-            '    "AuthenticatedClient",\n'
-            '    "Client",\n'
-            '    "OpenCodeClient",\n'
-            ")\n"
+            INIT_DOC
+            + "from importlib import import_module\n"
+            + "from typing import TYPE_CHECKING, Any\n\n"
+            + "if TYPE_CHECKING:\n"
+            + "".join(f"    from .{module} import {', '.join(names)}\n" for module, names in sorted(by_module.items()))
+            + "\n_MODULES = {\n"
+            + "".join(f'    "{name}": "{module}",\n' for name, module in sorted(modules.items()))
+            + "}\n\n"
+            + INIT_LAZY
+            + "\n__all__ = (\n"
+            + "".join(f'    "{name}",\n' for name in sorted(modules))
+            + ")\n"
         )
         init_path.write_text(init_text)
 
     print(f"Copied generated client to {out_pkg_dir}")
 
+    # Apply the post-generation passes (discriminator dispatch, ...)
+    try:
+        postprocess_args = ["--no-compact-models"] if args.no_compact_models else []
+        run([sys.executable, str(script_dir / "postprocess.py"), str(out_pkg_dir), *postprocess_args])
+    except subprocess.CalledProcessError as e:
+        print(e.stdout)
+        print(e.stderr, file=sys.stderr)
+        print("ERROR: Failed to post-process the generated client", file=sys.stderr)
+        return 1
+
     # 4) Format generated code
     try:
         run(["uv", "run", "--project", str(sdk_dir), "ruff", "check", "--select", "I", "--fix", str(out_pkg_dir)])
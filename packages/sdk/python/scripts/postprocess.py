@@ -0,0 +1,873 @@
+#!/usr/bin/env python3
+"""
+Post-process the package emitted by openapi-python-client.
+
+openapi-python-client has no extension point for these optimisations, so generate.py runs this
+script over the freshly copied package before formatting. Every pass is idempotent and can be
+re-run on an already processed tree:
+
+    uv run python packages/sdk/python/scripts/postprocess.py packages/sdk/python/src/opencode_ai
+
+Passes:
+- discriminators: replace the try/except cascade of tagged unions with a table lookup
+- lazy imports: load models on first attribute access and keep endpoint modules free of
+  import-time model imports
+- compact models (--no-compact-models to skip): allocate `additional_properties` only when a
+  payload actually carries unknown keys
+- zero-copy from_dict: read fields straight from the source mapping instead of copying it and
+  popping, and build additional properties from the leftover keys only
+- JSON codec: endpoint modules decode and encode bodies through `opencode_ai.codec` (orjson or
+  msgspec when installed) instead of httpx's stdlib json
+- instrumentation: endpoint requests go through `opencode_ai.instrument`, which reports per-endpoint
+  timings to the `instrumentation` hook of the Client when one is set
+- raw mode: every endpoint gains raw()/araw() returning the unparsed httpx.Response, and honours
+  the Client's `parse_mode` ("model", "dict" or "bytes")
+- Unix domain sockets: Client and AuthenticatedClient take `uds=` to reach the server through a
+  socket instead of TCP
+- pool metrics: a `pool_stats` on the Client counts in-flight requests and pool waits at the transport
+- thread safety: the httpx clients are created under a lock, and with_headers/with_cookies/with_timeout
+  return clients that share the original's connection pool instead of mutating it
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+CLASS_RE = re.compile(r"^class (\w+)\b", re.M)
+# `type_ = cast(Literal["session.idle"], d.pop("type"))` inside a generated from_dict
+CONST_RE = re.compile(r'^\s+\w+ = cast\(Literal\[("[^"]*")\], d(?:\.pop\("([^"]+)"\)|\["([^"]+)"\])\)$', re.M)
+PARSE_DEF_RE = re.compile(r"^(\s*)def _parse_(\w+)\(")
+MEMBER_RE = re.compile(r"^\s+(\w+?)_type_\d+ = (\w+)\.from_dict\(data\)$")
+
+DISCRIMINATORS_MODULE = '''"""Discriminator tables for the tagged unions of the opencode API
+
+Generated by scripts/postprocess.py, do not edit by hand.
+"""
+
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from typing import Any, Optional
+
+
+class Discriminator(Mapping[str, type]):
+    """Maps the const tag of a union member (``type``, ``status``, ...) to its model class
+
+    Member modules are imported on first use, so building the table is free and decoding a tagged
+    union costs one dict lookup and one ``from_dict`` instead of a try/except cascade.
+    """
+
+    __slots__ = ("key", "_members", "_classes")
+
+    def __init__(self, key: str, members: dict[str, tuple[str, str]]) -> None:
+        self.key = key
+        self._members = members
+        self._classes: dict[str, type] = {}
+
+    def __getitem__(self, tag: str) -> type:
+        cls = self._classes.get(tag)
+        if cls is None:
+            module, name = self._members[tag]
+            cls = self._classes[tag] = getattr(import_module(f"{__package__}.{module}"), name)
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def match(self, data: Mapping[str, Any]) -> Optional[type]:
+        """Return the member class tagged by ``data``, or None if the tag is missing or unknown"""
+        tag = data.get(self.key)
+        if not isinstance(tag, str):
+            return None
+        cls = self._classes.get(tag)
+        if cls is None and tag in self._members:
+            cls = self[tag]
+        return cls
+
+    def decode(self, data: Mapping[str, Any]) -> Any:
+        """Build the member model for ``data``
+
+        Raises:
+            ValueError: If ``data`` carries no known tag.
+        """
+        cls = self.match(data)
+        if cls is None:
+            raise ValueError(f"unknown {self.key} {data.get(self.key)!r}")
+        return cls.from_dict(data)
+
+'''
+
+
+def const_tags(models_dir: Path) -> dict[str, tuple[str, dict[str, str]]]:
+    """Return {class name: (module stem, {json key: const value})} for every generated model"""
+    tags: dict[str, tuple[str, dict[str, str]]] = {}
+    for path in sorted(models_dir.glob("*.py")):
+        text = path.read_text()
+        classes = CLASS_RE.findall(text)
+        if len(classes) != 1:
+            continue
+        consts: dict[str, str] = {}
+        for value, pop_key, item_key in CONST_RE.findall(text):
+            consts[pop_key or item_key] = value
+        tags[classes[0]] = (path.stem, consts)
+    return tags
+
+
+def _body_start(lines: list[str], start: int) -> int:
+    """Return the index of the first body line of the (possibly multi-line) def at lines[start]"""
+    depth = 0
+    i = start
+    while True:
+        line = lines[i]
+        depth += line.count("(") + line.count("[") - line.count(")") - line.count("]")
+        i += 1
+        if depth == 0 and line.rstrip().endswith(":"):
+            return i
+
+
+def _block_end(lines: list[str], body: int, indent: int) -> int:
+    """Return the index one past the last line of the block whose body starts at lines[body]"""
+    end = body
+    while end < len(lines):
+        line = lines[end]
+        if line.strip() and len(line) - len(line.lstrip()) <= indent:
+            break
+        end += 1
+    while end > body and not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def _union_table(
+    members: list[str], tags: dict[str, tuple[str, dict[str, str]]]
+) -> tuple[str, tuple[tuple[str, str, str], ...]] | None:
+    """Return (key, ((tag, module, class), ...)) when every member carries a distinct const tag on one key"""
+    if len(members) < 2 or any(m not in tags for m in members):
+        return None
+    keys = set.intersection(*(set(tags[m][1]) for m in members))
+    for key in sorted(keys):
+        values = [tags[m][1][key] for m in members]
+        if len(set(values)) == len(values):
+            return key, tuple((v, tags[m][0], m) for v, m in zip(values, members))
+    return None
+
+
+def add_import(text: str, statement: str) -> str:
+    """Append ``statement`` to the module's leading import block unless it is already there"""
+    lines = text.split("\n")
+    if statement in lines:
+        return text
+    last = 0
+    depth = 0
+    for i, line in enumerate(lines):
+        if depth == 0 and line and not line.startswith(("from ", "import ", '"""', "#")) and last:
+            break
+        depth += line.count("(") - line.count(")")
+        if line.startswith(("from ", "import ")) or depth > 0 or line == ")":
+            last = i + 1
+    lines.insert(last, statement)
+    return "\n".join(lines)
+
+
+def _table_name(uses: list[tuple[str, str]]) -> str:
+    """Name a table after its component schema, else after the field (qualified by module if used once)"""
+    prefixes = {prefix for _, prefix in uses}
+    for prefix in sorted(prefixes):
+        if prefix.startswith("componentsschemas_"):
+            return prefix[len("componentsschemas_") :].upper()
+    if len(uses) == 1:
+        return f"{uses[0][0]}_{uses[0][1]}".upper()
+    return min(prefixes).upper()
+
+
+def add_discriminator_dispatch(pkg_dir: Path) -> None:
+    """Dispatch tagged unions through generated Discriminator tables instead of try/except cascades
+
+    For every `_parse_*` union helper whose members all carry a distinct const tag on one field, a
+    lookup on that field is inserted ahead of the cascade. The cascade is kept as the fallback that
+    raises for unknown tags, exactly as before, and is all that untagged unions get.
+    """
+    models_dir = pkg_dir / "models"
+    tags = const_tags(models_dir)
+    names: dict[tuple[str, tuple[tuple[str, str, str], ...]], list[tuple[str, str]]] = {}
+    edits: list[tuple[Path, list[str], list[tuple[int, int, tuple]]]] = []
+
+    for path in sorted((pkg_dir / "api").rglob("*.py")) + sorted(models_dir.glob("*.py")):
+        lines = path.read_text().split("\n")
+        found: list[tuple[int, int, tuple]] = []
+        i = 0
+        while i < len(lines):
+            m = PARSE_DEF_RE.match(lines[i])
+            if not m:
+                i += 1
+                continue
+            indent = len(m.group(1))
+            body = _body_start(lines, i)
+            # only members of this helper's own cascade, not of helpers nested inside it
+            members = [
+                mm
+                for mm in map(MEMBER_RE.match, lines[body : _block_end(lines, body, indent)])
+                if mm and len(mm.group(0)) - len(mm.group(0).lstrip()) <= indent + 8
+            ]
+            table = _union_table([mm.group(2) for mm in members], tags)
+            if table is not None:
+                names.setdefault(table, []).append((path.stem, members[0].group(1)))
+                found.append((body, indent, table))
+            i = body
+        if found:
+            edits.append((path, lines, found))
+
+    if not names:
+        return
+    tables = {table: _table_name(candidates) for table, candidates in names.items()}
+
+    for path, lines, found in edits:
+        for body, indent, table in reversed(found):
+            if "_discriminators." in lines[body + 1]:
+                continue
+            pad = " " * (indent + 4)
+            lines[body:body] = [
+                f"{pad}if isinstance(data, dict):",
+                f"{pad}    _member = _discriminators.{tables[table]}.match(data)",
+                f"{pad}    if _member is not None:",
+                f"{pad}        return _member.from_dict(data)",
+            ]
+        package = ".." if path.parent == models_dir else "..."
+        path.write_text(add_import("\n".join(lines), f"from {package}models import _discriminators"))
+
+    out = [DISCRIMINATORS_MODULE]
+    for (key, members), name in sorted(tables.items(), key=lambda kv: kv[1]):
+        out.append(f'\n{name} = Discriminator(\n    "{key}",\n    {{\n')
+        for value, module, cls in members:
+            out.append(f'        {value}: ("{module}", "{cls}"),\n')
+        out.append("    },\n)\n")
+    (models_dir / "_discriminators.py").write_text("".join(out))
+
+
+LAZY_MODELS_INIT = '''"""Contains all the data models used in inputs/outputs
+
+Models are imported on first attribute access (PEP 562), so importing the package stays cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{imports}
+
+# model name -> defining module
+_MODULES = {{
+{modules}
+}}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(import_module(f"{{__name__}}.{{module}}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({{*globals(), *_MODULES}})
+
+
+{all}'''
+
+INIT_IMPORT_RE = re.compile(r"^from \.(\w+) import \(?\s*(\w+),?\s*\)?$", re.M)
+MODEL_IMPORT_RE = re.compile(r"^from \.\.\.models\.\w+ import \(?\s*(\w+),?\s*\)?\n", re.M)
+STRING_RE = re.compile(r"\"[^\"\n]*\"|'[^'\n]*'")
+
+
+def make_models_lazy(pkg_dir: Path) -> None:
+    """Rewrite models/__init__.py to import each model on first access instead of all up front"""
+    init_path = pkg_dir / "models" / "__init__.py"
+    text = init_path.read_text()
+    if "def __getattr__" in text:
+        return
+    exports = INIT_IMPORT_RE.findall(text)
+    all_block = text[text.index("__all__ = ") :]
+    init_path.write_text(
+        LAZY_MODELS_INIT.format(
+            imports="\n".join(f"    from .{module} import {name}" for module, name in exports),
+            modules="\n".join(f'    "{name}": "{module}",' for module, name in exports),
+            all=all_block,
+        )
+    )
+
+
+def defer_endpoint_model_imports(pkg_dir: Path) -> None:
+    """Move the model imports of endpoint modules into _parse_response, as generated models do
+
+    Only applies where every other reference to the models is a quoted annotation, so e.g.
+    importing event_subscribe no longer imports all event models.
+    """
+    for path in sorted((pkg_dir / "api").rglob("*.py")):
+        text = path.read_text()
+        imports = MODEL_IMPORT_RE.findall(text)
+        if not imports:
+            continue
+        lines = text.split("\n")
+        start = next((i for i, line in enumerate(lines) if line.startswith("def _parse_response(")), None)
+        if start is None:
+            continue
+        body = _body_start(lines, start)
+        end = _block_end(lines, body, 0)
+        outside = STRING_RE.sub("", "\n".join(lines[:start] + lines[end:]))
+        outside = MODEL_IMPORT_RE.sub("", outside)
+        if any(re.search(rf"\b{name}\b", outside) for name in imports):
+            continue
+
+        statements = [m.group(0).rstrip("\n") for m in MODEL_IMPORT_RE.finditer(text)]
+        lines[body:body] = ["    " + line for stmt in statements for line in stmt.split("\n")] + [""]
+        text = MODEL_IMPORT_RE.sub("", "\n".join(lines))
+        typing_import = re.search(r"^from typing import (.+)$", text, re.M)
+        names = sorted({*typing_import.group(1).split(", "), "TYPE_CHECKING"}, key=lambda n: (n != "TYPE_CHECKING", n))
+        text = text.replace(typing_import.group(0), f"from typing import {', '.join(names)}", 1)
+        anchor = "\n\n\ndef _get_kwargs("
+        text = text.replace(anchor, "\n\nif TYPE_CHECKING:\n" + "".join(f"    {s}\n" for s in statements) + anchor, 1)
+        path.write_text(text)
+
+
+ADDITIONAL_FIELD = "    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)\n"
+COMPACT_FIELD = (
+    "    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)\n"
+)
+ADDITIONAL_METHODS = """    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
+"""
+COMPACT_METHODS = """    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self._additional_properties or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self._additional_properties is not None and key in self._additional_properties
+"""
+EMPTY_AS_NONE = '''
+
+def _empty_as_none(value: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Comparison key for lazily allocated additional properties: no dict equals an empty one"""
+    return value or None
+'''
+
+
+def _add_typing_names(text: str, *names: str) -> str:
+    typing_import = re.search(r"^from typing import (.+)$", text, re.M)
+    current = typing_import.group(1).split(", ")
+    merged = sorted({*current, *names}, key=lambda n: (not n.isupper(), n))
+    return text.replace(typing_import.group(0), f"from typing import {', '.join(merged)}", 1)
+
+
+def compact_additional_properties(pkg_dir: Path) -> None:
+    """Only allocate a model's additional_properties dict when unknown keys are present
+
+    attrs.define already emits slotted classes, so the per-instance dict for unknown keys was the
+    last avoidable allocation of every decoded model. The field becomes an Optional private slot
+    behind an `additional_properties` property that allocates on first write access.
+    """
+    types_path = pkg_dir / "types.py"
+    types_text = types_path.read_text()
+    if "def _empty_as_none" not in types_text:
+        types_text = _add_typing_names(types_text, "Any")
+        anchor = "\n\n__all__ = "
+        types_path.write_text(types_text.replace(anchor, EMPTY_AS_NONE + anchor, 1))
+
+    for path in sorted((pkg_dir / "models").glob("*.py")):
+        text = path.read_text()
+        if ADDITIONAL_FIELD not in text or ADDITIONAL_METHODS not in text:
+            continue
+        text = text.replace(ADDITIONAL_FIELD, COMPACT_FIELD)
+        text = text.replace(ADDITIONAL_METHODS, COMPACT_METHODS)
+        text = text.replace(
+            "        field_dict.update(self.additional_properties)\n",
+            "        if self._additional_properties:\n            field_dict.update(self._additional_properties)\n",
+        )
+        text = re.sub(
+            r"^        (\w+)\.additional_properties = d$",
+            r"        if d:\n            \1._additional_properties = d",
+            text,
+            flags=re.M,
+        )
+        text = _add_typing_names(text, "Optional")
+        path.write_text(add_import(text, "from ..types import _empty_as_none"))
+
+
+POP_RE = re.compile(r'\bd\.pop\(("[^"]*")(, UNSET)?\)')
+EXTRAS_RE = re.compile(
+    r"^        (?:if d:\n            (\w+)\._additional_properties = d|(\w+)\.additional_properties = d)$", re.M
+)
+
+
+def _read_field(match: re.Match) -> str:
+    key, default = match.groups()
+    return f"d.get({key}, UNSET)" if default else f"d[{key}]"
+
+
+def read_without_copying(pkg_dir: Path) -> None:
+    """Stop copying the source dict in every from_dict
+
+    Generated from_dict copies its input and pops each known key so that whatever remains becomes
+    additional_properties: one dict copy and a pop per field for every decoded object, although
+    payloads almost never carry unknown keys. Fields are now read from the source mapping, and the
+    leftovers are computed against a per-model frozenset of known keys only when there are any.
+    Models without properties keep a plain copy of the mapping.
+    """
+    for path in sorted((pkg_dir / "models").glob("*.py")):
+        text = path.read_text()
+        if "        d = dict(src_dict)\n" not in text:
+            continue
+        keys = [m.group(1) for m in POP_RE.finditer(text)]
+        text = text.replace("        d = dict(src_dict)\n", "        d = src_dict\n")
+        text = POP_RE.sub(_read_field, text)
+
+        def extras(match: re.Match) -> str:
+            compact, eager = match.groups()
+            if not keys:
+                if eager:
+                    return f"        {eager}.additional_properties = dict(d)"
+                return f"        if d:\n            {compact}._additional_properties = dict(d)"
+            leftovers = "{k: v for k, v in d.items() if k not in _KNOWN_KEYS}"
+            if eager:
+                return f"        {eager}.additional_properties = {leftovers}"
+            return (
+                f"        if not _KNOWN_KEYS.issuperset(d):\n            {compact}._additional_properties = {leftovers}"
+            )
+
+        text, count = EXTRAS_RE.subn(extras, text)
+        if count and keys:
+            typevar = re.search(r"^T = TypeVar\(.*\)$", text, re.M)
+            members = f"({', '.join(keys)}{',' if len(keys) == 1 else ''})" if keys else ""
+            known = f"_KNOWN_KEYS = frozenset({members})"
+            text = text[: typevar.end()] + f"\n\n{known}" + text[typevar.end() :]
+        path.write_text(text)
+
+
+JSON_BODY_RE = re.compile(r'^(\s+)_kwargs\["json"\] = (.+)$', re.M)
+
+
+def use_codec(pkg_dir: Path) -> None:
+    """Route endpoint JSON through opencode_ai.codec
+
+    `response.json()` decodes the body to text and hands it to stdlib json; codec.loads parses the
+    raw bytes with orjson/msgspec when available. Request bodies are pre-encoded the same way.
+    """
+    for path in sorted((pkg_dir / "api").rglob("*.py")):
+        text = path.read_text()
+        if "response.json()" not in text and '_kwargs["json"]' not in text:
+            continue
+        text = text.replace("response.json()", "codec.loads(response.content)")
+        text = JSON_BODY_RE.sub(r'\1_kwargs["content"] = codec.dumps(\2)', text)
+        text = text.replace("from ... import errors\n", "from ... import codec, errors\n", 1)
+        path.write_text(text)
+
+
+SYNC_SEND = """    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+"""
+ASYNC_SEND = """    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+"""
+URL_RE = re.compile(r'^        "url": f?"([^"]+)",$', re.M)
+CLIENT_HOOK_FIELD = "    raise_on_unexpected_status: bool = field(default=False, kw_only=True)\n"
+CLIENT_HOOK_DOC = """            argument to the constructor.
+"""
+INSTRUMENTATION_DOC = """        instrumentation: An opencode_ai.instrument.Instrumentation receiving the timings of every request
+            made through the generated endpoints (connect, time to first byte, total, response size, JSON
+            decoding and model construction). None (the default) disables the measurements.
+"""
+
+
+def instrument_endpoints(pkg_dir: Path) -> None:
+    """Report request timings through opencode_ai.instrument
+
+    Every sync_detailed/asyncio_detailed sends through instrument.send/asend, labelled with the
+    endpoint's path template, and decodes JSON with instrument.loads so the decode time can be told
+    apart from model construction. With no `instrumentation` on the Client both reduce to the
+    original request and parse.
+    """
+    for path in sorted((pkg_dir / "api").rglob("*.py")):
+        text = path.read_text()
+        url = URL_RE.search(text)
+        if url is None or SYNC_SEND not in text:
+            continue
+        endpoint = url.group(1)
+        text = text.replace(SYNC_SEND, f'    return instrument.send(client, "{endpoint}", kwargs, _build_response)\n')
+        text = text.replace(
+            ASYNC_SEND, f'    return await instrument.asend(client, "{endpoint}", kwargs, _build_response)\n'
+        )
+        text = text.replace("codec.loads(response.content)", "instrument.loads(response.content)")
+        modules = "codec, errors, instrument" if "codec." in text else "errors, instrument"
+        text = re.sub(r"^from \.\.\. import (?:codec, )?errors\n", f"from ... import {modules}\n", text, 1, re.M)
+        path.write_text(text)
+
+    client_path = pkg_dir / "client.py"
+    text = client_path.read_text()
+    if "instrumentation" not in text:
+        text = text.replace(
+            CLIENT_HOOK_FIELD,
+            CLIENT_HOOK_FIELD
+            + '    instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True)\n',
+        )
+        text = text.replace(CLIENT_HOOK_DOC, CLIENT_HOOK_DOC + INSTRUMENTATION_DOC)
+        text = text.replace(
+            "from attrs import define, evolve, field\n",
+            "from attrs import define, evolve, field\n\n"
+            "if TYPE_CHECKING:\n    from .instrument import Instrumentation\n",
+            1,
+        )
+        text = text.replace(
+            "from typing import Any, Optional, Union\n", "from typing import TYPE_CHECKING, Any, Optional, Union\n", 1
+        )
+        client_path.write_text(text)
+
+
+PARSE_200 = "    if response.status_code == 200:\n"
+UNPARSED = """        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+"""
+RESPONSE_TYPE_RE = re.compile(r"\n\) -> Response\[.*?\]:\n", re.S)
+RETURNS_RE = re.compile(r"    Returns:\n        .*\n")
+UNEXPECTED_STATUS_LINE = "        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.\n"
+RAW_NOTE = "    The response body is neither decoded nor parsed: the httpx.Response is returned as received.\n\n"
+CLIENT_MODE_FIELD = (
+    '    parse_mode: str = field(default="model", kw_only=True, validator=validators.in_(("model", "dict", "bytes")))\n'
+)
+PARSE_MODE_DOC = """        parse_mode: What successful responses are parsed into: "model" (the default) builds the generated
+            models, "dict" returns the decoded JSON and "bytes" the body as received.
+"""
+
+
+def _function(text: str, header: str) -> str:
+    start = text.index(header)
+    end = text.find("\n\n\n", start)
+    return text[start : len(text) if end < 0 else end].rstrip("\n") + "\n"
+
+
+def _raw_variant(detailed: str, header: str, name: str) -> str:
+    text = detailed.replace(header, name, 1)
+    text = RESPONSE_TYPE_RE.sub("\n) -> httpx.Response:\n", text, 1)
+    text = RETURNS_RE.sub("    Returns:\n        httpx.Response\n", text, 1)
+    text = text.replace(UNEXPECTED_STATUS_LINE, "", 1)
+    note = min(i for i in (text.find("    Args:\n"), text.find("    Raises:\n")) if i >= 0)
+    text = text[:note] + RAW_NOTE + text[note:]
+    return text.replace("kwargs, _build_response)", "kwargs, parsing.raw_response)")
+
+
+def add_raw_mode(pkg_dir: Path) -> None:
+    """Let callers skip model construction
+
+    Each endpoint gains raw()/araw(), taking the same arguments as sync_detailed/asyncio_detailed and
+    returning the httpx.Response untouched, and _parse_response returns the decoded JSON or the body
+    bytes instead of models when the Client's `parse_mode` is "dict" or "bytes".
+    """
+    for path in sorted((pkg_dir / "api").rglob("*.py")):
+        text = path.read_text()
+        if "def sync_detailed(" not in text or "def raw(" in text:
+            continue
+        parse = text.index("def _parse_response(")
+        branch = text.index(PARSE_200, parse) + len(PARSE_200)
+        text = text[:branch] + UNPARSED + text[branch:]
+        raw = _raw_variant(_function(text, "def sync_detailed("), "def sync_detailed(", "def raw(")
+        araw = _raw_variant(
+            _function(text, "async def asyncio_detailed("), "async def asyncio_detailed(", "async def araw("
+        )
+        text = text.rstrip("\n") + "\n\n\n" + raw + "\n\n" + araw
+        text = re.sub(r"^(from \.\.\. import .*instrument)\n", r"\1, parsing\n", text, 1, re.M)
+        path.write_text(text)
+
+    client_path = pkg_dir / "client.py"
+    text = client_path.read_text()
+    if "parse_mode" not in text:
+        text = text.replace(CLIENT_HOOK_FIELD, CLIENT_HOOK_FIELD + CLIENT_MODE_FIELD)
+        text = text.replace(CLIENT_HOOK_DOC, CLIENT_HOOK_DOC + PARSE_MODE_DOC)
+        text = text.replace(
+            "from attrs import define, evolve, field\n", "from attrs import define, evolve, field, validators\n", 1
+        )
+        client_path.write_text(text)
+
+
+HTTPX_ARGS_FIELD = '    _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")\n'
+UDS_FIELD = '    _uds: Optional[str] = field(default=None, kw_only=True, alias="uds")\n'
+HTTPX_ARGS_DOC = """        ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
+"""
+UDS_DOC = """
+        ``uds``: Path of a Unix domain socket the server listens on. Requests go through it instead of TCP;
+        ``base_url`` still provides the paths and the Host header. Ignored when ``httpx_args`` has a ``transport``.
+"""
+HTTPX_CLIENT_RE = re.compile(r"(= httpx\.(Async)?Client\(\n(?:.*\n)*?\s+)\*\*self\._httpx_args,")
+WITH_UDS = '''
+
+def _with_uds(
+    httpx_args: dict[str, Any], uds: Optional[str], transport: type, verify: Union[str, bool, ssl.SSLContext]
+) -> dict[str, Any]:
+    """httpx client arguments with a transport connecting through the Unix domain socket `uds`, if set"""
+    if uds is None or "transport" in httpx_args:
+        return httpx_args
+    options = {k: httpx_args[k] for k in ("limits", "http1", "http2", "trust_env") if k in httpx_args}
+    return {**httpx_args, "transport": transport(uds=uds, verify=verify, **options)}
+'''
+
+
+def _client_args(match: re.Match) -> str:
+    transport = "httpx.AsyncHTTPTransport" if match.group(2) else "httpx.HTTPTransport"
+    return f"{match.group(1)}**_with_uds(self._httpx_args, self._uds, {transport}, self._verify_ssl),"
+
+
+def add_uds_transport(pkg_dir: Path) -> None:
+    """Connect to the server through a Unix domain socket
+
+    A local server behind a socket saves the loopback TCP handshake and the port bookkeeping; httpx
+    supports it through the transport's `uds` option, which the generated clients had no way to set.
+    """
+    client_path = pkg_dir / "client.py"
+    text = client_path.read_text()
+    if "_uds" in text:
+        return
+    text = text.replace(HTTPX_ARGS_FIELD, HTTPX_ARGS_FIELD + UDS_FIELD)
+    text = text.replace(HTTPX_ARGS_DOC, HTTPX_ARGS_DOC + UDS_DOC)
+    text = HTTPX_CLIENT_RE.sub(_client_args, text)
+    first_class = text.index("\n\n@define\n")
+    text = text[:first_class] + WITH_UDS + text[first_class:]
+    client_path.write_text(text)
+
+
+POOL_STATS_FIELD = '    pool_stats: Optional["PoolStats"] = field(default=None, kw_only=True)\n'
+POOL_STATS_DOC = """        pool_stats: An opencode_ai.pool.PoolStats counting the requests in flight on the connection pools this
+            client creates, to watch for pool saturation. Set it before the first request.
+"""
+TRANSPORT_ARGS = '''
+
+def _transport_args(
+    httpx_args: dict[str, Any],
+    uds: Optional[str],
+    transport: type,
+    verify: Union[str, bool, ssl.SSLContext],
+    pool_stats: Optional["PoolStats"],
+) -> dict[str, Any]:
+    """httpx client arguments with the transports for `uds` and `pool_stats`, when either is set"""
+    if uds is None and pool_stats is None:
+        return httpx_args
+    from .pool import build_transports
+
+    return build_transports(transport, httpx_args, uds=uds, verify=verify, pool_stats=pool_stats)
+'''
+WITH_UDS_CALL_RE = re.compile(r"\*\*_with_uds\((self\._httpx_args, self\._uds, httpx\.\w+, self\._verify_ssl)\),")
+
+
+def add_pool_stats(pkg_dir: Path) -> None:
+    """Count in-flight requests per connection pool
+
+    httpx exposes no pool occupancy, so a burst that exhausts the pool only shows up as PoolTimeout.
+    With a `pool_stats` the clients build their transports explicitly, including the proxy ones httpx
+    would have built from the environment, and wrap them to count requests from hand-off until the
+    response is closed.
+    """
+    client_path = pkg_dir / "client.py"
+    text = client_path.read_text()
+    if "pool_stats" in text or "_with_uds" not in text:
+        return
+    text = text.replace(WITH_UDS, TRANSPORT_ARGS)
+    text = WITH_UDS_CALL_RE.sub(r"**_transport_args(\1, self.pool_stats),", text)
+    text = text.replace(INSTRUMENTATION_DOC, INSTRUMENTATION_DOC + POOL_STATS_DOC)
+    hook = '    instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True)\n'
+    text = text.replace(hook, hook + POOL_STATS_FIELD)
+    text = text.replace(
+        "    from .instrument import Instrumentation\n",
+        "    from .instrument import Instrumentation\n    from .pool import PoolStats\n",
+        1,
+    )
+    client_path.write_text(text)
+
+
+POOL_FIELDS_ANCHOR = "    _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)\n"
+POOL_FIELDS = """    _pool_owner: Optional[Union["Client", "AuthenticatedClient"]] = field(default=None, init=False)
+    _transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _async_transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
+"""
+BORROW = '''
+
+def _borrow(httpx_args: dict[str, Any], transports: dict[str, Any]) -> dict[str, Any]:
+    """httpx client arguments sending through the `transports` of another client, which keeps owning them"""
+    from .pool import SharedTransport
+
+    args = {k: v for k, v in httpx_args.items() if k != "proxy"}
+    args["transport"] = SharedTransport(transports["transport"])
+    if "mounts" in transports:
+        args["mounts"] = {p: None if t is None else SharedTransport(t) for p, t in transports["mounts"].items()}
+    return args
+'''
+# _transport_args builds the transports even without `uds` or `pool_stats`, so they can be shared
+ALWAYS_BUILD = (
+    '    """httpx client arguments with the transports for `uds` and `pool_stats`, when either is set"""\n'
+    "    if uds is None and pool_stats is None:\n"
+    "        return httpx_args\n",
+    '    """httpx client arguments with the transports built here rather than by httpx, so they can be shared"""\n',
+)
+SET_CLIENT_RE = re.compile(r"(        self\.(_async)?_client = (?:async_)?client\n)(        return self\n)")
+SHARING_DOC = """
+    Clients can be shared between threads: the httpx clients are created once, under a lock. The
+    clients returned by ``with_headers``, ``with_cookies`` and ``with_timeout`` reuse this client's
+    connection pools and proxies (created on first use) and leave its settings untouched. Clients
+    derived from one given its httpx client with ``set_httpx_client`` create their own instead.
+"""
+MUTATE_RE = re.compile(
+    r"(    def with_(\w+)\(self, \w+: [^)]*\) -> \"(\w+)\":\n        \"\"\"[^\n]*\"\"\"\n)"
+    r"        if self\._client is not None:\n(?:            .*\n)+"
+    r"        if self\._async_client is not None:\n(?:            .*\n)+"
+    r"        return evolve\(self, (.*)\)\n"
+)
+DERIVE = '''
+    def _derive(self, **changes: Any) -> "{cls}":
+        """A copy with `changes` sharing this client's connection pools"""
+        derived = evolve(self, **{{"headers": dict(self._headers), "cookies": dict(self._cookies), **changes}})
+        derived._pool_owner = self._pool_owner or self
+        return derived
+'''
+LAZY_RE = re.compile(
+    r"(    def get_(async_)?httpx_client\(self\) -> httpx\.\w+:\n        \"\"\"[^\n]*\"\"\"\n)"
+    r"        if self\.(\w+) is None:\n((?:            .*\n)+)        return self\.\3\n"
+)
+TRANSPORT_CALL_RE = re.compile(
+    r"\*\*_transport_args\(\s*self\._httpx_args,\s*self\._uds,\s*httpx\.(\w+),\s*self\._verify_ssl,\s*self\.pool_stats,?\s*\),"
+)
+
+
+def _locked_creation(match: re.Match) -> str:
+    header, asynchronous, attr, body = match.groups()
+    getter = "get_async_httpx_client" if asynchronous else "get_httpx_client"
+    transports = "_async_transports" if asynchronous else "_transports"
+    transport = TRANSPORT_CALL_RE.search(body).group(1)
+    body = TRANSPORT_CALL_RE.sub("**args,", body)
+    construct = body.index(f"            self.{attr} = httpx.")
+    args = (
+        "            owner = self._pool_owner\n"
+        "            if owner is not None:\n"
+        f"                owner.{getter}()\n"
+        f"            if owner is not None and owner.{transports} is not None:\n"
+        f"                args = _borrow(self._httpx_args, owner.{transports})\n"
+        "            else:\n"
+        f"                args = self.{transports} = _transport_args(\n"
+        f"                    self._httpx_args, self._uds, httpx.{transport}, self._verify_ssl, self.pool_stats\n"
+        "                )\n"
+    )
+    body = body[:construct] + args + body[construct:]
+    inner = "".join("        " + line if line.strip() else line for line in body.splitlines(keepends=True))
+    return (
+        f"{header}        if self.{attr} is None:\n"
+        f"            with self._lock:\n"
+        f"                if self.{attr} is None:\n{inner}"
+        f"        return self.{attr}\n"
+    )
+
+
+def share_client_pools(pkg_dir: Path) -> None:
+    """Make the generated clients safe to share between threads
+
+    The httpx clients were created lazily without a lock, so threads racing on the first request
+    each built (and leaked) a pool. with_headers/with_timeout mutated the live httpx client behind
+    every other user's back and returned a copy that built yet another pool. Now every client builds
+    its transports itself and keeps them, and derived clients send through their owner's.
+    """
+    client_path = pkg_dir / "client.py"
+    text = client_path.read_text()
+    if "_pool_owner" in text or "_transport_args" not in text:
+        return
+    text = text.replace("import ssl\n", "import ssl\nimport threading\n", 1)
+    text = text.replace(POOL_FIELDS_ANCHOR, POOL_FIELDS_ANCHOR + POOL_FIELDS)
+
+    def derive(match: re.Match) -> str:
+        header, _, cls, changes = match.groups()
+        method = f"{header}        return self._derive({changes})\n"
+        return method + DERIVE.format(cls=cls) if match.group(2) == "timeout" else method
+
+    text = MUTATE_RE.sub(derive, text)
+    text = LAZY_RE.sub(_locked_creation, text)
+    text = text.replace(*ALWAYS_BUILD)
+    # transports of a replaced httpx client are not lent out any more
+    text = SET_CLIENT_RE.sub(
+        lambda m: f"{m.group(1)}        self.{'_async' if m.group(2) else ''}_transports = None\n{m.group(3)}", text
+    )
+    first_class = text.index("\n\n@define\n")
+    text = text[:first_class] + BORROW + text[first_class:]
+    text = text.replace("\n\n    Attributes:\n", SHARING_DOC + "\n    Attributes:\n")
+    client_path.write_text(text)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Post-process the generated opencode_ai package.")
+    parser.add_argument("package", type=Path, help="Path to the generated opencode_ai package")
+    parser.add_argument(
+        "--no-compact-models",
+        action="store_true",
+        help="Keep an always-allocated additional_properties dict on every model",
+    )
+    args = parser.parse_args()
+
+    pkg_dir: Path = args.package
+    if not (pkg_dir / "models").is_dir():
+        print(f"ERROR: {pkg_dir} does not look like a generated package", file=sys.stderr)
+        return 1
+
+    add_discriminator_dispatch(pkg_dir)
+    make_models_lazy(pkg_dir)
+    defer_endpoint_model_imports(pkg_dir)
+    if not args.no_compact_models:
+        compact_additional_properties(pkg_dir)
+    read_without_copying(pkg_dir)
+    use_codec(pkg_dir)
+    instrument_endpoints(pkg_dir)
+    add_raw_mode(pkg_dir)
+    add_uds_transport(pkg_dir)
+    add_pool_stats(pkg_dir)
+    share_client_pools(pkg_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,13 +2,60 @@
 
 This package is generated by openapi-python-client.
 A thin convenience wrapper `OpenCodeClient` is also provided.
+
+The names below are imported on first attribute access (PEP 562), so importing the package does not
+load asyncio, subprocess or concurrent.futures until something that needs them is used.
 """
 
-from .client import AuthenticatedClient, Client
-from .extras import OpenCodeClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .buffering import EventBuffer
+    from .client import AuthenticatedClient, Client
+    from .coalesce import PartCoalescer
+    from .events import EventEnvelope
+    from .extras import AsyncOpenCodeClient, OpenCodeClient
+    from .mux import EventMux
+    from .server import LocalServer
+    from .store import SessionStore
+
+_MODULES = {
+    "AsyncOpenCodeClient": "extras",
+    "AuthenticatedClient": "client",
+    "Client": "client",
+    "EventBuffer": "buffering",
+    "EventEnvelope": "events",
+    "EventMux": "mux",
+    "LocalServer": "server",
+    "OpenCodeClient": "extras",
+    "PartCoalescer": "coalesce",
+    "SessionStore": "store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
+
 
 __all__ = (
+    "AsyncOpenCodeClient",
     "AuthenticatedClient",
     "Client",
+    "EventBuffer",
+    "EventEnvelope",
+    "EventMux",
+    "LocalServer",
     "OpenCodeClient",
+    "PartCoalescer",
+    "SessionStore",
 )
@@ -1,13 +1,15 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, instrument, parsing
 from ...client import AuthenticatedClient, Client
-from ...models.agent import Agent
 from ...types import UNSET, Response, Unset
 
+if TYPE_CHECKING:
+    from ...models.agent import Agent
+
 
 def _get_kwargs(
     *,
@@ -29,9 +31,13 @@ def _get_kwargs(
 
 
 def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[list["Agent"]]:
+    from ...models.agent import Agent
+
     if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = instrument.loads(response.content)
         for response_200_item_data in _response_200:
             response_200_item = Agent.from_dict(response_200_item_data)
 
@@ -76,11 +82,7 @@ def sync_detailed(
         directory=directory,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return instrument.send(client, "/agent", kwargs, _build_response)
 
 
 def sync(
@@ -129,9 +131,7 @@ async def asyncio_detailed(
         directory=directory,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await instrument.asend(client, "/agent", kwargs, _build_response)
 
 
 async def asyncio(
@@ -158,3 +158,55 @@ async def asyncio(
             directory=directory,
         )
     ).parsed
+
+
+def raw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all agents
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return instrument.send(client, "/agent", kwargs, parsing.raw_response)
+
+
+async def araw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all agents
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/agent", kwargs, parsing.raw_response)
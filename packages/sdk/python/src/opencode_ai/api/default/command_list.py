@@ -1,13 +1,15 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, instrument, parsing
 from ...client import AuthenticatedClient, Client
-from ...models.command import Command
 from ...types import UNSET, Response, Unset
 
+if TYPE_CHECKING:
+    from ...models.command import Command
+
 
 def _get_kwargs(
     *,
@@ -31,9 +33,13 @@ def _get_kwargs(
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[list["Command"]]:
+    from ...models.command import Command
+
     if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
         response_200 = []
-        _response_200 = response.json()
+        _response_200 = instrument.loads(response.content)
         for response_200_item_data in _response_200:
             response_200_item = Command.from_dict(response_200_item_data)
 
@@ -80,11 +86,7 @@ def sync_detailed(
         directory=directory,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return instrument.send(client, "/command", kwargs, _build_response)
 
 
 def sync(
@@ -133,9 +135,7 @@ async def asyncio_detailed(
         directory=directory,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await instrument.asend(client, "/command", kwargs, _build_response)
 
 
 async def asyncio(
@@ -162,3 +162,55 @@ async def asyncio(
             directory=directory,
         )
     ).parsed
+
+
+def raw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all commands
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return instrument.send(client, "/command", kwargs, parsing.raw_response)
+
+
+async def araw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all commands
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/command", kwargs, parsing.raw_response)
@@ -3,7 +3,7 @@ from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, instrument, parsing
 from ...client import AuthenticatedClient, Client
 from ...models.config import Config
 from ...types import UNSET, Response, Unset
@@ -30,7 +30,9 @@ def _get_kwargs(
 
 def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Config]:
     if response.status_code == 200:
-        response_200 = Config.from_dict(response.json())
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = Config.from_dict(instrument.loads(response.content))
 
         return response_200
 
@@ -71,11 +73,7 @@ def sync_detailed(
         directory=directory,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return instrument.send(client, "/config", kwargs, _build_response)
 
 
 def sync(
@@ -124,9 +122,7 @@ async def asyncio_detailed(
         directory=directory,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await instrument.asend(client, "/config", kwargs, _build_response)
 
 
 async def asyncio(
@@ -153,3 +149,55 @@ async def asyncio(
             directory=directory,
         )
     ).parsed
+
+
+def raw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get config info
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return instrument.send(client, "/config", kwargs, parsing.raw_response)
+
+
+async def araw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get config info
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/config", kwargs, parsing.raw_response)
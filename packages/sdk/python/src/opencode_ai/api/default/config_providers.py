@@ -3,7 +3,7 @@ from typing import Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, instrument, parsing
 from ...client import AuthenticatedClient, Client
 from ...models.config_providers_response_200 import ConfigProvidersResponse200
 from ...types import UNSET, Response, Unset
@@ -32,7 +32,9 @@ def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[ConfigProvidersResponse200]:
     if response.status_code == 200:
-        response_200 = ConfigProvidersResponse200.from_dict(response.json())
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = ConfigProvidersResponse200.from_dict(instrument.loads(response.content))
 
         return response_200
 
@@ -75,11 +77,7 @@ def sync_detailed(
         directory=directory,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return instrument.send(client, "/config/providers", kwargs, _build_response)
 
 
 def sync(
@@ -128,9 +126,7 @@ async def asyncio_detailed(
         directory=directory,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await instrument.asend(client, "/config/providers", kwargs, _build_response)
 
 
 async def asyncio(
@@ -157,3 +153,55 @@ async def asyncio(
             directory=directory,
         )
     ).parsed
+
+
+def raw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all providers
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return instrument.send(client, "/config/providers", kwargs, parsing.raw_response)
+
+
+async def araw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """List all providers
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/config/providers", kwargs, parsing.raw_response)
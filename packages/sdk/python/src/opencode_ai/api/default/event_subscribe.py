@@ -1,29 +1,32 @@
 from http import HTTPStatus
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
 
-from ... import errors
+from ... import errors, instrument, parsing
 from ...client import AuthenticatedClient, Client
-from ...models.event_file_edited import EventFileEdited
-from ...models.event_file_watcher_updated import EventFileWatcherUpdated
-from ...models.event_ide_installed import EventIdeInstalled
-from ...models.event_installation_updated import EventInstallationUpdated
-from ...models.event_lsp_client_diagnostics import EventLspClientDiagnostics
-from ...models.event_message_part_removed import EventMessagePartRemoved
-from ...models.event_message_part_updated import EventMessagePartUpdated
-from ...models.event_message_removed import EventMessageRemoved
-from ...models.event_message_updated import EventMessageUpdated
-from ...models.event_permission_replied import EventPermissionReplied
-from ...models.event_permission_updated import EventPermissionUpdated
-from ...models.event_server_connected import EventServerConnected
-from ...models.event_session_compacted import EventSessionCompacted
-from ...models.event_session_deleted import EventSessionDeleted
-from ...models.event_session_error import EventSessionError
-from ...models.event_session_idle import EventSessionIdle
-from ...models.event_session_updated import EventSessionUpdated
+from ...models import _discriminators
 from ...types import UNSET, Response, Unset
 
+if TYPE_CHECKING:
+    from ...models.event_file_edited import EventFileEdited
+    from ...models.event_file_watcher_updated import EventFileWatcherUpdated
+    from ...models.event_ide_installed import EventIdeInstalled
+    from ...models.event_installation_updated import EventInstallationUpdated
+    from ...models.event_lsp_client_diagnostics import EventLspClientDiagnostics
+    from ...models.event_message_part_removed import EventMessagePartRemoved
+    from ...models.event_message_part_updated import EventMessagePartUpdated
+    from ...models.event_message_removed import EventMessageRemoved
+    from ...models.event_message_updated import EventMessageUpdated
+    from ...models.event_permission_replied import EventPermissionReplied
+    from ...models.event_permission_updated import EventPermissionUpdated
+    from ...models.event_server_connected import EventServerConnected
+    from ...models.event_session_compacted import EventSessionCompacted
+    from ...models.event_session_deleted import EventSessionDeleted
+    from ...models.event_session_error import EventSessionError
+    from ...models.event_session_idle import EventSessionIdle
+    from ...models.event_session_updated import EventSessionUpdated
+
 
 def _get_kwargs(
     *,
@@ -65,7 +68,27 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
         "EventSessionUpdated",
     ]
 ]:
+    from ...models.event_file_edited import EventFileEdited
+    from ...models.event_file_watcher_updated import EventFileWatcherUpdated
+    from ...models.event_ide_installed import EventIdeInstalled
+    from ...models.event_installation_updated import EventInstallationUpdated
+    from ...models.event_lsp_client_diagnostics import EventLspClientDiagnostics
+    from ...models.event_message_part_removed import EventMessagePartRemoved
+    from ...models.event_message_part_updated import EventMessagePartUpdated
+    from ...models.event_message_removed import EventMessageRemoved
+    from ...models.event_message_updated import EventMessageUpdated
+    from ...models.event_permission_replied import EventPermissionReplied
+    from ...models.event_permission_updated import EventPermissionUpdated
+    from ...models.event_server_connected import EventServerConnected
+    from ...models.event_session_compacted import EventSessionCompacted
+    from ...models.event_session_deleted import EventSessionDeleted
+    from ...models.event_session_error import EventSessionError
+    from ...models.event_session_idle import EventSessionIdle
+    from ...models.event_session_updated import EventSessionUpdated
+
     if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
 
         def _parse_response_200(
             data: object,
@@ -88,6 +111,10 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
             "EventSessionIdle",
             "EventSessionUpdated",
         ]:
+            if isinstance(data, dict):
+                _member = _discriminators.EVENT.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             try:
                 if not isinstance(data, dict):
                     raise TypeError()
@@ -303,11 +330,7 @@ def sync_detailed(
         directory=directory,
     )
 
-    response = client.get_httpx_client().request(
-        **kwargs,
-    )
-
-    return _build_response(client=client, response=response)
+    return instrument.send(client, "/event", kwargs, _build_response)
 
 
 def sync(
@@ -396,9 +419,7 @@ async def asyncio_detailed(
         directory=directory,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
-
-    return _build_response(client=client, response=response)
+    return await instrument.asend(client, "/event", kwargs, _build_response)
 
 
 async def asyncio(
@@ -445,3 +466,55 @@ async def asyncio(
             directory=directory,
         )
     ).parsed
+
+
+def raw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get events
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return instrument.send(client, "/event", kwargs, parsing.raw_response)
+
+
+async def araw(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get events
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/event", kwargs, parsing.raw_response)
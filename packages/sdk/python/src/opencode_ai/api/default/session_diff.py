@@ -0,0 +1,235 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import httpx
+
+from ... import errors, instrument, parsing
+from ...client import AuthenticatedClient, Client
+from ...types import UNSET, Response, Unset
+
+if TYPE_CHECKING:
+    from ...models.file_diff import FileDiff
+
+
+def _get_kwargs(
+    id: str,
+    *,
+    directory: Union[Unset, str] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["directory"] = directory
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/session/{id}/diff",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[list["FileDiff"]]:
+    from ...models.file_diff import FileDiff
+
+    if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = []
+        _response_200 = instrument.loads(response.content)
+        for response_200_item_data in _response_200:
+            response_200_item = FileDiff.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[list["FileDiff"]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[list["FileDiff"]]:
+    """Get the diff for this session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list['FileDiff']]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}/diff", kwargs, _build_response)
+
+
+def sync(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[list["FileDiff"]]:
+    """Get the diff for this session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list['FileDiff']
+    """
+
+    return sync_detailed(
+        id=id,
+        client=client,
+        directory=directory,
+    ).parsed
+
+
+async def asyncio_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[list["FileDiff"]]:
+    """Get the diff for this session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list['FileDiff']]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}/diff", kwargs, _build_response)
+
+
+async def asyncio(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[list["FileDiff"]]:
+    """Get the diff for this session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list['FileDiff']
+    """
+
+    return (
+        await asyncio_detailed(
+            id=id,
+            client=client,
+            directory=directory,
+        )
+    ).parsed
+
+
+def raw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get the diff for this session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}/diff", kwargs, parsing.raw_response)
+
+
+async def araw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get the diff for this session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}/diff", kwargs, parsing.raw_response)
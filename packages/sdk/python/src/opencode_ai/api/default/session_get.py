@@ -0,0 +1,222 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors, instrument, parsing
+from ...client import AuthenticatedClient, Client
+from ...models.session import Session
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    id: str,
+    *,
+    directory: Union[Unset, str] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["directory"] = directory
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/session/{id}",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Session]:
+    if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = Session.from_dict(instrument.loads(response.content))
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Session]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[Session]:
+    """Get session
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Session]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}", kwargs, _build_response)
+
+
+def sync(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[Session]:
+    """Get session
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Session
+    """
+
+    return sync_detailed(
+        id=id,
+        client=client,
+        directory=directory,
+    ).parsed
+
+
+async def asyncio_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[Session]:
+    """Get session
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Session]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}", kwargs, _build_response)
+
+
+async def asyncio(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[Session]:
+    """Get session
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Session
+    """
+
+    return (
+        await asyncio_detailed(
+            id=id,
+            client=client,
+            directory=directory,
+        )
+    ).parsed
+
+
+def raw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}", kwargs, parsing.raw_response)
+
+
+async def araw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str):
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}", kwargs, parsing.raw_response)
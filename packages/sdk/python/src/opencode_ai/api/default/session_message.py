@@ -0,0 +1,245 @@
+from http import HTTPStatus
+from typing import Any, Optional, Union
+
+import httpx
+
+from ... import errors, instrument, parsing
+from ...client import AuthenticatedClient, Client
+from ...models.session_message_response_200 import SessionMessageResponse200
+from ...types import UNSET, Response, Unset
+
+
+def _get_kwargs(
+    id: str,
+    message_id: str,
+    *,
+    directory: Union[Unset, str] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["directory"] = directory
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/session/{id}/message/{message_id}",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[SessionMessageResponse200]:
+    if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = SessionMessageResponse200.from_dict(instrument.loads(response.content))
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[SessionMessageResponse200]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[SessionMessageResponse200]:
+    """Get a message from a session
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[SessionMessageResponse200]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        message_id=message_id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}/message/{message_id}", kwargs, _build_response)
+
+
+def sync(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[SessionMessageResponse200]:
+    """Get a message from a session
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        SessionMessageResponse200
+    """
+
+    return sync_detailed(
+        id=id,
+        message_id=message_id,
+        client=client,
+        directory=directory,
+    ).parsed
+
+
+async def asyncio_detailed(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Response[SessionMessageResponse200]:
+    """Get a message from a session
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[SessionMessageResponse200]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        message_id=message_id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}/message/{message_id}", kwargs, _build_response)
+
+
+async def asyncio(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> Optional[SessionMessageResponse200]:
+    """Get a message from a session
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        SessionMessageResponse200
+    """
+
+    return (
+        await asyncio_detailed(
+            id=id,
+            message_id=message_id,
+            client=client,
+            directory=directory,
+        )
+    ).parsed
+
+
+def raw(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get a message from a session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        message_id=message_id,
+        directory=directory,
+    )
+
+    return instrument.send(client, "/session/{id}/message/{message_id}", kwargs, parsing.raw_response)
+
+
+async def araw(
+    id: str,
+    message_id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+) -> httpx.Response:
+    """Get a message from a session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        message_id (str): Message ID
+        directory (Union[Unset, str]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        message_id=message_id,
+        directory=directory,
+    )
+
+    return await instrument.asend(client, "/session/{id}/message/{message_id}", kwargs, parsing.raw_response)
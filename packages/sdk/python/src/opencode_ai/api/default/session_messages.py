@@ -0,0 +1,256 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+import httpx
+
+from ... import errors, instrument, parsing
+from ...client import AuthenticatedClient, Client
+from ...types import UNSET, Response, Unset
+
+if TYPE_CHECKING:
+    from ...models.session_messages_response_200_item import SessionMessagesResponse200Item
+
+
+def _get_kwargs(
+    id: str,
+    *,
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {}
+
+    params["directory"] = directory
+
+    params["limit"] = limit
+
+    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": f"/session/{id}/message",
+        "params": params,
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Optional[list["SessionMessagesResponse200Item"]]:
+    from ...models.session_messages_response_200_item import SessionMessagesResponse200Item
+
+    if response.status_code == 200:
+        if client.parse_mode != "model":
+            return parsing.unparsed(client, response)
+        response_200 = []
+        _response_200 = instrument.loads(response.content)
+        for response_200_item_data in _response_200:
+            response_200_item = SessionMessagesResponse200Item.from_dict(response_200_item_data)
+
+            response_200.append(response_200_item)
+
+        return response_200
+
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: Union[AuthenticatedClient, Client], response: httpx.Response
+) -> Response[list["SessionMessagesResponse200Item"]]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> Response[list["SessionMessagesResponse200Item"]]:
+    """List messages for a session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list['SessionMessagesResponse200Item']]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+        limit=limit,
+    )
+
+    return instrument.send(client, "/session/{id}/message", kwargs, _build_response)
+
+
+def sync(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> Optional[list["SessionMessagesResponse200Item"]]:
+    """List messages for a session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list['SessionMessagesResponse200Item']
+    """
+
+    return sync_detailed(
+        id=id,
+        client=client,
+        directory=directory,
+        limit=limit,
+    ).parsed
+
+
+async def asyncio_detailed(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> Response[list["SessionMessagesResponse200Item"]]:
+    """List messages for a session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[list['SessionMessagesResponse200Item']]
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+        limit=limit,
+    )
+
+    return await instrument.asend(client, "/session/{id}/message", kwargs, _build_response)
+
+
+async def asyncio(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> Optional[list["SessionMessagesResponse200Item"]]:
+    """List messages for a session
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list['SessionMessagesResponse200Item']
+    """
+
+    return (
+        await asyncio_detailed(
+            id=id,
+            client=client,
+            directory=directory,
+            limit=limit,
+        )
+    ).parsed
+
+
+def raw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> httpx.Response:
+    """List messages for a session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+        limit=limit,
+    )
+
+    return instrument.send(client, "/session/{id}/message", kwargs, parsing.raw_response)
+
+
+async def araw(
+    id: str,
+    *,
+    client: Union[AuthenticatedClient, Client],
+    directory: Union[Unset, str] = UNSET,
+    limit: Union[Unset, float] = UNSET,
+) -> httpx.Response:
+    """List messages for a session
+
+    The response body is neither decoded nor parsed: the httpx.Response is returned as received.
+
+    Args:
+        id (str): Session ID
+        directory (Union[Unset, str]):
+        limit (Union[Unset, float]):
+
+    Raises:
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        httpx.Response
+    """
+
+    kwargs = _get_kwargs(
+        id=id,
+        directory=directory,
+        limit=limit,
+    )
+
+    return await instrument.asend(client, "/session/{id}/message", kwargs, parsing.raw_response)
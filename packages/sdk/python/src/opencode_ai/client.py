@@ -1,8 +1,37 @@
 import ssl
-from typing import Any, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import httpx
-from attrs import define, evolve, field
+from attrs import define, evolve, field, validators
+
+if TYPE_CHECKING:
+    from .instrument import Instrumentation
+    from .pool import PoolStats
+
+
+def _transport_args(
+    httpx_args: dict[str, Any],
+    uds: Optional[str],
+    transport: type,
+    verify: Union[str, bool, ssl.SSLContext],
+    pool_stats: Optional["PoolStats"],
+) -> dict[str, Any]:
+    """httpx client arguments with the transports built here rather than by httpx, so they can be shared"""
+    from .pool import build_transports
+
+    return build_transports(transport, httpx_args, uds=uds, verify=verify, pool_stats=pool_stats)
+
+
+def _borrow(httpx_args: dict[str, Any], transports: dict[str, Any]) -> dict[str, Any]:
+    """httpx client arguments sending through the `transports` of another client, which keeps owning them"""
+    from .pool import SharedTransport
+
+    args = {k: v for k, v in httpx_args.items() if k != "proxy"}
+    args["transport"] = SharedTransport(transports["transport"])
+    if "mounts" in transports:
+        args["mounts"] = {p: None if t is None else SharedTransport(t) for p, t in transports["mounts"].items()}
+    return args
 
 
 @define
@@ -27,14 +56,31 @@ class Client:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``uds``: Path of a Unix domain socket the server listens on. Requests go through it instead of TCP;
+        ``base_url`` still provides the paths and the Host header. Ignored when ``httpx_args`` has a ``transport``.
+
+    Clients can be shared between threads: the httpx clients are created once, under a lock. The
+    clients returned by ``with_headers``, ``with_cookies`` and ``with_timeout`` reuse this client's
+    connection pools and proxies (created on first use) and leave its settings untouched. Clients
+    derived from one given its httpx client with ``set_httpx_client`` create their own instead.
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        parse_mode: What successful responses are parsed into: "model" (the default) builds the generated
+            models, "dict" returns the decoded JSON and "bytes" the body as received.
+        instrumentation: An opencode_ai.instrument.Instrumentation receiving the timings of every request
+            made through the generated endpoints (connect, time to first byte, total, response size, JSON
+            decoding and model construction). None (the default) disables the measurements.
+        pool_stats: An opencode_ai.pool.PoolStats counting the requests in flight on the connection pools this
+            client creates, to watch for pool saturation. Set it before the first request.
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    parse_mode: str = field(default="model", kw_only=True, validator=validators.in_(("model", "dict", "bytes")))
+    instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True)
+    pool_stats: Optional["PoolStats"] = field(default=None, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -42,32 +88,31 @@ class Client:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _uds: Optional[str] = field(default=None, kw_only=True, alias="uds")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _pool_owner: Optional[Union["Client", "AuthenticatedClient"]] = field(default=None, init=False)
+    _transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _async_transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
 
     def with_headers(self, headers: dict[str, str]) -> "Client":
         """Get a new client matching this one with additional headers"""
-        if self._client is not None:
-            self._client.headers.update(headers)
-        if self._async_client is not None:
-            self._async_client.headers.update(headers)
-        return evolve(self, headers={**self._headers, **headers})
+        return self._derive(headers={**self._headers, **headers})
 
     def with_cookies(self, cookies: dict[str, str]) -> "Client":
         """Get a new client matching this one with additional cookies"""
-        if self._client is not None:
-            self._client.cookies.update(cookies)
-        if self._async_client is not None:
-            self._async_client.cookies.update(cookies)
-        return evolve(self, cookies={**self._cookies, **cookies})
+        return self._derive(cookies={**self._cookies, **cookies})
 
     def with_timeout(self, timeout: httpx.Timeout) -> "Client":
         """Get a new client matching this one with a new timeout (in seconds)"""
-        if self._client is not None:
-            self._client.timeout = timeout
-        if self._async_client is not None:
-            self._async_client.timeout = timeout
-        return evolve(self, timeout=timeout)
+        return self._derive(timeout=timeout)
+
+    def _derive(self, **changes: Any) -> "Client":
+        """A copy with `changes` sharing this client's connection pools"""
+        derived = evolve(self, **{"headers": dict(self._headers), "cookies": dict(self._cookies), **changes})
+        derived._pool_owner = self._pool_owner or self
+        return derived
 
     def set_httpx_client(self, client: httpx.Client) -> "Client":
         """Manually set the underlying httpx.Client
@@ -75,20 +120,32 @@ class Client:
         **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
         """
         self._client = client
+        self._transports = None
         return self
 
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            with self._lock:
+                if self._client is None:
+                    owner = self._pool_owner
+                    if owner is not None:
+                        owner.get_httpx_client()
+                    if owner is not None and owner._transports is not None:
+                        args = _borrow(self._httpx_args, owner._transports)
+                    else:
+                        args = self._transports = _transport_args(
+                            self._httpx_args, self._uds, httpx.HTTPTransport, self._verify_ssl, self.pool_stats
+                        )
+                    self._client = httpx.Client(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **args,
+                    )
         return self._client
 
     def __enter__(self) -> "Client":
@@ -106,20 +163,32 @@ class Client:
         **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
         """
         self._async_client = async_client
+        self._async_transports = None
         return self
 
     def get_async_httpx_client(self) -> httpx.AsyncClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            with self._lock:
+                if self._async_client is None:
+                    owner = self._pool_owner
+                    if owner is not None:
+                        owner.get_async_httpx_client()
+                    if owner is not None and owner._async_transports is not None:
+                        args = _borrow(self._httpx_args, owner._async_transports)
+                    else:
+                        args = self._async_transports = _transport_args(
+                            self._httpx_args, self._uds, httpx.AsyncHTTPTransport, self._verify_ssl, self.pool_stats
+                        )
+                    self._async_client = httpx.AsyncClient(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **args,
+                    )
         return self._async_client
 
     async def __aenter__(self) -> "Client":
@@ -154,17 +223,34 @@ class AuthenticatedClient:
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
+        ``uds``: Path of a Unix domain socket the server listens on. Requests go through it instead of TCP;
+        ``base_url`` still provides the paths and the Host header. Ignored when ``httpx_args`` has a ``transport``.
+
+    Clients can be shared between threads: the httpx clients are created once, under a lock. The
+    clients returned by ``with_headers``, ``with_cookies`` and ``with_timeout`` reuse this client's
+    connection pools and proxies (created on first use) and leave its settings untouched. Clients
+    derived from one given its httpx client with ``set_httpx_client`` create their own instead.
 
     Attributes:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        parse_mode: What successful responses are parsed into: "model" (the default) builds the generated
+            models, "dict" returns the decoded JSON and "bytes" the body as received.
+        instrumentation: An opencode_ai.instrument.Instrumentation receiving the timings of every request
+            made through the generated endpoints (connect, time to first byte, total, response size, JSON
+            decoding and model construction). None (the default) disables the measurements.
+        pool_stats: An opencode_ai.pool.PoolStats counting the requests in flight on the connection pools this
+            client creates, to watch for pool saturation. Set it before the first request.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    parse_mode: str = field(default="model", kw_only=True, validator=validators.in_(("model", "dict", "bytes")))
+    instrumentation: Optional["Instrumentation"] = field(default=None, kw_only=True)
+    pool_stats: Optional["PoolStats"] = field(default=None, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
@@ -172,8 +258,13 @@ class AuthenticatedClient:
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
+    _uds: Optional[str] = field(default=None, kw_only=True, alias="uds")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
+    _pool_owner: Optional[Union["Client", "AuthenticatedClient"]] = field(default=None, init=False)
+    _transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _async_transports: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(factory=threading.Lock, init=False, repr=False, eq=False)
 
     token: str
     prefix: str = "Bearer"
@@ -181,27 +272,21 @@ class AuthenticatedClient:
 
     def with_headers(self, headers: dict[str, str]) -> "AuthenticatedClient":
         """Get a new client matching this one with additional headers"""
-        if self._client is not None:
-            self._client.headers.update(headers)
-        if self._async_client is not None:
-            self._async_client.headers.update(headers)
-        return evolve(self, headers={**self._headers, **headers})
+        return self._derive(headers={**self._headers, **headers})
 
     def with_cookies(self, cookies: dict[str, str]) -> "AuthenticatedClient":
         """Get a new client matching this one with additional cookies"""
-        if self._client is not None:
-            self._client.cookies.update(cookies)
-        if self._async_client is not None:
-            self._async_client.cookies.update(cookies)
-        return evolve(self, cookies={**self._cookies, **cookies})
+        return self._derive(cookies={**self._cookies, **cookies})
 
     def with_timeout(self, timeout: httpx.Timeout) -> "AuthenticatedClient":
         """Get a new client matching this one with a new timeout (in seconds)"""
-        if self._client is not None:
-            self._client.timeout = timeout
-        if self._async_client is not None:
-            self._async_client.timeout = timeout
-        return evolve(self, timeout=timeout)
+        return self._derive(timeout=timeout)
+
+    def _derive(self, **changes: Any) -> "AuthenticatedClient":
+        """A copy with `changes` sharing this client's connection pools"""
+        derived = evolve(self, **{"headers": dict(self._headers), "cookies": dict(self._cookies), **changes})
+        derived._pool_owner = self._pool_owner or self
+        return derived
 
     def set_httpx_client(self, client: httpx.Client) -> "AuthenticatedClient":
         """Manually set the underlying httpx.Client
@@ -209,21 +294,33 @@ class AuthenticatedClient:
         **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
         """
         self._client = client
+        self._transports = None
         return self
 
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            with self._lock:
+                if self._client is None:
+                    self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+                    owner = self._pool_owner
+                    if owner is not None:
+                        owner.get_httpx_client()
+                    if owner is not None and owner._transports is not None:
+                        args = _borrow(self._httpx_args, owner._transports)
+                    else:
+                        args = self._transports = _transport_args(
+                            self._httpx_args, self._uds, httpx.HTTPTransport, self._verify_ssl, self.pool_stats
+                        )
+                    self._client = httpx.Client(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **args,
+                    )
         return self._client
 
     def __enter__(self) -> "AuthenticatedClient":
@@ -241,21 +338,33 @@ class AuthenticatedClient:
         **NOTE**: This will override any other settings on the client, including cookies, headers, and timeout.
         """
         self._async_client = async_client
+        self._async_transports = None
         return self
 
     def get_async_httpx_client(self) -> httpx.AsyncClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
-            self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
-            self._async_client = httpx.AsyncClient(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            with self._lock:
+                if self._async_client is None:
+                    self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
+                    owner = self._pool_owner
+                    if owner is not None:
+                        owner.get_async_httpx_client()
+                    if owner is not None and owner._async_transports is not None:
+                        args = _borrow(self._httpx_args, owner._async_transports)
+                    else:
+                        args = self._async_transports = _transport_args(
+                            self._httpx_args, self._uds, httpx.AsyncHTTPTransport, self._verify_ssl, self.pool_stats
+                        )
+                    self._async_client = httpx.AsyncClient(
+                        base_url=self._base_url,
+                        cookies=self._cookies,
+                        headers=self._headers,
+                        timeout=self._timeout,
+                        verify=self._verify_ssl,
+                        follow_redirects=self._follow_redirects,
+                        **args,
+                    )
         return self._async_client
 
     async def __aenter__(self) -> "AuthenticatedClient":
@@ -0,0 +1,69 @@
+"""JSON codec used for response bodies, request bodies and server-sent events.
+
+orjson or msgspec is used when installed (`pip install opencode-ai[orjson]`), stdlib `json` otherwise.
+Callers go through `loads`/`dumps` at call time, so `set_backend()` takes effect everywhere.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+BACKEND = "json"
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+_loads: Callable[[Union[bytes, bytearray, str]], Any] = json.loads
+_dumps: Callable[[Any], bytes] = _json_dumps
+
+
+def _load_backend(name: str) -> Tuple[Callable[..., Any], Callable[[Any], bytes]]:
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads, orjson.dumps
+    if name == "msgspec":
+        import msgspec
+
+        return msgspec.json.Decoder().decode, msgspec.json.Encoder().encode
+    if name == "json":
+        return json.loads, _json_dumps
+    raise ValueError(f"Unknown JSON backend {name!r}, expected one of {', '.join(BACKENDS)}")
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """Select the JSON backend by name, or the fastest installed one when `name` is None.
+
+    Raises ImportError if the named backend is not installed. Returns the backend in use.
+    """
+    global BACKEND, _loads, _dumps
+    if name is None:
+        for candidate in BACKENDS[:-1]:
+            try:
+                return set_backend(candidate)
+            except ImportError:
+                continue
+        name = "json"
+    _loads, _dumps = _load_backend(name)
+    BACKEND = name
+    return BACKEND
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode a JSON document from bytes (preferred, avoids a text decode) or str."""
+    return _loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode `obj` as compact UTF-8 JSON."""
+    return _dumps(obj)
+
+
+set_backend()
+
+__all__ = ["BACKEND", "BACKENDS", "dumps", "loads", "set_backend"]
@@ -1,31 +1,104 @@
 from __future__ import annotations
 
+import asyncio
+import random
 import time
-from typing import AsyncIterator, Dict, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Sequence
 
 import httpx
+from attrs import evolve
 
-from .api.default import (
-    app_agents,
-    command_list,
-    config_get,
-    config_providers,
-    file_status,
-    path_get,
-    project_current,
-    project_list,
-    session_list,
-    tool_ids,
-)
+from . import codec, errors, instrument, parsing
+from .buffering import EventBuffer
+from .cache import ResponseCache
 from .client import Client
+from .coalesce import PartCoalescer
+from .events import GAP_EVENT_TYPE, EventEnvelope, EventFilter
+from .jsonstream import aiter_json_array, iter_json_array
+from .pool import PoolStats, pool_limits, require_h2
+from .server import LocalServer
+from .snapshots import SNAPSHOT_ENDPOINTS, SNAPSHOT_PARTS, SessionSnapshot, SnapshotTable
+from .sse import ServerSentEvent, SSEDecoder, aiter_sse, iter_sse
 from .types import UNSET, Unset
 
+if TYPE_CHECKING:
+    from .models.session_messages_response_200_item import SessionMessagesResponse200Item
 
-class OpenCodeClient:
-    """High-level convenience wrapper around the generated Client.
 
-    Provides sensible defaults and a couple of helper methods, with optional retries.
-    """
+def _endpoint(name: str) -> ModuleType:
+    """Import a generated endpoint module on first use, so importing the SDK stays cheap."""
+    return import_module(f"{__package__}.api.default.{name}")
+
+
+def _decode_event(sse: ServerSentEvent, probe: Optional[instrument.StreamProbe] = None) -> Optional[dict]:
+    """Decode the JSON payload of an SSE message, skipping empty or malformed ones."""
+    if not sse.data:
+        return None
+    try:
+        return codec.loads(sse.data) if probe is None else probe.loads(sse.data)
+    except Exception:
+        return None
+
+
+def _parsed(response: Any) -> Any:
+    """The parsed body of a 200 response from a `*_detailed` endpoint; UnexpectedStatus otherwise."""
+    if response.status_code != 200:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed
+
+
+def _event_filter(types: Optional[Iterable[str]], session_id: Optional[str]) -> Optional[EventFilter]:
+    if types is None and session_id is None:
+        return None
+    return EventFilter(types, session_id)
+
+
+class _ReconnectState:
+    """Backoff and gap bookkeeping for a reconnecting event subscription."""
+
+    def __init__(self, backoff: float, max_delay: float) -> None:
+        self._backoff = backoff
+        self._max_delay = max_delay
+        self._attempt = 0
+        self._lost_at: Optional[float] = None
+        self._reason = ""
+
+    def disconnected(self, reason: str) -> None:
+        if self._lost_at is None:
+            self._lost_at = time.time()
+            self._reason = reason
+        self._attempt += 1
+
+    def next_delay(self, retry_ms: Optional[int]) -> float:
+        base = retry_ms / 1000 if retry_ms is not None else self._backoff
+        delay = min(self._max_delay, base * 2 ** (self._attempt - 1))
+        # equal jitter: keep half the delay, randomise the rest to spread reconnect storms
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def connected(self, event: dict) -> Optional[dict]:
+        """Return the synthetic gap event to emit before `event`, if it starts a resync."""
+        if event.get("type") != "server.connected":
+            return None
+        self._attempt = 0
+        if self._lost_at is None:
+            return None
+        gap = {
+            "type": GAP_EVENT_TYPE,
+            "properties": {
+                "disconnectedAt": self._lost_at,
+                "reconnectedAt": time.time(),
+                "reason": self._reason,
+            },
+        }
+        self._lost_at = None
+        return gap
+
+
+class _OpenCodeClientBase:
+    """Construction, retry policy and SSE plumbing shared by the sync and async wrappers."""
 
     def __init__(
         self,
@@ -40,25 +113,207 @@ class OpenCodeClient:
         retries: int = 0,
         backoff_factor: float = 0.5,
         status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+        cache: bool | ResponseCache | None = None,
+        instrumentation: Optional[instrument.Instrumentation] = None,
+        parse_mode: str = "model",
+        uds: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        stream_connections: Optional[int] = None,
+        http2: bool = False,
     ) -> None:
-        httpx_timeout = None if timeout is None else httpx.Timeout(timeout)
+        if http2:
+            require_h2()
+        if timeout is None and pool_timeout is None:
+            httpx_timeout = None
+        else:
+            httpx_timeout = httpx.Timeout(timeout, pool=timeout if pool_timeout is None else pool_timeout)
         all_headers = dict(headers or {})
         if token:
             all_headers[auth_header_name] = f"{auth_prefix} {token}".strip()
+        limits = pool_limits(max_connections, max_keepalive_connections, keepalive_expiry)
+        # in-flight requests on the request pool, and on the stream pool when streams have their own
+        self.pool_stats = PoolStats(limits.max_connections)
+        self.stream_pool_stats: Optional[PoolStats] = None
         self._client = Client(
             base_url=base_url,
             headers=all_headers,
             timeout=httpx_timeout,
             verify_ssl=verify_ssl if isinstance(verify_ssl, bool) else True,
+            httpx_args={"limits": limits, "http2": http2},
+            instrumentation=instrumentation,
+            parse_mode=parse_mode,
+            uds=uds,
+            pool_stats=self.pool_stats,
         )
+        # event streams hold their connection for as long as they are subscribed; with
+        # `stream_connections` they get a pool of their own instead of starving requests
+        self._stream_client = self._client
+        if stream_connections:
+            self.stream_pool_stats = PoolStats(stream_connections)
+            self._stream_client = evolve(
+                self._client,
+                httpx_args={
+                    "limits": pool_limits(stream_connections, stream_connections, keepalive_expiry),
+                    "http2": http2,
+                },
+                pool_stats=self.stream_pool_stats,
+            )
         self._retries = max(0, int(retries))
         self._backoff = float(backoff_factor)
         self._status_forcelist = set(status_forcelist)
+        self._cache = cache if isinstance(cache, ResponseCache) else (ResponseCache() if cache else None)
+        # the local server started by spawn(), stopped when the client is closed
+        self.server: Optional[LocalServer] = None
 
     @property
     def client(self) -> Client:
         return self._client
 
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """Response cache for read-mostly endpoints, when enabled with `cache=`."""
+        return self._cache
+
+    def _conditional_kwargs(self, module: ModuleType, directory: str | Unset, stale: Any) -> dict[str, Any]:
+        """Request kwargs for a cache miss, with the stale entry's validators when it has any."""
+        kwargs = module._get_kwargs(directory=directory)
+        if stale is not None:
+            kwargs["headers"] = stale.validators()
+        return kwargs
+
+    # ---- Internal retry helpers ----
+
+    def _is_transient(self, exc: Exception) -> bool:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response is not None and exc.response.status_code in self._status_forcelist
+        if isinstance(exc, errors.UnexpectedStatus):
+            return exc.status_code in self._status_forcelist
+        return isinstance(exc, httpx.TransportError)
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> float:
+        """Return how long to wait before retrying after `exc`, or re-raise it when out of retries."""
+        if attempt >= self._retries or not self._is_transient(exc):
+            raise exc
+        return self._backoff * (2**attempt)
+
+    # ---- Server-Sent Events (SSE) plumbing ----
+
+    def _event_request(
+        self, directory: str | Unset, decoder: SSEDecoder, event_filter: Optional[EventFilter] = None
+    ) -> tuple[dict[str, str], dict[str, Any]]:
+        headers = {"Accept": "text/event-stream"}
+        if decoder.last_event_id:
+            headers["Last-Event-ID"] = decoder.last_event_id
+        params: dict[str, Any] = {}
+        if directory is not UNSET and directory is not None:
+            params["directory"] = str(directory)
+        if event_filter is not None:
+            params.update(event_filter.params())
+            if self._cache is not None and "type" in params:
+                params["type"] = sorted(set(params["type"]) | self._cache.EVENT_TYPES)
+        return headers, params
+
+    async def _aiter_events(
+        self,
+        directory: str | Unset,
+        reconnect: bool,
+        max_reconnect_delay: float,
+        event_filter: Optional[EventFilter] = None,
+    ) -> AsyncIterator[dict]:
+        aclient = self._stream_client.get_async_httpx_client()
+        decoder = SSEDecoder()
+        state = _ReconnectState(self._backoff, max_reconnect_delay)
+        while True:
+            headers, params = self._event_request(directory, decoder, event_filter)
+            probe = instrument.stream_probe(self._client, "/event")
+            extensions = None if probe is None else probe.extensions(asynchronous=True)
+            failure: Optional[BaseException] = None
+            try:
+                async with aclient.stream("GET", "/event", headers=headers, params=params, extensions=extensions) as r:
+                    r.raise_for_status()
+                    if probe is not None:
+                        probe.opened(r.status_code)
+                    async for sse in aiter_sse(r.aiter_bytes(), decoder):
+                        if event_filter is not None and not event_filter.admits_data(sse.data):
+                            # filtered out, but the cache still has to see what invalidates it
+                            if self._cache is None or not self._cache.invalidated_by(sse.data):
+                                continue
+                        event = _decode_event(sse, probe)
+                        if event is None:
+                            continue
+                        gap = state.connected(event)
+                        if self._cache is not None:
+                            self._cache.observe(gap or event)
+                        if gap is not None:
+                            yield gap
+                        if event_filter is None or event_filter.admits(event):
+                            yield event
+                if not reconnect:
+                    return
+                state.disconnected("stream closed by server")
+            except httpx.HTTPError as e:
+                failure = e
+                if not reconnect or not self._is_transient(e):
+                    raise
+                state.disconnected(repr(e))
+            finally:
+                if probe is not None:
+                    probe.close(failure)
+            decoder.reset()
+            await asyncio.sleep(state.next_delay(decoder.retry))
+
+    def _aiter_pipeline(
+        self,
+        directory: str | Unset,
+        reconnect: bool,
+        max_reconnect_delay: float,
+        buffer: Optional[EventBuffer],
+        coalesce: Optional[PartCoalescer],
+        event_filter: Optional[EventFilter],
+    ) -> AsyncIterator[dict]:
+        events = self._aiter_events(directory, reconnect, max_reconnect_delay, event_filter)
+        if buffer is not None:
+            events = buffer.arelay(events)
+        if coalesce is not None:
+            events = coalesce.arelay(events)
+        return events
+
+
+class OpenCodeClient(_OpenCodeClientBase):
+    """High-level convenience wrapper around the generated Client.
+
+    Provides sensible defaults and a couple of helper methods, with optional retries.
+    """
+
+    @classmethod
+    def spawn(cls, server: Optional[LocalServer] = None, **kwargs: Any) -> "OpenCodeClient":
+        """Start a local `opencode serve` (or `server`) and return a client for it.
+
+        Keyword arguments are passed to the client. `close()` (or leaving the `with` block) stops the
+        server again.
+        """
+        server = (server or LocalServer()).start()
+        client = cls(base_url=server.base_url, uds=server.uds, **kwargs)
+        client.server = server
+        return client
+
+    def close(self) -> None:
+        """Close the underlying httpx.Client(s) and stop the server started by spawn()."""
+        self._client.get_httpx_client().close()
+        if self._stream_client is not self._client:
+            self._stream_client.get_httpx_client().close()
+        if self.server is not None:
+            self.server.stop()
+
+    def __enter__(self) -> "OpenCodeClient":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     # ---- Internal retry helper ----
 
     def _call_with_retries(self, fn, *args, **kwargs):
@@ -66,18 +321,27 @@ class OpenCodeClient:
         while True:
             try:
                 return fn(*args, **kwargs)
-            except httpx.RequestError:
-                pass
-            except httpx.HTTPStatusError as e:
-                if e.response is None or e.response.status_code not in self._status_forcelist:
-                    raise
-            if attempt >= self._retries:
-                # re-raise last exception if we have one
-                raise
-            sleep = self._backoff * (2**attempt)
-            time.sleep(sleep)
+            except (httpx.HTTPError, errors.UnexpectedStatus) as e:
+                delay = self._retry_delay(e, attempt)
+            time.sleep(delay)
             attempt += 1
 
+    def _cached(self, name: str, directory: str | Unset):
+        module = _endpoint(name)
+        if self._cache is None:
+            return self._call_with_retries(module.sync, client=self._client, directory=directory)
+        key = (name, None if directory is UNSET else directory)
+        value, stale = self._cache.lookup(key)
+        if value is not None:
+            return value
+        kwargs = self._conditional_kwargs(module, directory, stale)
+        cache = self._cache
+
+        def build(client: Client, response: httpx.Response) -> Any:
+            return cache.update(key, stale, response, lambda: module._parse_response(client=client, response=response))
+
+        return self._call_with_retries(instrument.send, self._client, kwargs["url"], kwargs, build)
+
     # ---- Convenience wrappers over generated endpoints ----
 
     def list_sessions(self, *, directory: str | Unset = UNSET):
@@ -85,102 +349,498 @@ class OpenCodeClient:
 
         Wraps GET /session. Pass `directory` to target a specific project/directory if needed.
         """
-        return self._call_with_retries(session_list.sync, client=self._client, directory=directory)
+        return self._call_with_retries(_endpoint("session_list").sync, client=self._client, directory=directory)
 
     def get_config(self, *, directory: str | Unset = UNSET):
         """Return opencode configuration for the current project (GET /config)."""
-        return self._call_with_retries(config_get.sync, client=self._client, directory=directory)
+        return self._cached("config_get", directory)
 
     def list_agents(self, *, directory: str | Unset = UNSET):
         """List configured agents (GET /agent)."""
-        return self._call_with_retries(app_agents.sync, client=self._client, directory=directory)
+        return self._cached("app_agents", directory)
 
     def list_projects(self, *, directory: str | Unset = UNSET):
         """List known projects (GET /project)."""
-        return self._call_with_retries(project_list.sync, client=self._client, directory=directory)
+        return self._call_with_retries(_endpoint("project_list").sync, client=self._client, directory=directory)
 
     def current_project(self, *, directory: str | Unset = UNSET):
         """Return current project (GET /project/current)."""
-        return self._call_with_retries(project_current.sync, client=self._client, directory=directory)
+        return self._call_with_retries(_endpoint("project_current").sync, client=self._client, directory=directory)
 
     def file_status(self, *, directory: str | Unset = UNSET):
         """Return file status list (GET /file/status)."""
-        return self._call_with_retries(file_status.sync, client=self._client, directory=directory)
+        return self._call_with_retries(_endpoint("file_status").sync, client=self._client, directory=directory)
 
     def get_path(self, *, directory: str | Unset = UNSET):
         """Return opencode path info (GET /path)."""
-        return self._call_with_retries(path_get.sync, client=self._client, directory=directory)
+        return self._cached("path_get", directory)
 
     def config_providers(self, *, directory: str | Unset = UNSET):
         """Return configured providers (GET /config/providers)."""
-        return self._call_with_retries(config_providers.sync, client=self._client, directory=directory)
+        return self._cached("config_providers", directory)
 
     def tool_ids(self, *, directory: str | Unset = UNSET):
         """Return tool identifiers for a provider/model pair (GET /experimental/tool)."""
-        return self._call_with_retries(tool_ids.sync, client=self._client, directory=directory)
+        return self._cached("tool_ids", directory)
 
     def list_commands(self, *, directory: str | Unset = UNSET):
         """List commands (GET /command)."""
-        return self._call_with_retries(command_list.sync, client=self._client, directory=directory)
+        return self._cached("command_list", directory)
+
+    def get_message(self, session_id: str, message_id: str, *, directory: str | Unset = UNSET):
+        """Return one message with its parts (GET /session/{id}/message/{messageID})."""
+        return self._call_with_retries(
+            _endpoint("session_message").sync, session_id, message_id, client=self._client, directory=directory
+        )
+
+    # ---- Bulk session snapshots ----
+
+    def snapshot_sessions(
+        self,
+        ids: Iterable[str],
+        *,
+        include: Sequence[str] = SNAPSHOT_PARTS,
+        concurrency: int = 16,
+        directory: str | Unset = UNSET,
+    ) -> SnapshotTable:
+        """Fetch session, children, todo and/or diff for many sessions concurrently.
+
+        Requests for every (id, part) pair run on up to `concurrency` worker threads sharing this
+        client's connection pool, each with the usual retries. A failed request does not abort the
+        others; its exception (UnexpectedStatus for a response other than 200) is stored in the row's
+        `errors` and the column is left None.
+
+            table = client.snapshot_sessions([s.id for s in client.list_sessions()], include=["session", "todo"])
+            for row in table.values():
+                print(row.id, row.session.title if row.session else row.errors)
+        """
+        table = SnapshotTable(ids, include)
+        jobs = table.jobs()
+        if not jobs:
+            return table
+        endpoints = {part: _endpoint(SNAPSHOT_ENDPOINTS[part]).sync_detailed for part in table.include}
+
+        def get(part: str, session_id: str) -> Any:
+            return _parsed(endpoints[part](session_id, client=self._client, directory=directory))
+
+        def fetch(row: SessionSnapshot, part: str) -> None:
+            try:
+                value = self._call_with_retries(get, part, row.id)
+            except Exception as e:
+                row.errors[part] = e
+            else:
+                setattr(row, part, value)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(jobs)))) as pool:
+            for future in [pool.submit(fetch, row, part) for row, part in jobs]:
+                future.result()
+        return table
+
+    # ---- Streaming message history ----
+
+    def iter_messages(
+        self, session_id: str, *, limit: float | Unset = UNSET, directory: str | Unset = UNSET
+    ) -> Iterator[SessionMessagesResponse200Item]:
+        """Yield a session's messages one at a time as GET /session/{id}/message downloads.
+
+        Each item has `info` (UserMessage or AssistantMessage) and its `parts`. The JSON array is
+        split incrementally and every element decoded on its own, so memory stays flat however long
+        the conversation is. The request is not retried once items have been yielded. With a
+        `parse_mode` of "dict" or "bytes" the items are decoded JSON or their encoded bytes.
+        """
+        from .models.session_messages_response_200_item import SessionMessagesResponse200Item
+
+        kwargs = _endpoint("session_messages")._get_kwargs(session_id, directory=directory, limit=limit)
+        probe = instrument.stream_probe(self._client, "/session/{id}/message")
+        if probe is not None:
+            kwargs["extensions"] = probe.extensions(asynchronous=False)
+        failure: Optional[BaseException] = None
+        try:
+            with self._client.get_httpx_client().stream(**kwargs) as r:
+                r.raise_for_status()
+                if probe is not None:
+                    probe.opened(r.status_code)
+                for item in iter_json_array(r.iter_bytes()):
+                    yield parsing.parse_item(self._client, item, SessionMessagesResponse200Item.from_dict, probe)
+        except Exception as e:
+            failure = e
+            raise
+        finally:
+            if probe is not None:
+                probe.close(failure)
 
     # ---- Server-Sent Events (SSE) streaming ----
 
-    def subscribe_events(self, *, directory: str | Unset = UNSET) -> Iterator[dict]:
+    def subscribe_events(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> Iterator[dict]:
         """Subscribe to /event SSE endpoint and yield parsed JSON events.
 
         This is a blocking generator which yields one event dict per message.
+
+        With `reconnect=True` the stream survives server restarts, idle proxy timeouts and network
+        errors: it reconnects with jittered exponential backoff (based on the server's `retry:` field
+        when sent, else on `backoff_factor`, capped at `max_reconnect_delay` seconds). Events sent
+        while disconnected are lost, so when the fresh `server.connected` arrives a synthetic
+        `{"type": "client.gap", ...}` event is yielded first; refetch any cached state on it.
+
+        With an EventBuffer as `buffer`, the stream is read by a background thread into it, so a slow
+        consumer does not stall the connection; see EventBuffer for the overflow policies. With a
+        PartCoalescer as `coalesce`, bursts of `message.part.updated` for the same part are collapsed
+        into their latest state.
+
+        `types` and `session_id` restrict the stream to those event types and/or to events of one
+        session (connection events always pass); see EventFilter.
         """
-        client = self._client.get_httpx_client()
-        params: dict[str, str] = {}
-        if directory is not UNSET and directory is not None:
-            params["directory"] = str(directory)
-        with client.stream("GET", "/event", headers={"Accept": "text/event-stream"}, params=params) as r:
-            r.raise_for_status()
-            buf = ""
-            for line_bytes in r.iter_lines():
-                line = line_bytes.decode("utf-8") if isinstance(line_bytes, (bytes, bytearray)) else str(line_bytes)
-                if line.startswith(":"):
-                    # comment/heartbeat
-                    continue
-                if line == "":
-                    if buf:
-                        # end of event
-                        for part in buf.split("\n"):
-                            if part.startswith("data:"):
-                                data = part[5:].strip()
-                                if data:
-                                    try:
-                                        yield httpx._models.jsonlib.loads(data)  # type: ignore[attr-defined]
-                                    except Exception:
-                                        # fall back: skip malformed
-                                        pass
-                        buf = ""
-                    continue
-                buf += line + "\n"
-
-    async def subscribe_events_async(self, *, directory: str | Unset = UNSET) -> AsyncIterator[dict]:
+        if buffer is not None or coalesce is not None:
+            events = self.subscribe_events(
+                directory=directory,
+                reconnect=reconnect,
+                max_reconnect_delay=max_reconnect_delay,
+                types=types,
+                session_id=session_id,
+            )
+            if buffer is not None:
+                events = buffer.relay(events)
+            if coalesce is not None:
+                events = coalesce.relay(events)
+            yield from events
+            return
+        event_filter = _event_filter(types, session_id)
+        client = self._stream_client.get_httpx_client()
+        decoder = SSEDecoder()
+        state = _ReconnectState(self._backoff, max_reconnect_delay)
+        while True:
+            headers, params = self._event_request(directory, decoder, event_filter)
+            probe = instrument.stream_probe(self._client, "/event")
+            extensions = None if probe is None else probe.extensions(asynchronous=False)
+            failure: Optional[BaseException] = None
+            try:
+                with client.stream("GET", "/event", headers=headers, params=params, extensions=extensions) as r:
+                    r.raise_for_status()
+                    if probe is not None:
+                        probe.opened(r.status_code)
+                    for sse in iter_sse(r.iter_bytes(), decoder):
+                        if event_filter is not None and not event_filter.admits_data(sse.data):
+                            # filtered out, but the cache still has to see what invalidates it
+                            if self._cache is None or not self._cache.invalidated_by(sse.data):
+                                continue
+                        event = _decode_event(sse, probe)
+                        if event is None:
+                            continue
+                        gap = state.connected(event)
+                        if self._cache is not None:
+                            self._cache.observe(gap or event)
+                        if gap is not None:
+                            yield gap
+                        if event_filter is None or event_filter.admits(event):
+                            yield event
+                if not reconnect:
+                    return
+                state.disconnected("stream closed by server")
+            except httpx.HTTPError as e:
+                failure = e
+                if not reconnect or not self._is_transient(e):
+                    raise
+                state.disconnected(repr(e))
+            finally:
+                if probe is not None:
+                    probe.close(failure)
+            decoder.reset()
+            time.sleep(state.next_delay(decoder.retry))
+
+    def subscribe_typed_events(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> Iterator[EventEnvelope]:
+        """Like subscribe_events, but yield EventEnvelope objects.
+
+        Each envelope exposes `type` and raw `properties` immediately; the typed model is only built
+        when `.model` is accessed.
+        """
+        for event in self.subscribe_events(
+            directory=directory,
+            reconnect=reconnect,
+            max_reconnect_delay=max_reconnect_delay,
+            buffer=buffer,
+            coalesce=coalesce,
+            types=types,
+            session_id=session_id,
+        ):
+            yield EventEnvelope(event)
+
+    async def subscribe_events_async(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[dict]:
         """Async variant of subscribe_events using httpx.AsyncClient."""
-        aclient = self._client.get_async_httpx_client()
-        params: dict[str, str] = {}
-        if directory is not UNSET and directory is not None:
-            params["directory"] = str(directory)
-        async with aclient.stream("GET", "/event", headers={"Accept": "text/event-stream"}, params=params) as r:
-            r.raise_for_status()
-            buf = ""
-            async for line_bytes in r.aiter_lines():
-                line = line_bytes
-                if line.startswith(":"):
-                    continue
-                if line == "":
-                    if buf:
-                        for part in buf.split("\n"):
-                            if part.startswith("data:"):
-                                data = part[5:].strip()
-                                if data:
-                                    try:
-                                        yield httpx._models.jsonlib.loads(data)  # type: ignore[attr-defined]
-                                    except Exception:
-                                        pass
-                        buf = ""
-                    continue
-                buf += line + "\n"
+        async for event in self._aiter_pipeline(
+            directory, reconnect, max_reconnect_delay, buffer, coalesce, _event_filter(types, session_id)
+        ):
+            yield event
+
+    async def subscribe_typed_events_async(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[EventEnvelope]:
+        """Async variant of subscribe_typed_events."""
+        async for event in self.subscribe_events_async(
+            directory=directory,
+            reconnect=reconnect,
+            max_reconnect_delay=max_reconnect_delay,
+            buffer=buffer,
+            coalesce=coalesce,
+            types=types,
+            session_id=session_id,
+        ):
+            yield EventEnvelope(event)
+
+
+class AsyncOpenCodeClient(_OpenCodeClientBase):
+    """asyncio counterpart of OpenCodeClient.
+
+    Every wrapper is a coroutine built on the generated `asyncio()` functions and retries without
+    blocking the event loop. Use it as an async context manager (or call `aclose()`) to release the
+    underlying httpx.AsyncClient:
+
+        async with AsyncOpenCodeClient() as client:
+            sessions = await client.list_sessions()
+    """
+
+    async def __aenter__(self) -> "AsyncOpenCodeClient":
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self._client.__aexit__(*args)
+        if self._stream_client is not self._client:
+            await self._stream_client.get_async_httpx_client().aclose()
+        await self._stop_server()
+
+    @classmethod
+    async def spawn(cls, server: Optional[LocalServer] = None, **kwargs: Any) -> "AsyncOpenCodeClient":
+        """Async variant of OpenCodeClient.spawn; the server is started off the event loop."""
+        server = server or LocalServer()
+        await asyncio.get_running_loop().run_in_executor(None, server.start)
+        client = cls(base_url=server.base_url, uds=server.uds, **kwargs)
+        client.server = server
+        return client
+
+    async def _stop_server(self) -> None:
+        if self.server is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.server.stop)
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx.AsyncClient(s) and stop the server started by spawn()."""
+        await self._client.get_async_httpx_client().aclose()
+        if self._stream_client is not self._client:
+            await self._stream_client.get_async_httpx_client().aclose()
+        await self._stop_server()
+
+    async def close(self) -> None:
+        """Same as aclose()."""
+        await self.aclose()
+
+    # ---- Internal retry helper ----
+
+    async def _call_with_retries(self, fn, *args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return await fn(*args, **kwargs)
+            except (httpx.HTTPError, errors.UnexpectedStatus) as e:
+                delay = self._retry_delay(e, attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _cached(self, name: str, directory: str | Unset):
+        module = _endpoint(name)
+        if self._cache is None:
+            return await self._call_with_retries(module.asyncio, client=self._client, directory=directory)
+        key = (name, None if directory is UNSET else directory)
+        value, stale = self._cache.lookup(key)
+        if value is not None:
+            return value
+        kwargs = self._conditional_kwargs(module, directory, stale)
+        cache = self._cache
+
+        def build(client: Client, response: httpx.Response) -> Any:
+            return cache.update(key, stale, response, lambda: module._parse_response(client=client, response=response))
+
+        return await self._call_with_retries(instrument.asend, self._client, kwargs["url"], kwargs, build)
+
+    # ---- Convenience wrappers over generated endpoints ----
+
+    async def list_sessions(self, *, directory: str | Unset = UNSET):
+        """Return sessions in the current project (GET /session)."""
+        return await self._call_with_retries(
+            _endpoint("session_list").asyncio, client=self._client, directory=directory
+        )
+
+    async def get_config(self, *, directory: str | Unset = UNSET):
+        """Return opencode configuration for the current project (GET /config)."""
+        return await self._cached("config_get", directory)
+
+    async def list_agents(self, *, directory: str | Unset = UNSET):
+        """List configured agents (GET /agent)."""
+        return await self._cached("app_agents", directory)
+
+    async def list_projects(self, *, directory: str | Unset = UNSET):
+        """List known projects (GET /project)."""
+        return await self._call_with_retries(
+            _endpoint("project_list").asyncio, client=self._client, directory=directory
+        )
+
+    async def current_project(self, *, directory: str | Unset = UNSET):
+        """Return current project (GET /project/current)."""
+        return await self._call_with_retries(
+            _endpoint("project_current").asyncio, client=self._client, directory=directory
+        )
+
+    async def file_status(self, *, directory: str | Unset = UNSET):
+        """Return file status list (GET /file/status)."""
+        return await self._call_with_retries(_endpoint("file_status").asyncio, client=self._client, directory=directory)
+
+    async def get_path(self, *, directory: str | Unset = UNSET):
+        """Return opencode path info (GET /path)."""
+        return await self._cached("path_get", directory)
+
+    async def config_providers(self, *, directory: str | Unset = UNSET):
+        """Return configured providers (GET /config/providers)."""
+        return await self._cached("config_providers", directory)
+
+    async def tool_ids(self, *, directory: str | Unset = UNSET):
+        """Return tool identifiers for a provider/model pair (GET /experimental/tool)."""
+        return await self._cached("tool_ids", directory)
+
+    async def list_commands(self, *, directory: str | Unset = UNSET):
+        """List commands (GET /command)."""
+        return await self._cached("command_list", directory)
+
+    async def get_message(self, session_id: str, message_id: str, *, directory: str | Unset = UNSET):
+        """Return one message with its parts (GET /session/{id}/message/{messageID})."""
+        return await self._call_with_retries(
+            _endpoint("session_message").asyncio, session_id, message_id, client=self._client, directory=directory
+        )
+
+    # ---- Bulk session snapshots ----
+
+    async def snapshot_sessions(
+        self,
+        ids: Iterable[str],
+        *,
+        include: Sequence[str] = SNAPSHOT_PARTS,
+        concurrency: int = 16,
+        directory: str | Unset = UNSET,
+    ) -> SnapshotTable:
+        """Async variant of OpenCodeClient.snapshot_sessions; at most `concurrency` requests in flight."""
+        table = SnapshotTable(ids, include)
+        endpoints = {part: _endpoint(SNAPSHOT_ENDPOINTS[part]).asyncio_detailed for part in table.include}
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def get(part: str, session_id: str) -> Any:
+            return _parsed(await endpoints[part](session_id, client=self._client, directory=directory))
+
+        async def fetch(row: SessionSnapshot, part: str) -> None:
+            async with limit:
+                try:
+                    value = await self._call_with_retries(get, part, row.id)
+                except Exception as e:
+                    row.errors[part] = e
+                else:
+                    setattr(row, part, value)
+
+        await asyncio.gather(*(fetch(row, part) for row, part in table.jobs()))
+        return table
+
+    # ---- Streaming message history ----
+
+    async def iter_messages(
+        self, session_id: str, *, limit: float | Unset = UNSET, directory: str | Unset = UNSET
+    ) -> AsyncIterator[SessionMessagesResponse200Item]:
+        """Async variant of OpenCodeClient.iter_messages."""
+        from .models.session_messages_response_200_item import SessionMessagesResponse200Item
+
+        kwargs = _endpoint("session_messages")._get_kwargs(session_id, directory=directory, limit=limit)
+        probe = instrument.stream_probe(self._client, "/session/{id}/message")
+        if probe is not None:
+            kwargs["extensions"] = probe.extensions(asynchronous=True)
+        failure: Optional[BaseException] = None
+        try:
+            async with self._client.get_async_httpx_client().stream(**kwargs) as r:
+                r.raise_for_status()
+                if probe is not None:
+                    probe.opened(r.status_code)
+                async for item in aiter_json_array(r.aiter_bytes()):
+                    yield parsing.parse_item(self._client, item, SessionMessagesResponse200Item.from_dict, probe)
+        except Exception as e:
+            failure = e
+            raise
+        finally:
+            if probe is not None:
+                probe.close(failure)
+
+    # ---- Server-Sent Events (SSE) streaming ----
+
+    async def subscribe_events(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[dict]:
+        """Subscribe to /event and yield parsed JSON events; see OpenCodeClient.subscribe_events."""
+        async for event in self._aiter_pipeline(
+            directory, reconnect, max_reconnect_delay, buffer, coalesce, _event_filter(types, session_id)
+        ):
+            yield event
+
+    async def subscribe_typed_events(
+        self,
+        *,
+        directory: str | Unset = UNSET,
+        reconnect: bool = False,
+        max_reconnect_delay: float = 30.0,
+        buffer: Optional[EventBuffer] = None,
+        coalesce: Optional[PartCoalescer] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[EventEnvelope]:
+        """Like subscribe_events, but yield lazily decoded EventEnvelope objects."""
+        async for event in self._aiter_pipeline(
+            directory, reconnect, max_reconnect_delay, buffer, coalesce, _event_filter(types, session_id)
+        ):
+            yield EventEnvelope(event)
@@ -1,194 +1,400 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
+
+Models are imported on first attribute access (PEP 562), so importing the package stays cheap.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import Agent
+    from .agent_config import AgentConfig
+    from .agent_config_permission import AgentConfigPermission
+    from .agent_config_permission_bash_type_1 import AgentConfigPermissionBashType1
+    from .agent_config_tools import AgentConfigTools
+    from .agent_model import AgentModel
+    from .agent_options import AgentOptions
+    from .agent_part import AgentPart
+    from .agent_part_input import AgentPartInput
+    from .agent_part_input_source import AgentPartInputSource
+    from .agent_part_source import AgentPartSource
+    from .agent_permission import AgentPermission
+    from .agent_permission_bash import AgentPermissionBash
+    from .agent_tools import AgentTools
+    from .api_auth import ApiAuth
+    from .assistant_message import AssistantMessage
+    from .assistant_message_path import AssistantMessagePath
+    from .assistant_message_time import AssistantMessageTime
+    from .assistant_message_tokens import AssistantMessageTokens
+    from .assistant_message_tokens_cache import AssistantMessageTokensCache
+    from .command import Command
+    from .config import Config
+    from .config_agent import ConfigAgent
+    from .config_command import ConfigCommand
+    from .config_command_additional_property import ConfigCommandAdditionalProperty
+    from .config_experimental import ConfigExperimental
+    from .config_experimental_hook import ConfigExperimentalHook
+    from .config_experimental_hook_file_edited import ConfigExperimentalHookFileEdited
+    from .config_experimental_hook_file_edited_additional_property_item import (
+        ConfigExperimentalHookFileEditedAdditionalPropertyItem,
+    )
+    from .config_experimental_hook_file_edited_additional_property_item_environment import (
+        ConfigExperimentalHookFileEditedAdditionalPropertyItemEnvironment,
+    )
+    from .config_experimental_hook_session_completed_item import ConfigExperimentalHookSessionCompletedItem
+    from .config_experimental_hook_session_completed_item_environment import (
+        ConfigExperimentalHookSessionCompletedItemEnvironment,
+    )
+    from .config_formatter import ConfigFormatter
+    from .config_formatter_additional_property import ConfigFormatterAdditionalProperty
+    from .config_formatter_additional_property_environment import ConfigFormatterAdditionalPropertyEnvironment
+    from .config_lsp import ConfigLsp
+    from .config_lsp_additional_property_type_0 import ConfigLspAdditionalPropertyType0
+    from .config_lsp_additional_property_type_1 import ConfigLspAdditionalPropertyType1
+    from .config_lsp_additional_property_type_1_env import ConfigLspAdditionalPropertyType1Env
+    from .config_lsp_additional_property_type_1_initialization import ConfigLspAdditionalPropertyType1Initialization
+    from .config_mcp import ConfigMcp
+    from .config_mode import ConfigMode
+    from .config_permission import ConfigPermission
+    from .config_permission_bash_type_1 import ConfigPermissionBashType1
+    from .config_provider import ConfigProvider
+    from .config_provider_additional_property import ConfigProviderAdditionalProperty
+    from .config_provider_additional_property_models import ConfigProviderAdditionalPropertyModels
+    from .config_provider_additional_property_models_additional_property import (
+        ConfigProviderAdditionalPropertyModelsAdditionalProperty,
+    )
+    from .config_provider_additional_property_models_additional_property_cost import (
+        ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost,
+    )
+    from .config_provider_additional_property_models_additional_property_limit import (
+        ConfigProviderAdditionalPropertyModelsAdditionalPropertyLimit,
+    )
+    from .config_provider_additional_property_models_additional_property_options import (
+        ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions,
+    )
+    from .config_provider_additional_property_models_additional_property_provider import (
+        ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider,
+    )
+    from .config_provider_additional_property_options import ConfigProviderAdditionalPropertyOptions
+    from .config_providers_response_200 import ConfigProvidersResponse200
+    from .config_providers_response_200_default import ConfigProvidersResponse200Default
+    from .config_share import ConfigShare
+    from .config_tools import ConfigTools
+    from .config_tui import ConfigTui
+    from .config_watcher import ConfigWatcher
+    from .error import Error
+    from .error_data import ErrorData
+    from .event_file_edited import EventFileEdited
+    from .event_file_edited_properties import EventFileEditedProperties
+    from .event_file_watcher_updated import EventFileWatcherUpdated
+    from .event_file_watcher_updated_properties import EventFileWatcherUpdatedProperties
+    from .event_ide_installed import EventIdeInstalled
+    from .event_ide_installed_properties import EventIdeInstalledProperties
+    from .event_installation_updated import EventInstallationUpdated
+    from .event_installation_updated_properties import EventInstallationUpdatedProperties
+    from .event_lsp_client_diagnostics import EventLspClientDiagnostics
+    from .event_lsp_client_diagnostics_properties import EventLspClientDiagnosticsProperties
+    from .event_message_part_removed import EventMessagePartRemoved
+    from .event_message_part_removed_properties import EventMessagePartRemovedProperties
+    from .event_message_part_updated import EventMessagePartUpdated
+    from .event_message_part_updated_properties import EventMessagePartUpdatedProperties
+    from .event_message_removed import EventMessageRemoved
+    from .event_message_removed_properties import EventMessageRemovedProperties
+    from .event_message_updated import EventMessageUpdated
+    from .event_message_updated_properties import EventMessageUpdatedProperties
+    from .event_permission_replied import EventPermissionReplied
+    from .event_permission_replied_properties import EventPermissionRepliedProperties
+    from .event_permission_updated import EventPermissionUpdated
+    from .event_server_connected import EventServerConnected
+    from .event_server_connected_properties import EventServerConnectedProperties
+    from .event_session_compacted import EventSessionCompacted
+    from .event_session_compacted_properties import EventSessionCompactedProperties
+    from .event_session_deleted import EventSessionDeleted
+    from .event_session_deleted_properties import EventSessionDeletedProperties
+    from .event_session_error import EventSessionError
+    from .event_session_error_properties import EventSessionErrorProperties
+    from .event_session_idle import EventSessionIdle
+    from .event_session_idle_properties import EventSessionIdleProperties
+    from .event_session_updated import EventSessionUpdated
+    from .event_session_updated_properties import EventSessionUpdatedProperties
+    from .file import File
+    from .file_content import FileContent
+    from .file_content_patch import FileContentPatch
+    from .file_content_patch_hunks_item import FileContentPatchHunksItem
+    from .file_diff import FileDiff
+    from .file_node import FileNode
+    from .file_node_type import FileNodeType
+    from .file_part import FilePart
+    from .file_part_input import FilePartInput
+    from .file_part_source_text import FilePartSourceText
+    from .file_source import FileSource
+    from .file_status import FileStatus
+    from .keybinds_config import KeybindsConfig
+    from .layout_config import LayoutConfig
+    from .mcp_local_config import McpLocalConfig
+    from .mcp_local_config_environment import McpLocalConfigEnvironment
+    from .mcp_remote_config import McpRemoteConfig
+    from .mcp_remote_config_headers import McpRemoteConfigHeaders
+    from .message_aborted_error import MessageAbortedError
+    from .message_aborted_error_data import MessageAbortedErrorData
+    from .message_output_length_error import MessageOutputLengthError
+    from .message_output_length_error_data import MessageOutputLengthErrorData
+    from .model import Model
+    from .model_cost import ModelCost
+    from .model_limit import ModelLimit
+    from .model_options import ModelOptions
+    from .model_provider import ModelProvider
+    from .o_auth import OAuth
+    from .patch_part import PatchPart
+    from .path import Path
+    from .permission import Permission
+    from .permission_metadata import PermissionMetadata
+    from .permission_time import PermissionTime
+    from .project import Project
+    from .project_time import ProjectTime
+    from .provider import Provider
+    from .provider_auth_error import ProviderAuthError
+    from .provider_auth_error_data import ProviderAuthErrorData
+    from .provider_models import ProviderModels
+    from .range_ import Range
+    from .range_end import RangeEnd
+    from .range_start import RangeStart
+    from .reasoning_part import ReasoningPart
+    from .reasoning_part_metadata import ReasoningPartMetadata
+    from .reasoning_part_time import ReasoningPartTime
+    from .session import Session
+    from .session_message_response_200 import SessionMessageResponse200
+    from .session_messages_response_200_item import SessionMessagesResponse200Item
+    from .session_revert import SessionRevert
+    from .session_share import SessionShare
+    from .session_time import SessionTime
+    from .snapshot_part import SnapshotPart
+    from .step_finish_part import StepFinishPart
+    from .step_finish_part_tokens import StepFinishPartTokens
+    from .step_finish_part_tokens_cache import StepFinishPartTokensCache
+    from .step_start_part import StepStartPart
+    from .symbol import Symbol
+    from .symbol_location import SymbolLocation
+    from .symbol_source import SymbolSource
+    from .text_part import TextPart
+    from .text_part_input import TextPartInput
+    from .text_part_input_time import TextPartInputTime
+    from .text_part_time import TextPartTime
+    from .todo import Todo
+    from .tool_list_item import ToolListItem
+    from .tool_part import ToolPart
+    from .tool_state_completed import ToolStateCompleted
+    from .tool_state_completed_input import ToolStateCompletedInput
+    from .tool_state_completed_metadata import ToolStateCompletedMetadata
+    from .tool_state_completed_time import ToolStateCompletedTime
+    from .tool_state_error import ToolStateError
+    from .tool_state_error_input import ToolStateErrorInput
+    from .tool_state_error_metadata import ToolStateErrorMetadata
+    from .tool_state_error_time import ToolStateErrorTime
+    from .tool_state_pending import ToolStatePending
+    from .tool_state_running import ToolStateRunning
+    from .tool_state_running_metadata import ToolStateRunningMetadata
+    from .tool_state_running_time import ToolStateRunningTime
+    from .unknown_error import UnknownError
+    from .unknown_error_data import UnknownErrorData
+    from .user_message import UserMessage
+    from .user_message_time import UserMessageTime
+    from .well_known_auth import WellKnownAuth
+
+# model name -> defining module
+_MODULES = {
+    "Agent": "agent",
+    "AgentConfig": "agent_config",
+    "AgentConfigPermission": "agent_config_permission",
+    "AgentConfigPermissionBashType1": "agent_config_permission_bash_type_1",
+    "AgentConfigTools": "agent_config_tools",
+    "AgentModel": "agent_model",
+    "AgentOptions": "agent_options",
+    "AgentPart": "agent_part",
+    "AgentPartInput": "agent_part_input",
+    "AgentPartInputSource": "agent_part_input_source",
+    "AgentPartSource": "agent_part_source",
+    "AgentPermission": "agent_permission",
+    "AgentPermissionBash": "agent_permission_bash",
+    "AgentTools": "agent_tools",
+    "ApiAuth": "api_auth",
+    "AssistantMessage": "assistant_message",
+    "AssistantMessagePath": "assistant_message_path",
+    "AssistantMessageTime": "assistant_message_time",
+    "AssistantMessageTokens": "assistant_message_tokens",
+    "AssistantMessageTokensCache": "assistant_message_tokens_cache",
+    "Command": "command",
+    "Config": "config",
+    "ConfigAgent": "config_agent",
+    "ConfigCommand": "config_command",
+    "ConfigCommandAdditionalProperty": "config_command_additional_property",
+    "ConfigExperimental": "config_experimental",
+    "ConfigExperimentalHook": "config_experimental_hook",
+    "ConfigExperimentalHookFileEdited": "config_experimental_hook_file_edited",
+    "ConfigExperimentalHookFileEditedAdditionalPropertyItem": "config_experimental_hook_file_edited_additional_property_item",
+    "ConfigExperimentalHookFileEditedAdditionalPropertyItemEnvironment": "config_experimental_hook_file_edited_additional_property_item_environment",
+    "ConfigExperimentalHookSessionCompletedItem": "config_experimental_hook_session_completed_item",
+    "ConfigExperimentalHookSessionCompletedItemEnvironment": "config_experimental_hook_session_completed_item_environment",
+    "ConfigFormatter": "config_formatter",
+    "ConfigFormatterAdditionalProperty": "config_formatter_additional_property",
+    "ConfigFormatterAdditionalPropertyEnvironment": "config_formatter_additional_property_environment",
+    "ConfigLsp": "config_lsp",
+    "ConfigLspAdditionalPropertyType0": "config_lsp_additional_property_type_0",
+    "ConfigLspAdditionalPropertyType1": "config_lsp_additional_property_type_1",
+    "ConfigLspAdditionalPropertyType1Env": "config_lsp_additional_property_type_1_env",
+    "ConfigLspAdditionalPropertyType1Initialization": "config_lsp_additional_property_type_1_initialization",
+    "ConfigMcp": "config_mcp",
+    "ConfigMode": "config_mode",
+    "ConfigPermission": "config_permission",
+    "ConfigPermissionBashType1": "config_permission_bash_type_1",
+    "ConfigProvider": "config_provider",
+    "ConfigProviderAdditionalProperty": "config_provider_additional_property",
+    "ConfigProviderAdditionalPropertyModels": "config_provider_additional_property_models",
+    "ConfigProviderAdditionalPropertyModelsAdditionalProperty": "config_provider_additional_property_models_additional_property",
+    "ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost": "config_provider_additional_property_models_additional_property_cost",
+    "ConfigProviderAdditionalPropertyModelsAdditionalPropertyLimit": "config_provider_additional_property_models_additional_property_limit",
+    "ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions": "config_provider_additional_property_models_additional_property_options",
+    "ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider": "config_provider_additional_property_models_additional_property_provider",
+    "ConfigProviderAdditionalPropertyOptions": "config_provider_additional_property_options",
+    "ConfigProvidersResponse200": "config_providers_response_200",
+    "ConfigProvidersResponse200Default": "config_providers_response_200_default",
+    "ConfigShare": "config_share",
+    "ConfigTools": "config_tools",
+    "ConfigTui": "config_tui",
+    "ConfigWatcher": "config_watcher",
+    "Error": "error",
+    "ErrorData": "error_data",
+    "EventFileEdited": "event_file_edited",
+    "EventFileEditedProperties": "event_file_edited_properties",
+    "EventFileWatcherUpdated": "event_file_watcher_updated",
+    "EventFileWatcherUpdatedProperties": "event_file_watcher_updated_properties",
+    "EventIdeInstalled": "event_ide_installed",
+    "EventIdeInstalledProperties": "event_ide_installed_properties",
+    "EventInstallationUpdated": "event_installation_updated",
+    "EventInstallationUpdatedProperties": "event_installation_updated_properties",
+    "EventLspClientDiagnostics": "event_lsp_client_diagnostics",
+    "EventLspClientDiagnosticsProperties": "event_lsp_client_diagnostics_properties",
+    "EventMessagePartRemoved": "event_message_part_removed",
+    "EventMessagePartRemovedProperties": "event_message_part_removed_properties",
+    "EventMessagePartUpdated": "event_message_part_updated",
+    "EventMessagePartUpdatedProperties": "event_message_part_updated_properties",
+    "EventMessageRemoved": "event_message_removed",
+    "EventMessageRemovedProperties": "event_message_removed_properties",
+    "EventMessageUpdated": "event_message_updated",
+    "EventMessageUpdatedProperties": "event_message_updated_properties",
+    "EventPermissionReplied": "event_permission_replied",
+    "EventPermissionRepliedProperties": "event_permission_replied_properties",
+    "EventPermissionUpdated": "event_permission_updated",
+    "EventServerConnected": "event_server_connected",
+    "EventServerConnectedProperties": "event_server_connected_properties",
+    "EventSessionCompacted": "event_session_compacted",
+    "EventSessionCompactedProperties": "event_session_compacted_properties",
+    "EventSessionDeleted": "event_session_deleted",
+    "EventSessionDeletedProperties": "event_session_deleted_properties",
+    "EventSessionError": "event_session_error",
+    "EventSessionErrorProperties": "event_session_error_properties",
+    "EventSessionIdle": "event_session_idle",
+    "EventSessionIdleProperties": "event_session_idle_properties",
+    "EventSessionUpdated": "event_session_updated",
+    "EventSessionUpdatedProperties": "event_session_updated_properties",
+    "File": "file",
+    "FileContent": "file_content",
+    "FileContentPatch": "file_content_patch",
+    "FileContentPatchHunksItem": "file_content_patch_hunks_item",
+    "FileDiff": "file_diff",
+    "FileNode": "file_node",
+    "FileNodeType": "file_node_type",
+    "FilePart": "file_part",
+    "FilePartInput": "file_part_input",
+    "FilePartSourceText": "file_part_source_text",
+    "FileSource": "file_source",
+    "FileStatus": "file_status",
+    "KeybindsConfig": "keybinds_config",
+    "LayoutConfig": "layout_config",
+    "McpLocalConfig": "mcp_local_config",
+    "McpLocalConfigEnvironment": "mcp_local_config_environment",
+    "McpRemoteConfig": "mcp_remote_config",
+    "McpRemoteConfigHeaders": "mcp_remote_config_headers",
+    "MessageAbortedError": "message_aborted_error",
+    "MessageAbortedErrorData": "message_aborted_error_data",
+    "MessageOutputLengthError": "message_output_length_error",
+    "MessageOutputLengthErrorData": "message_output_length_error_data",
+    "Model": "model",
+    "ModelCost": "model_cost",
+    "ModelLimit": "model_limit",
+    "ModelOptions": "model_options",
+    "ModelProvider": "model_provider",
+    "OAuth": "o_auth",
+    "PatchPart": "patch_part",
+    "Path": "path",
+    "Permission": "permission",
+    "PermissionMetadata": "permission_metadata",
+    "PermissionTime": "permission_time",
+    "Project": "project",
+    "ProjectTime": "project_time",
+    "Provider": "provider",
+    "ProviderAuthError": "provider_auth_error",
+    "ProviderAuthErrorData": "provider_auth_error_data",
+    "ProviderModels": "provider_models",
+    "Range": "range_",
+    "RangeEnd": "range_end",
+    "RangeStart": "range_start",
+    "ReasoningPart": "reasoning_part",
+    "ReasoningPartMetadata": "reasoning_part_metadata",
+    "ReasoningPartTime": "reasoning_part_time",
+    "Session": "session",
+    "SessionMessageResponse200": "session_message_response_200",
+    "SessionMessagesResponse200Item": "session_messages_response_200_item",
+    "SessionRevert": "session_revert",
+    "SessionShare": "session_share",
+    "SessionTime": "session_time",
+    "SnapshotPart": "snapshot_part",
+    "StepFinishPart": "step_finish_part",
+    "StepFinishPartTokens": "step_finish_part_tokens",
+    "StepFinishPartTokensCache": "step_finish_part_tokens_cache",
+    "StepStartPart": "step_start_part",
+    "Symbol": "symbol",
+    "SymbolLocation": "symbol_location",
+    "SymbolSource": "symbol_source",
+    "TextPart": "text_part",
+    "TextPartInput": "text_part_input",
+    "TextPartInputTime": "text_part_input_time",
+    "TextPartTime": "text_part_time",
+    "Todo": "todo",
+    "ToolListItem": "tool_list_item",
+    "ToolPart": "tool_part",
+    "ToolStateCompleted": "tool_state_completed",
+    "ToolStateCompletedInput": "tool_state_completed_input",
+    "ToolStateCompletedMetadata": "tool_state_completed_metadata",
+    "ToolStateCompletedTime": "tool_state_completed_time",
+    "ToolStateError": "tool_state_error",
+    "ToolStateErrorInput": "tool_state_error_input",
+    "ToolStateErrorMetadata": "tool_state_error_metadata",
+    "ToolStateErrorTime": "tool_state_error_time",
+    "ToolStatePending": "tool_state_pending",
+    "ToolStateRunning": "tool_state_running",
+    "ToolStateRunningMetadata": "tool_state_running_metadata",
+    "ToolStateRunningTime": "tool_state_running_time",
+    "UnknownError": "unknown_error",
+    "UnknownErrorData": "unknown_error_data",
+    "UserMessage": "user_message",
+    "UserMessageTime": "user_message_time",
+    "WellKnownAuth": "well_known_auth",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODULES})
 
-from .agent import Agent
-from .agent_config import AgentConfig
-from .agent_config_permission import AgentConfigPermission
-from .agent_config_permission_bash_type_1 import AgentConfigPermissionBashType1
-from .agent_config_tools import AgentConfigTools
-from .agent_model import AgentModel
-from .agent_options import AgentOptions
-from .agent_part import AgentPart
-from .agent_part_input import AgentPartInput
-from .agent_part_input_source import AgentPartInputSource
-from .agent_part_source import AgentPartSource
-from .agent_permission import AgentPermission
-from .agent_permission_bash import AgentPermissionBash
-from .agent_tools import AgentTools
-from .api_auth import ApiAuth
-from .assistant_message import AssistantMessage
-from .assistant_message_path import AssistantMessagePath
-from .assistant_message_time import AssistantMessageTime
-from .assistant_message_tokens import AssistantMessageTokens
-from .assistant_message_tokens_cache import AssistantMessageTokensCache
-from .command import Command
-from .config import Config
-from .config_agent import ConfigAgent
-from .config_command import ConfigCommand
-from .config_command_additional_property import ConfigCommandAdditionalProperty
-from .config_experimental import ConfigExperimental
-from .config_experimental_hook import ConfigExperimentalHook
-from .config_experimental_hook_file_edited import ConfigExperimentalHookFileEdited
-from .config_experimental_hook_file_edited_additional_property_item import (
-    ConfigExperimentalHookFileEditedAdditionalPropertyItem,
-)
-from .config_experimental_hook_file_edited_additional_property_item_environment import (
-    ConfigExperimentalHookFileEditedAdditionalPropertyItemEnvironment,
-)
-from .config_experimental_hook_session_completed_item import ConfigExperimentalHookSessionCompletedItem
-from .config_experimental_hook_session_completed_item_environment import (
-    ConfigExperimentalHookSessionCompletedItemEnvironment,
-)
-from .config_formatter import ConfigFormatter
-from .config_formatter_additional_property import ConfigFormatterAdditionalProperty
-from .config_formatter_additional_property_environment import ConfigFormatterAdditionalPropertyEnvironment
-from .config_lsp import ConfigLsp
-from .config_lsp_additional_property_type_0 import ConfigLspAdditionalPropertyType0
-from .config_lsp_additional_property_type_1 import ConfigLspAdditionalPropertyType1
-from .config_lsp_additional_property_type_1_env import ConfigLspAdditionalPropertyType1Env
-from .config_lsp_additional_property_type_1_initialization import ConfigLspAdditionalPropertyType1Initialization
-from .config_mcp import ConfigMcp
-from .config_mode import ConfigMode
-from .config_permission import ConfigPermission
-from .config_permission_bash_type_1 import ConfigPermissionBashType1
-from .config_provider import ConfigProvider
-from .config_provider_additional_property import ConfigProviderAdditionalProperty
-from .config_provider_additional_property_models import ConfigProviderAdditionalPropertyModels
-from .config_provider_additional_property_models_additional_property import (
-    ConfigProviderAdditionalPropertyModelsAdditionalProperty,
-)
-from .config_provider_additional_property_models_additional_property_cost import (
-    ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost,
-)
-from .config_provider_additional_property_models_additional_property_limit import (
-    ConfigProviderAdditionalPropertyModelsAdditionalPropertyLimit,
-)
-from .config_provider_additional_property_models_additional_property_options import (
-    ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions,
-)
-from .config_provider_additional_property_models_additional_property_provider import (
-    ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider,
-)
-from .config_provider_additional_property_options import ConfigProviderAdditionalPropertyOptions
-from .config_providers_response_200 import ConfigProvidersResponse200
-from .config_providers_response_200_default import ConfigProvidersResponse200Default
-from .config_share import ConfigShare
-from .config_tools import ConfigTools
-from .config_tui import ConfigTui
-from .config_watcher import ConfigWatcher
-from .error import Error
-from .error_data import ErrorData
-from .event_file_edited import EventFileEdited
-from .event_file_edited_properties import EventFileEditedProperties
-from .event_file_watcher_updated import EventFileWatcherUpdated
-from .event_file_watcher_updated_properties import EventFileWatcherUpdatedProperties
-from .event_ide_installed import EventIdeInstalled
-from .event_ide_installed_properties import EventIdeInstalledProperties
-from .event_installation_updated import EventInstallationUpdated
-from .event_installation_updated_properties import EventInstallationUpdatedProperties
-from .event_lsp_client_diagnostics import EventLspClientDiagnostics
-from .event_lsp_client_diagnostics_properties import EventLspClientDiagnosticsProperties
-from .event_message_part_removed import EventMessagePartRemoved
-from .event_message_part_removed_properties import EventMessagePartRemovedProperties
-from .event_message_part_updated import EventMessagePartUpdated
-from .event_message_part_updated_properties import EventMessagePartUpdatedProperties
-from .event_message_removed import EventMessageRemoved
-from .event_message_removed_properties import EventMessageRemovedProperties
-from .event_message_updated import EventMessageUpdated
-from .event_message_updated_properties import EventMessageUpdatedProperties
-from .event_permission_replied import EventPermissionReplied
-from .event_permission_replied_properties import EventPermissionRepliedProperties
-from .event_permission_updated import EventPermissionUpdated
-from .event_server_connected import EventServerConnected
-from .event_server_connected_properties import EventServerConnectedProperties
-from .event_session_compacted import EventSessionCompacted
-from .event_session_compacted_properties import EventSessionCompactedProperties
-from .event_session_deleted import EventSessionDeleted
-from .event_session_deleted_properties import EventSessionDeletedProperties
-from .event_session_error import EventSessionError
-from .event_session_error_properties import EventSessionErrorProperties
-from .event_session_idle import EventSessionIdle
-from .event_session_idle_properties import EventSessionIdleProperties
-from .event_session_updated import EventSessionUpdated
-from .event_session_updated_properties import EventSessionUpdatedProperties
-from .file import File
-from .file_content import FileContent
-from .file_content_patch import FileContentPatch
-from .file_content_patch_hunks_item import FileContentPatchHunksItem
-from .file_node import FileNode
-from .file_node_type import FileNodeType
-from .file_part import FilePart
-from .file_part_input import FilePartInput
-from .file_part_source_text import FilePartSourceText
-from .file_source import FileSource
-from .file_status import FileStatus
-from .keybinds_config import KeybindsConfig
-from .layout_config import LayoutConfig
-from .mcp_local_config import McpLocalConfig
-from .mcp_local_config_environment import McpLocalConfigEnvironment
-from .mcp_remote_config import McpRemoteConfig
-from .mcp_remote_config_headers import McpRemoteConfigHeaders
-from .message_aborted_error import MessageAbortedError
-from .message_aborted_error_data import MessageAbortedErrorData
-from .message_output_length_error import MessageOutputLengthError
-from .message_output_length_error_data import MessageOutputLengthErrorData
-from .model import Model
-from .model_cost import ModelCost
-from .model_limit import ModelLimit
-from .model_options import ModelOptions
-from .model_provider import ModelProvider
-from .o_auth import OAuth
-from .patch_part import PatchPart
-from .path import Path
-from .permission import Permission
-from .permission_metadata import PermissionMetadata
-from .permission_time import PermissionTime
-from .project import Project
-from .project_time import ProjectTime
-from .provider import Provider
-from .provider_auth_error import ProviderAuthError
-from .provider_auth_error_data import ProviderAuthErrorData
-from .provider_models import ProviderModels
-from .range_ import Range
-from .range_end import RangeEnd
-from .range_start import RangeStart
-from .reasoning_part import ReasoningPart
-from .reasoning_part_metadata import ReasoningPartMetadata
-from .reasoning_part_time import ReasoningPartTime
-from .session import Session
-from .session_revert import SessionRevert
-from .session_share import SessionShare
-from .session_time import SessionTime
-from .snapshot_part import SnapshotPart
-from .step_finish_part import StepFinishPart
-from .step_finish_part_tokens import StepFinishPartTokens
-from .step_finish_part_tokens_cache import StepFinishPartTokensCache
-from .step_start_part import StepStartPart
-from .symbol import Symbol
-from .symbol_location import SymbolLocation
-from .symbol_source import SymbolSource
-from .text_part import TextPart
-from .text_part_input import TextPartInput
-from .text_part_input_time import TextPartInputTime
-from .text_part_time import TextPartTime
-from .tool_list_item import ToolListItem
-from .tool_part import ToolPart
-from .tool_state_completed import ToolStateCompleted
-from .tool_state_completed_input import ToolStateCompletedInput
-from .tool_state_completed_metadata import ToolStateCompletedMetadata
-from .tool_state_completed_time import ToolStateCompletedTime
-from .tool_state_error import ToolStateError
-from .tool_state_error_input import ToolStateErrorInput
-from .tool_state_error_metadata import ToolStateErrorMetadata
-from .tool_state_error_time import ToolStateErrorTime
-from .tool_state_pending import ToolStatePending
-from .tool_state_running import ToolStateRunning
-from .tool_state_running_metadata import ToolStateRunningMetadata
-from .tool_state_running_time import ToolStateRunningTime
-from .unknown_error import UnknownError
-from .unknown_error_data import UnknownErrorData
-from .user_message import UserMessage
-from .user_message_time import UserMessageTime
-from .well_known_auth import WellKnownAuth
 
 __all__ = (
     "Agent",
@@ -289,6 +495,7 @@ __all__ = (
     "FileContent",
     "FileContentPatch",
     "FileContentPatchHunksItem",
+    "FileDiff",
     "FileNode",
     "FileNodeType",
     "FilePart",
@@ -330,6 +537,8 @@ __all__ = (
     "ReasoningPartMetadata",
     "ReasoningPartTime",
     "Session",
+    "SessionMessageResponse200",
+    "SessionMessagesResponse200Item",
     "SessionRevert",
     "SessionShare",
     "SessionTime",
@@ -345,6 +554,7 @@ __all__ = (
     "TextPartInput",
     "TextPartInputTime",
     "TextPartTime",
+    "Todo",
     "ToolListItem",
     "ToolPart",
     "ToolStateCompleted",
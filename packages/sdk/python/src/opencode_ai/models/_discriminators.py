@@ -0,0 +1,140 @@
+"""Discriminator tables for the tagged unions of the opencode API
+
+Generated by scripts/postprocess.py, do not edit by hand.
+"""
+
+from collections.abc import Iterator, Mapping
+from importlib import import_module
+from typing import Any, Optional
+
+
+class Discriminator(Mapping[str, type]):
+    """Maps the const tag of a union member (``type``, ``status``, ...) to its model class
+
+    Member modules are imported on first use, so building the table is free and decoding a tagged
+    union costs one dict lookup and one ``from_dict`` instead of a try/except cascade.
+    """
+
+    __slots__ = ("key", "_members", "_classes")
+
+    def __init__(self, key: str, members: dict[str, tuple[str, str]]) -> None:
+        self.key = key
+        self._members = members
+        self._classes: dict[str, type] = {}
+
+    def __getitem__(self, tag: str) -> type:
+        cls = self._classes.get(tag)
+        if cls is None:
+            module, name = self._members[tag]
+            cls = self._classes[tag] = getattr(import_module(f"{__package__}.{module}"), name)
+        return cls
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def match(self, data: Mapping[str, Any]) -> Optional[type]:
+        """Return the member class tagged by ``data``, or None if the tag is missing or unknown"""
+        tag = data.get(self.key)
+        if not isinstance(tag, str):
+            return None
+        cls = self._classes.get(tag)
+        if cls is None and tag in self._members:
+            cls = self[tag]
+        return cls
+
+    def decode(self, data: Mapping[str, Any]) -> Any:
+        """Build the member model for ``data``
+
+        Raises:
+            ValueError: If ``data`` carries no known tag.
+        """
+        cls = self.match(data)
+        if cls is None:
+            raise ValueError(f"unknown {self.key} {data.get(self.key)!r}")
+        return cls.from_dict(data)
+
+
+CONFIG_MCP_ADDITIONAL_PROPERTY = Discriminator(
+    "type",
+    {
+        "local": ("mcp_local_config", "McpLocalConfig"),
+        "remote": ("mcp_remote_config", "McpRemoteConfig"),
+    },
+)
+
+ERROR = Discriminator(
+    "name",
+    {
+        "ProviderAuthError": ("provider_auth_error", "ProviderAuthError"),
+        "UnknownError": ("unknown_error", "UnknownError"),
+        "MessageOutputLengthError": ("message_output_length_error", "MessageOutputLengthError"),
+        "MessageAbortedError": ("message_aborted_error", "MessageAbortedError"),
+    },
+)
+
+EVENT = Discriminator(
+    "type",
+    {
+        "installation.updated": ("event_installation_updated", "EventInstallationUpdated"),
+        "lsp.client.diagnostics": ("event_lsp_client_diagnostics", "EventLspClientDiagnostics"),
+        "message.updated": ("event_message_updated", "EventMessageUpdated"),
+        "message.removed": ("event_message_removed", "EventMessageRemoved"),
+        "message.part.updated": ("event_message_part_updated", "EventMessagePartUpdated"),
+        "message.part.removed": ("event_message_part_removed", "EventMessagePartRemoved"),
+        "session.compacted": ("event_session_compacted", "EventSessionCompacted"),
+        "permission.updated": ("event_permission_updated", "EventPermissionUpdated"),
+        "permission.replied": ("event_permission_replied", "EventPermissionReplied"),
+        "file.edited": ("event_file_edited", "EventFileEdited"),
+        "session.idle": ("event_session_idle", "EventSessionIdle"),
+        "session.updated": ("event_session_updated", "EventSessionUpdated"),
+        "session.deleted": ("event_session_deleted", "EventSessionDeleted"),
+        "session.error": ("event_session_error", "EventSessionError"),
+        "file.watcher.updated": ("event_file_watcher_updated", "EventFileWatcherUpdated"),
+        "server.connected": ("event_server_connected", "EventServerConnected"),
+        "ide.installed": ("event_ide_installed", "EventIdeInstalled"),
+    },
+)
+
+FILE_PART_SOURCE = Discriminator(
+    "type",
+    {
+        "file": ("file_source", "FileSource"),
+        "symbol": ("symbol_source", "SymbolSource"),
+    },
+)
+
+MESSAGE = Discriminator(
+    "role",
+    {
+        "user": ("user_message", "UserMessage"),
+        "assistant": ("assistant_message", "AssistantMessage"),
+    },
+)
+
+PART = Discriminator(
+    "type",
+    {
+        "text": ("text_part", "TextPart"),
+        "reasoning": ("reasoning_part", "ReasoningPart"),
+        "file": ("file_part", "FilePart"),
+        "tool": ("tool_part", "ToolPart"),
+        "step-start": ("step_start_part", "StepStartPart"),
+        "step-finish": ("step_finish_part", "StepFinishPart"),
+        "snapshot": ("snapshot_part", "SnapshotPart"),
+        "patch": ("patch_part", "PatchPart"),
+        "agent": ("agent_part", "AgentPart"),
+    },
+)
+
+TOOL_STATE = Discriminator(
+    "status",
+    {
+        "pending": ("tool_state_pending", "ToolStatePending"),
+        "running": ("tool_state_running", "ToolStateRunning"),
+        "completed": ("tool_state_completed", "ToolStateCompleted"),
+        "error": ("tool_state_error", "ToolStateError"),
+    },
+)
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.agent_model import AgentModel
@@ -15,6 +15,22 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Agent")
 
+_KNOWN_KEYS = frozenset(
+    (
+        "name",
+        "mode",
+        "builtIn",
+        "permission",
+        "tools",
+        "options",
+        "description",
+        "topP",
+        "temperature",
+        "model",
+        "prompt",
+    )
+)
+
 
 @_attrs_define
 class Agent:
@@ -44,7 +60,7 @@ class Agent:
     temperature: Union[Unset, float] = UNSET
     model: Union[Unset, "AgentModel"] = UNSET
     prompt: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -73,7 +89,8 @@ class Agent:
         prompt = self.prompt
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -104,8 +121,8 @@ class Agent:
         from ..models.agent_permission import AgentPermission
         from ..models.agent_tools import AgentTools
 
-        d = dict(src_dict)
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
         def _parse_mode(data: object) -> Union[Literal["all"], Literal["primary"], Literal["subagent"]]:
             mode_type_0 = cast(Literal["subagent"], data)
@@ -121,30 +138,30 @@ class Agent:
                 raise ValueError(f"mode_type_2 must match const 'all', got '{mode_type_2}'")
             return mode_type_2
 
-        mode = _parse_mode(d.pop("mode"))
+        mode = _parse_mode(d["mode"])
 
-        built_in = d.pop("builtIn")
+        built_in = d["builtIn"]
 
-        permission = AgentPermission.from_dict(d.pop("permission"))
+        permission = AgentPermission.from_dict(d["permission"])
 
-        tools = AgentTools.from_dict(d.pop("tools"))
+        tools = AgentTools.from_dict(d["tools"])
 
-        options = AgentOptions.from_dict(d.pop("options"))
+        options = AgentOptions.from_dict(d["options"])
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
-        top_p = d.pop("topP", UNSET)
+        top_p = d.get("topP", UNSET)
 
-        temperature = d.pop("temperature", UNSET)
+        temperature = d.get("temperature", UNSET)
 
-        _model = d.pop("model", UNSET)
+        _model = d.get("model", UNSET)
         model: Union[Unset, AgentModel]
         if isinstance(_model, Unset):
             model = UNSET
         else:
             model = AgentModel.from_dict(_model)
 
-        prompt = d.pop("prompt", UNSET)
+        prompt = d.get("prompt", UNSET)
 
         agent = cls(
             name=name,
@@ -160,15 +177,28 @@ class Agent:
             prompt=prompt,
         )
 
-        agent.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -177,4 +207,4 @@ class Agent:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
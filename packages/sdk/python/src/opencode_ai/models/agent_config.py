@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.agent_config_permission import AgentConfigPermission
@@ -13,6 +13,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AgentConfig")
 
+_KNOWN_KEYS = frozenset(
+    ("model", "temperature", "top_p", "prompt", "tools", "disable", "description", "mode", "permission")
+)
+
 
 @_attrs_define
 class AgentConfig:
@@ -38,7 +42,7 @@ class AgentConfig:
     description: Union[Unset, str] = UNSET
     mode: Union[Literal["all"], Literal["primary"], Literal["subagent"], Unset] = UNSET
     permission: Union[Unset, "AgentConfigPermission"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         model = self.model
@@ -68,7 +72,8 @@ class AgentConfig:
             permission = self.permission.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if model is not UNSET:
             field_dict["model"] = model
@@ -96,25 +101,25 @@ class AgentConfig:
         from ..models.agent_config_permission import AgentConfigPermission
         from ..models.agent_config_tools import AgentConfigTools
 
-        d = dict(src_dict)
-        model = d.pop("model", UNSET)
+        d = src_dict
+        model = d.get("model", UNSET)
 
-        temperature = d.pop("temperature", UNSET)
+        temperature = d.get("temperature", UNSET)
 
-        top_p = d.pop("top_p", UNSET)
+        top_p = d.get("top_p", UNSET)
 
-        prompt = d.pop("prompt", UNSET)
+        prompt = d.get("prompt", UNSET)
 
-        _tools = d.pop("tools", UNSET)
+        _tools = d.get("tools", UNSET)
         tools: Union[Unset, AgentConfigTools]
         if isinstance(_tools, Unset):
             tools = UNSET
         else:
             tools = AgentConfigTools.from_dict(_tools)
 
-        disable = d.pop("disable", UNSET)
+        disable = d.get("disable", UNSET)
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
         def _parse_mode(data: object) -> Union[Literal["all"], Literal["primary"], Literal["subagent"], Unset]:
             if isinstance(data, Unset):
@@ -132,9 +137,9 @@ class AgentConfig:
                 raise ValueError(f"mode_type_2 must match const 'all', got '{mode_type_2}'")
             return mode_type_2
 
-        mode = _parse_mode(d.pop("mode", UNSET))
+        mode = _parse_mode(d.get("mode", UNSET))
 
-        _permission = d.pop("permission", UNSET)
+        _permission = d.get("permission", UNSET)
         permission: Union[Unset, AgentConfigPermission]
         if isinstance(_permission, Unset):
             permission = UNSET
@@ -153,15 +158,28 @@ class AgentConfig:
             permission=permission,
         )
 
-        agent_config.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent_config._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent_config
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -170,4 +188,4 @@ class AgentConfig:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.agent_part_source import AgentPartSource
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AgentPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "name", "source"))
+
 
 @_attrs_define
 class AgentPart:
@@ -31,7 +33,7 @@ class AgentPart:
     type_: Literal["agent"]
     name: str
     source: Union[Unset, "AgentPartSource"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -49,7 +51,8 @@ class AgentPart:
             source = self.source.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -68,20 +71,20 @@ class AgentPart:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.agent_part_source import AgentPartSource
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["agent"], d.pop("type"))
+        type_ = cast(Literal["agent"], d["type"])
         if type_ != "agent":
             raise ValueError(f"type must match const 'agent', got '{type_}'")
 
-        name = d.pop("name")
+        name = d["name"]
 
-        _source = d.pop("source", UNSET)
+        _source = d.get("source", UNSET)
         source: Union[Unset, AgentPartSource]
         if isinstance(_source, Unset):
             source = UNSET
@@ -97,15 +100,28 @@ class AgentPart:
             source=source,
         )
 
-        agent_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -114,4 +130,4 @@ class AgentPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
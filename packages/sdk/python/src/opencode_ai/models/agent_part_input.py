@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.agent_part_input_source import AgentPartInputSource
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AgentPartInput")
 
+_KNOWN_KEYS = frozenset(("type", "name", "id", "source"))
+
 
 @_attrs_define
 class AgentPartInput:
@@ -27,7 +29,7 @@ class AgentPartInput:
     name: str
     id: Union[Unset, str] = UNSET
     source: Union[Unset, "AgentPartInputSource"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         type_ = self.type_
@@ -41,7 +43,8 @@ class AgentPartInput:
             source = self.source.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -59,16 +62,16 @@ class AgentPartInput:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.agent_part_input_source import AgentPartInputSource
 
-        d = dict(src_dict)
-        type_ = cast(Literal["agent"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["agent"], d["type"])
         if type_ != "agent":
             raise ValueError(f"type must match const 'agent', got '{type_}'")
 
-        name = d.pop("name")
+        name = d["name"]
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
-        _source = d.pop("source", UNSET)
+        _source = d.get("source", UNSET)
         source: Union[Unset, AgentPartInputSource]
         if isinstance(_source, Unset):
             source = UNSET
@@ -82,15 +85,28 @@ class AgentPartInput:
             source=source,
         )
 
-        agent_part_input.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent_part_input._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent_part_input
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -99,4 +115,4 @@ class AgentPartInput:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="AgentPartInputSource")
 
+_KNOWN_KEYS = frozenset(("value", "start", "end"))
+
 
 @_attrs_define
 class AgentPartInputSource:
@@ -19,7 +23,7 @@ class AgentPartInputSource:
     value: str
     start: int
     end: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         value = self.value
@@ -29,7 +33,8 @@ class AgentPartInputSource:
         end = self.end
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "value": value,
@@ -42,12 +47,12 @@ class AgentPartInputSource:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        value = d.pop("value")
+        d = src_dict
+        value = d["value"]
 
-        start = d.pop("start")
+        start = d["start"]
 
-        end = d.pop("end")
+        end = d["end"]
 
         agent_part_input_source = cls(
             value=value,
@@ -55,15 +60,28 @@ class AgentPartInputSource:
             end=end,
         )
 
-        agent_part_input_source.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent_part_input_source._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent_part_input_source
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -72,4 +90,4 @@ class AgentPartInputSource:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
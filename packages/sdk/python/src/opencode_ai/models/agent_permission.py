@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.agent_permission_bash import AgentPermissionBash
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AgentPermission")
 
+_KNOWN_KEYS = frozenset(("edit", "bash", "webfetch"))
+
 
 @_attrs_define
 class AgentPermission:
@@ -25,7 +27,7 @@ class AgentPermission:
     edit: Union[Literal["allow"], Literal["ask"], Literal["deny"]]
     bash: "AgentPermissionBash"
     webfetch: Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         edit: Union[Literal["allow"], Literal["ask"], Literal["deny"]]
@@ -40,7 +42,8 @@ class AgentPermission:
             webfetch = self.webfetch
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "edit": edit,
@@ -56,7 +59,7 @@ class AgentPermission:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.agent_permission_bash import AgentPermissionBash
 
-        d = dict(src_dict)
+        d = src_dict
 
         def _parse_edit(data: object) -> Union[Literal["allow"], Literal["ask"], Literal["deny"]]:
             edit_type_0 = cast(Literal["ask"], data)
@@ -72,9 +75,9 @@ class AgentPermission:
                 raise ValueError(f"edit_type_2 must match const 'deny', got '{edit_type_2}'")
             return edit_type_2
 
-        edit = _parse_edit(d.pop("edit"))
+        edit = _parse_edit(d["edit"])
 
-        bash = AgentPermissionBash.from_dict(d.pop("bash"))
+        bash = AgentPermissionBash.from_dict(d["bash"])
 
         def _parse_webfetch(data: object) -> Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset]:
             if isinstance(data, Unset):
@@ -92,7 +95,7 @@ class AgentPermission:
                 raise ValueError(f"webfetch_type_2 must match const 'deny', got '{webfetch_type_2}'")
             return webfetch_type_2
 
-        webfetch = _parse_webfetch(d.pop("webfetch", UNSET))
+        webfetch = _parse_webfetch(d.get("webfetch", UNSET))
 
         agent_permission = cls(
             edit=edit,
@@ -100,15 +103,28 @@ class AgentPermission:
             webfetch=webfetch,
         )
 
-        agent_permission.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            agent_permission._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return agent_permission
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -117,4 +133,4 @@ class AgentPermission:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
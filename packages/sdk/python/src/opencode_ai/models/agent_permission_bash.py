@@ -24,7 +24,7 @@ class AgentPermissionBash:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         agent_permission_bash = cls()
 
         additional_properties = {}
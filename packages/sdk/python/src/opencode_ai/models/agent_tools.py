@@ -21,10 +21,10 @@ class AgentTools:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         agent_tools = cls()
 
-        agent_tools.additional_properties = d
+        agent_tools.additional_properties = dict(d)
         return agent_tools
 
     @property
@@ -1,10 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..models import _discriminators
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.assistant_message_path import AssistantMessagePath
@@ -18,6 +19,24 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="AssistantMessage")
 
+_KNOWN_KEYS = frozenset(
+    (
+        "id",
+        "sessionID",
+        "role",
+        "time",
+        "system",
+        "modelID",
+        "providerID",
+        "mode",
+        "path",
+        "cost",
+        "tokens",
+        "error",
+        "summary",
+    )
+)
+
 
 @_attrs_define
 class AssistantMessage:
@@ -51,7 +70,7 @@ class AssistantMessage:
     tokens: "AssistantMessageTokens"
     error: Union["MessageAbortedError", "MessageOutputLengthError", "ProviderAuthError", "UnknownError", Unset] = UNSET
     summary: Union[Unset, bool] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.message_output_length_error import MessageOutputLengthError
@@ -95,7 +114,8 @@ class AssistantMessage:
         summary = self.summary
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -128,34 +148,38 @@ class AssistantMessage:
         from ..models.provider_auth_error import ProviderAuthError
         from ..models.unknown_error import UnknownError
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        role = cast(Literal["assistant"], d.pop("role"))
+        role = cast(Literal["assistant"], d["role"])
         if role != "assistant":
             raise ValueError(f"role must match const 'assistant', got '{role}'")
 
-        time = AssistantMessageTime.from_dict(d.pop("time"))
+        time = AssistantMessageTime.from_dict(d["time"])
 
-        system = cast(list[str], d.pop("system"))
+        system = cast(list[str], d["system"])
 
-        model_id = d.pop("modelID")
+        model_id = d["modelID"]
 
-        provider_id = d.pop("providerID")
+        provider_id = d["providerID"]
 
-        mode = d.pop("mode")
+        mode = d["mode"]
 
-        path = AssistantMessagePath.from_dict(d.pop("path"))
+        path = AssistantMessagePath.from_dict(d["path"])
 
-        cost = d.pop("cost")
+        cost = d["cost"]
 
-        tokens = AssistantMessageTokens.from_dict(d.pop("tokens"))
+        tokens = AssistantMessageTokens.from_dict(d["tokens"])
 
         def _parse_error(
             data: object,
         ) -> Union["MessageAbortedError", "MessageOutputLengthError", "ProviderAuthError", "UnknownError", Unset]:
+            if isinstance(data, dict):
+                _member = _discriminators.ERROR.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             if isinstance(data, Unset):
                 return data
             try:
@@ -188,9 +212,9 @@ class AssistantMessage:
 
             return error_type_3
 
-        error = _parse_error(d.pop("error", UNSET))
+        error = _parse_error(d.get("error", UNSET))
 
-        summary = d.pop("summary", UNSET)
+        summary = d.get("summary", UNSET)
 
         assistant_message = cls(
             id=id,
@@ -208,15 +232,28 @@ class AssistantMessage:
             summary=summary,
         )
 
-        assistant_message.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            assistant_message._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return assistant_message
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -225,4 +262,4 @@ class AssistantMessage:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="AssistantMessageTime")
 
+_KNOWN_KEYS = frozenset(("created", "completed"))
+
 
 @_attrs_define
 class AssistantMessageTime:
@@ -19,7 +21,7 @@ class AssistantMessageTime:
 
     created: float
     completed: Union[Unset, float] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         created = self.created
@@ -27,7 +29,8 @@ class AssistantMessageTime:
         completed = self.completed
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "created": created,
@@ -40,25 +43,38 @@ class AssistantMessageTime:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        created = d.pop("created")
+        d = src_dict
+        created = d["created"]
 
-        completed = d.pop("completed", UNSET)
+        completed = d.get("completed", UNSET)
 
         assistant_message_time = cls(
             created=created,
             completed=completed,
         )
 
-        assistant_message_time.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            assistant_message_time._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return assistant_message_time
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -67,4 +83,4 @@ class AssistantMessageTime:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.assistant_message_tokens_cache import AssistantMessageTokensCache
 
 
 T = TypeVar("T", bound="AssistantMessageTokens")
 
+_KNOWN_KEYS = frozenset(("input", "output", "reasoning", "cache"))
+
 
 @_attrs_define
 class AssistantMessageTokens:
@@ -25,7 +29,7 @@ class AssistantMessageTokens:
     output: float
     reasoning: float
     cache: "AssistantMessageTokensCache"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         input_ = self.input_
@@ -37,7 +41,8 @@ class AssistantMessageTokens:
         cache = self.cache.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "input": input_,
@@ -53,14 +58,14 @@ class AssistantMessageTokens:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.assistant_message_tokens_cache import AssistantMessageTokensCache
 
-        d = dict(src_dict)
-        input_ = d.pop("input")
+        d = src_dict
+        input_ = d["input"]
 
-        output = d.pop("output")
+        output = d["output"]
 
-        reasoning = d.pop("reasoning")
+        reasoning = d["reasoning"]
 
-        cache = AssistantMessageTokensCache.from_dict(d.pop("cache"))
+        cache = AssistantMessageTokensCache.from_dict(d["cache"])
 
         assistant_message_tokens = cls(
             input_=input_,
@@ -69,15 +74,28 @@ class AssistantMessageTokens:
             cache=cache,
         )
 
-        assistant_message_tokens.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            assistant_message_tokens._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return assistant_message_tokens
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -86,4 +104,4 @@ class AssistantMessageTokens:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="Command")
 
+_KNOWN_KEYS = frozenset(("name", "template", "description", "agent", "model", "subtask"))
+
 
 @_attrs_define
 class Command:
@@ -27,7 +29,7 @@ class Command:
     agent: Union[Unset, str] = UNSET
     model: Union[Unset, str] = UNSET
     subtask: Union[Unset, bool] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -43,7 +45,8 @@ class Command:
         subtask = self.subtask
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -63,18 +66,18 @@ class Command:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        template = d.pop("template")
+        template = d["template"]
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
-        agent = d.pop("agent", UNSET)
+        agent = d.get("agent", UNSET)
 
-        model = d.pop("model", UNSET)
+        model = d.get("model", UNSET)
 
-        subtask = d.pop("subtask", UNSET)
+        subtask = d.get("subtask", UNSET)
 
         command = cls(
             name=name,
@@ -85,15 +88,28 @@ class Command:
             subtask=subtask,
         )
 
-        command.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            command._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return command
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -102,4 +118,4 @@ class Command:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
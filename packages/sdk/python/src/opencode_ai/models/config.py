@@ -251,128 +251,128 @@ class Config:
         from ..models.config_watcher import ConfigWatcher
         from ..models.keybinds_config import KeybindsConfig
 
-        d = dict(src_dict)
-        schema = d.pop("$schema", UNSET)
+        d = src_dict
+        schema = d.get("$schema", UNSET)
 
-        theme = d.pop("theme", UNSET)
+        theme = d.get("theme", UNSET)
 
-        _keybinds = d.pop("keybinds", UNSET)
+        _keybinds = d.get("keybinds", UNSET)
         keybinds: Union[Unset, KeybindsConfig]
         if isinstance(_keybinds, Unset):
             keybinds = UNSET
         else:
             keybinds = KeybindsConfig.from_dict(_keybinds)
 
-        _tui = d.pop("tui", UNSET)
+        _tui = d.get("tui", UNSET)
         tui: Union[Unset, ConfigTui]
         if isinstance(_tui, Unset):
             tui = UNSET
         else:
             tui = ConfigTui.from_dict(_tui)
 
-        _command = d.pop("command", UNSET)
+        _command = d.get("command", UNSET)
         command: Union[Unset, ConfigCommand]
         if isinstance(_command, Unset):
             command = UNSET
         else:
             command = ConfigCommand.from_dict(_command)
 
-        _watcher = d.pop("watcher", UNSET)
+        _watcher = d.get("watcher", UNSET)
         watcher: Union[Unset, ConfigWatcher]
         if isinstance(_watcher, Unset):
             watcher = UNSET
         else:
             watcher = ConfigWatcher.from_dict(_watcher)
 
-        plugin = cast(list[str], d.pop("plugin", UNSET))
+        plugin = cast(list[str], d.get("plugin", UNSET))
 
-        snapshot = d.pop("snapshot", UNSET)
+        snapshot = d.get("snapshot", UNSET)
 
-        _share = d.pop("share", UNSET)
+        _share = d.get("share", UNSET)
         share: Union[Unset, ConfigShare]
         if isinstance(_share, Unset):
             share = UNSET
         else:
             share = ConfigShare(_share)
 
-        autoshare = d.pop("autoshare", UNSET)
+        autoshare = d.get("autoshare", UNSET)
 
-        autoupdate = d.pop("autoupdate", UNSET)
+        autoupdate = d.get("autoupdate", UNSET)
 
-        disabled_providers = cast(list[str], d.pop("disabled_providers", UNSET))
+        disabled_providers = cast(list[str], d.get("disabled_providers", UNSET))
 
-        model = d.pop("model", UNSET)
+        model = d.get("model", UNSET)
 
-        small_model = d.pop("small_model", UNSET)
+        small_model = d.get("small_model", UNSET)
 
-        username = d.pop("username", UNSET)
+        username = d.get("username", UNSET)
 
-        _mode = d.pop("mode", UNSET)
+        _mode = d.get("mode", UNSET)
         mode: Union[Unset, ConfigMode]
         if isinstance(_mode, Unset):
             mode = UNSET
         else:
             mode = ConfigMode.from_dict(_mode)
 
-        _agent = d.pop("agent", UNSET)
+        _agent = d.get("agent", UNSET)
         agent: Union[Unset, ConfigAgent]
         if isinstance(_agent, Unset):
             agent = UNSET
         else:
             agent = ConfigAgent.from_dict(_agent)
 
-        _provider = d.pop("provider", UNSET)
+        _provider = d.get("provider", UNSET)
         provider: Union[Unset, ConfigProvider]
         if isinstance(_provider, Unset):
             provider = UNSET
         else:
             provider = ConfigProvider.from_dict(_provider)
 
-        _mcp = d.pop("mcp", UNSET)
+        _mcp = d.get("mcp", UNSET)
         mcp: Union[Unset, ConfigMcp]
         if isinstance(_mcp, Unset):
             mcp = UNSET
         else:
             mcp = ConfigMcp.from_dict(_mcp)
 
-        _formatter = d.pop("formatter", UNSET)
+        _formatter = d.get("formatter", UNSET)
         formatter: Union[Unset, ConfigFormatter]
         if isinstance(_formatter, Unset):
             formatter = UNSET
         else:
             formatter = ConfigFormatter.from_dict(_formatter)
 
-        _lsp = d.pop("lsp", UNSET)
+        _lsp = d.get("lsp", UNSET)
         lsp: Union[Unset, ConfigLsp]
         if isinstance(_lsp, Unset):
             lsp = UNSET
         else:
             lsp = ConfigLsp.from_dict(_lsp)
 
-        instructions = cast(list[str], d.pop("instructions", UNSET))
+        instructions = cast(list[str], d.get("instructions", UNSET))
 
-        _layout = d.pop("layout", UNSET)
+        _layout = d.get("layout", UNSET)
         layout: Union[Unset, LayoutConfig]
         if isinstance(_layout, Unset):
             layout = UNSET
         else:
             layout = LayoutConfig(_layout)
 
-        _permission = d.pop("permission", UNSET)
+        _permission = d.get("permission", UNSET)
         permission: Union[Unset, ConfigPermission]
         if isinstance(_permission, Unset):
             permission = UNSET
         else:
             permission = ConfigPermission.from_dict(_permission)
 
-        _tools = d.pop("tools", UNSET)
+        _tools = d.get("tools", UNSET)
         tools: Union[Unset, ConfigTools]
         if isinstance(_tools, Unset):
             tools = UNSET
         else:
             tools = ConfigTools.from_dict(_tools)
 
-        _experimental = d.pop("experimental", UNSET)
+        _experimental = d.get("experimental", UNSET)
         experimental: Union[Unset, ConfigExperimental]
         if isinstance(_experimental, Unset):
             experimental = UNSET
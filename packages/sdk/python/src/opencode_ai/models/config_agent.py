@@ -59,22 +59,22 @@ class ConfigAgent:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.agent_config import AgentConfig
 
-        d = dict(src_dict)
-        _plan = d.pop("plan", UNSET)
+        d = src_dict
+        _plan = d.get("plan", UNSET)
         plan: Union[Unset, AgentConfig]
         if isinstance(_plan, Unset):
             plan = UNSET
         else:
             plan = AgentConfig.from_dict(_plan)
 
-        _build = d.pop("build", UNSET)
+        _build = d.get("build", UNSET)
         build: Union[Unset, AgentConfig]
         if isinstance(_build, Unset):
             build = UNSET
         else:
             build = AgentConfig.from_dict(_build)
 
-        _general = d.pop("general", UNSET)
+        _general = d.get("general", UNSET)
         general: Union[Unset, AgentConfig]
         if isinstance(_general, Unset):
             general = UNSET
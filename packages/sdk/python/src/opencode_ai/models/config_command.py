@@ -28,7 +28,7 @@ class ConfigCommand:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.config_command_additional_property import ConfigCommandAdditionalProperty
 
-        d = dict(src_dict)
+        d = src_dict
         config_command = cls()
 
         additional_properties = {}
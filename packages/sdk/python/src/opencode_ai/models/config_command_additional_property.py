@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ConfigCommandAdditionalProperty")
 
+_KNOWN_KEYS = frozenset(("template", "description", "agent", "model", "subtask"))
+
 
 @_attrs_define
 class ConfigCommandAdditionalProperty:
@@ -25,7 +27,7 @@ class ConfigCommandAdditionalProperty:
     agent: Union[Unset, str] = UNSET
     model: Union[Unset, str] = UNSET
     subtask: Union[Unset, bool] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         template = self.template
@@ -39,7 +41,8 @@ class ConfigCommandAdditionalProperty:
         subtask = self.subtask
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "template": template,
@@ -58,16 +61,16 @@ class ConfigCommandAdditionalProperty:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        template = d.pop("template")
+        d = src_dict
+        template = d["template"]
 
-        description = d.pop("description", UNSET)
+        description = d.get("description", UNSET)
 
-        agent = d.pop("agent", UNSET)
+        agent = d.get("agent", UNSET)
 
-        model = d.pop("model", UNSET)
+        model = d.get("model", UNSET)
 
-        subtask = d.pop("subtask", UNSET)
+        subtask = d.get("subtask", UNSET)
 
         config_command_additional_property = cls(
             template=template,
@@ -77,15 +80,30 @@ class ConfigCommandAdditionalProperty:
             subtask=subtask,
         )
 
-        config_command_additional_property.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_command_additional_property._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_command_additional_property
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -94,4 +112,4 @@ class ConfigCommandAdditionalProperty:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_experimental_hook import ConfigExperimentalHook
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigExperimental")
 
+_KNOWN_KEYS = frozenset(("hook", "disable_paste_summary"))
+
 
 @_attrs_define
 class ConfigExperimental:
@@ -23,7 +25,7 @@ class ConfigExperimental:
 
     hook: Union[Unset, "ConfigExperimentalHook"] = UNSET
     disable_paste_summary: Union[Unset, bool] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         hook: Union[Unset, dict[str, Any]] = UNSET
@@ -33,7 +35,8 @@ class ConfigExperimental:
         disable_paste_summary = self.disable_paste_summary
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if hook is not UNSET:
             field_dict["hook"] = hook
@@ -46,30 +49,43 @@ class ConfigExperimental:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.config_experimental_hook import ConfigExperimentalHook
 
-        d = dict(src_dict)
-        _hook = d.pop("hook", UNSET)
+        d = src_dict
+        _hook = d.get("hook", UNSET)
         hook: Union[Unset, ConfigExperimentalHook]
         if isinstance(_hook, Unset):
             hook = UNSET
         else:
             hook = ConfigExperimentalHook.from_dict(_hook)
 
-        disable_paste_summary = d.pop("disable_paste_summary", UNSET)
+        disable_paste_summary = d.get("disable_paste_summary", UNSET)
 
         config_experimental = cls(
             hook=hook,
             disable_paste_summary=disable_paste_summary,
         )
 
-        config_experimental.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_experimental._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_experimental
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -78,4 +94,4 @@ class ConfigExperimental:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_experimental_hook_file_edited import ConfigExperimentalHookFileEdited
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigExperimentalHook")
 
+_KNOWN_KEYS = frozenset(("file_edited", "session_completed"))
+
 
 @_attrs_define
 class ConfigExperimentalHook:
@@ -24,7 +26,7 @@ class ConfigExperimentalHook:
 
     file_edited: Union[Unset, "ConfigExperimentalHookFileEdited"] = UNSET
     session_completed: Union[Unset, list["ConfigExperimentalHookSessionCompletedItem"]] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         file_edited: Union[Unset, dict[str, Any]] = UNSET
@@ -39,7 +41,8 @@ class ConfigExperimentalHook:
                 session_completed.append(session_completed_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if file_edited is not UNSET:
             field_dict["file_edited"] = file_edited
@@ -53,8 +56,8 @@ class ConfigExperimentalHook:
         from ..models.config_experimental_hook_file_edited import ConfigExperimentalHookFileEdited
         from ..models.config_experimental_hook_session_completed_item import ConfigExperimentalHookSessionCompletedItem
 
-        d = dict(src_dict)
-        _file_edited = d.pop("file_edited", UNSET)
+        d = src_dict
+        _file_edited = d.get("file_edited", UNSET)
         file_edited: Union[Unset, ConfigExperimentalHookFileEdited]
         if isinstance(_file_edited, Unset):
             file_edited = UNSET
@@ -62,7 +65,7 @@ class ConfigExperimentalHook:
             file_edited = ConfigExperimentalHookFileEdited.from_dict(_file_edited)
 
         session_completed = []
-        _session_completed = d.pop("session_completed", UNSET)
+        _session_completed = d.get("session_completed", UNSET)
         for session_completed_item_data in _session_completed or []:
             session_completed_item = ConfigExperimentalHookSessionCompletedItem.from_dict(session_completed_item_data)
 
@@ -73,15 +76,28 @@ class ConfigExperimentalHook:
             session_completed=session_completed,
         )
 
-        config_experimental_hook.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_experimental_hook._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_experimental_hook
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -90,4 +106,4 @@ class ConfigExperimentalHook:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
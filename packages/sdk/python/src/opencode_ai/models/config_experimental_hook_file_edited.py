@@ -37,7 +37,7 @@ class ConfigExperimentalHookFileEdited:
             ConfigExperimentalHookFileEditedAdditionalPropertyItem,
         )
 
-        d = dict(src_dict)
+        d = src_dict
         config_experimental_hook_file_edited = cls()
 
         additional_properties = {}
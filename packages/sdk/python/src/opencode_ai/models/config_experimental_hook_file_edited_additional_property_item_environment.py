@@ -21,10 +21,10 @@ class ConfigExperimentalHookFileEditedAdditionalPropertyItemEnvironment:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_experimental_hook_file_edited_additional_property_item_environment = cls()
 
-        config_experimental_hook_file_edited_additional_property_item_environment.additional_properties = d
+        config_experimental_hook_file_edited_additional_property_item_environment.additional_properties = dict(d)
         return config_experimental_hook_file_edited_additional_property_item_environment
 
     @property
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_experimental_hook_session_completed_item_environment import (
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigExperimentalHookSessionCompletedItem")
 
+_KNOWN_KEYS = frozenset(("command", "environment"))
+
 
 @_attrs_define
 class ConfigExperimentalHookSessionCompletedItem:
@@ -25,7 +27,7 @@ class ConfigExperimentalHookSessionCompletedItem:
 
     command: list[str]
     environment: Union[Unset, "ConfigExperimentalHookSessionCompletedItemEnvironment"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         command = self.command
@@ -35,7 +37,8 @@ class ConfigExperimentalHookSessionCompletedItem:
             environment = self.environment.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "command": command,
@@ -52,10 +55,10 @@ class ConfigExperimentalHookSessionCompletedItem:
             ConfigExperimentalHookSessionCompletedItemEnvironment,
         )
 
-        d = dict(src_dict)
-        command = cast(list[str], d.pop("command"))
+        d = src_dict
+        command = cast(list[str], d["command"])
 
-        _environment = d.pop("environment", UNSET)
+        _environment = d.get("environment", UNSET)
         environment: Union[Unset, ConfigExperimentalHookSessionCompletedItemEnvironment]
         if isinstance(_environment, Unset):
             environment = UNSET
@@ -67,15 +70,30 @@ class ConfigExperimentalHookSessionCompletedItem:
             environment=environment,
         )
 
-        config_experimental_hook_session_completed_item.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_experimental_hook_session_completed_item._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_experimental_hook_session_completed_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -84,4 +102,4 @@ class ConfigExperimentalHookSessionCompletedItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -21,10 +21,10 @@ class ConfigExperimentalHookSessionCompletedItemEnvironment:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_experimental_hook_session_completed_item_environment = cls()
 
-        config_experimental_hook_session_completed_item_environment.additional_properties = d
+        config_experimental_hook_session_completed_item_environment.additional_properties = dict(d)
         return config_experimental_hook_session_completed_item_environment
 
     @property
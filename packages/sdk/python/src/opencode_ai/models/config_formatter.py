@@ -28,7 +28,7 @@ class ConfigFormatter:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.config_formatter_additional_property import ConfigFormatterAdditionalProperty
 
-        d = dict(src_dict)
+        d = src_dict
         config_formatter = cls()
 
         additional_properties = {}
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_formatter_additional_property_environment import ConfigFormatterAdditionalPropertyEnvironment
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigFormatterAdditionalProperty")
 
+_KNOWN_KEYS = frozenset(("disabled", "command", "environment", "extensions"))
+
 
 @_attrs_define
 class ConfigFormatterAdditionalProperty:
@@ -27,7 +29,7 @@ class ConfigFormatterAdditionalProperty:
     command: Union[Unset, list[str]] = UNSET
     environment: Union[Unset, "ConfigFormatterAdditionalPropertyEnvironment"] = UNSET
     extensions: Union[Unset, list[str]] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         disabled = self.disabled
@@ -45,7 +47,8 @@ class ConfigFormatterAdditionalProperty:
             extensions = self.extensions
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if disabled is not UNSET:
             field_dict["disabled"] = disabled
@@ -64,19 +67,19 @@ class ConfigFormatterAdditionalProperty:
             ConfigFormatterAdditionalPropertyEnvironment,
         )
 
-        d = dict(src_dict)
-        disabled = d.pop("disabled", UNSET)
+        d = src_dict
+        disabled = d.get("disabled", UNSET)
 
-        command = cast(list[str], d.pop("command", UNSET))
+        command = cast(list[str], d.get("command", UNSET))
 
-        _environment = d.pop("environment", UNSET)
+        _environment = d.get("environment", UNSET)
         environment: Union[Unset, ConfigFormatterAdditionalPropertyEnvironment]
         if isinstance(_environment, Unset):
             environment = UNSET
         else:
             environment = ConfigFormatterAdditionalPropertyEnvironment.from_dict(_environment)
 
-        extensions = cast(list[str], d.pop("extensions", UNSET))
+        extensions = cast(list[str], d.get("extensions", UNSET))
 
         config_formatter_additional_property = cls(
             disabled=disabled,
@@ -85,15 +88,30 @@ class ConfigFormatterAdditionalProperty:
             extensions=extensions,
         )
 
-        config_formatter_additional_property.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_formatter_additional_property._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_formatter_additional_property
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -102,4 +120,4 @@ class ConfigFormatterAdditionalProperty:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -21,10 +21,10 @@ class ConfigFormatterAdditionalPropertyEnvironment:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_formatter_additional_property_environment = cls()
 
-        config_formatter_additional_property_environment.additional_properties = d
+        config_formatter_additional_property_environment.additional_properties = dict(d)
         return config_formatter_additional_property_environment
 
     @property
@@ -37,7 +37,7 @@ class ConfigLsp:
         from ..models.config_lsp_additional_property_type_0 import ConfigLspAdditionalPropertyType0
         from ..models.config_lsp_additional_property_type_1 import ConfigLspAdditionalPropertyType1
 
-        d = dict(src_dict)
+        d = src_dict
         config_lsp = cls()
 
         additional_properties = {}
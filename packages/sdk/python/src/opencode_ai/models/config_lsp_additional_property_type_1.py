@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_lsp_additional_property_type_1_env import ConfigLspAdditionalPropertyType1Env
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigLspAdditionalPropertyType1")
 
+_KNOWN_KEYS = frozenset(("command", "extensions", "disabled", "env", "initialization"))
+
 
 @_attrs_define
 class ConfigLspAdditionalPropertyType1:
@@ -32,7 +34,7 @@ class ConfigLspAdditionalPropertyType1:
     disabled: Union[Unset, bool] = UNSET
     env: Union[Unset, "ConfigLspAdditionalPropertyType1Env"] = UNSET
     initialization: Union[Unset, "ConfigLspAdditionalPropertyType1Initialization"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         command = self.command
@@ -52,7 +54,8 @@ class ConfigLspAdditionalPropertyType1:
             initialization = self.initialization.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "command": command,
@@ -76,21 +79,21 @@ class ConfigLspAdditionalPropertyType1:
             ConfigLspAdditionalPropertyType1Initialization,
         )
 
-        d = dict(src_dict)
-        command = cast(list[str], d.pop("command"))
+        d = src_dict
+        command = cast(list[str], d["command"])
 
-        extensions = cast(list[str], d.pop("extensions", UNSET))
+        extensions = cast(list[str], d.get("extensions", UNSET))
 
-        disabled = d.pop("disabled", UNSET)
+        disabled = d.get("disabled", UNSET)
 
-        _env = d.pop("env", UNSET)
+        _env = d.get("env", UNSET)
         env: Union[Unset, ConfigLspAdditionalPropertyType1Env]
         if isinstance(_env, Unset):
             env = UNSET
         else:
             env = ConfigLspAdditionalPropertyType1Env.from_dict(_env)
 
-        _initialization = d.pop("initialization", UNSET)
+        _initialization = d.get("initialization", UNSET)
         initialization: Union[Unset, ConfigLspAdditionalPropertyType1Initialization]
         if isinstance(_initialization, Unset):
             initialization = UNSET
@@ -105,15 +108,30 @@ class ConfigLspAdditionalPropertyType1:
             initialization=initialization,
         )
 
-        config_lsp_additional_property_type_1.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_lsp_additional_property_type_1._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_lsp_additional_property_type_1
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -122,4 +140,4 @@ class ConfigLspAdditionalPropertyType1:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
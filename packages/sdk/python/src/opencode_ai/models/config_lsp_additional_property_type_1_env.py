@@ -21,10 +21,10 @@ class ConfigLspAdditionalPropertyType1Env:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_lsp_additional_property_type_1_env = cls()
 
-        config_lsp_additional_property_type_1_env.additional_properties = d
+        config_lsp_additional_property_type_1_env.additional_properties = dict(d)
         return config_lsp_additional_property_type_1_env
 
     @property
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models import _discriminators
+
 if TYPE_CHECKING:
     from ..models.mcp_local_config import McpLocalConfig
     from ..models.mcp_remote_config import McpRemoteConfig
@@ -37,13 +39,17 @@ class ConfigMcp:
         from ..models.mcp_local_config import McpLocalConfig
         from ..models.mcp_remote_config import McpRemoteConfig
 
-        d = dict(src_dict)
+        d = src_dict
         config_mcp = cls()
 
         additional_properties = {}
         for prop_name, prop_dict in d.items():
 
             def _parse_additional_property(data: object) -> Union["McpLocalConfig", "McpRemoteConfig"]:
+                if isinstance(data, dict):
+                    _member = _discriminators.CONFIG_MCP_ADDITIONAL_PROPERTY.match(data)
+                    if _member is not None:
+                        return _member.from_dict(data)
                 try:
                     if not isinstance(data, dict):
                         raise TypeError()
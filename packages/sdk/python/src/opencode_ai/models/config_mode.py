@@ -51,15 +51,15 @@ class ConfigMode:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.agent_config import AgentConfig
 
-        d = dict(src_dict)
-        _build = d.pop("build", UNSET)
+        d = src_dict
+        _build = d.get("build", UNSET)
         build: Union[Unset, AgentConfig]
         if isinstance(_build, Unset):
             build = UNSET
         else:
             build = AgentConfig.from_dict(_build)
 
-        _plan = d.pop("plan", UNSET)
+        _plan = d.get("plan", UNSET)
         plan: Union[Unset, AgentConfig]
         if isinstance(_plan, Unset):
             plan = UNSET
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_permission_bash_type_1 import ConfigPermissionBashType1
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigPermission")
 
+_KNOWN_KEYS = frozenset(("edit", "bash", "webfetch"))
+
 
 @_attrs_define
 class ConfigPermission:
@@ -25,7 +27,7 @@ class ConfigPermission:
     edit: Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset] = UNSET
     bash: Union["ConfigPermissionBashType1", Literal["allow"], Literal["ask"], Literal["deny"], Unset] = UNSET
     webfetch: Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.config_permission_bash_type_1 import ConfigPermissionBashType1
@@ -51,7 +53,8 @@ class ConfigPermission:
             webfetch = self.webfetch
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if edit is not UNSET:
             field_dict["edit"] = edit
@@ -66,7 +69,7 @@ class ConfigPermission:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.config_permission_bash_type_1 import ConfigPermissionBashType1
 
-        d = dict(src_dict)
+        d = src_dict
 
         def _parse_edit(data: object) -> Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset]:
             if isinstance(data, Unset):
@@ -84,7 +87,7 @@ class ConfigPermission:
                 raise ValueError(f"edit_type_2 must match const 'deny', got '{edit_type_2}'")
             return edit_type_2
 
-        edit = _parse_edit(d.pop("edit", UNSET))
+        edit = _parse_edit(d.get("edit", UNSET))
 
         def _parse_bash(
             data: object,
@@ -109,7 +112,7 @@ class ConfigPermission:
 
             return bash_type_1
 
-        bash = _parse_bash(d.pop("bash", UNSET))
+        bash = _parse_bash(d.get("bash", UNSET))
 
         def _parse_webfetch(data: object) -> Union[Literal["allow"], Literal["ask"], Literal["deny"], Unset]:
             if isinstance(data, Unset):
@@ -127,7 +130,7 @@ class ConfigPermission:
                 raise ValueError(f"webfetch_type_2 must match const 'deny', got '{webfetch_type_2}'")
             return webfetch_type_2
 
-        webfetch = _parse_webfetch(d.pop("webfetch", UNSET))
+        webfetch = _parse_webfetch(d.get("webfetch", UNSET))
 
         config_permission = cls(
             edit=edit,
@@ -135,15 +138,28 @@ class ConfigPermission:
             webfetch=webfetch,
         )
 
-        config_permission.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_permission._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_permission
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -152,4 +168,4 @@ class ConfigPermission:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -24,7 +24,7 @@ class ConfigPermissionBashType1:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_permission_bash_type_1 = cls()
 
         additional_properties = {}
@@ -28,7 +28,7 @@ class ConfigProvider:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.config_provider_additional_property import ConfigProviderAdditionalProperty
 
-        d = dict(src_dict)
+        d = src_dict
         config_provider = cls()
 
         additional_properties = {}
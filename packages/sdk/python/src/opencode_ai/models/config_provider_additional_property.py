@@ -80,25 +80,25 @@ class ConfigProviderAdditionalProperty:
         from ..models.config_provider_additional_property_models import ConfigProviderAdditionalPropertyModels
         from ..models.config_provider_additional_property_options import ConfigProviderAdditionalPropertyOptions
 
-        d = dict(src_dict)
-        api = d.pop("api", UNSET)
+        d = src_dict
+        api = d.get("api", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
-        env = cast(list[str], d.pop("env", UNSET))
+        env = cast(list[str], d.get("env", UNSET))
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
-        npm = d.pop("npm", UNSET)
+        npm = d.get("npm", UNSET)
 
-        _models = d.pop("models", UNSET)
+        _models = d.get("models", UNSET)
         models: Union[Unset, ConfigProviderAdditionalPropertyModels]
         if isinstance(_models, Unset):
             models = UNSET
         else:
             models = ConfigProviderAdditionalPropertyModels.from_dict(_models)
 
-        _options = d.pop("options", UNSET)
+        _options = d.get("options", UNSET)
         options: Union[Unset, ConfigProviderAdditionalPropertyOptions]
         if isinstance(_options, Unset):
             options = UNSET
@@ -34,7 +34,7 @@ class ConfigProviderAdditionalPropertyModels:
             ConfigProviderAdditionalPropertyModelsAdditionalProperty,
         )
 
-        d = dict(src_dict)
+        d = src_dict
         config_provider_additional_property_models = cls()
 
         additional_properties = {}
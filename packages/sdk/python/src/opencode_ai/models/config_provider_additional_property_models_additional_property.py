@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.config_provider_additional_property_models_additional_property_cost import (
@@ -23,6 +23,23 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigProviderAdditionalPropertyModelsAdditionalProperty")
 
+_KNOWN_KEYS = frozenset(
+    (
+        "id",
+        "name",
+        "release_date",
+        "attachment",
+        "reasoning",
+        "temperature",
+        "tool_call",
+        "cost",
+        "limit",
+        "experimental",
+        "options",
+        "provider",
+    )
+)
+
 
 @_attrs_define
 class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
@@ -54,7 +71,7 @@ class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
     experimental: Union[Unset, bool] = UNSET
     options: Union[Unset, "ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions"] = UNSET
     provider: Union[Unset, "ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -90,7 +107,8 @@ class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
             provider = self.provider.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if id is not UNSET:
             field_dict["id"] = id
@@ -134,45 +152,45 @@ class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
             ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider,
         )
 
-        d = dict(src_dict)
-        id = d.pop("id", UNSET)
+        d = src_dict
+        id = d.get("id", UNSET)
 
-        name = d.pop("name", UNSET)
+        name = d.get("name", UNSET)
 
-        release_date = d.pop("release_date", UNSET)
+        release_date = d.get("release_date", UNSET)
 
-        attachment = d.pop("attachment", UNSET)
+        attachment = d.get("attachment", UNSET)
 
-        reasoning = d.pop("reasoning", UNSET)
+        reasoning = d.get("reasoning", UNSET)
 
-        temperature = d.pop("temperature", UNSET)
+        temperature = d.get("temperature", UNSET)
 
-        tool_call = d.pop("tool_call", UNSET)
+        tool_call = d.get("tool_call", UNSET)
 
-        _cost = d.pop("cost", UNSET)
+        _cost = d.get("cost", UNSET)
         cost: Union[Unset, ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost]
         if isinstance(_cost, Unset):
             cost = UNSET
         else:
             cost = ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost.from_dict(_cost)
 
-        _limit = d.pop("limit", UNSET)
+        _limit = d.get("limit", UNSET)
         limit: Union[Unset, ConfigProviderAdditionalPropertyModelsAdditionalPropertyLimit]
         if isinstance(_limit, Unset):
             limit = UNSET
         else:
             limit = ConfigProviderAdditionalPropertyModelsAdditionalPropertyLimit.from_dict(_limit)
 
-        experimental = d.pop("experimental", UNSET)
+        experimental = d.get("experimental", UNSET)
 
-        _options = d.pop("options", UNSET)
+        _options = d.get("options", UNSET)
         options: Union[Unset, ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions]
         if isinstance(_options, Unset):
             options = UNSET
         else:
             options = ConfigProviderAdditionalPropertyModelsAdditionalPropertyOptions.from_dict(_options)
 
-        _provider = d.pop("provider", UNSET)
+        _provider = d.get("provider", UNSET)
         provider: Union[Unset, ConfigProviderAdditionalPropertyModelsAdditionalPropertyProvider]
         if isinstance(_provider, Unset):
             provider = UNSET
@@ -194,15 +212,30 @@ class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
             provider=provider,
         )
 
-        config_provider_additional_property_models_additional_property.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_provider_additional_property_models_additional_property._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_provider_additional_property_models_additional_property
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -211,4 +244,4 @@ class ConfigProviderAdditionalPropertyModelsAdditionalProperty:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
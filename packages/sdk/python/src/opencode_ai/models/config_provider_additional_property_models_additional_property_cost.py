@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost")
 
+_KNOWN_KEYS = frozenset(("input", "output", "cache_read", "cache_write"))
+
 
 @_attrs_define
 class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
@@ -23,7 +25,7 @@ class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
     output: float
     cache_read: Union[Unset, float] = UNSET
     cache_write: Union[Unset, float] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         input_ = self.input_
@@ -35,7 +37,8 @@ class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
         cache_write = self.cache_write
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "input": input_,
@@ -51,14 +54,14 @@ class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        input_ = d.pop("input")
+        d = src_dict
+        input_ = d["input"]
 
-        output = d.pop("output")
+        output = d["output"]
 
-        cache_read = d.pop("cache_read", UNSET)
+        cache_read = d.get("cache_read", UNSET)
 
-        cache_write = d.pop("cache_write", UNSET)
+        cache_write = d.get("cache_write", UNSET)
 
         config_provider_additional_property_models_additional_property_cost = cls(
             input_=input_,
@@ -67,15 +70,30 @@ class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
             cache_write=cache_write,
         )
 
-        config_provider_additional_property_models_additional_property_cost.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_provider_additional_property_models_additional_property_cost._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_provider_additional_property_models_additional_property_cost
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -84,4 +102,4 @@ class ConfigProviderAdditionalPropertyModelsAdditionalPropertyCost:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
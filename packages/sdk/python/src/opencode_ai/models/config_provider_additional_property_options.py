@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ConfigProviderAdditionalPropertyOptions")
 
+_KNOWN_KEYS = frozenset(("apiKey", "baseURL", "timeout"))
+
 
 @_attrs_define
 class ConfigProviderAdditionalPropertyOptions:
@@ -22,7 +24,7 @@ class ConfigProviderAdditionalPropertyOptions:
     api_key: Union[Unset, str] = UNSET
     base_url: Union[Unset, str] = UNSET
     timeout: Union[Unset, bool, int] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         api_key = self.api_key
@@ -36,7 +38,8 @@ class ConfigProviderAdditionalPropertyOptions:
             timeout = self.timeout
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if api_key is not UNSET:
             field_dict["apiKey"] = api_key
@@ -49,17 +52,17 @@ class ConfigProviderAdditionalPropertyOptions:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        api_key = d.pop("apiKey", UNSET)
+        d = src_dict
+        api_key = d.get("apiKey", UNSET)
 
-        base_url = d.pop("baseURL", UNSET)
+        base_url = d.get("baseURL", UNSET)
 
         def _parse_timeout(data: object) -> Union[Unset, bool, int]:
             if isinstance(data, Unset):
                 return data
             return cast(Union[Unset, bool, int], data)
 
-        timeout = _parse_timeout(d.pop("timeout", UNSET))
+        timeout = _parse_timeout(d.get("timeout", UNSET))
 
         config_provider_additional_property_options = cls(
             api_key=api_key,
@@ -67,15 +70,30 @@ class ConfigProviderAdditionalPropertyOptions:
             timeout=timeout,
         )
 
-        config_provider_additional_property_options.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_provider_additional_property_options._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return config_provider_additional_property_options
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -84,4 +102,4 @@ class ConfigProviderAdditionalPropertyOptions:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,9 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.config_providers_response_200_default import ConfigProvidersResponse200Default
     from ..models.provider import Provider
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ConfigProvidersResponse200")
 
+_KNOWN_KEYS = frozenset(("providers", "default"))
+
 
 @_attrs_define
 class ConfigProvidersResponse200:
@@ -22,7 +26,7 @@ class ConfigProvidersResponse200:
 
     providers: list["Provider"]
     default: "ConfigProvidersResponse200Default"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         providers = []
@@ -33,7 +37,8 @@ class ConfigProvidersResponse200:
         default = self.default.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "providers": providers,
@@ -48,30 +53,43 @@ class ConfigProvidersResponse200:
         from ..models.config_providers_response_200_default import ConfigProvidersResponse200Default
         from ..models.provider import Provider
 
-        d = dict(src_dict)
+        d = src_dict
         providers = []
-        _providers = d.pop("providers")
+        _providers = d["providers"]
         for providers_item_data in _providers:
             providers_item = Provider.from_dict(providers_item_data)
 
             providers.append(providers_item)
 
-        default = ConfigProvidersResponse200Default.from_dict(d.pop("default"))
+        default = ConfigProvidersResponse200Default.from_dict(d["default"])
 
         config_providers_response_200 = cls(
             providers=providers,
             default=default,
         )
 
-        config_providers_response_200.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_providers_response_200._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_providers_response_200
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -80,4 +98,4 @@ class ConfigProvidersResponse200:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -21,10 +21,10 @@ class ConfigProvidersResponse200Default:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_providers_response_200_default = cls()
 
-        config_providers_response_200_default.additional_properties = d
+        config_providers_response_200_default.additional_properties = dict(d)
         return config_providers_response_200_default
 
     @property
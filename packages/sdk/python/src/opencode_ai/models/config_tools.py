@@ -21,10 +21,10 @@ class ConfigTools:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         config_tools = cls()
 
-        config_tools.additional_properties = d
+        config_tools.additional_properties = dict(d)
         return config_tools
 
     @property
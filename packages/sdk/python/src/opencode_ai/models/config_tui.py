@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ConfigTui")
 
+_KNOWN_KEYS = frozenset(("scroll_speed",))
+
 
 @_attrs_define
 class ConfigTui:
@@ -18,13 +20,14 @@ class ConfigTui:
     """
 
     scroll_speed: Union[Unset, float] = 2.0
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         scroll_speed = self.scroll_speed
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if scroll_speed is not UNSET:
             field_dict["scroll_speed"] = scroll_speed
@@ -33,22 +36,35 @@ class ConfigTui:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        scroll_speed = d.pop("scroll_speed", UNSET)
+        d = src_dict
+        scroll_speed = d.get("scroll_speed", UNSET)
 
         config_tui = cls(
             scroll_speed=scroll_speed,
         )
 
-        config_tui.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_tui._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_tui
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -57,4 +73,4 @@ class ConfigTui:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union, cast
+from typing import Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ConfigWatcher")
 
+_KNOWN_KEYS = frozenset(("ignore",))
+
 
 @_attrs_define
 class ConfigWatcher:
@@ -17,7 +19,7 @@ class ConfigWatcher:
     """
 
     ignore: Union[Unset, list[str]] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         ignore: Union[Unset, list[str]] = UNSET
@@ -25,7 +27,8 @@ class ConfigWatcher:
             ignore = self.ignore
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if ignore is not UNSET:
             field_dict["ignore"] = ignore
@@ -34,22 +37,35 @@ class ConfigWatcher:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        ignore = cast(list[str], d.pop("ignore", UNSET))
+        d = src_dict
+        ignore = cast(list[str], d.get("ignore", UNSET))
 
         config_watcher = cls(
             ignore=ignore,
         )
 
-        config_watcher.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            config_watcher._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return config_watcher
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -58,4 +74,4 @@ class ConfigWatcher:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, Union, cast
+from typing import Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="EventFileWatcherUpdatedProperties")
 
+_KNOWN_KEYS = frozenset(("file", "event"))
+
 
 @_attrs_define
 class EventFileWatcherUpdatedProperties:
@@ -17,7 +21,7 @@ class EventFileWatcherUpdatedProperties:
 
     file: str
     event: Union[Literal["add"], Literal["change"], Literal["unlink"]]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         file = self.file
@@ -26,7 +30,8 @@ class EventFileWatcherUpdatedProperties:
         event = self.event
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "file": file,
@@ -38,8 +43,8 @@ class EventFileWatcherUpdatedProperties:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        file = d.pop("file")
+        d = src_dict
+        file = d["file"]
 
         def _parse_event(data: object) -> Union[Literal["add"], Literal["change"], Literal["unlink"]]:
             event_type_0 = cast(Literal["add"], data)
@@ -55,22 +60,37 @@ class EventFileWatcherUpdatedProperties:
                 raise ValueError(f"event_type_2 must match const 'unlink', got '{event_type_2}'")
             return event_type_2
 
-        event = _parse_event(d.pop("event"))
+        event = _parse_event(d["event"])
 
         event_file_watcher_updated_properties = cls(
             file=file,
             event=event,
         )
 
-        event_file_watcher_updated_properties.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_file_watcher_updated_properties._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return event_file_watcher_updated_properties
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -79,4 +99,4 @@ class EventFileWatcherUpdatedProperties:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
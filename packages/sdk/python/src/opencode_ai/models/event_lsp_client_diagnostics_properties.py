@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="EventLspClientDiagnosticsProperties")
 
+_KNOWN_KEYS = frozenset(("serverID", "path"))
+
 
 @_attrs_define
 class EventLspClientDiagnosticsProperties:
@@ -17,7 +21,7 @@ class EventLspClientDiagnosticsProperties:
 
     server_id: str
     path: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         server_id = self.server_id
@@ -25,7 +29,8 @@ class EventLspClientDiagnosticsProperties:
         path = self.path
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "serverID": server_id,
@@ -37,25 +42,40 @@ class EventLspClientDiagnosticsProperties:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        server_id = d.pop("serverID")
+        d = src_dict
+        server_id = d["serverID"]
 
-        path = d.pop("path")
+        path = d["path"]
 
         event_lsp_client_diagnostics_properties = cls(
             server_id=server_id,
             path=path,
         )
 
-        event_lsp_client_diagnostics_properties.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_lsp_client_diagnostics_properties._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return event_lsp_client_diagnostics_properties
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -64,4 +84,4 @@ class EventLspClientDiagnosticsProperties:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,9 +1,12 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models import _discriminators
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.agent_part import AgentPart
     from ..models.file_part import FilePart
@@ -18,6 +21,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="EventMessagePartUpdatedProperties")
 
+_KNOWN_KEYS = frozenset(("part",))
+
 
 @_attrs_define
 class EventMessagePartUpdatedProperties:
@@ -38,7 +43,7 @@ class EventMessagePartUpdatedProperties:
         "TextPart",
         "ToolPart",
     ]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.file_part import FilePart
@@ -71,7 +76,8 @@ class EventMessagePartUpdatedProperties:
             part = self.part.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "part": part,
@@ -92,7 +98,7 @@ class EventMessagePartUpdatedProperties:
         from ..models.text_part import TextPart
         from ..models.tool_part import ToolPart
 
-        d = dict(src_dict)
+        d = src_dict
 
         def _parse_part(
             data: object,
@@ -107,6 +113,10 @@ class EventMessagePartUpdatedProperties:
             "TextPart",
             "ToolPart",
         ]:
+            if isinstance(data, dict):
+                _member = _discriminators.PART.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             try:
                 if not isinstance(data, dict):
                     raise TypeError()
@@ -177,21 +187,36 @@ class EventMessagePartUpdatedProperties:
 
             return componentsschemas_part_type_8
 
-        part = _parse_part(d.pop("part"))
+        part = _parse_part(d["part"])
 
         event_message_part_updated_properties = cls(
             part=part,
         )
 
-        event_message_part_updated_properties.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_message_part_updated_properties._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return event_message_part_updated_properties
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -200,4 +225,4 @@ class EventMessagePartUpdatedProperties:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.event_message_removed_properties import EventMessageRemovedProperties
 
 
 T = TypeVar("T", bound="EventMessageRemoved")
 
+_KNOWN_KEYS = frozenset(("type", "properties"))
+
 
 @_attrs_define
 class EventMessageRemoved:
@@ -21,7 +25,7 @@ class EventMessageRemoved:
 
     type_: Literal["message.removed"]
     properties: "EventMessageRemovedProperties"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         type_ = self.type_
@@ -29,7 +33,8 @@ class EventMessageRemoved:
         properties = self.properties.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -43,27 +48,40 @@ class EventMessageRemoved:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.event_message_removed_properties import EventMessageRemovedProperties
 
-        d = dict(src_dict)
-        type_ = cast(Literal["message.removed"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["message.removed"], d["type"])
         if type_ != "message.removed":
             raise ValueError(f"type must match const 'message.removed', got '{type_}'")
 
-        properties = EventMessageRemovedProperties.from_dict(d.pop("properties"))
+        properties = EventMessageRemovedProperties.from_dict(d["properties"])
 
         event_message_removed = cls(
             type_=type_,
             properties=properties,
         )
 
-        event_message_removed.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_message_removed._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return event_message_removed
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -72,4 +90,4 @@ class EventMessageRemoved:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
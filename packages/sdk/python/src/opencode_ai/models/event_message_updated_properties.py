@@ -1,9 +1,12 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models import _discriminators
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.assistant_message import AssistantMessage
     from ..models.user_message import UserMessage
@@ -11,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="EventMessageUpdatedProperties")
 
+_KNOWN_KEYS = frozenset(("info",))
+
 
 @_attrs_define
 class EventMessageUpdatedProperties:
@@ -20,7 +25,7 @@ class EventMessageUpdatedProperties:
     """
 
     info: Union["AssistantMessage", "UserMessage"]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.user_message import UserMessage
@@ -32,7 +37,8 @@ class EventMessageUpdatedProperties:
             info = self.info.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "info": info,
@@ -46,9 +52,13 @@ class EventMessageUpdatedProperties:
         from ..models.assistant_message import AssistantMessage
         from ..models.user_message import UserMessage
 
-        d = dict(src_dict)
+        d = src_dict
 
         def _parse_info(data: object) -> Union["AssistantMessage", "UserMessage"]:
+            if isinstance(data, dict):
+                _member = _discriminators.MESSAGE.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             try:
                 if not isinstance(data, dict):
                     raise TypeError()
@@ -63,21 +73,36 @@ class EventMessageUpdatedProperties:
 
             return componentsschemas_message_type_1
 
-        info = _parse_info(d.pop("info"))
+        info = _parse_info(d["info"])
 
         event_message_updated_properties = cls(
             info=info,
         )
 
-        event_message_updated_properties.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_message_updated_properties._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
         return event_message_updated_properties
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -86,4 +111,4 @@ class EventMessageUpdatedProperties:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..models import _discriminators
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.message_aborted_error import MessageAbortedError
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="EventSessionErrorProperties")
 
+_KNOWN_KEYS = frozenset(("sessionID", "error"))
+
 
 @_attrs_define
 class EventSessionErrorProperties:
@@ -26,7 +29,7 @@ class EventSessionErrorProperties:
 
     session_id: Union[Unset, str] = UNSET
     error: Union["MessageAbortedError", "MessageOutputLengthError", "ProviderAuthError", "UnknownError", Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.message_output_length_error import MessageOutputLengthError
@@ -48,7 +51,8 @@ class EventSessionErrorProperties:
             error = self.error.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if session_id is not UNSET:
             field_dict["sessionID"] = session_id
@@ -64,12 +68,16 @@ class EventSessionErrorProperties:
         from ..models.provider_auth_error import ProviderAuthError
         from ..models.unknown_error import UnknownError
 
-        d = dict(src_dict)
-        session_id = d.pop("sessionID", UNSET)
+        d = src_dict
+        session_id = d.get("sessionID", UNSET)
 
         def _parse_error(
             data: object,
         ) -> Union["MessageAbortedError", "MessageOutputLengthError", "ProviderAuthError", "UnknownError", Unset]:
+            if isinstance(data, dict):
+                _member = _discriminators.ERROR.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             if isinstance(data, Unset):
                 return data
             try:
@@ -102,22 +110,35 @@ class EventSessionErrorProperties:
 
             return error_type_3
 
-        error = _parse_error(d.pop("error", UNSET))
+        error = _parse_error(d.get("error", UNSET))
 
         event_session_error_properties = cls(
             session_id=session_id,
             error=error,
         )
 
-        event_session_error_properties.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            event_session_error_properties._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return event_session_error_properties
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -126,4 +147,4 @@ class EventSessionErrorProperties:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,16 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.file_status import FileStatus
+from ..types import _empty_as_none
 
 T = TypeVar("T", bound="File")
 
+_KNOWN_KEYS = frozenset(("path", "added", "removed", "status"))
+
 
 @_attrs_define
 class File:
@@ -23,7 +26,7 @@ class File:
     added: int
     removed: int
     status: FileStatus
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         path = self.path
@@ -35,7 +38,8 @@ class File:
         status = self.status.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "path": path,
@@ -49,14 +53,14 @@ class File:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        path = d.pop("path")
+        d = src_dict
+        path = d["path"]
 
-        added = d.pop("added")
+        added = d["added"]
 
-        removed = d.pop("removed")
+        removed = d["removed"]
 
-        status = FileStatus(d.pop("status"))
+        status = FileStatus(d["status"])
 
         file = cls(
             path=path,
@@ -65,15 +69,28 @@ class File:
             status=status,
         )
 
-        file.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -82,4 +99,4 @@ class File:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.file_content_patch import FileContentPatch
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="FileContent")
 
+_KNOWN_KEYS = frozenset(("content", "diff", "patch"))
+
 
 @_attrs_define
 class FileContent:
@@ -25,7 +27,7 @@ class FileContent:
     content: str
     diff: Union[Unset, str] = UNSET
     patch: Union[Unset, "FileContentPatch"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         content = self.content
@@ -37,7 +39,8 @@ class FileContent:
             patch = self.patch.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "content": content,
@@ -54,12 +57,12 @@ class FileContent:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.file_content_patch import FileContentPatch
 
-        d = dict(src_dict)
-        content = d.pop("content")
+        d = src_dict
+        content = d["content"]
 
-        diff = d.pop("diff", UNSET)
+        diff = d.get("diff", UNSET)
 
-        _patch = d.pop("patch", UNSET)
+        _patch = d.get("patch", UNSET)
         patch: Union[Unset, FileContentPatch]
         if isinstance(_patch, Unset):
             patch = UNSET
@@ -72,15 +75,28 @@ class FileContent:
             patch=patch,
         )
 
-        file_content.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_content._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_content
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -89,4 +105,4 @@ class FileContent:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.file_content_patch_hunks_item import FileContentPatchHunksItem
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="FileContentPatch")
 
+_KNOWN_KEYS = frozenset(("oldFileName", "newFileName", "hunks", "oldHeader", "newHeader", "index"))
+
 
 @_attrs_define
 class FileContentPatch:
@@ -31,7 +33,7 @@ class FileContentPatch:
     old_header: Union[Unset, str] = UNSET
     new_header: Union[Unset, str] = UNSET
     index: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         old_file_name = self.old_file_name
@@ -50,7 +52,8 @@ class FileContentPatch:
         index = self.index
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "oldFileName": old_file_name,
@@ -71,23 +74,23 @@ class FileContentPatch:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.file_content_patch_hunks_item import FileContentPatchHunksItem
 
-        d = dict(src_dict)
-        old_file_name = d.pop("oldFileName")
+        d = src_dict
+        old_file_name = d["oldFileName"]
 
-        new_file_name = d.pop("newFileName")
+        new_file_name = d["newFileName"]
 
         hunks = []
-        _hunks = d.pop("hunks")
+        _hunks = d["hunks"]
         for hunks_item_data in _hunks:
             hunks_item = FileContentPatchHunksItem.from_dict(hunks_item_data)
 
             hunks.append(hunks_item)
 
-        old_header = d.pop("oldHeader", UNSET)
+        old_header = d.get("oldHeader", UNSET)
 
-        new_header = d.pop("newHeader", UNSET)
+        new_header = d.get("newHeader", UNSET)
 
-        index = d.pop("index", UNSET)
+        index = d.get("index", UNSET)
 
         file_content_patch = cls(
             old_file_name=old_file_name,
@@ -98,15 +101,28 @@ class FileContentPatch:
             index=index,
         )
 
-        file_content_patch.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_content_patch._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_content_patch
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -115,4 +131,4 @@ class FileContentPatch:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from typing import Any, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="FileContentPatchHunksItem")
 
+_KNOWN_KEYS = frozenset(("oldStart", "oldLines", "newStart", "newLines", "lines"))
+
 
 @_attrs_define
 class FileContentPatchHunksItem:
@@ -23,7 +27,7 @@ class FileContentPatchHunksItem:
     new_start: float
     new_lines: float
     lines: list[str]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         old_start = self.old_start
@@ -37,7 +41,8 @@ class FileContentPatchHunksItem:
         lines = self.lines
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "oldStart": old_start,
@@ -52,16 +57,16 @@ class FileContentPatchHunksItem:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        old_start = d.pop("oldStart")
+        d = src_dict
+        old_start = d["oldStart"]
 
-        old_lines = d.pop("oldLines")
+        old_lines = d["oldLines"]
 
-        new_start = d.pop("newStart")
+        new_start = d["newStart"]
 
-        new_lines = d.pop("newLines")
+        new_lines = d["newLines"]
 
-        lines = cast(list[str], d.pop("lines"))
+        lines = cast(list[str], d["lines"])
 
         file_content_patch_hunks_item = cls(
             old_start=old_start,
@@ -71,15 +76,28 @@ class FileContentPatchHunksItem:
             lines=lines,
         )
 
-        file_content_patch_hunks_item.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_content_patch_hunks_item._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_content_patch_hunks_item
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -88,4 +106,4 @@ class FileContentPatchHunksItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
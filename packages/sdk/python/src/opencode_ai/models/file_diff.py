@@ -0,0 +1,109 @@
+from collections.abc import Mapping
+from typing import Any, Optional, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import _empty_as_none
+
+T = TypeVar("T", bound="FileDiff")
+
+_KNOWN_KEYS = frozenset(("file", "before", "after", "additions", "deletions"))
+
+
+@_attrs_define
+class FileDiff:
+    """
+    Attributes:
+        file (str):
+        before (str):
+        after (str):
+        additions (float):
+        deletions (float):
+    """
+
+    file: str
+    before: str
+    after: str
+    additions: float
+    deletions: float
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
+
+    def to_dict(self) -> dict[str, Any]:
+        file = self.file
+
+        before = self.before
+
+        after = self.after
+
+        additions = self.additions
+
+        deletions = self.deletions
+
+        field_dict: dict[str, Any] = {}
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
+        field_dict.update(
+            {
+                "file": file,
+                "before": before,
+                "after": after,
+                "additions": additions,
+                "deletions": deletions,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = src_dict
+        file = d["file"]
+
+        before = d["before"]
+
+        after = d["after"]
+
+        additions = d["additions"]
+
+        deletions = d["deletions"]
+
+        file_diff = cls(
+            file=file,
+            before=before,
+            after=after,
+            additions=additions,
+            deletions=deletions,
+        )
+
+        if not _KNOWN_KEYS.issuperset(d):
+            file_diff._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
+        return file_diff
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self._additional_properties or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,16 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar
+from typing import Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
 from ..models.file_node_type import FileNodeType
+from ..types import _empty_as_none
 
 T = TypeVar("T", bound="FileNode")
 
+_KNOWN_KEYS = frozenset(("name", "path", "absolute", "type", "ignored"))
+
 
 @_attrs_define
 class FileNode:
@@ -25,7 +28,7 @@ class FileNode:
     absolute: str
     type_: FileNodeType
     ignored: bool
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -39,7 +42,8 @@ class FileNode:
         ignored = self.ignored
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -54,16 +58,16 @@ class FileNode:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        path = d.pop("path")
+        path = d["path"]
 
-        absolute = d.pop("absolute")
+        absolute = d["absolute"]
 
-        type_ = FileNodeType(d.pop("type"))
+        type_ = FileNodeType(d["type"])
 
-        ignored = d.pop("ignored")
+        ignored = d["ignored"]
 
         file_node = cls(
             name=name,
@@ -73,15 +77,28 @@ class FileNode:
             ignored=ignored,
         )
 
-        file_node.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_node._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_node
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -90,4 +107,4 @@ class FileNode:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
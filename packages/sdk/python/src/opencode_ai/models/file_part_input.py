@@ -1,10 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..models import _discriminators
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.file_source import FileSource
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="FilePartInput")
 
+_KNOWN_KEYS = frozenset(("type", "mime", "url", "id", "filename", "source"))
+
 
 @_attrs_define
 class FilePartInput:
@@ -32,7 +35,7 @@ class FilePartInput:
     id: Union[Unset, str] = UNSET
     filename: Union[Unset, str] = UNSET
     source: Union["FileSource", "SymbolSource", Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.file_source import FileSource
@@ -56,7 +59,8 @@ class FilePartInput:
             source = self.source.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -78,20 +82,24 @@ class FilePartInput:
         from ..models.file_source import FileSource
         from ..models.symbol_source import SymbolSource
 
-        d = dict(src_dict)
-        type_ = cast(Literal["file"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["file"], d["type"])
         if type_ != "file":
             raise ValueError(f"type must match const 'file', got '{type_}'")
 
-        mime = d.pop("mime")
+        mime = d["mime"]
 
-        url = d.pop("url")
+        url = d["url"]
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
-        filename = d.pop("filename", UNSET)
+        filename = d.get("filename", UNSET)
 
         def _parse_source(data: object) -> Union["FileSource", "SymbolSource", Unset]:
+            if isinstance(data, dict):
+                _member = _discriminators.FILE_PART_SOURCE.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             if isinstance(data, Unset):
                 return data
             try:
@@ -108,7 +116,7 @@ class FilePartInput:
 
             return componentsschemas_file_part_source_type_1
 
-        source = _parse_source(d.pop("source", UNSET))
+        source = _parse_source(d.get("source", UNSET))
 
         file_part_input = cls(
             type_=type_,
@@ -119,15 +127,28 @@ class FilePartInput:
             source=source,
         )
 
-        file_part_input.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_part_input._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_part_input
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -136,4 +157,4 @@ class FilePartInput:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.file_part_source_text import FilePartSourceText
 
 
 T = TypeVar("T", bound="FileSource")
 
+_KNOWN_KEYS = frozenset(("text", "type", "path"))
+
 
 @_attrs_define
 class FileSource:
@@ -23,7 +27,7 @@ class FileSource:
     text: "FilePartSourceText"
     type_: Literal["file"]
     path: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         text = self.text.to_dict()
@@ -33,7 +37,8 @@ class FileSource:
         path = self.path
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "text": text,
@@ -48,14 +53,14 @@ class FileSource:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.file_part_source_text import FilePartSourceText
 
-        d = dict(src_dict)
-        text = FilePartSourceText.from_dict(d.pop("text"))
+        d = src_dict
+        text = FilePartSourceText.from_dict(d["text"])
 
-        type_ = cast(Literal["file"], d.pop("type"))
+        type_ = cast(Literal["file"], d["type"])
         if type_ != "file":
             raise ValueError(f"type must match const 'file', got '{type_}'")
 
-        path = d.pop("path")
+        path = d["path"]
 
         file_source = cls(
             text=text,
@@ -63,15 +68,28 @@ class FileSource:
             path=path,
         )
 
-        file_source.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            file_source._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return file_source
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -80,4 +98,4 @@ class FileSource:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -320,104 +320,104 @@ class KeybindsConfig:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        leader = d.pop("leader", UNSET)
+        d = src_dict
+        leader = d.get("leader", UNSET)
 
-        app_help = d.pop("app_help", UNSET)
+        app_help = d.get("app_help", UNSET)
 
-        app_exit = d.pop("app_exit", UNSET)
+        app_exit = d.get("app_exit", UNSET)
 
-        editor_open = d.pop("editor_open", UNSET)
+        editor_open = d.get("editor_open", UNSET)
 
-        theme_list = d.pop("theme_list", UNSET)
+        theme_list = d.get("theme_list", UNSET)
 
-        project_init = d.pop("project_init", UNSET)
+        project_init = d.get("project_init", UNSET)
 
-        tool_details = d.pop("tool_details", UNSET)
+        tool_details = d.get("tool_details", UNSET)
 
-        thinking_blocks = d.pop("thinking_blocks", UNSET)
+        thinking_blocks = d.get("thinking_blocks", UNSET)
 
-        session_export = d.pop("session_export", UNSET)
+        session_export = d.get("session_export", UNSET)
 
-        session_new = d.pop("session_new", UNSET)
+        session_new = d.get("session_new", UNSET)
 
-        session_list = d.pop("session_list", UNSET)
+        session_list = d.get("session_list", UNSET)
 
-        session_timeline = d.pop("session_timeline", UNSET)
+        session_timeline = d.get("session_timeline", UNSET)
 
-        session_share = d.pop("session_share", UNSET)
+        session_share = d.get("session_share", UNSET)
 
-        session_unshare = d.pop("session_unshare", UNSET)
+        session_unshare = d.get("session_unshare", UNSET)
 
-        session_interrupt = d.pop("session_interrupt", UNSET)
+        session_interrupt = d.get("session_interrupt", UNSET)
 
-        session_compact = d.pop("session_compact", UNSET)
+        session_compact = d.get("session_compact", UNSET)
 
-        session_child_cycle = d.pop("session_child_cycle", UNSET)
+        session_child_cycle = d.get("session_child_cycle", UNSET)
 
-        session_child_cycle_reverse = d.pop("session_child_cycle_reverse", UNSET)
+        session_child_cycle_reverse = d.get("session_child_cycle_reverse", UNSET)
 
-        messages_page_up = d.pop("messages_page_up", UNSET)
+        messages_page_up = d.get("messages_page_up", UNSET)
 
-        messages_page_down = d.pop("messages_page_down", UNSET)
+        messages_page_down = d.get("messages_page_down", UNSET)
 
-        messages_half_page_up = d.pop("messages_half_page_up", UNSET)
+        messages_half_page_up = d.get("messages_half_page_up", UNSET)
 
-        messages_half_page_down = d.pop("messages_half_page_down", UNSET)
+        messages_half_page_down = d.get("messages_half_page_down", UNSET)
 
-        messages_first = d.pop("messages_first", UNSET)
+        messages_first = d.get("messages_first", UNSET)
 
-        messages_last = d.pop("messages_last", UNSET)
+        messages_last = d.get("messages_last", UNSET)
 
-        messages_copy = d.pop("messages_copy", UNSET)
+        messages_copy = d.get("messages_copy", UNSET)
 
-        messages_undo = d.pop("messages_undo", UNSET)
+        messages_undo = d.get("messages_undo", UNSET)
 
-        messages_redo = d.pop("messages_redo", UNSET)
+        messages_redo = d.get("messages_redo", UNSET)
 
-        model_list = d.pop("model_list", UNSET)
+        model_list = d.get("model_list", UNSET)
 
-        model_cycle_recent = d.pop("model_cycle_recent", UNSET)
+        model_cycle_recent = d.get("model_cycle_recent", UNSET)
 
-        model_cycle_recent_reverse = d.pop("model_cycle_recent_reverse", UNSET)
+        model_cycle_recent_reverse = d.get("model_cycle_recent_reverse", UNSET)
 
-        agent_list = d.pop("agent_list", UNSET)
+        agent_list = d.get("agent_list", UNSET)
 
-        agent_cycle = d.pop("agent_cycle", UNSET)
+        agent_cycle = d.get("agent_cycle", UNSET)
 
-        agent_cycle_reverse = d.pop("agent_cycle_reverse", UNSET)
+        agent_cycle_reverse = d.get("agent_cycle_reverse", UNSET)
 
-        input_clear = d.pop("input_clear", UNSET)
+        input_clear = d.get("input_clear", UNSET)
 
-        input_paste = d.pop("input_paste", UNSET)
+        input_paste = d.get("input_paste", UNSET)
 
-        input_submit = d.pop("input_submit", UNSET)
+        input_submit = d.get("input_submit", UNSET)
 
-        input_newline = d.pop("input_newline", UNSET)
+        input_newline = d.get("input_newline", UNSET)
 
-        switch_mode = d.pop("switch_mode", UNSET)
+        switch_mode = d.get("switch_mode", UNSET)
 
-        switch_mode_reverse = d.pop("switch_mode_reverse", UNSET)
+        switch_mode_reverse = d.get("switch_mode_reverse", UNSET)
 
-        switch_agent = d.pop("switch_agent", UNSET)
+        switch_agent = d.get("switch_agent", UNSET)
 
-        switch_agent_reverse = d.pop("switch_agent_reverse", UNSET)
+        switch_agent_reverse = d.get("switch_agent_reverse", UNSET)
 
-        file_list = d.pop("file_list", UNSET)
+        file_list = d.get("file_list", UNSET)
 
-        file_close = d.pop("file_close", UNSET)
+        file_close = d.get("file_close", UNSET)
 
-        file_search = d.pop("file_search", UNSET)
+        file_search = d.get("file_search", UNSET)
 
-        file_diff_toggle = d.pop("file_diff_toggle", UNSET)
+        file_diff_toggle = d.get("file_diff_toggle", UNSET)
 
-        messages_previous = d.pop("messages_previous", UNSET)
+        messages_previous = d.get("messages_previous", UNSET)
 
-        messages_next = d.pop("messages_next", UNSET)
+        messages_next = d.get("messages_next", UNSET)
 
-        messages_layout_toggle = d.pop("messages_layout_toggle", UNSET)
+        messages_layout_toggle = d.get("messages_layout_toggle", UNSET)
 
-        messages_revert = d.pop("messages_revert", UNSET)
+        messages_revert = d.get("messages_revert", UNSET)
 
         keybinds_config = cls(
             leader=leader,
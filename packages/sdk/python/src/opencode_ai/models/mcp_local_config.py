@@ -57,21 +57,21 @@ class McpLocalConfig:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.mcp_local_config_environment import McpLocalConfigEnvironment
 
-        d = dict(src_dict)
-        type_ = cast(Literal["local"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["local"], d["type"])
         if type_ != "local":
             raise ValueError(f"type must match const 'local', got '{type_}'")
 
-        command = cast(list[str], d.pop("command"))
+        command = cast(list[str], d["command"])
 
-        _environment = d.pop("environment", UNSET)
+        _environment = d.get("environment", UNSET)
         environment: Union[Unset, McpLocalConfigEnvironment]
         if isinstance(_environment, Unset):
             environment = UNSET
         else:
             environment = McpLocalConfigEnvironment.from_dict(_environment)
 
-        enabled = d.pop("enabled", UNSET)
+        enabled = d.get("enabled", UNSET)
 
         mcp_local_config = cls(
             type_=type_,
@@ -21,10 +21,10 @@ class McpLocalConfigEnvironment:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         mcp_local_config_environment = cls()
 
-        mcp_local_config_environment.additional_properties = d
+        mcp_local_config_environment.additional_properties = dict(d)
         return mcp_local_config_environment
 
     @property
@@ -57,16 +57,16 @@ class McpRemoteConfig:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.mcp_remote_config_headers import McpRemoteConfigHeaders
 
-        d = dict(src_dict)
-        type_ = cast(Literal["remote"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["remote"], d["type"])
         if type_ != "remote":
             raise ValueError(f"type must match const 'remote', got '{type_}'")
 
-        url = d.pop("url")
+        url = d["url"]
 
-        enabled = d.pop("enabled", UNSET)
+        enabled = d.get("enabled", UNSET)
 
-        _headers = d.pop("headers", UNSET)
+        _headers = d.get("headers", UNSET)
         headers: Union[Unset, McpRemoteConfigHeaders]
         if isinstance(_headers, Unset):
             headers = UNSET
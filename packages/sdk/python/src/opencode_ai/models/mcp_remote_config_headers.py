@@ -21,10 +21,10 @@ class McpRemoteConfigHeaders:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
+        d = src_dict
         mcp_remote_config_headers = cls()
 
-        mcp_remote_config_headers.additional_properties = d
+        mcp_remote_config_headers.additional_properties = dict(d)
         return mcp_remote_config_headers
 
     @property
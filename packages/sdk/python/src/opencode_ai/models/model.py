@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.model_cost import ModelCost
@@ -15,6 +15,23 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Model")
 
+_KNOWN_KEYS = frozenset(
+    (
+        "id",
+        "name",
+        "release_date",
+        "attachment",
+        "reasoning",
+        "temperature",
+        "tool_call",
+        "cost",
+        "limit",
+        "options",
+        "experimental",
+        "provider",
+    )
+)
+
 
 @_attrs_define
 class Model:
@@ -46,7 +63,7 @@ class Model:
     options: "ModelOptions"
     experimental: Union[Unset, bool] = UNSET
     provider: Union[Unset, "ModelProvider"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -76,7 +93,8 @@ class Model:
             provider = self.provider.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -105,30 +123,30 @@ class Model:
         from ..models.model_options import ModelOptions
         from ..models.model_provider import ModelProvider
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        name = d.pop("name")
+        name = d["name"]
 
-        release_date = d.pop("release_date")
+        release_date = d["release_date"]
 
-        attachment = d.pop("attachment")
+        attachment = d["attachment"]
 
-        reasoning = d.pop("reasoning")
+        reasoning = d["reasoning"]
 
-        temperature = d.pop("temperature")
+        temperature = d["temperature"]
 
-        tool_call = d.pop("tool_call")
+        tool_call = d["tool_call"]
 
-        cost = ModelCost.from_dict(d.pop("cost"))
+        cost = ModelCost.from_dict(d["cost"])
 
-        limit = ModelLimit.from_dict(d.pop("limit"))
+        limit = ModelLimit.from_dict(d["limit"])
 
-        options = ModelOptions.from_dict(d.pop("options"))
+        options = ModelOptions.from_dict(d["options"])
 
-        experimental = d.pop("experimental", UNSET)
+        experimental = d.get("experimental", UNSET)
 
-        _provider = d.pop("provider", UNSET)
+        _provider = d.get("provider", UNSET)
         provider: Union[Unset, ModelProvider]
         if isinstance(_provider, Unset):
             provider = UNSET
@@ -150,15 +168,28 @@ class Model:
             provider=provider,
         )
 
-        model.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            model._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return model
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -167,4 +198,4 @@ class Model:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="OAuth")
 
+_KNOWN_KEYS = frozenset(("type", "refresh", "access", "expires"))
+
 
 @_attrs_define
 class OAuth:
@@ -21,7 +25,7 @@ class OAuth:
     refresh: str
     access: str
     expires: float
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         type_ = self.type_
@@ -33,7 +37,8 @@ class OAuth:
         expires = self.expires
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -47,16 +52,16 @@ class OAuth:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = cast(Literal["oauth"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["oauth"], d["type"])
         if type_ != "oauth":
             raise ValueError(f"type must match const 'oauth', got '{type_}'")
 
-        refresh = d.pop("refresh")
+        refresh = d["refresh"]
 
-        access = d.pop("access")
+        access = d["access"]
 
-        expires = d.pop("expires")
+        expires = d["expires"]
 
         o_auth = cls(
             type_=type_,
@@ -65,15 +70,28 @@ class OAuth:
             expires=expires,
         )
 
-        o_auth.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            o_auth._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return o_auth
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -82,4 +100,4 @@ class OAuth:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
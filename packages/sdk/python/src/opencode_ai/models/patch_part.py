@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="PatchPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "hash", "files"))
+
 
 @_attrs_define
 class PatchPart:
@@ -25,7 +29,7 @@ class PatchPart:
     type_: Literal["patch"]
     hash_: str
     files: list[str]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -41,7 +45,8 @@ class PatchPart:
         files = self.files
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -57,20 +62,20 @@ class PatchPart:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["patch"], d.pop("type"))
+        type_ = cast(Literal["patch"], d["type"])
         if type_ != "patch":
             raise ValueError(f"type must match const 'patch', got '{type_}'")
 
-        hash_ = d.pop("hash")
+        hash_ = d["hash"]
 
-        files = cast(list[str], d.pop("files"))
+        files = cast(list[str], d["files"])
 
         patch_part = cls(
             id=id,
@@ -81,15 +86,28 @@ class PatchPart:
             files=files,
         )
 
-        patch_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            patch_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return patch_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -98,4 +116,4 @@ class PatchPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
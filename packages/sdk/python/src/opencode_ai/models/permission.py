@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.permission_metadata import PermissionMetadata
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Permission")
 
+_KNOWN_KEYS = frozenset(("id", "type", "sessionID", "messageID", "title", "metadata", "time", "pattern", "callID"))
+
 
 @_attrs_define
 class Permission:
@@ -38,7 +40,7 @@ class Permission:
     time: "PermissionTime"
     pattern: Union[Unset, list[str], str] = UNSET
     call_id: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -67,7 +69,8 @@ class Permission:
         call_id = self.call_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -91,20 +94,20 @@ class Permission:
         from ..models.permission_metadata import PermissionMetadata
         from ..models.permission_time import PermissionTime
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        type_ = d.pop("type")
+        type_ = d["type"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        title = d.pop("title")
+        title = d["title"]
 
-        metadata = PermissionMetadata.from_dict(d.pop("metadata"))
+        metadata = PermissionMetadata.from_dict(d["metadata"])
 
-        time = PermissionTime.from_dict(d.pop("time"))
+        time = PermissionTime.from_dict(d["time"])
 
         def _parse_pattern(data: object) -> Union[Unset, list[str], str]:
             if isinstance(data, Unset):
@@ -119,9 +122,9 @@ class Permission:
                 pass
             return cast(Union[Unset, list[str], str], data)
 
-        pattern = _parse_pattern(d.pop("pattern", UNSET))
+        pattern = _parse_pattern(d.get("pattern", UNSET))
 
-        call_id = d.pop("callID", UNSET)
+        call_id = d.get("callID", UNSET)
 
         permission = cls(
             id=id,
@@ -135,15 +138,28 @@ class Permission:
             call_id=call_id,
         )
 
-        permission.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            permission._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return permission
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -152,4 +168,4 @@ class Permission:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
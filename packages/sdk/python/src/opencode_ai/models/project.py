@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.project_time import ProjectTime
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Project")
 
+_KNOWN_KEYS = frozenset(("id", "worktree", "time", "vcs"))
+
 
 @_attrs_define
 class Project:
@@ -27,7 +29,7 @@ class Project:
     worktree: str
     time: "ProjectTime"
     vcs: Union[Literal["git"], Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -39,7 +41,8 @@ class Project:
         vcs = self.vcs
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -56,14 +59,14 @@ class Project:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.project_time import ProjectTime
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        worktree = d.pop("worktree")
+        worktree = d["worktree"]
 
-        time = ProjectTime.from_dict(d.pop("time"))
+        time = ProjectTime.from_dict(d["time"])
 
-        vcs = cast(Union[Literal["git"], Unset], d.pop("vcs", UNSET))
+        vcs = cast(Union[Literal["git"], Unset], d.get("vcs", UNSET))
         if vcs != "git" and not isinstance(vcs, Unset):
             raise ValueError(f"vcs must match const 'git', got '{vcs}'")
 
@@ -74,15 +77,28 @@ class Project:
             vcs=vcs,
         )
 
-        project.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            project._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return project
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -91,4 +107,4 @@ class Project:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
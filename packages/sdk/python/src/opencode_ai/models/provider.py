@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.provider_models import ProviderModels
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Provider")
 
+_KNOWN_KEYS = frozenset(("name", "env", "id", "models", "api", "npm"))
+
 
 @_attrs_define
 class Provider:
@@ -31,7 +33,7 @@ class Provider:
     models: "ProviderModels"
     api: Union[Unset, str] = UNSET
     npm: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -47,7 +49,8 @@ class Provider:
         npm = self.npm
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -67,18 +70,18 @@ class Provider:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.provider_models import ProviderModels
 
-        d = dict(src_dict)
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        env = cast(list[str], d.pop("env"))
+        env = cast(list[str], d["env"])
 
-        id = d.pop("id")
+        id = d["id"]
 
-        models = ProviderModels.from_dict(d.pop("models"))
+        models = ProviderModels.from_dict(d["models"])
 
-        api = d.pop("api", UNSET)
+        api = d.get("api", UNSET)
 
-        npm = d.pop("npm", UNSET)
+        npm = d.get("npm", UNSET)
 
         provider = cls(
             name=name,
@@ -89,15 +92,28 @@ class Provider:
             npm=npm,
         )
 
-        provider.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            provider._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return provider
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -106,4 +122,4 @@ class Provider:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
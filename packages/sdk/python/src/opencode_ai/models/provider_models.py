@@ -28,7 +28,7 @@ class ProviderModels:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.model import Model
 
-        d = dict(src_dict)
+        d = src_dict
         provider_models = cls()
 
         additional_properties = {}
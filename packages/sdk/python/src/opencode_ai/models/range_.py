@@ -1,9 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.range_end import RangeEnd
     from ..models.range_start import RangeStart
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Range")
 
+_KNOWN_KEYS = frozenset(("start", "end"))
+
 
 @_attrs_define
 class Range:
@@ -22,7 +26,7 @@ class Range:
 
     start: "RangeStart"
     end: "RangeEnd"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         start = self.start.to_dict()
@@ -30,7 +34,8 @@ class Range:
         end = self.end.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "start": start,
@@ -45,25 +50,38 @@ class Range:
         from ..models.range_end import RangeEnd
         from ..models.range_start import RangeStart
 
-        d = dict(src_dict)
-        start = RangeStart.from_dict(d.pop("start"))
+        d = src_dict
+        start = RangeStart.from_dict(d["start"])
 
-        end = RangeEnd.from_dict(d.pop("end"))
+        end = RangeEnd.from_dict(d["end"])
 
         range_ = cls(
             start=start,
             end=end,
         )
 
-        range_.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            range_._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return range_
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -72,4 +90,4 @@ class Range:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
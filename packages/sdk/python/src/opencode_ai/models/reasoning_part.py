@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.reasoning_part_metadata import ReasoningPartMetadata
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ReasoningPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "text", "time", "metadata"))
+
 
 @_attrs_define
 class ReasoningPart:
@@ -34,7 +36,7 @@ class ReasoningPart:
     text: str
     time: "ReasoningPartTime"
     metadata: Union[Unset, "ReasoningPartMetadata"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -54,7 +56,8 @@ class ReasoningPart:
             metadata = self.metadata.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -75,22 +78,22 @@ class ReasoningPart:
         from ..models.reasoning_part_metadata import ReasoningPartMetadata
         from ..models.reasoning_part_time import ReasoningPartTime
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["reasoning"], d.pop("type"))
+        type_ = cast(Literal["reasoning"], d["type"])
         if type_ != "reasoning":
             raise ValueError(f"type must match const 'reasoning', got '{type_}'")
 
-        text = d.pop("text")
+        text = d["text"]
 
-        time = ReasoningPartTime.from_dict(d.pop("time"))
+        time = ReasoningPartTime.from_dict(d["time"])
 
-        _metadata = d.pop("metadata", UNSET)
+        _metadata = d.get("metadata", UNSET)
         metadata: Union[Unset, ReasoningPartMetadata]
         if isinstance(_metadata, Unset):
             metadata = UNSET
@@ -107,15 +110,28 @@ class ReasoningPart:
             metadata=metadata,
         )
 
-        reasoning_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            reasoning_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return reasoning_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -124,4 +140,4 @@ class ReasoningPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.session_revert import SessionRevert
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="Session")
 
+_KNOWN_KEYS = frozenset(("id", "projectID", "directory", "title", "version", "time", "parentID", "share", "revert"))
+
 
 @_attrs_define
 class Session:
@@ -39,7 +41,7 @@ class Session:
     parent_id: Union[Unset, str] = UNSET
     share: Union[Unset, "SessionShare"] = UNSET
     revert: Union[Unset, "SessionRevert"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -65,7 +67,8 @@ class Session:
             revert = self.revert.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -91,29 +94,29 @@ class Session:
         from ..models.session_share import SessionShare
         from ..models.session_time import SessionTime
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        project_id = d.pop("projectID")
+        project_id = d["projectID"]
 
-        directory = d.pop("directory")
+        directory = d["directory"]
 
-        title = d.pop("title")
+        title = d["title"]
 
-        version = d.pop("version")
+        version = d["version"]
 
-        time = SessionTime.from_dict(d.pop("time"))
+        time = SessionTime.from_dict(d["time"])
 
-        parent_id = d.pop("parentID", UNSET)
+        parent_id = d.get("parentID", UNSET)
 
-        _share = d.pop("share", UNSET)
+        _share = d.get("share", UNSET)
         share: Union[Unset, SessionShare]
         if isinstance(_share, Unset):
             share = UNSET
         else:
             share = SessionShare.from_dict(_share)
 
-        _revert = d.pop("revert", UNSET)
+        _revert = d.get("revert", UNSET)
         revert: Union[Unset, SessionRevert]
         if isinstance(_revert, Unset):
             revert = UNSET
@@ -132,15 +135,28 @@ class Session:
             revert=revert,
         )
 
-        session.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            session._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return session
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -149,4 +165,4 @@ class Session:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -0,0 +1,275 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..models import _discriminators
+from ..types import _empty_as_none
+
+if TYPE_CHECKING:
+    from ..models.agent_part import AgentPart
+    from ..models.assistant_message import AssistantMessage
+    from ..models.file_part import FilePart
+    from ..models.patch_part import PatchPart
+    from ..models.reasoning_part import ReasoningPart
+    from ..models.snapshot_part import SnapshotPart
+    from ..models.step_finish_part import StepFinishPart
+    from ..models.step_start_part import StepStartPart
+    from ..models.text_part import TextPart
+    from ..models.tool_part import ToolPart
+    from ..models.user_message import UserMessage
+
+
+T = TypeVar("T", bound="SessionMessagesResponse200Item")
+
+_KNOWN_KEYS = frozenset(("info", "parts"))
+
+
+@_attrs_define
+class SessionMessagesResponse200Item:
+    """
+    Attributes:
+        info (Union['AssistantMessage', 'UserMessage']):
+        parts (list[Union['AgentPart', 'FilePart', 'PatchPart', 'ReasoningPart', 'SnapshotPart', 'StepFinishPart',
+            'StepStartPart', 'TextPart', 'ToolPart']]):
+    """
+
+    info: Union["AssistantMessage", "UserMessage"]
+    parts: list[
+        Union[
+            "AgentPart",
+            "FilePart",
+            "PatchPart",
+            "ReasoningPart",
+            "SnapshotPart",
+            "StepFinishPart",
+            "StepStartPart",
+            "TextPart",
+            "ToolPart",
+        ]
+    ]
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
+
+    def to_dict(self) -> dict[str, Any]:
+        from ..models.file_part import FilePart
+        from ..models.patch_part import PatchPart
+        from ..models.reasoning_part import ReasoningPart
+        from ..models.snapshot_part import SnapshotPart
+        from ..models.step_finish_part import StepFinishPart
+        from ..models.step_start_part import StepStartPart
+        from ..models.text_part import TextPart
+        from ..models.tool_part import ToolPart
+        from ..models.user_message import UserMessage
+
+        info: dict[str, Any]
+        if isinstance(self.info, UserMessage):
+            info = self.info.to_dict()
+        else:
+            info = self.info.to_dict()
+
+        parts = []
+        for parts_item_data in self.parts:
+            parts_item: dict[str, Any]
+            if isinstance(parts_item_data, TextPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, ReasoningPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, FilePart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, ToolPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, StepStartPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, StepFinishPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, SnapshotPart):
+                parts_item = parts_item_data.to_dict()
+            elif isinstance(parts_item_data, PatchPart):
+                parts_item = parts_item_data.to_dict()
+            else:
+                parts_item = parts_item_data.to_dict()
+            parts.append(parts_item)
+
+        field_dict: dict[str, Any] = {}
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
+        field_dict.update(
+            {
+                "info": info,
+                "parts": parts,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        from ..models.agent_part import AgentPart
+        from ..models.assistant_message import AssistantMessage
+        from ..models.file_part import FilePart
+        from ..models.patch_part import PatchPart
+        from ..models.reasoning_part import ReasoningPart
+        from ..models.snapshot_part import SnapshotPart
+        from ..models.step_finish_part import StepFinishPart
+        from ..models.step_start_part import StepStartPart
+        from ..models.text_part import TextPart
+        from ..models.tool_part import ToolPart
+        from ..models.user_message import UserMessage
+
+        d = src_dict
+
+        def _parse_info(data: object) -> Union["AssistantMessage", "UserMessage"]:
+            if isinstance(data, dict):
+                _member = _discriminators.MESSAGE.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
+            try:
+                if not isinstance(data, dict):
+                    raise TypeError()
+                componentsschemas_message_type_0 = UserMessage.from_dict(data)
+
+                return componentsschemas_message_type_0
+            except:  # noqa: E722
+                pass
+            if not isinstance(data, dict):
+                raise TypeError()
+            componentsschemas_message_type_1 = AssistantMessage.from_dict(data)
+
+            return componentsschemas_message_type_1
+
+        info = _parse_info(d["info"])
+
+        parts = []
+        _parts = d["parts"]
+        for parts_item_data in _parts:
+
+            def _parse_parts_item(
+                data: object,
+            ) -> Union[
+                "AgentPart",
+                "FilePart",
+                "PatchPart",
+                "ReasoningPart",
+                "SnapshotPart",
+                "StepFinishPart",
+                "StepStartPart",
+                "TextPart",
+                "ToolPart",
+            ]:
+                if isinstance(data, dict):
+                    _member = _discriminators.PART.match(data)
+                    if _member is not None:
+                        return _member.from_dict(data)
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_0 = TextPart.from_dict(data)
+
+                    return componentsschemas_part_type_0
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_1 = ReasoningPart.from_dict(data)
+
+                    return componentsschemas_part_type_1
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_2 = FilePart.from_dict(data)
+
+                    return componentsschemas_part_type_2
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_3 = ToolPart.from_dict(data)
+
+                    return componentsschemas_part_type_3
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_4 = StepStartPart.from_dict(data)
+
+                    return componentsschemas_part_type_4
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_5 = StepFinishPart.from_dict(data)
+
+                    return componentsschemas_part_type_5
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_6 = SnapshotPart.from_dict(data)
+
+                    return componentsschemas_part_type_6
+                except:  # noqa: E722
+                    pass
+                try:
+                    if not isinstance(data, dict):
+                        raise TypeError()
+                    componentsschemas_part_type_7 = PatchPart.from_dict(data)
+
+                    return componentsschemas_part_type_7
+                except:  # noqa: E722
+                    pass
+                if not isinstance(data, dict):
+                    raise TypeError()
+                componentsschemas_part_type_8 = AgentPart.from_dict(data)
+
+                return componentsschemas_part_type_8
+
+            parts_item = _parse_parts_item(parts_item_data)
+
+            parts.append(parts_item)
+
+        session_messages_response_200_item = cls(
+            info=info,
+            parts=parts,
+        )
+
+        if not _KNOWN_KEYS.issuperset(d):
+            session_messages_response_200_item._additional_properties = {
+                k: v for k, v in d.items() if k not in _KNOWN_KEYS
+            }
+        return session_messages_response_200_item
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self._additional_properties or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="SessionRevert")
 
+_KNOWN_KEYS = frozenset(("messageID", "partID", "snapshot", "diff"))
+
 
 @_attrs_define
 class SessionRevert:
@@ -23,7 +25,7 @@ class SessionRevert:
     part_id: Union[Unset, str] = UNSET
     snapshot: Union[Unset, str] = UNSET
     diff: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         message_id = self.message_id
@@ -35,7 +37,8 @@ class SessionRevert:
         diff = self.diff
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "messageID": message_id,
@@ -52,14 +55,14 @@ class SessionRevert:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        message_id = d.pop("messageID")
+        d = src_dict
+        message_id = d["messageID"]
 
-        part_id = d.pop("partID", UNSET)
+        part_id = d.get("partID", UNSET)
 
-        snapshot = d.pop("snapshot", UNSET)
+        snapshot = d.get("snapshot", UNSET)
 
-        diff = d.pop("diff", UNSET)
+        diff = d.get("diff", UNSET)
 
         session_revert = cls(
             message_id=message_id,
@@ -68,15 +71,28 @@ class SessionRevert:
             diff=diff,
         )
 
-        session_revert.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            session_revert._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return session_revert
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -85,4 +101,4 @@ class SessionRevert:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="SessionTime")
 
+_KNOWN_KEYS = frozenset(("created", "updated", "compacting"))
+
 
 @_attrs_define
 class SessionTime:
@@ -21,7 +23,7 @@ class SessionTime:
     created: float
     updated: float
     compacting: Union[Unset, float] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         created = self.created
@@ -31,7 +33,8 @@ class SessionTime:
         compacting = self.compacting
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "created": created,
@@ -45,12 +48,12 @@ class SessionTime:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        created = d.pop("created")
+        d = src_dict
+        created = d["created"]
 
-        updated = d.pop("updated")
+        updated = d["updated"]
 
-        compacting = d.pop("compacting", UNSET)
+        compacting = d.get("compacting", UNSET)
 
         session_time = cls(
             created=created,
@@ -58,15 +61,28 @@ class SessionTime:
             compacting=compacting,
         )
 
-        session_time.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            session_time._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return session_time
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -75,4 +91,4 @@ class SessionTime:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
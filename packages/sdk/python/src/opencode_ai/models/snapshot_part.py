@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="SnapshotPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "snapshot"))
+
 
 @_attrs_define
 class SnapshotPart:
@@ -23,7 +27,7 @@ class SnapshotPart:
     message_id: str
     type_: Literal["snapshot"]
     snapshot: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -37,7 +41,8 @@ class SnapshotPart:
         snapshot = self.snapshot
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -52,18 +57,18 @@ class SnapshotPart:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["snapshot"], d.pop("type"))
+        type_ = cast(Literal["snapshot"], d["type"])
         if type_ != "snapshot":
             raise ValueError(f"type must match const 'snapshot', got '{type_}'")
 
-        snapshot = d.pop("snapshot")
+        snapshot = d["snapshot"]
 
         snapshot_part = cls(
             id=id,
@@ -73,15 +78,28 @@ class SnapshotPart:
             snapshot=snapshot,
         )
 
-        snapshot_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            snapshot_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return snapshot_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -90,4 +108,4 @@ class SnapshotPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.step_finish_part_tokens import StepFinishPartTokens
 
 
 T = TypeVar("T", bound="StepFinishPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "cost", "tokens"))
+
 
 @_attrs_define
 class StepFinishPart:
@@ -29,7 +33,7 @@ class StepFinishPart:
     type_: Literal["step-finish"]
     cost: float
     tokens: "StepFinishPartTokens"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -45,7 +49,8 @@ class StepFinishPart:
         tokens = self.tokens.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -63,20 +68,20 @@ class StepFinishPart:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.step_finish_part_tokens import StepFinishPartTokens
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["step-finish"], d.pop("type"))
+        type_ = cast(Literal["step-finish"], d["type"])
         if type_ != "step-finish":
             raise ValueError(f"type must match const 'step-finish', got '{type_}'")
 
-        cost = d.pop("cost")
+        cost = d["cost"]
 
-        tokens = StepFinishPartTokens.from_dict(d.pop("tokens"))
+        tokens = StepFinishPartTokens.from_dict(d["tokens"])
 
         step_finish_part = cls(
             id=id,
@@ -87,15 +92,28 @@ class StepFinishPart:
             tokens=tokens,
         )
 
-        step_finish_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            step_finish_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return step_finish_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -104,4 +122,4 @@ class StepFinishPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
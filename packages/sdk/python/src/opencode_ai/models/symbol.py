@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.symbol_location import SymbolLocation
 
 
 T = TypeVar("T", bound="Symbol")
 
+_KNOWN_KEYS = frozenset(("name", "kind", "location"))
+
 
 @_attrs_define
 class Symbol:
@@ -23,7 +27,7 @@ class Symbol:
     name: str
     kind: float
     location: "SymbolLocation"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -33,7 +37,8 @@ class Symbol:
         location = self.location.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -48,12 +53,12 @@ class Symbol:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.symbol_location import SymbolLocation
 
-        d = dict(src_dict)
-        name = d.pop("name")
+        d = src_dict
+        name = d["name"]
 
-        kind = d.pop("kind")
+        kind = d["kind"]
 
-        location = SymbolLocation.from_dict(d.pop("location"))
+        location = SymbolLocation.from_dict(d["location"])
 
         symbol = cls(
             name=name,
@@ -61,15 +66,28 @@ class Symbol:
             location=location,
         )
 
-        symbol.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            symbol._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return symbol
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -78,4 +96,4 @@ class Symbol:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.range_ import Range
 
 
 T = TypeVar("T", bound="SymbolLocation")
 
+_KNOWN_KEYS = frozenset(("uri", "range"))
+
 
 @_attrs_define
 class SymbolLocation:
@@ -21,7 +25,7 @@ class SymbolLocation:
 
     uri: str
     range_: "Range"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         uri = self.uri
@@ -29,7 +33,8 @@ class SymbolLocation:
         range_ = self.range_.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "uri": uri,
@@ -43,25 +48,38 @@ class SymbolLocation:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.range_ import Range
 
-        d = dict(src_dict)
-        uri = d.pop("uri")
+        d = src_dict
+        uri = d["uri"]
 
-        range_ = Range.from_dict(d.pop("range"))
+        range_ = Range.from_dict(d["range"])
 
         symbol_location = cls(
             uri=uri,
             range_=range_,
         )
 
-        symbol_location.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            symbol_location._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return symbol_location
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -70,4 +88,4 @@ class SymbolLocation:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
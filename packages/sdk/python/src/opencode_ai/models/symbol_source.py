@@ -1,9 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.file_part_source_text import FilePartSourceText
     from ..models.range_ import Range
@@ -11,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="SymbolSource")
 
+_KNOWN_KEYS = frozenset(("text", "type", "path", "range", "name", "kind"))
+
 
 @_attrs_define
 class SymbolSource:
@@ -30,7 +34,7 @@ class SymbolSource:
     range_: "Range"
     name: str
     kind: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         text = self.text.to_dict()
@@ -46,7 +50,8 @@ class SymbolSource:
         kind = self.kind
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "text": text,
@@ -65,20 +70,20 @@ class SymbolSource:
         from ..models.file_part_source_text import FilePartSourceText
         from ..models.range_ import Range
 
-        d = dict(src_dict)
-        text = FilePartSourceText.from_dict(d.pop("text"))
+        d = src_dict
+        text = FilePartSourceText.from_dict(d["text"])
 
-        type_ = cast(Literal["symbol"], d.pop("type"))
+        type_ = cast(Literal["symbol"], d["type"])
         if type_ != "symbol":
             raise ValueError(f"type must match const 'symbol', got '{type_}'")
 
-        path = d.pop("path")
+        path = d["path"]
 
-        range_ = Range.from_dict(d.pop("range"))
+        range_ = Range.from_dict(d["range"])
 
-        name = d.pop("name")
+        name = d["name"]
 
-        kind = d.pop("kind")
+        kind = d["kind"]
 
         symbol_source = cls(
             text=text,
@@ -89,15 +94,28 @@ class SymbolSource:
             kind=kind,
         )
 
-        symbol_source.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            symbol_source._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return symbol_source
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -106,4 +124,4 @@ class SymbolSource:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
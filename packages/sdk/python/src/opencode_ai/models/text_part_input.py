@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.text_part_input_time import TextPartInputTime
@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="TextPartInput")
 
+_KNOWN_KEYS = frozenset(("type", "text", "id", "synthetic", "time"))
+
 
 @_attrs_define
 class TextPartInput:
@@ -29,7 +31,7 @@ class TextPartInput:
     id: Union[Unset, str] = UNSET
     synthetic: Union[Unset, bool] = UNSET
     time: Union[Unset, "TextPartInputTime"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         type_ = self.type_
@@ -45,7 +47,8 @@ class TextPartInput:
             time = self.time.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -65,18 +68,18 @@ class TextPartInput:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.text_part_input_time import TextPartInputTime
 
-        d = dict(src_dict)
-        type_ = cast(Literal["text"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["text"], d["type"])
         if type_ != "text":
             raise ValueError(f"type must match const 'text', got '{type_}'")
 
-        text = d.pop("text")
+        text = d["text"]
 
-        id = d.pop("id", UNSET)
+        id = d.get("id", UNSET)
 
-        synthetic = d.pop("synthetic", UNSET)
+        synthetic = d.get("synthetic", UNSET)
 
-        _time = d.pop("time", UNSET)
+        _time = d.get("time", UNSET)
         time: Union[Unset, TextPartInputTime]
         if isinstance(_time, Unset):
             time = UNSET
@@ -91,15 +94,28 @@ class TextPartInput:
             time=time,
         )
 
-        text_part_input.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            text_part_input._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return text_part_input
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -108,4 +124,4 @@ class TextPartInput:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
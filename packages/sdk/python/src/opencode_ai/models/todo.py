@@ -0,0 +1,101 @@
+from collections.abc import Mapping
+from typing import Any, Optional, TypeVar
+
+from attrs import define as _attrs_define
+from attrs import field as _attrs_field
+
+from ..types import _empty_as_none
+
+T = TypeVar("T", bound="Todo")
+
+_KNOWN_KEYS = frozenset(("content", "status", "priority", "id"))
+
+
+@_attrs_define
+class Todo:
+    """
+    Attributes:
+        content (str): Brief description of the task
+        status (str): Current status of the task: pending, in_progress, completed, cancelled
+        priority (str): Priority level of the task: high, medium, low
+        id (str): Unique identifier for the todo item
+    """
+
+    content: str
+    status: str
+    priority: str
+    id: str
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
+
+    def to_dict(self) -> dict[str, Any]:
+        content = self.content
+
+        status = self.status
+
+        priority = self.priority
+
+        id = self.id
+
+        field_dict: dict[str, Any] = {}
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
+        field_dict.update(
+            {
+                "content": content,
+                "status": status,
+                "priority": priority,
+                "id": id,
+            }
+        )
+
+        return field_dict
+
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        d = src_dict
+        content = d["content"]
+
+        status = d["status"]
+
+        priority = d["priority"]
+
+        id = d["id"]
+
+        todo = cls(
+            content=content,
+            status=status,
+            priority=priority,
+            id=id,
+        )
+
+        if not _KNOWN_KEYS.issuperset(d):
+            todo._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
+        return todo
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self._additional_properties or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,9 +1,12 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models import _discriminators
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.tool_state_completed import ToolStateCompleted
     from ..models.tool_state_error import ToolStateError
@@ -13,6 +16,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ToolPart")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "messageID", "type", "callID", "tool", "state"))
+
 
 @_attrs_define
 class ToolPart:
@@ -34,7 +39,7 @@ class ToolPart:
     call_id: str
     tool: str
     state: Union["ToolStateCompleted", "ToolStateError", "ToolStatePending", "ToolStateRunning"]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.tool_state_completed import ToolStateCompleted
@@ -64,7 +69,8 @@ class ToolPart:
             state = self.state.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -86,24 +92,28 @@ class ToolPart:
         from ..models.tool_state_pending import ToolStatePending
         from ..models.tool_state_running import ToolStateRunning
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        message_id = d.pop("messageID")
+        message_id = d["messageID"]
 
-        type_ = cast(Literal["tool"], d.pop("type"))
+        type_ = cast(Literal["tool"], d["type"])
         if type_ != "tool":
             raise ValueError(f"type must match const 'tool', got '{type_}'")
 
-        call_id = d.pop("callID")
+        call_id = d["callID"]
 
-        tool = d.pop("tool")
+        tool = d["tool"]
 
         def _parse_state(
             data: object,
         ) -> Union["ToolStateCompleted", "ToolStateError", "ToolStatePending", "ToolStateRunning"]:
+            if isinstance(data, dict):
+                _member = _discriminators.TOOL_STATE.match(data)
+                if _member is not None:
+                    return _member.from_dict(data)
             try:
                 if not isinstance(data, dict):
                     raise TypeError()
@@ -134,7 +144,7 @@ class ToolPart:
 
             return componentsschemas_tool_state_type_3
 
-        state = _parse_state(d.pop("state"))
+        state = _parse_state(d["state"])
 
         tool_part = cls(
             id=id,
@@ -146,15 +156,28 @@ class ToolPart:
             state=state,
         )
 
-        tool_part.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_part._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_part
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -163,4 +186,4 @@ class ToolPart:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,9 +1,11 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.tool_state_completed_input import ToolStateCompletedInput
     from ..models.tool_state_completed_metadata import ToolStateCompletedMetadata
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ToolStateCompleted")
 
+_KNOWN_KEYS = frozenset(("status", "input", "output", "title", "metadata", "time"))
+
 
 @_attrs_define
 class ToolStateCompleted:
@@ -31,7 +35,7 @@ class ToolStateCompleted:
     title: str
     metadata: "ToolStateCompletedMetadata"
     time: "ToolStateCompletedTime"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         status = self.status
@@ -47,7 +51,8 @@ class ToolStateCompleted:
         time = self.time.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "status": status,
@@ -67,20 +72,20 @@ class ToolStateCompleted:
         from ..models.tool_state_completed_metadata import ToolStateCompletedMetadata
         from ..models.tool_state_completed_time import ToolStateCompletedTime
 
-        d = dict(src_dict)
-        status = cast(Literal["completed"], d.pop("status"))
+        d = src_dict
+        status = cast(Literal["completed"], d["status"])
         if status != "completed":
             raise ValueError(f"status must match const 'completed', got '{status}'")
 
-        input_ = ToolStateCompletedInput.from_dict(d.pop("input"))
+        input_ = ToolStateCompletedInput.from_dict(d["input"])
 
-        output = d.pop("output")
+        output = d["output"]
 
-        title = d.pop("title")
+        title = d["title"]
 
-        metadata = ToolStateCompletedMetadata.from_dict(d.pop("metadata"))
+        metadata = ToolStateCompletedMetadata.from_dict(d["metadata"])
 
-        time = ToolStateCompletedTime.from_dict(d.pop("time"))
+        time = ToolStateCompletedTime.from_dict(d["time"])
 
         tool_state_completed = cls(
             status=status,
@@ -91,15 +96,28 @@ class ToolStateCompleted:
             time=time,
         )
 
-        tool_state_completed.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_state_completed._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_state_completed
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -108,4 +126,4 @@ class ToolStateCompleted:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,13 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, TypeVar, Union
+from typing import Any, Optional, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 T = TypeVar("T", bound="ToolStateCompletedTime")
 
+_KNOWN_KEYS = frozenset(("start", "end", "compacted"))
+
 
 @_attrs_define
 class ToolStateCompletedTime:
@@ -21,7 +23,7 @@ class ToolStateCompletedTime:
     start: float
     end: float
     compacted: Union[Unset, float] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         start = self.start
@@ -31,7 +33,8 @@ class ToolStateCompletedTime:
         compacted = self.compacted
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "start": start,
@@ -45,12 +48,12 @@ class ToolStateCompletedTime:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        start = d.pop("start")
+        d = src_dict
+        start = d["start"]
 
-        end = d.pop("end")
+        end = d["end"]
 
-        compacted = d.pop("compacted", UNSET)
+        compacted = d.get("compacted", UNSET)
 
         tool_state_completed_time = cls(
             start=start,
@@ -58,15 +61,28 @@ class ToolStateCompletedTime:
             compacted=compacted,
         )
 
-        tool_state_completed_time.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_state_completed_time._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_state_completed_time
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -75,4 +91,4 @@ class ToolStateCompletedTime:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
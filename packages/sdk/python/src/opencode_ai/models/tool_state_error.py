@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.tool_state_error_input import ToolStateErrorInput
@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ToolStateError")
 
+_KNOWN_KEYS = frozenset(("status", "input", "error", "time", "metadata"))
+
 
 @_attrs_define
 class ToolStateError:
@@ -31,7 +33,7 @@ class ToolStateError:
     error: str
     time: "ToolStateErrorTime"
     metadata: Union[Unset, "ToolStateErrorMetadata"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         status = self.status
@@ -47,7 +49,8 @@ class ToolStateError:
             metadata = self.metadata.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "status": status,
@@ -67,18 +70,18 @@ class ToolStateError:
         from ..models.tool_state_error_metadata import ToolStateErrorMetadata
         from ..models.tool_state_error_time import ToolStateErrorTime
 
-        d = dict(src_dict)
-        status = cast(Literal["error"], d.pop("status"))
+        d = src_dict
+        status = cast(Literal["error"], d["status"])
         if status != "error":
             raise ValueError(f"status must match const 'error', got '{status}'")
 
-        input_ = ToolStateErrorInput.from_dict(d.pop("input"))
+        input_ = ToolStateErrorInput.from_dict(d["input"])
 
-        error = d.pop("error")
+        error = d["error"]
 
-        time = ToolStateErrorTime.from_dict(d.pop("time"))
+        time = ToolStateErrorTime.from_dict(d["time"])
 
-        _metadata = d.pop("metadata", UNSET)
+        _metadata = d.get("metadata", UNSET)
         metadata: Union[Unset, ToolStateErrorMetadata]
         if isinstance(_metadata, Unset):
             metadata = UNSET
@@ -93,15 +96,28 @@ class ToolStateError:
             metadata=metadata,
         )
 
-        tool_state_error.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_state_error._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_state_error
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -110,4 +126,4 @@ class ToolStateError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="ToolStatePending")
 
+_KNOWN_KEYS = frozenset(("status",))
+
 
 @_attrs_define
 class ToolStatePending:
@@ -15,13 +19,14 @@ class ToolStatePending:
     """
 
     status: Literal["pending"]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         status = self.status
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "status": status,
@@ -32,8 +37,8 @@ class ToolStatePending:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        status = cast(Literal["pending"], d.pop("status"))
+        d = src_dict
+        status = cast(Literal["pending"], d["status"])
         if status != "pending":
             raise ValueError(f"status must match const 'pending', got '{status}'")
 
@@ -41,15 +46,28 @@ class ToolStatePending:
             status=status,
         )
 
-        tool_state_pending.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_state_pending._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_state_pending
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -58,4 +76,4 @@ class ToolStatePending:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
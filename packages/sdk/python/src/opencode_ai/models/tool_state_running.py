@@ -1,10 +1,10 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, _empty_as_none
 
 if TYPE_CHECKING:
     from ..models.tool_state_running_metadata import ToolStateRunningMetadata
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ToolStateRunning")
 
+_KNOWN_KEYS = frozenset(("status", "input", "time", "title", "metadata"))
+
 
 @_attrs_define
 class ToolStateRunning:
@@ -30,7 +32,7 @@ class ToolStateRunning:
     time: "ToolStateRunningTime"
     title: Union[Unset, str] = UNSET
     metadata: Union[Unset, "ToolStateRunningMetadata"] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         status = self.status
@@ -46,7 +48,8 @@ class ToolStateRunning:
             metadata = self.metadata.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "status": status,
@@ -66,18 +69,18 @@ class ToolStateRunning:
         from ..models.tool_state_running_metadata import ToolStateRunningMetadata
         from ..models.tool_state_running_time import ToolStateRunningTime
 
-        d = dict(src_dict)
-        status = cast(Literal["running"], d.pop("status"))
+        d = src_dict
+        status = cast(Literal["running"], d["status"])
         if status != "running":
             raise ValueError(f"status must match const 'running', got '{status}'")
 
-        input_ = d.pop("input")
+        input_ = d["input"]
 
-        time = ToolStateRunningTime.from_dict(d.pop("time"))
+        time = ToolStateRunningTime.from_dict(d["time"])
 
-        title = d.pop("title", UNSET)
+        title = d.get("title", UNSET)
 
-        _metadata = d.pop("metadata", UNSET)
+        _metadata = d.get("metadata", UNSET)
         metadata: Union[Unset, ToolStateRunningMetadata]
         if isinstance(_metadata, Unset):
             metadata = UNSET
@@ -92,15 +95,28 @@ class ToolStateRunning:
             metadata=metadata,
         )
 
-        tool_state_running.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            tool_state_running._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return tool_state_running
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -109,4 +125,4 @@ class ToolStateRunning:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
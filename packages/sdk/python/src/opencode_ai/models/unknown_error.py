@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.unknown_error_data import UnknownErrorData
 
 
 T = TypeVar("T", bound="UnknownError")
 
+_KNOWN_KEYS = frozenset(("name", "data"))
+
 
 @_attrs_define
 class UnknownError:
@@ -21,7 +25,7 @@ class UnknownError:
 
     name: Literal["UnknownError"]
     data: "UnknownErrorData"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         name = self.name
@@ -29,7 +33,8 @@ class UnknownError:
         data = self.data.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "name": name,
@@ -43,27 +48,40 @@ class UnknownError:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.unknown_error_data import UnknownErrorData
 
-        d = dict(src_dict)
-        name = cast(Literal["UnknownError"], d.pop("name"))
+        d = src_dict
+        name = cast(Literal["UnknownError"], d["name"])
         if name != "UnknownError":
             raise ValueError(f"name must match const 'UnknownError', got '{name}'")
 
-        data = UnknownErrorData.from_dict(d.pop("data"))
+        data = UnknownErrorData.from_dict(d["data"])
 
         unknown_error = cls(
             name=name,
             data=data,
         )
 
-        unknown_error.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            unknown_error._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return unknown_error
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -72,4 +90,4 @@ class UnknownError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
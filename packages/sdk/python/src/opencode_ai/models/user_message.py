@@ -1,15 +1,19 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 if TYPE_CHECKING:
     from ..models.user_message_time import UserMessageTime
 
 
 T = TypeVar("T", bound="UserMessage")
 
+_KNOWN_KEYS = frozenset(("id", "sessionID", "role", "time"))
+
 
 @_attrs_define
 class UserMessage:
@@ -25,7 +29,7 @@ class UserMessage:
     session_id: str
     role: Literal["user"]
     time: "UserMessageTime"
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -37,7 +41,8 @@ class UserMessage:
         time = self.time.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -53,16 +58,16 @@ class UserMessage:
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
         from ..models.user_message_time import UserMessageTime
 
-        d = dict(src_dict)
-        id = d.pop("id")
+        d = src_dict
+        id = d["id"]
 
-        session_id = d.pop("sessionID")
+        session_id = d["sessionID"]
 
-        role = cast(Literal["user"], d.pop("role"))
+        role = cast(Literal["user"], d["role"])
         if role != "user":
             raise ValueError(f"role must match const 'user', got '{role}'")
 
-        time = UserMessageTime.from_dict(d.pop("time"))
+        time = UserMessageTime.from_dict(d["time"])
 
         user_message = cls(
             id=id,
@@ -71,15 +76,28 @@ class UserMessage:
             time=time,
         )
 
-        user_message.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            user_message._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return user_message
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -88,4 +106,4 @@ class UserMessage:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
@@ -1,11 +1,15 @@
 from collections.abc import Mapping
-from typing import Any, Literal, TypeVar, cast
+from typing import Any, Literal, Optional, TypeVar, cast
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import _empty_as_none
+
 T = TypeVar("T", bound="WellKnownAuth")
 
+_KNOWN_KEYS = frozenset(("type", "key", "token"))
+
 
 @_attrs_define
 class WellKnownAuth:
@@ -19,7 +23,7 @@ class WellKnownAuth:
     type_: Literal["wellknown"]
     key: str
     token: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: Optional[dict[str, Any]] = _attrs_field(init=False, default=None, eq=_empty_as_none)
 
     def to_dict(self) -> dict[str, Any]:
         type_ = self.type_
@@ -29,7 +33,8 @@ class WellKnownAuth:
         token = self.token
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "type": type_,
@@ -42,14 +47,14 @@ class WellKnownAuth:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = cast(Literal["wellknown"], d.pop("type"))
+        d = src_dict
+        type_ = cast(Literal["wellknown"], d["type"])
         if type_ != "wellknown":
             raise ValueError(f"type must match const 'wellknown', got '{type_}'")
 
-        key = d.pop("key")
+        key = d["key"]
 
-        token = d.pop("token")
+        token = d["token"]
 
         well_known_auth = cls(
             type_=type_,
@@ -57,15 +62,28 @@ class WellKnownAuth:
             token=token,
         )
 
-        well_known_auth.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(d):
+            well_known_auth._additional_properties = {k: v for k, v in d.items() if k not in _KNOWN_KEYS}
         return well_known_auth
 
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         self.additional_properties[key] = value
@@ -74,4 +92,4 @@ class WellKnownAuth:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return self._additional_properties is not None and key in self._additional_properties
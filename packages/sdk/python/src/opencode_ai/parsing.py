@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+import httpx
+
+from . import instrument
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient, Client
+
+# values of Client.parse_mode: attrs models, decoded JSON, or the body as received
+PARSE_MODES = ("model", "dict", "bytes")
+
+
+def raw_response(*, client: Union["AuthenticatedClient", "Client"], response: httpx.Response) -> httpx.Response:
+    """Response builder of the generated raw()/araw(): the httpx.Response itself, body unread by the SDK."""
+    return response
+
+
+def unparsed(client: Union["AuthenticatedClient", "Client"], response: httpx.Response) -> Any:
+    """The parsed value of a successful response when `client.parse_mode` is not "model"."""
+    if client.parse_mode == "bytes":
+        return response.content
+    return instrument.loads(response.content)
+
+
+def parse_item(
+    client: Union["AuthenticatedClient", "Client"],
+    data: bytes,
+    from_dict: Callable[[Any], Any],
+    probe: Optional["instrument.StreamProbe"] = None,
+) -> Any:
+    """Parse one encoded JSON value (e.g. an element of a streamed array) according to `client.parse_mode`.
+
+    With the `probe` of an instrumented stream, its size, decoding and model building are counted there.
+    """
+    if client.parse_mode == "bytes":
+        if probe is not None:
+            probe.bytes += len(data)
+        return data
+    if probe is not None:
+        return probe.item(data, None if client.parse_mode == "dict" else from_dict)
+    value = instrument.loads(data)
+    return value if client.parse_mode == "dict" else from_dict(value)
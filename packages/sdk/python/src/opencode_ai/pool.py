@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import ipaddress
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
+from urllib.request import getproxies
+
+import httpx
+
+# httpx's defaults, used for the pool options OpenCodeClient is not given
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def pool_limits(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+) -> httpx.Limits:
+    """httpx.Limits with httpx's defaults for the options left out."""
+    if max_connections is None:
+        max_connections = DEFAULT_MAX_CONNECTIONS
+    if max_keepalive_connections is None:
+        max_keepalive_connections = min(DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections)
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY if keepalive_expiry is None else keepalive_expiry,
+    )
+
+
+def _is_ip_address(host: str, version: int) -> bool:
+    try:
+        return ipaddress.ip_address(host.split("/")[0]).version == version
+    except ValueError:
+        return False
+
+
+def environment_proxies() -> Dict[str, Optional[str]]:
+    """Proxy URL (None to bypass) per httpx mount pattern, from HTTP(S)_PROXY, ALL_PROXY and NO_PROXY.
+
+    The same mapping httpx derives for a client with `trust_env`: NO_PROXY entries become `all://`
+    patterns (`.example.com` matches subdomains only, `example.com` the domain as well), and `*`
+    turns proxies off altogether.
+    """
+    found = getproxies()
+    mounts: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        url = found.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+    for host in (h.strip() for h in found.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            mounts[host] = None
+        elif _is_ip_address(host, 4) or host.lower() == "localhost":
+            mounts[f"all://{host}"] = None
+        elif _is_ip_address(host, 6):
+            mounts[f"all://[{host}]"] = None
+        else:
+            mounts[f"all://*{host}"] = None
+    return mounts
+
+
+# httpx.Client arguments that configure the transports it builds
+_TRANSPORT_OPTIONS = ("cert", "trust_env", "http1", "http2", "limits")
+
+
+def build_transports(
+    transport_cls: type,
+    httpx_args: Dict[str, Any],
+    *,
+    uds: Optional[str] = None,
+    verify: Any = True,
+    pool_stats: Optional["PoolStats"] = None,
+) -> Dict[str, Any]:
+    """`httpx_args` with the `transport` and `mounts` httpx would build itself, built here instead.
+
+    The connection pool gets the pool options and `uds`; proxies get a transport each: `proxy` when
+    given, else HTTP(S)_PROXY/ALL_PROXY/NO_PROXY from the environment unless `trust_env` is False.
+    As in httpx, a `transport` in `httpx_args` is used as is and turns off the environment proxies,
+    and so does `uds`. With `pool_stats` every transport counts into it.
+    """
+    args = dict(httpx_args)
+    options = {k: args[k] for k in _TRANSPORT_OPTIONS if k in args}
+    proxy = args.pop("proxy", None)
+    given = args.pop("transport", None)
+    if proxy is not None:
+        proxies: Dict[str, Any] = {"all://": proxy}
+    elif given is None and uds is None and options.get("trust_env", True):
+        proxies = environment_proxies()
+    else:
+        proxies = {}
+    wrap = pool_stats.wrap if pool_stats is not None else (lambda transport: transport)
+    pool = given if given is not None else transport_cls(uds=uds, verify=verify, **options)
+    args["transport"] = wrap(pool)
+    mounts = {
+        pattern: None if url is None else wrap(transport_cls(proxy=url, verify=verify, **options))
+        for pattern, url in proxies.items()
+    }
+    # mounts of the caller's own win, as they do in httpx
+    mounts.update({pattern: None if t is None else wrap(t) for pattern, t in (args.get("mounts") or {}).items()})
+    if mounts:
+        args["mounts"] = mounts
+    return args
+
+
+def require_h2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError as e:
+        raise ImportError("http2=True needs the h2 package: pip install opencode-ai[http2]") from e
+
+
+class PoolStats:
+    """Saturation counters of one connection pool, kept by the transport as requests come and go.
+
+    A request is in flight from when it is handed to the pool until its response body is closed,
+    which for an event stream is the life of the subscription. `saturated` counts requests that
+    started while `max_connections` were already in flight, i.e. had to wait for a connection over
+    HTTP/1.1 (HTTP/2 multiplexes them instead), and `pool_timeouts` those that gave up waiting.
+    """
+
+    __slots__ = ("max_connections", "in_flight", "peak", "requests", "saturated", "pool_timeouts", "_lock")
+
+    def __init__(self, max_connections: Optional[int] = None) -> None:
+        self.max_connections = max_connections
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+        self.saturated = 0
+        self.pool_timeouts = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolStats(in_flight={self.in_flight}/{self.max_connections}, peak={self.peak}, "
+            f"saturated={self.saturated}, pool_timeouts={self.pool_timeouts})"
+        )
+
+    @property
+    def saturation(self) -> Optional[float]:
+        """In-flight requests as a fraction of `max_connections` (None when unbounded)."""
+        return None if not self.max_connections else self.in_flight / self.max_connections
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_connections": self.max_connections,
+                "in_flight": self.in_flight,
+                "peak": self.peak,
+                "requests": self.requests,
+                "saturated": self.saturated,
+                "pool_timeouts": self.pool_timeouts,
+            }
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self.max_connections and self.in_flight >= self.max_connections:
+                self.saturated += 1
+            self.in_flight += 1
+            self.requests += 1
+            if self.in_flight > self.peak:
+                self.peak = self.in_flight
+
+    def _release(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if isinstance(error, httpx.PoolTimeout):
+                self.pool_timeouts += 1
+
+    def wrap(self, transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport]) -> "_GaugedTransport":
+        """`transport`, counting its requests into these stats."""
+        return _GaugedTransport(transport, self)
+
+
+class _Release:
+    __slots__ = ("stats", "done")
+
+    def __init__(self, stats: PoolStats) -> None:
+        self.stats = stats
+        self.done = False
+
+    def __call__(self) -> None:
+        if not self.done:
+            self.done = True
+            self.stats._release()
+
+
+class _ReleasingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that gives the pool slot back when it is closed."""
+
+    def __init__(self, stream: Any, release: _Release) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._stream)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._stream.__aiter__()
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _GaugedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Counts requests into PoolStats around a sync or async transport (or one that is both)."""
+
+    def __init__(self, transport: Any, stats: PoolStats) -> None:
+        self._transport = transport
+        self._stats = stats
+
+    def _track(self, response: httpx.Response) -> httpx.Response:
+        if isinstance(response.stream, httpx.ByteStream):
+            # an in-memory body holds no connection
+            self._stats._release()
+        else:
+            response.stream = _ReleasingStream(response.stream, _Release(self._stats))
+        return response
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._stats._acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as e:
+            self._stats._release(e)
+            raise
+        return self._track(response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._stats._acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as e:
+            self._stats._release(e)
+            raise
+        return self._track(response)
+
+    def close(self) -> None:
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class SharedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Another client's transport, borrowed: requests go through its pool, closing leaves it open.
+
+    Clients derived with `with_headers`/`with_cookies`/`with_timeout` use one of these, so they
+    reuse the connection pool of the client they came from, which keeps owning it.
+    """
+
+    def __init__(self, transport: Any) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
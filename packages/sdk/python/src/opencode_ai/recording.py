@@ -0,0 +1,325 @@
+"""Record a live `/event` stream to a file and replay it through an httpx.MockTransport.
+
+Recordings are append-only. Each event is stored with its arrival time in seconds since recording
+started (from `time.monotonic`; appended events continue from the last recorded time), either as
+newline-delimited JSON, one `{"t": ..., "event": ...}` object per line, or length-prefixed: a
+header, then a big-endian float64 time, a uint32 length and the JSON payload per event. Files ending
+in `.gz` or `.zst` are gzip or zstd compressed (zstd needs the `zstandard` package,
+`pip install opencode-ai[zstd]`).
+
+    python -m opencode_ai.recording record events.ndjson.gz --base-url http://localhost:4096 --count 5000
+
+    transport = replay_transport("events.ndjson.gz", speed=10)
+    client.client.set_httpx_client(httpx.Client(base_url="http://replay", transport=transport))
+    for event in client.subscribe_events():
+        ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import io
+import queue
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import httpx
+
+from . import codec
+
+FRAMINGS = ("ndjson", "length")
+COMPRESSIONS = ("gzip", "zstd")
+
+# first bytes of a length-prefixed recording
+LENGTH_MAGIC = b"OCEVENTS1\n"
+_RECORD = struct.Struct(">dI")
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+PathLike = Union[str, Path]
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd recordings need the zstandard package: pip install opencode-ai[zstd]") from e
+    return zstandard
+
+
+def _compression_for(path: Path) -> Optional[str]:
+    if path.suffix == ".gz":
+        return "gzip"
+    if path.suffix == ".zst":
+        return "zstd"
+    return None
+
+
+class EventRecorder:
+    """Append events to a recording file.
+
+    `framing` is "ndjson" (default) or "length"; `compression` is "gzip", "zstd", None, or "auto" to
+    pick it from the file suffix. Use it as a context manager, or call `close()`. Events appended to
+    an existing recording are timed from its last event on, so its times stay in order; its framing
+    and compression must match, or ValueError is raised.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        framing: str = "ndjson",
+        compression: Optional[str] = "auto",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if framing not in FRAMINGS:
+            raise ValueError(f"Unknown framing {framing!r}, expected one of {list(FRAMINGS)}")
+        path = Path(path)
+        if compression == "auto":
+            compression = _compression_for(path)
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression!r}, expected one of {list(COMPRESSIONS)} or None")
+        self.path = path
+        self.framing = framing
+        self.compression = compression
+        self.count = 0
+        self._clock = clock
+        fresh = not path.exists() or path.stat().st_size == 0
+        last = 0.0
+        if not fresh:
+            existing = _format_of(path)
+            if existing != (framing, compression):
+                raise ValueError(
+                    f"{path} is a {existing[0]} recording with compression {existing[1]!r}; "
+                    f"cannot append {framing} records with compression {compression!r}"
+                )
+            for last, _ in iter_recording(path):
+                pass
+        self._start = clock() - last
+        self._raw = open(path, "ab")
+        self._out: IO[bytes]
+        if compression == "gzip":
+            self._out = gzip.GzipFile(fileobj=self._raw, mode="ab")
+        elif compression == "zstd":
+            self._out = _zstandard().ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            self._out = self._raw
+        if framing == "length" and fresh:
+            self._out.write(LENGTH_MAGIC)
+
+    def write(self, event: Dict[str, Any]) -> None:
+        """Append one event, stamped with the time since the recorder was created."""
+        t = self._clock() - self._start
+        if self.framing == "ndjson":
+            self._out.write(codec.dumps({"t": round(t, 6), "event": event}) + b"\n")
+        else:
+            payload = codec.dumps(event)
+            self._out.write(_RECORD.pack(t, len(payload)) + payload)
+        self.count += 1
+
+    def record(self, events: Iterable[Dict[str, Any]], *, count: Optional[int] = None) -> int:
+        """Write events until `events` ends or `count` were written; return how many were written."""
+        written = 0
+        if count is not None and count <= 0:
+            return written
+        for event in events:
+            self.write(event)
+            written += 1
+            if count is not None and written >= count:
+                break
+        return written
+
+    def flush(self) -> None:
+        self._out.flush()
+        if self._out is not self._raw:
+            self._raw.flush()
+
+    def close(self) -> None:
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _format_of(path: Path) -> Tuple[str, Optional[str]]:
+    """(framing, compression) of an existing recording."""
+    with open(path, "rb") as raw:
+        head = raw.read(4)
+    compression = "gzip" if head.startswith(_GZIP_MAGIC) else "zstd" if head == _ZSTD_MAGIC else None
+    with _open_recording(path) as stream:
+        framing = "length" if stream.peek(len(LENGTH_MAGIC))[: len(LENGTH_MAGIC)] == LENGTH_MAGIC else "ndjson"
+    return framing, compression
+
+
+def _open_recording(path: Path) -> IO[bytes]:
+    raw = open(path, "rb")
+    head = raw.read(4)
+    raw.seek(0)
+    if head.startswith(_GZIP_MAGIC):
+        raw.close()
+        return gzip.open(path, "rb")
+    if head == _ZSTD_MAGIC:
+        return io.BufferedReader(_zstandard().ZstdDecompressor().stream_reader(raw, read_across_frames=True))
+    return raw
+
+
+def iter_recording(path: PathLike) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Yield (seconds since recording started, event) pairs; framing and compression are detected."""
+    with _open_recording(Path(path)) as stream:
+        if stream.peek(len(LENGTH_MAGIC))[: len(LENGTH_MAGIC)] == LENGTH_MAGIC:
+            stream.read(len(LENGTH_MAGIC))
+            while True:
+                header = stream.read(_RECORD.size)
+                if len(header) < _RECORD.size:
+                    return
+                t, size = _RECORD.unpack(header)
+                yield t, codec.loads(stream.read(size))
+        else:
+            for line in stream:
+                if line.strip():
+                    record = codec.loads(line)
+                    yield record["t"], record["event"]
+
+
+def load_recording(path: PathLike) -> List[Tuple[float, Dict[str, Any]]]:
+    return list(iter_recording(path))
+
+
+class _ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """SSE body replaying recorded events, sleeping between them to reproduce their timing."""
+
+    def __init__(self, records: Sequence[Tuple[float, Dict[str, Any]]], speed: Optional[float]) -> None:
+        self._records = records
+        self._speed = speed
+
+    def _frames(self) -> Iterator[Tuple[float, bytes]]:
+        previous = self._records[0][0] if self._records else 0.0
+        for t, event in self._records:
+            delay = max(0.0, t - previous) / self._speed if self._speed else 0.0
+            previous = t
+            yield delay, b"data: " + codec.dumps(event) + b"\n\n"
+
+    def __iter__(self) -> Iterator[bytes]:
+        for delay, frame in self._frames():
+            if delay:
+                time.sleep(delay)
+            yield frame
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for delay, frame in self._frames():
+            if delay:
+                await asyncio.sleep(delay)
+            yield frame
+
+
+def replay_transport(
+    recording: Union[PathLike, Sequence[Tuple[float, Dict[str, Any]]]], *, speed: Optional[float] = 1.0
+) -> httpx.MockTransport:
+    """An httpx.MockTransport serving a recording as the `/event` stream, for sync and async clients.
+
+    `speed` scales the recorded gaps between events (2.0 replays twice as fast); None replays without
+    any delay. Every `/event` request replays the whole recording; other paths return 404.
+    """
+    records = load_recording(recording) if isinstance(recording, (str, Path)) else list(recording)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path != "/event":
+            return httpx.Response(404)
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, stream=_ReplayStream(records, speed))
+
+    return httpx.MockTransport(handler)
+
+
+_END = object()
+
+
+def _until(events: Iterable[Dict[str, Any]], deadline: Optional[float]) -> Iterator[Dict[str, Any]]:
+    """Events from `events` until the `time.monotonic` deadline, which also ends a silent stream.
+
+    `events` is read on a daemon thread, so waiting for the next event cannot outlast the deadline.
+    """
+    if deadline is None:
+        yield from events
+        return
+    inbox: "queue.Queue[Any]" = queue.Queue(1000)
+
+    def read() -> None:
+        try:
+            for event in events:
+                inbox.put(event)
+        except BaseException as e:
+            inbox.put(e)
+        finally:
+            inbox.put(_END)
+
+    threading.Thread(target=read, name="opencode-record", daemon=True).start()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        try:
+            item = inbox.get(timeout=remaining)
+        except queue.Empty:
+            return
+        if item is _END:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m opencode_ai.recording", description=__doc__.split("\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="record the /event stream of a running server")
+    rec.add_argument("path", help="output file; .gz or .zst selects compression")
+    rec.add_argument("--base-url", default="http://localhost:4096")
+    rec.add_argument("--directory")
+    rec.add_argument("--framing", choices=FRAMINGS, default="ndjson")
+    rec.add_argument("--count", type=int, help="stop after this many events")
+    rec.add_argument("--duration", type=float, help="stop after this many seconds")
+    info = sub.add_parser("info", help="summarise a recording")
+    info.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.command == "info":
+        records = load_recording(args.path)
+        span = records[-1][0] - records[0][0] if records else 0.0
+        print(f"{len(records)} events over {span:.3f}s")
+        kinds: Dict[str, int] = {}
+        for _, event in records:
+            kinds[event.get("type", "")] = kinds.get(event.get("type", ""), 0) + 1
+        for kind, n in sorted(kinds.items(), key=lambda kv: -kv[1]):
+            print(f"{n:8d}  {kind}")
+        return 0
+
+    from .extras import OpenCodeClient
+    from .types import UNSET
+
+    client = OpenCodeClient(base_url=args.base_url)
+    deadline = None if args.duration is None else time.monotonic() + args.duration
+    events = client.subscribe_events(directory=args.directory or UNSET, reconnect=True)
+    with EventRecorder(args.path, framing=args.framing) as recorder:
+        try:
+            for event in _until(events, deadline):
+                recorder.write(event)
+                if args.count is not None and recorder.count >= args.count:
+                    break
+        except KeyboardInterrupt:
+            pass
+    print(f"recorded {recorder.count} events to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
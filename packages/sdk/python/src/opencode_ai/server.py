@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from . import codec
+
+if TYPE_CHECKING:
+    from .extras import AsyncOpenCodeClient, OpenCodeClient
+
+# printed by `opencode serve` once it accepts connections
+_LISTENING_RE = re.compile(r"opencode server listening on\s+(https?://\S+)")
+
+
+class ServerError(RuntimeError):
+    """A local opencode server could not be started or reached."""
+
+
+def wait_until_ready(base_url: str = "http://localhost", *, uds: Optional[str] = None, timeout: float = 5.0) -> None:
+    """Poll GET /path until the server at `base_url` (or behind the socket `uds`) answers."""
+    transport = httpx.HTTPTransport(uds=uds) if uds is not None else None
+    deadline = time.monotonic() + timeout
+    with httpx.Client(base_url=base_url, transport=transport, timeout=1.0) as client:
+        while True:
+            try:
+                client.get("/path")
+                return
+            except httpx.TransportError as e:
+                if time.monotonic() >= deadline:
+                    target = uds or base_url
+                    raise ServerError(f"opencode server at {target} not reachable after {timeout}s") from e
+            time.sleep(0.05)
+
+
+class LocalServer:
+    """An opencode server on this host: a spawned `opencode serve` child process, or an attached one.
+
+        with LocalServer() as server:
+            client = server.client()
+            client.list_sessions()
+
+    `start()` runs `command` (default `opencode serve`) with `--hostname`/`--port` and waits until
+    it prints the address it listens on; port 0 picks a free one. `config` is passed to the child as
+    OPENCODE_CONFIG_CONTENT. For a command that serves on a Unix domain socket, pass `uds` and the
+    server is polled through the socket instead. `attach()` wraps a server that is already running.
+    Servers started here are terminated by `stop()`, attached ones are left alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        hostname: str = "127.0.0.1",
+        port: int = 0,
+        config: Optional[Dict[str, Any]] = None,
+        command: Sequence[str] = ("opencode", "serve"),
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        uds: Optional[str] = None,
+        timeout: float = 5.0,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+        self.config = config
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = env
+        self.uds = uds
+        self.timeout = timeout
+        self.url: Optional[str] = None
+        self.process: Optional[subprocess.Popen] = None
+        self._output: List[str] = []
+
+    def __repr__(self) -> str:
+        state = "spawned" if self.process is not None else "attached" if self.url else "stopped"
+        return f"LocalServer({self.uds or self.url!r}, {state})"
+
+    @classmethod
+    def attach(
+        cls, base_url: str = "http://localhost:4096", *, uds: Optional[str] = None, timeout: float = 5.0
+    ) -> "LocalServer":
+        """A server that is already running, once it answers requests."""
+        wait_until_ready(base_url, uds=uds, timeout=timeout)
+        server = cls(uds=uds, timeout=timeout)
+        server.url = base_url
+        return server
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    @property
+    def base_url(self) -> str:
+        """The URL to give clients; with a socket only its path part matters."""
+        return self.url or "http://localhost"
+
+    def start(self) -> "LocalServer":
+        if self.process is not None:
+            return self
+        env = {**os.environ, **(self.env or {}), "OPENCODE_CONFIG_CONTENT": codec.dumps(self.config or {}).decode()}
+        args = [*self.command, f"--hostname={self.hostname}", f"--port={self.port}"]
+        try:
+            self.process = subprocess.Popen(
+                args,
+                cwd=self.cwd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        except OSError as e:
+            raise ServerError(f"Could not run {args[0]!r}: {e}") from e
+        listening = threading.Event()
+        threading.Thread(
+            target=self._read_output, args=(self.process.stdout, listening), name="opencode-server", daemon=True
+        ).start()
+        try:
+            if self.uds is not None:
+                wait_until_ready(uds=self.uds, timeout=self.timeout)
+            elif not listening.wait(self.timeout) or self.url is None:
+                raise ServerError(self._failure(f"Timeout waiting for server to start after {self.timeout}s"))
+        except BaseException:
+            self.stop()
+            raise
+        return self
+
+    def _read_output(self, stream: IO[str], listening: threading.Event) -> None:
+        # keeps draining the child's output so it never blocks on a full pipe
+        for line in stream:
+            if len(self._output) < 200:
+                self._output.append(line)
+            if self.url is None:
+                match = _LISTENING_RE.search(line)
+                if match:
+                    self.url = match.group(1)
+                    listening.set()
+        listening.set()
+
+    def _failure(self, message: str) -> str:
+        if self.process is not None:
+            try:
+                # the output ends just before the process does
+                message = f"Server exited with code {self.process.wait(0.5)}"
+            except subprocess.TimeoutExpired:
+                pass
+        output = "".join(self._output).strip()
+        return f"{message}\nServer output: {output}" if output else message
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Terminate a spawned server (killing it after `timeout` seconds); attached ones are untouched."""
+        process, self.process = self.process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self.url = None
+
+    def client(self, **kwargs: Any) -> "OpenCodeClient":
+        """An OpenCodeClient for this server; keyword arguments are passed to it."""
+        from .extras import OpenCodeClient
+
+        return OpenCodeClient(base_url=self.base_url, uds=self.uds, **kwargs)
+
+    def async_client(self, **kwargs: Any) -> "AsyncOpenCodeClient":
+        """An AsyncOpenCodeClient for this server; keyword arguments are passed to it."""
+        from .extras import AsyncOpenCodeClient
+
+        return AsyncOpenCodeClient(base_url=self.base_url, uds=self.uds, **kwargs)
+
+    def __enter__(self) -> "LocalServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
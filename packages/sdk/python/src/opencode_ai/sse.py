@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class ServerSentEvent:
+    """One dispatched server-sent event."""
+
+    __slots__ = ("data", "event", "id", "retry")
+
+    def __init__(self, data: str, event: str = "message", id: str = "", retry: Optional[int] = None) -> None:
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"ServerSentEvent(event={self.event!r}, id={self.id!r}, data={self.data[:40]!r})"
+
+
+class SSEDecoder:
+    """Incremental text/event-stream decoder working on raw byte chunks.
+
+    Implements the WHATWG event stream interpretation: CRLF, LF or CR line endings, comments,
+    multi-line `data:`, `event:`, `id:` and `retry:` fields, and a leading BOM. Chunks are appended
+    to one bytearray and scanned in place, so a large event costs one pass over its bytes no matter
+    how it is split across chunks.
+
+    Use `feed()` for each chunk read from the response; both the sync and async streams share it.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        # offset into _buf before which no line terminator remains to be found
+        self._scanned = 0
+        self._started = False
+        self._skip_lf = False
+        self._event = ""
+        self._data: List[str] = []
+        self._retry: Optional[int] = None
+        self.last_event_id = ""
+        self.retry: Optional[int] = None
+
+    def reset(self) -> None:
+        """Drop any partially received event, e.g. before reconnecting.
+
+        `last_event_id` and `retry` are kept, as an EventSource does across reconnections.
+        """
+        self._buf = bytearray()
+        self._scanned = 0
+        self._started = False
+        self._skip_lf = False
+        self._event = ""
+        self._data = []
+        self._retry = None
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Consume a chunk and return the events it completed."""
+        if self._skip_lf and chunk:
+            # the previous chunk ended in CR; a leading LF belongs to that line ending
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        buf = self._buf
+        buf += chunk
+        if not self._started:
+            if len(buf) < len(_BOM) and _BOM.startswith(buf):
+                return []
+            if buf.startswith(_BOM):
+                del buf[: len(_BOM)]
+            self._started = True
+
+        events: List[ServerSentEvent] = []
+        pos = 0
+        size = len(buf)
+        lf = buf.find(b"\n", self._scanned)
+        cr = buf.find(b"\r", self._scanned)
+        with memoryview(buf) as view:
+            while lf != -1 or cr != -1:
+                if cr == -1 or (lf != -1 and lf < cr):
+                    end = lf
+                    nxt = lf + 1
+                elif cr + 1 < size:
+                    end = cr
+                    nxt = cr + 2 if buf[cr + 1] == 0x0A else cr + 1
+                else:
+                    end = cr
+                    nxt = cr + 1
+                    self._skip_lf = True
+                self._line(buf, view, pos, end, events)
+                pos = nxt
+                if lf != -1 and lf < pos:
+                    lf = buf.find(b"\n", pos)
+                if cr != -1 and cr < pos:
+                    cr = buf.find(b"\r", pos)
+        del buf[:pos]
+        self._scanned = len(buf)
+        return events
+
+    def _line(self, buf: bytearray, view: memoryview, start: int, end: int, events: List[ServerSentEvent]) -> None:
+        if start == end:
+            self._dispatch(events)
+            return
+        if buf[start] == 0x3A:  # ":" comment / heartbeat
+            return
+        colon = buf.find(b":", start, end)
+        if colon == -1:
+            field = bytes(view[start:end])
+            value = ""
+        else:
+            field = bytes(view[start:colon])
+            vstart = colon + 1
+            if vstart < end and buf[vstart] == 0x20:
+                vstart += 1
+            value = str(view[vstart:end], "utf-8", "replace")
+        if field == b"data":
+            self._data.append(value)
+        elif field == b"event":
+            self._event = value
+        elif field == b"id":
+            if "\0" not in value:
+                self.last_event_id = value
+        elif field == b"retry":
+            if value.isascii() and value.isdigit():
+                self.retry = self._retry = int(value)
+
+    def _dispatch(self, events: List[ServerSentEvent]) -> None:
+        if self._data:
+            events.append(
+                ServerSentEvent(
+                    "\n".join(self._data),
+                    event=self._event or "message",
+                    id=self.last_event_id,
+                    retry=self._retry,
+                )
+            )
+        self._event = ""
+        self._data = []
+        self._retry = None
+
+
+def iter_sse(chunks: Iterable[bytes], decoder: Optional[SSEDecoder] = None) -> Iterator[ServerSentEvent]:
+    """Decode server-sent events from an iterable of byte chunks (e.g. `Response.iter_bytes()`)."""
+    decoder = decoder or SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+
+
+async def aiter_sse(
+    chunks: AsyncIterable[bytes], decoder: Optional[SSEDecoder] = None
+) -> AsyncIterator[ServerSentEvent]:
+    """Async variant of iter_sse (e.g. over `Response.aiter_bytes()`)."""
+    decoder = decoder or SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
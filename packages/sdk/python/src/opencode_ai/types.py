@@ -2,7 +2,7 @@
 
 from collections.abc import Mapping, MutableMapping
 from http import HTTPStatus
-from typing import IO, BinaryIO, Generic, Literal, Optional, TypeVar, Union
+from typing import IO, Any, BinaryIO, Generic, Literal, Optional, TypeVar, Union
 
 from attrs import define
 
@@ -51,4 +51,9 @@ class Response(Generic[T]):
     parsed: Optional[T]
 
 
+def _empty_as_none(value: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """Comparison key for lazily allocated additional properties: no dict equals an empty one"""
+    return value or None
+
+
 __all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Dict, Hashable, Iterable, Iterator, Optional
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_by_type", "coalesce")
+
+
+def part_key(event: Dict[str, Any]) -> Optional[Hashable]:
+    """Coalescing key of an event: the part id of `message.part.updated`, None for everything else."""
+    if event.get("type") != "message.part.updated":
+        return None
+    part = (event.get("properties") or {}).get("part") or {}
+    return part.get("id")
+
+
+class EventBuffer:
+    """Bounded buffer decoupling an event subscription from a slow consumer.
+
+    Pass one as `subscribe_events(buffer=...)`: the stream is then read by a background thread (or
+    task, for the async clients) into the buffer, so the connection keeps draining while the consumer
+    works. What happens when `maxsize` events are waiting depends on `overflow`:
+
+    - "block": the reader waits for the consumer, pushing back on the connection (the default).
+    - "drop_oldest": the oldest waiting event is discarded.
+    - "drop_by_type": the oldest waiting event of the first type in `shed_types` that has one is
+      discarded; an incoming event of a shed type is discarded when none is waiting; otherwise the
+      oldest event is.
+    - "coalesce": an event with the same `key` (by default the part id of `message.part.updated`) as
+      a waiting one replaces it, so only the newest state of each part is delivered, at the position
+      of the newest update. When the buffer is full of distinct events the reader waits.
+
+    `dropped` and `coalesced` count discarded and replaced events. A buffer serves one subscription
+    at a time; starting the next one empties it and resets the counts.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        overflow: str = "block",
+        *,
+        shed_types: Iterable[str] = ("file.watcher.updated",),
+        key: Callable[[Dict[str, Any]], Optional[Hashable]] = part_key,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}, expected one of {list(OVERFLOW_POLICIES)}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.shed_types = tuple(shed_types)
+        self._key = key
+        self.dropped = 0
+        self.coalesced = 0
+        # sequence number -> (event, coalescing key), oldest first
+        self._items: "OrderedDict[int, tuple[Dict[str, Any], Optional[Hashable]]]" = OrderedDict()
+        self._seq = 0
+        # coalescing key -> sequence number of the waiting event holding it
+        self._keys: Dict[Hashable, int] = {}
+        # shed type -> sequence numbers of waiting events of that type, oldest first
+        self._shed: Dict[str, Deque[int]] = {t: deque() for t in self.shed_types}
+        self._cond = threading.Condition()
+        self._done = False
+        self._stopped = False
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return (
+            f"EventBuffer(overflow={self.overflow!r}, {len(self._items)}/{self.maxsize} waiting, "
+            f"dropped={self.dropped}, coalesced={self.coalesced})"
+        )
+
+    # ---- Queue operations (callers synchronise) ----
+
+    def _offer(self, event: Dict[str, Any]) -> bool:
+        """Add `event` according to the overflow policy; False means the reader has to wait."""
+        key = None
+        if self.overflow == "coalesce":
+            key = self._key(event)
+            if key is not None:
+                seq = self._keys.pop(key, None)
+                if seq is not None:
+                    del self._items[seq]
+                    self.coalesced += 1
+        if len(self._items) >= self.maxsize:
+            if self.overflow == "drop_oldest":
+                self._take()
+                self.dropped += 1
+            elif self.overflow == "drop_by_type":
+                self.dropped += 1
+                if not self._shed_one():
+                    if event.get("type") in self._shed:
+                        return True
+                    self._take()
+            else:
+                return False
+        seq = self._seq = self._seq + 1
+        self._items[seq] = (event, key)
+        if key is not None:
+            self._keys[key] = seq
+        shed = self._shed.get(event.get("type"))  # type: ignore[arg-type]
+        if shed is not None and self.overflow == "drop_by_type":
+            shed.append(seq)
+        return True
+
+    def _shed_one(self) -> bool:
+        for kind in self.shed_types:
+            waiting = self._shed[kind]
+            if waiting:
+                del self._items[waiting.popleft()]
+                return True
+        return False
+
+    def _take(self) -> Dict[str, Any]:
+        seq, (event, key) = self._items.popitem(last=False)
+        if key is not None and self._keys.get(key) == seq:
+            del self._keys[key]
+        if self.overflow == "drop_by_type":
+            shed = self._shed.get(event.get("type"))  # type: ignore[arg-type]
+            if shed:
+                shed.popleft()
+        return event
+
+    def _start(self) -> None:
+        # events left over from an abandoned subscription are not delivered to the next one
+        self._items.clear()
+        self._keys.clear()
+        for waiting in self._shed.values():
+            waiting.clear()
+        self.dropped = self.coalesced = 0
+        self._done = self._stopped = False
+        self._error = None
+
+    # ---- Relaying a subscription ----
+
+    def relay(self, source: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Read `source` on a daemon thread into the buffer and yield events from it.
+
+        Errors raised by `source` are re-raised here once the events before them are consumed.
+        When the consumer stops early, the thread exits at the next event it receives.
+        """
+        cond = self._cond
+        self._start()
+
+        def read() -> None:
+            try:
+                for event in source:
+                    with cond:
+                        while not self._offer(event):
+                            if self._stopped:
+                                return
+                            cond.wait()
+                        cond.notify_all()
+                    if self._stopped:
+                        return
+            except BaseException as e:
+                self._error = e
+            finally:
+                with cond:
+                    self._done = True
+                    cond.notify_all()
+
+        threading.Thread(target=read, name="opencode-events", daemon=True).start()
+        try:
+            while True:
+                with cond:
+                    while not self._items and not self._done:
+                        cond.wait()
+                    if not self._items:
+                        break
+                    event = self._take()
+                    cond.notify_all()
+                yield event
+            if self._error is not None:
+                raise self._error
+        finally:
+            with cond:
+                self._stopped = True
+                cond.notify_all()
+
+    async def arelay(self, source: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of relay(): `source` is read by a task on the running event loop."""
+        self._start()
+        ready = asyncio.Event()
+        space = asyncio.Event()
+
+        async def read() -> None:
+            try:
+                async for event in source:
+                    while not self._offer(event):
+                        space.clear()
+                        await space.wait()
+                    ready.set()
+            except Exception as e:
+                self._error = e
+            finally:
+                self._done = True
+                ready.set()
+
+        task = asyncio.ensure_future(read())
+        try:
+            while True:
+                while not self._items and not self._done:
+                    ready.clear()
+                    await ready.wait()
+                if not self._items:
+                    break
+                event = self._take()
+                space.set()
+                yield event
+            if self._error is not None:
+                raise self._error
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import httpx
+
+from .events import GAP_EVENT_TYPE
+
+# results derived from the configuration files, dropped when one of them changes
+CONFIG_DERIVED = frozenset(("config_get", "config_providers", "app_agents", "command_list", "tool_ids"))
+
+_CONFIG_FILES = ("opencode.json", "opencode.jsonc", "AGENTS.md")
+
+
+def _is_config_file(path: str) -> bool:
+    path = path.replace("\\", "/")
+    return path.endswith(_CONFIG_FILES) or "/.opencode/" in path or "/.config/opencode/" in path
+
+
+CacheKey = Tuple[str, Optional[str]]
+
+
+class _Entry:
+    __slots__ = ("value", "etag", "last_modified", "expires")
+
+    def __init__(self, value: Any, etag: Optional[str], last_modified: Optional[str], expires: float) -> None:
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Opt-in cache of parsed results for read-mostly endpoints, per endpoint and `directory`.
+
+    Entries are served without a request for `ttl` seconds. After that, an entry whose response
+    carried an `ETag` or `Last-Modified` validator is revalidated with a conditional request and
+    kept on `304 Not Modified`; otherwise it is refetched. Events seen by the owning client's
+    subscriptions invalidate entries early: a change to an opencode config file drops everything
+    derived from configuration, and `installation.updated` or a reconnect gap drops all entries.
+    Subscriptions filtered with `types=` or `session_id=` still let those events through to the cache.
+
+    Counters `hits`, `misses` and `revalidated` are kept for monitoring.
+    """
+
+    # server events that can make entries stale (reconnect gaps are detected by the client)
+    EVENT_TYPES = frozenset(("installation.updated", "file.edited", "file.watcher.updated"))
+    _NEEDLES = tuple(f'"{t}"' for t in sorted(EVENT_TYPES))
+
+    def __init__(self, ttl: float = 60.0, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: Dict[CacheKey, _Entry] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[Any], Optional[_Entry]]:
+        """Return (fresh value, None) on a hit, else (None, stale entry to revalidate or None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > self._clock():
+                self.hits += 1
+                return entry.value, None
+            self.misses += 1
+            return None, entry
+
+    def update(self, key: CacheKey, stale: Optional[_Entry], response: httpx.Response, parse: Callable[[], Any]) -> Any:
+        """Store the result of a (possibly conditional) request and return the parsed value."""
+        expires = self._clock() + self.ttl
+        if response.status_code == 304 and stale is not None:
+            with self._lock:
+                stale.expires = expires
+                self._entries[key] = stale
+                self.revalidated += 1
+            return stale.value
+        value = parse()
+        if response.status_code == 200 and value is not None:
+            entry = _Entry(value, response.headers.get("ETag"), response.headers.get("Last-Modified"), expires)
+            with self._lock:
+                self._entries[key] = entry
+        return value
+
+    def invalidate(self, endpoints: Optional[Iterable[str]] = None, directory: Optional[str] = None) -> None:
+        """Drop entries for the given endpoints (all by default), optionally for one directory only."""
+        names = None if endpoints is None else frozenset(endpoints)
+        with self._lock:
+            for key in [
+                k
+                for k in self._entries
+                if (names is None or k[0] in names) and (directory is None or k[1] == directory)
+            ]:
+                del self._entries[key]
+
+    def invalidated_by(self, data: str) -> bool:
+        """Cheap check on an undecoded event payload; False means `observe` would ignore it."""
+        return any(needle in data for needle in self._NEEDLES)
+
+    def observe(self, event: Dict[str, Any]) -> None:
+        """Invalidate whatever `event` may have made stale."""
+        kind = event.get("type")
+        if kind in ("installation.updated", GAP_EVENT_TYPE):
+            self.invalidate()
+        elif kind in ("file.edited", "file.watcher.updated"):
+            file = (event.get("properties") or {}).get("file")
+            if isinstance(file, str) and _is_config_file(file):
+                self.invalidate(CONFIG_DERIVED)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(ttl={self.ttl}, entries={len(self._entries)}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .buffering import part_key
+
+# parts that end a step; pending updates are flushed ahead of them
+_FLUSH_PARTS = frozenset(("step-finish",))
+
+_END = object()
+
+
+class _Failed:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class PartCoalescer:
+    """Collapses bursts of `message.part.updated` events for the same part into their latest state.
+
+    While a model streams, the server sends the whole TextPart/ReasoningPart again for every token
+    chunk. Pass a coalescer as `subscribe_events(coalesce=...)` and an update is held for up to
+    `window` seconds after the first one of a burst; updates for the same part arriving meanwhile
+    replace it. Pending updates are delivered early, ahead of the triggering event, when a
+    `step-finish` part or one of `flush_types` (default `session.idle`) arrives, and when the stream
+    ends. Other events pass through immediately, so they may overtake pending updates.
+
+    `coalesced` counts the updates that were replaced and never delivered.
+    """
+
+    def __init__(
+        self,
+        window: float = 0.1,
+        *,
+        key: Callable[[Dict[str, Any]], Optional[Hashable]] = part_key,
+        flush_types: Iterable[str] = ("session.idle",),
+        maxsize: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = window
+        self.flush_types = frozenset(flush_types)
+        self.maxsize = maxsize
+        self._key = key
+        self._clock = clock
+        # key -> (deadline, newest event), in order of each burst's first update
+        self._pending: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"PartCoalescer(window={self.window}, pending={len(self._pending)}, coalesced={self.coalesced})"
+
+    # ---- Pipeline steps ----
+
+    def push(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Take one event and return the events to deliver now."""
+        key = self._key(event)
+        if key is not None:
+            part = event["properties"]["part"]
+            if part.get("type") in _FLUSH_PARTS:
+                return self.flush() + [event]
+            pending = self._pending.get(key)
+            if pending is not None:
+                self._pending[key] = (pending[0], event)
+                self.coalesced += 1
+            else:
+                self._pending[key] = (self._clock() + self.window, event)
+            return []
+        kind = event.get("type")
+        if kind in self.flush_types:
+            return self.flush() + [event]
+        if kind == "message.part.removed":
+            # a pending update of the removed part is stale
+            self._pending.pop((event.get("properties") or {}).get("partID"), None)
+        return [event]
+
+    def due(self) -> List[Dict[str, Any]]:
+        """Pending updates whose window has elapsed."""
+        if not self._pending:
+            return []
+        now = self._clock()
+        ready = [key for key, (deadline, _) in self._pending.items() if deadline <= now]
+        return [self._pending.pop(key)[1] for key in ready]
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """All pending updates, oldest burst first."""
+        events = [event for _, event in self._pending.values()]
+        self._pending.clear()
+        return events
+
+    def timeout(self) -> Optional[float]:
+        """Seconds until the next pending update is due, or None when nothing is pending."""
+        if not self._pending:
+            return None
+        return max(0.0, min(deadline for deadline, _ in self._pending.values()) - self._clock())
+
+    # ---- Relaying a subscription ----
+
+    def relay(self, source: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Coalesce `source`, read on a daemon thread so held updates are released on time."""
+        inbox: "queue.Queue[Any]" = queue.Queue(self.maxsize)
+        stopped = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    inbox.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read() -> None:
+            try:
+                for event in source:
+                    if not put(event):
+                        return
+            except BaseException as e:
+                put(_Failed(e))
+            finally:
+                put(_END)
+
+        threading.Thread(target=read, name="opencode-coalesce", daemon=True).start()
+        try:
+            while True:
+                try:
+                    item = inbox.get(timeout=self.timeout())
+                except queue.Empty:
+                    yield from self.due()
+                    continue
+                yield from self.due()
+                if item is _END:
+                    break
+                if type(item) is _Failed:
+                    yield from self.flush()
+                    raise item.error
+                yield from self.push(item)
+            yield from self.flush()
+        finally:
+            stopped.set()
+
+    async def arelay(self, source: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of relay(): `source` is read by a task on the running event loop."""
+        inbox: "asyncio.Queue[Any]" = asyncio.Queue(self.maxsize)
+
+        async def read() -> None:
+            try:
+                async for event in source:
+                    await inbox.put(event)
+            except Exception as e:
+                await inbox.put(_Failed(e))
+            await inbox.put(_END)
+
+        task = asyncio.ensure_future(read())
+        # one get() stays pending across flush ticks: cancelling it on a timeout could lose an item
+        # it had already taken off the queue (wait_for before Python 3.12)
+        getter: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if getter is None:
+                    getter = asyncio.ensure_future(inbox.get())
+                done, _ = await asyncio.wait((getter,), timeout=self.timeout())
+                if not done:
+                    for event in self.due():
+                        yield event
+                    continue
+                item, getter = getter.result(), None
+                for event in self.due():
+                    yield event
+                if item is _END:
+                    break
+                if type(item) is _Failed:
+                    for event in self.flush():
+                        yield event
+                    raise item.error
+                for event in self.push(item):
+                    yield event
+            for event in self.flush():
+                yield event
+        finally:
+            if getter is not None:
+                getter.cancel()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional
+
+from .models._discriminators import EVENT
+
+# Synthetic event yielded by reconnecting subscriptions ahead of a new connection's server.connected.
+# Events published while disconnected were missed, so cached state should be refetched.
+GAP_EVENT_TYPE = "client.gap"
+
+
+class EventEnvelope:
+    """A server event whose typed model is only built when first accessed.
+
+    `type` and `properties` are available straight from the decoded JSON, so consumers that route
+    on the event type and drop most events never pay for attrs model construction.
+    """
+
+    __slots__ = ("raw", "_model")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.raw = raw
+        self._model: Any = None
+
+    @property
+    def type(self) -> str:
+        """Event type, e.g. "message.part.updated"."""
+        return self.raw.get("type", "")
+
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """Raw event properties as sent by the server."""
+        return self.raw.get("properties") or {}
+
+    @property
+    def model(self) -> Optional[Any]:
+        """Typed event model (EventMessageUpdated, EventSessionIdle, ...), decoded on first access.
+
+        Returns None for event types unknown to this SDK version.
+        """
+        if self._model is None and self.raw.get("type") in EVENT:
+            self._model = EVENT.decode(self.raw)
+        return self._model
+
+    def __repr__(self) -> str:
+        return f"EventEnvelope(type={self.type!r})"
+
+
+def _session_of(properties: Dict[str, Any]) -> Optional[str]:
+    """Session id an event belongs to, from the places the server's payloads keep it."""
+    session_id = properties.get("sessionID")
+    if session_id is None:
+        for key in ("info", "part"):
+            obj = properties.get(key)
+            if isinstance(obj, dict):
+                session_id = obj.get("sessionID")
+                if session_id is not None:
+                    break
+    if session_id is None:
+        # session.updated / session.deleted carry the Session itself
+        info = properties.get("info")
+        if isinstance(info, dict) and "sessionID" not in info:
+            session_id = info.get("id")
+    return session_id
+
+
+class EventFilter:
+    """Event types and/or one session id a subscription is restricted to.
+
+    The filter is sent to the server as `type` and `sessionID` query parameters. Servers that ignore
+    them still send everything, so each SSE payload is first checked for the quoted type names and
+    session id as substrings, which rejects most events without decoding them; only the remainder is
+    decoded and matched exactly. Connection events (`server.connected`, `client.gap`) always pass,
+    since reconnect handling and resyncing depend on them.
+    """
+
+    __slots__ = ("types", "session_id", "_type_needles", "_session_needle")
+
+    CONNECTION_TYPES = frozenset(("server.connected", GAP_EVENT_TYPE))
+
+    def __init__(self, types: Optional[Iterable[str]] = None, session_id: Optional[str] = None) -> None:
+        self.types = None if types is None else frozenset(types)
+        self.session_id = session_id
+        self._type_needles = None if self.types is None else tuple(f'"{t}"' for t in self.types | {"server.connected"})
+        self._session_needle = None if session_id is None else f'"{session_id}"'
+
+    def params(self) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if self.types is not None:
+            params["type"] = sorted(self.types)
+        if self.session_id is not None:
+            params["sessionID"] = self.session_id
+        return params
+
+    def admits_data(self, data: str) -> bool:
+        """Cheap check on an undecoded payload; False means the event certainly does not match."""
+        if self._type_needles is not None and not any(needle in data for needle in self._type_needles):
+            return False
+        if self._session_needle is not None and self._session_needle not in data:
+            return '"server.connected"' in data
+        return True
+
+    def admits(self, event: Dict[str, Any]) -> bool:
+        kind = event.get("type")
+        if kind in self.CONNECTION_TYPES:
+            return True
+        if self.types is not None and kind not in self.types:
+            return False
+        if self.session_id is not None:
+            return _session_of(event.get("properties") or {}) == self.session_id
+        return True
+
+    def __repr__(self) -> str:
+        types = None if self.types is None else sorted(self.types)
+        return f"EventFilter(types={types}, session_id={self.session_id!r})"
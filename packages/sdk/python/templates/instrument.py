@@ -0,0 +1,545 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from . import codec
+
+if TYPE_CHECKING:
+    from .client import AuthenticatedClient, Client
+
+T = TypeVar("T")
+
+_now = time.perf_counter
+
+
+class RequestSample:
+    """Timings of one API request, reported to Instrumentation.on_request.
+
+    All durations are in seconds, measured from when the request was issued. `connect` and `ttfb`
+    (time to the response headers) come from httpx's trace extension and are None when the
+    transport does not report them (e.g. a reused connection has no connect phase). `total` ends
+    when the body has been read; JSON decoding (`decode`) and model construction (`build`) happen
+    after it. For streams, `total` is the lifetime of the connection and `decode` covers all events.
+    """
+
+    __slots__ = (
+        "endpoint",
+        "method",
+        "status",
+        "started",
+        "connect",
+        "ttfb",
+        "total",
+        "bytes",
+        "decode",
+        "build",
+        "error",
+    )
+
+    def __init__(
+        self,
+        endpoint: str,
+        method: str,
+        status: Optional[int],
+        started: float,
+        connect: Optional[float],
+        ttfb: Optional[float],
+        total: float,
+        bytes: int,
+        decode: float,
+        build: float,
+        error: Optional[str] = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.method = method
+        self.status = status
+        # wall-clock start (time.time()), for exporters that need absolute timestamps
+        self.started = started
+        self.connect = connect
+        self.ttfb = ttfb
+        self.total = total
+        self.bytes = bytes
+        self.decode = decode
+        self.build = build
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestSample({self.method} {self.endpoint} -> {self.status}, total={self.total * 1000:.2f}ms, "
+            f"bytes={self.bytes}, decode={self.decode * 1000:.2f}ms, build={self.build * 1000:.2f}ms)"
+        )
+
+
+class EventSample:
+    """One event received on a stream: its type, payload size and JSON decode time in seconds."""
+
+    __slots__ = ("endpoint", "type", "bytes", "decode")
+
+    def __init__(self, endpoint: str, type: str, bytes: int, decode: float) -> None:
+        self.endpoint = endpoint
+        self.type = type
+        self.bytes = bytes
+        self.decode = decode
+
+    def __repr__(self) -> str:
+        return f"EventSample({self.type!r}, bytes={self.bytes}, decode={self.decode * 1e6:.1f}us)"
+
+
+class Instrumentation:
+    """Receives samples from a Client created with `instrumentation=`; override the hooks you need.
+
+    Hooks run synchronously on the thread (or event loop) making the request, so keep them cheap.
+    """
+
+    def on_request(self, sample: RequestSample) -> None:
+        pass
+
+    def on_event(self, sample: EventSample) -> None:
+        pass
+
+
+class _Fanout(Instrumentation):
+    def __init__(self, hooks: Iterable[Instrumentation]) -> None:
+        self.hooks = list(hooks)
+
+    def on_request(self, sample: RequestSample) -> None:
+        for hook in self.hooks:
+            hook.on_request(sample)
+
+    def on_event(self, sample: EventSample) -> None:
+        for hook in self.hooks:
+            hook.on_event(sample)
+
+
+def combine(*hooks: Instrumentation) -> Instrumentation:
+    """One Instrumentation forwarding every sample to each of `hooks` in turn."""
+    return hooks[0] if len(hooks) == 1 else _Fanout(hooks)
+
+
+# ---- Probes used by the generated endpoints and the SSE readers ----
+
+
+class _Probe:
+    __slots__ = ("start", "connect", "ttfb", "decode")
+
+    def __init__(self) -> None:
+        self.start = _now()
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.decode = 0.0
+
+    def trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpx/httpcore `trace` extension callback."""
+        if name.endswith(("connect_tcp.complete", "connect_unix_socket.complete", "start_tls.complete")):
+            self.connect = _now() - self.start
+        elif name.endswith("receive_response_headers.complete"):
+            self.ttfb = _now() - self.start
+
+    async def atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self.trace(name, info)
+
+
+_PROBE: ContextVar[Optional[_Probe]] = ContextVar("opencode_probe", default=None)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """codec.loads, timed into the current request's sample when instrumentation is enabled."""
+    probe = _PROBE.get()
+    if probe is None:
+        return codec.loads(data)
+    start = _now()
+    try:
+        return codec.loads(data)
+    finally:
+        probe.decode += _now() - start
+
+
+def _report(
+    hooks: Instrumentation,
+    probe: _Probe,
+    endpoint: str,
+    kwargs: Dict[str, Any],
+    response: Any,
+    received: float,
+    error: Optional[BaseException],
+) -> None:
+    finished = _now()
+    hooks.on_request(
+        RequestSample(
+            endpoint,
+            kwargs["method"].upper(),
+            None if response is None else response.status_code,
+            time.time() - (finished - probe.start),
+            probe.connect,
+            probe.ttfb,
+            received - probe.start,
+            0 if response is None else len(response.content),
+            probe.decode,
+            max(0.0, finished - received - probe.decode) if response is not None else 0.0,
+            None if error is None else type(error).__name__,
+        )
+    )
+
+
+def send(
+    client: Union["AuthenticatedClient", "Client"],
+    endpoint: str,
+    kwargs: Dict[str, Any],
+    build: Callable[..., T],
+) -> T:
+    """Issue a generated endpoint's request and build its Response, reporting a RequestSample."""
+    hooks = client.instrumentation
+    if hooks is None:
+        return build(client=client, response=client.get_httpx_client().request(**kwargs))
+    probe = _Probe()
+    response = None
+    received = probe.start
+    token = _PROBE.set(probe)
+    try:
+        response = client.get_httpx_client().request(**kwargs, extensions={"trace": probe.trace})
+        received = _now()
+        result = build(client=client, response=response)
+    except BaseException as e:
+        _report(hooks, probe, endpoint, kwargs, response, received if response is not None else _now(), e)
+        raise
+    finally:
+        _PROBE.reset(token)
+    _report(hooks, probe, endpoint, kwargs, response, received, None)
+    return result
+
+
+async def asend(
+    client: Union["AuthenticatedClient", "Client"],
+    endpoint: str,
+    kwargs: Dict[str, Any],
+    build: Callable[..., T],
+) -> T:
+    """Async variant of send()."""
+    hooks = client.instrumentation
+    if hooks is None:
+        return build(client=client, response=await client.get_async_httpx_client().request(**kwargs))
+    probe = _Probe()
+    response = None
+    received = probe.start
+    token = _PROBE.set(probe)
+    try:
+        response = await client.get_async_httpx_client().request(**kwargs, extensions={"trace": probe.atrace})
+        received = _now()
+        result = build(client=client, response=response)
+    except BaseException as e:
+        _report(hooks, probe, endpoint, kwargs, response, received if response is not None else _now(), e)
+        raise
+    finally:
+        _PROBE.reset(token)
+    _report(hooks, probe, endpoint, kwargs, response, received, None)
+    return result
+
+
+class StreamProbe(_Probe):
+    """Timings of a streaming request (an SSE connection or a streamed array), reported when it ends."""
+
+    __slots__ = ("hooks", "endpoint", "method", "status", "bytes", "build")
+
+    def __init__(self, hooks: Instrumentation, endpoint: str, method: str = "GET") -> None:
+        super().__init__()
+        self.hooks = hooks
+        self.endpoint = endpoint
+        self.method = method
+        self.status: Optional[int] = None
+        self.bytes = 0
+        self.build = 0.0
+
+    def extensions(self, asynchronous: bool = False) -> Dict[str, Any]:
+        return {"trace": self.atrace if asynchronous else self.trace}
+
+    def opened(self, status: int) -> None:
+        self.status = status
+        if self.ttfb is None:
+            self.ttfb = _now() - self.start
+
+    def loads(self, data: str) -> Any:
+        """Decode one event payload, reporting an EventSample (also for payloads that fail to decode)."""
+        start = _now()
+        event: Any = None
+        try:
+            event = codec.loads(data)
+            return event
+        finally:
+            decode = _now() - start
+            size = len(data.encode())
+            self.bytes += size
+            self.decode += decode
+            kind = event.get("type", "") if isinstance(event, dict) else ""
+            self.hooks.on_event(EventSample(self.endpoint, kind, size, decode))
+
+    def item(self, data: bytes, from_dict: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Decode one element of a streamed array, and build it with `from_dict` when given, timing both."""
+        self.bytes += len(data)
+        start = _now()
+        value = codec.loads(data)
+        decoded = _now()
+        self.decode += decoded - start
+        if from_dict is None:
+            return value
+        try:
+            return from_dict(value)
+        finally:
+            self.build += _now() - decoded
+
+    def close(self, error: Optional[BaseException] = None) -> None:
+        total = _now() - self.start
+        self.hooks.on_request(
+            RequestSample(
+                self.endpoint,
+                self.method,
+                self.status,
+                time.time() - total,
+                self.connect,
+                self.ttfb,
+                total,
+                self.bytes,
+                self.decode,
+                self.build,
+                None if error is None else type(error).__name__,
+            )
+        )
+
+
+def stream_probe(client: Union["AuthenticatedClient", "Client"], endpoint: str) -> Optional[StreamProbe]:
+    hooks = client.instrumentation
+    return None if hooks is None else StreamProbe(hooks, endpoint)
+
+
+# ---- Adapters ----
+
+
+class Histogram:
+    """HDR-style histogram: constant relative precision over any range, O(1) recording.
+
+    Values are counted in integer multiples of `unit` (default one microsecond for seconds). Below
+    `2 ** ceil(log2(2 * 10 ** significant_digits))` units they are exact; above, each power of two
+    is split into the same number of linear sub-buckets, so the error stays within one part in 10
+    ** significant_digits however large the value.
+    """
+
+    __slots__ = ("unit", "_size", "_half", "_bits", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, significant_digits: int = 2, unit: float = 1e-6) -> None:
+        self.unit = unit
+        self._size = 1 << (2 * 10**significant_digits - 1).bit_length()
+        self._half = self._size // 2
+        self._bits = self._size.bit_length() - 1
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def _index(self, n: int) -> int:
+        if n < self._size:
+            return n
+        shift = n.bit_length() - self._bits
+        return self._size + (shift - 1) * self._half + (n >> shift) - self._half
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        if index < self._size:
+            return index, index
+        k = index - self._size
+        shift = k // self._half + 1
+        m = k % self._half + self._half
+        return m << shift, ((m + 1) << shift) - 1
+
+    def record(self, value: float) -> None:
+        n = max(0, int(value / self.unit))
+        index = self._index(n)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """Value at or below which `p` percent of the recorded values fall (0 when empty)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(p / 100 * self.count + 0.5 - 1e-9)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._bounds(index)[1] * self.unit, self.max)
+        return self.max
+
+    def count_at_most(self, value: float) -> int:
+        """How many recorded values are at most `value`, to bucket precision."""
+        limit = value / self.unit
+        return sum(n for index, n in self._counts.items() if self._bounds(index)[1] <= limit)
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, p50={self.percentile(50)}, p99={self.percentile(99)}, max={self.max})"
+
+
+# timing fields of RequestSample kept per endpoint by HistogramRecorder
+PHASES = ("connect", "ttfb", "total", "decode", "build")
+
+
+class HistogramRecorder(Instrumentation):
+    """In-process latency/size histograms per endpoint template, plus request and event counters.
+
+    recorder = HistogramRecorder()
+    client = OpenCodeClient(instrumentation=recorder)
+    ...
+    recorder.summary()["/session"]["total"]["p99"]
+    """
+
+    def __init__(self, significant_digits: int = 2) -> None:
+        self._digits = significant_digits
+        self._lock = threading.Lock()
+        # (endpoint, phase) -> seconds; (endpoint, "bytes") -> bytes
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        # (endpoint, method, status or error) -> count
+        self.requests: Dict[Tuple[str, str, str], int] = {}
+        # (endpoint, event type) -> count
+        self.events: Dict[Tuple[str, str], int] = {}
+
+    def _histogram(self, endpoint: str, name: str) -> Histogram:
+        histogram = self.histograms.get((endpoint, name))
+        if histogram is None:
+            unit = 1.0 if name == "bytes" else 1e-6
+            histogram = self.histograms[(endpoint, name)] = Histogram(self._digits, unit)
+        return histogram
+
+    def on_request(self, sample: RequestSample) -> None:
+        outcome = sample.error or str(sample.status)
+        with self._lock:
+            key = (sample.endpoint, sample.method, outcome)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            for phase in PHASES:
+                value = getattr(sample, phase)
+                if value is not None:
+                    self._histogram(sample.endpoint, phase).record(value)
+            self._histogram(sample.endpoint, "bytes").record(sample.bytes)
+
+    def on_event(self, sample: EventSample) -> None:
+        with self._lock:
+            key = (sample.endpoint, sample.type)
+            self.events[key] = self.events.get(key, 0) + 1
+            self._histogram(sample.endpoint, "event_decode").record(sample.decode)
+
+    def summary(self, percentiles: Iterable[float] = (50, 90, 99)) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{endpoint: {phase: {"count", "mean", "max", "p50", ...}}} with times in seconds."""
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        with self._lock:
+            for (endpoint, name), h in sorted(self.histograms.items()):
+                stats = {"count": h.count, "mean": h.mean, "max": h.max}
+                stats.update({f"p{p:g}": h.percentile(p) for p in percentiles})
+                out.setdefault(endpoint, {})[name] = stats
+        return out
+
+
+# default Prometheus histogram buckets, in seconds
+PROMETHEUS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _labels(**labels: str) -> str:
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+class PrometheusExporter(HistogramRecorder):
+    """HistogramRecorder that renders its data in the Prometheus text exposition format.
+
+    Serve `render()` from your metrics endpoint; bucket counts are derived from the HDR histograms.
+    """
+
+    def __init__(self, buckets: Iterable[float] = PROMETHEUS_BUCKETS, *, prefix: str = "opencode_sdk") -> None:
+        super().__init__()
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+
+    def render(self) -> str:
+        p = self.prefix
+        lines: List[str] = []
+        with self._lock:
+            lines += [
+                f"# HELP {p}_request_duration_seconds Request phases per endpoint template.",
+                f"# TYPE {p}_request_duration_seconds histogram",
+            ]
+            for (endpoint, name), h in sorted(self.histograms.items()):
+                if name not in PHASES:
+                    continue
+                for le in self.buckets:
+                    labels = _labels(endpoint=endpoint, phase=name, le=f"{le:g}")
+                    lines.append(f"{p}_request_duration_seconds_bucket{labels} {h.count_at_most(le)}")
+                labels = _labels(endpoint=endpoint, phase=name, le="+Inf")
+                lines.append(f"{p}_request_duration_seconds_bucket{labels} {h.count}")
+                lines.append(f"{p}_request_duration_seconds_sum{_labels(endpoint=endpoint, phase=name)} {h.total:g}")
+                lines.append(f"{p}_request_duration_seconds_count{_labels(endpoint=endpoint, phase=name)} {h.count}")
+            lines += [
+                f"# HELP {p}_response_bytes_total Response bytes received per endpoint template.",
+                f"# TYPE {p}_response_bytes_total counter",
+            ]
+            for (endpoint, name), h in sorted(self.histograms.items()):
+                if name == "bytes":
+                    lines.append(f"{p}_response_bytes_total{_labels(endpoint=endpoint)} {h.total:g}")
+            lines += [f"# HELP {p}_requests_total Requests by outcome.", f"# TYPE {p}_requests_total counter"]
+            for (endpoint, method, outcome), n in sorted(self.requests.items()):
+                lines.append(f"{p}_requests_total{_labels(endpoint=endpoint, method=method, outcome=outcome)} {n}")
+            lines += [f"# HELP {p}_events_total Stream events by type.", f"# TYPE {p}_events_total counter"]
+            for (endpoint, kind), n in sorted(self.events.items()):
+                lines.append(f"{p}_events_total{_labels(endpoint=endpoint, type=kind)} {n}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Emit an OpenTelemetry client span per request, with the SDK's phase timings as attributes.
+
+    Needs `opentelemetry-api` (`pip install opencode-ai[otel]`) unless a `tracer` is given. Spans are
+    created after the fact with the request's real start and end times.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        if tracer is None:
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("opencode_ai")
+        self._tracer = tracer
+
+    def on_request(self, sample: RequestSample) -> None:
+        start = int(sample.started * 1e9)
+        attributes: Dict[str, Any] = {
+            "http.request.method": sample.method,
+            "http.route": sample.endpoint,
+            "opencode.response.bytes": sample.bytes,
+            "opencode.decode_ms": sample.decode * 1000,
+            "opencode.build_ms": sample.build * 1000,
+        }
+        if sample.status is not None:
+            attributes["http.response.status_code"] = sample.status
+        if sample.connect is not None:
+            attributes["opencode.connect_ms"] = sample.connect * 1000
+        if sample.ttfb is not None:
+            attributes["opencode.ttfb_ms"] = sample.ttfb * 1000
+        if sample.error is not None:
+            attributes["error.type"] = sample.error
+        kind = None
+        try:
+            from opentelemetry.trace import SpanKind
+
+            kind = SpanKind.CLIENT
+        except ImportError:
+            pass
+        kwargs: Dict[str, Any] = {"start_time": start, "attributes": attributes}
+        if kind is not None:
+            kwargs["kind"] = kind
+        span = self._tracer.start_span(f"{sample.method} {sample.endpoint}", **kwargs)
+        span.end(end_time=start + int((sample.total + sample.decode + sample.build) * 1e9))
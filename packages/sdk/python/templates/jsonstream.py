@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional
+
+# bytes that change the nesting state outside of strings, and the ones that matter inside them
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class JSONArrayDecoder:
+    """Incremental splitter for a top-level JSON array received in byte chunks.
+
+    `feed()` returns the encoded elements completed by each chunk, ready for `codec.loads`, so a
+    response holding thousands of messages is decoded one element at a time. Strings are skipped
+    with a regex search rather than byte by byte, and consumed bytes are dropped from the buffer, so
+    memory is bounded by the largest single element.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        # offset of the element currently being received
+        self._start = 0
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consume a chunk and return the array elements it completed."""
+        if self.done:
+            return []
+        buf = self._buf
+        buf += chunk
+        items: List[bytes] = []
+        pos, depth, start = self._pos, self._depth, self._start
+        size = len(buf)
+        while pos < size:
+            if self._in_string:
+                m = _STRING_SPECIAL.search(buf, pos)
+                if m is None:
+                    pos = size
+                    break
+                i = m.start()
+                if buf[i] == 0x5C:  # backslash: skip the escaped byte, once it has arrived
+                    if i + 1 >= size:
+                        pos = i
+                        break
+                    pos = i + 2
+                    continue
+                self._in_string = False
+                pos = i + 1
+                continue
+
+            m = _STRUCTURAL.search(buf, pos)
+            if m is None:
+                pos = size
+                break
+            i = m.start()
+            c = buf[i]
+            if depth == 0:
+                if c != 0x5B or buf[:i].strip():
+                    raise ValueError("expected a JSON array")
+                depth = 1
+                start = i + 1
+            elif c == 0x22:
+                self._in_string = True
+            elif c == 0x5B or c == 0x7B:
+                depth += 1
+            elif c == 0x5D or c == 0x7D:
+                depth -= 1
+                if depth == 0:
+                    item = bytes(buf[start:i]).strip()
+                    if item:
+                        items.append(item)
+                    self.done = True
+                    self._buf = bytearray()
+                    return items
+            elif depth == 1:  # element separator
+                items.append(bytes(buf[start:i]).strip())
+                start = i + 1
+            pos = i + 1
+
+        if start:
+            del buf[:start]
+            pos -= start
+            start = 0
+        self._pos, self._depth, self._start = pos, depth, start
+        return items
+
+    def close(self) -> None:
+        """Raise ValueError if the array was not complete."""
+        if not self.done:
+            raise ValueError("truncated JSON array")
+
+
+def iter_json_array(chunks: Iterable[bytes], decoder: Optional[JSONArrayDecoder] = None) -> Iterator[bytes]:
+    """Yield the encoded elements of a JSON array streamed as byte chunks (e.g. `Response.iter_bytes()`)."""
+    decoder = decoder or JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    decoder.close()
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes], decoder: Optional[JSONArrayDecoder] = None
+) -> AsyncIterator[bytes]:
+    """Async variant of iter_json_array (e.g. over `Response.aiter_bytes()`)."""
+    decoder = decoder or JSONArrayDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    decoder.close()
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .extras import AsyncOpenCodeClient, OpenCodeClient
+
+
+class TaggedEvent:
+    """An event dict together with the directory whose subscription delivered it."""
+
+    __slots__ = ("directory", "event")
+
+    def __init__(self, directory: str, event: Dict[str, Any]) -> None:
+        self.directory = directory
+        self.event = event
+
+    @property
+    def type(self) -> str:
+        return self.event.get("type", "")
+
+    def __repr__(self) -> str:
+        return f"TaggedEvent(directory={self.directory!r}, type={self.type!r})"
+
+
+class _End:
+    """Queued after a directory's last event; carries the error that ended it, if any."""
+
+    __slots__ = ("directory", "error")
+
+    def __init__(self, directory: str, error: Optional[BaseException] = None) -> None:
+        self.directory = directory
+        self.error = error
+
+
+_CLOSED = _End("")
+
+
+class EventMux:
+    """Multiplex `/event` subscriptions for many directories onto one event loop and connection pool.
+
+    Every subscription is an asyncio task reading through the client's single httpx.AsyncClient,
+    instead of one thread and client per project. Events are wrapped in TaggedEvent and put on a
+    bounded queue: one shared queue read by iterating the mux (`merge=True`), or one queue per
+    directory read with `events(directory)`. A full queue makes that directory's reader wait,
+    which pushes back on its connection rather than buffering without limit.
+
+        async with EventMux(client, ["/repo/a", "/repo/b"]) as mux:
+            async for tagged in mux:
+                print(tagged.directory, tagged.type)
+
+    Subscriptions reconnect by default (see `subscribe_events`). An error that ends one is raised
+    from the iterator after its last event. In merged mode that is fail-fast: the other
+    subscriptions are cancelled too and the mux is closed, ready for `start()` again. httpx pools
+    allow 100 connections by default, so raise the client's limits when watching more directories
+    than that.
+    """
+
+    def __init__(
+        self,
+        client: Union["AsyncOpenCodeClient", "OpenCodeClient"],
+        directories: Iterable[str] = (),
+        *,
+        merge: bool = True,
+        maxsize: int = 1000,
+        reconnect: bool = True,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._client = client
+        self._merge = merge
+        self._maxsize = maxsize
+        self._reconnect = reconnect
+        self._max_reconnect_delay = max_reconnect_delay
+        self._directories: List[str] = list(dict.fromkeys(directories))
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._merged: Optional[asyncio.Queue] = None
+        # subscriptions started whose end marker has not been consumed yet (merged mode)
+        self._open = 0
+        self._running = False
+
+    @property
+    def directories(self) -> List[str]:
+        return list(self._directories)
+
+    # ---- Lifecycle ----
+
+    async def start(self) -> None:
+        """Start a subscription task for every directory added so far."""
+        if self._running:
+            return
+        self._running = True
+        if self._merge:
+            self._merged = asyncio.Queue(self._maxsize)
+        for directory in self._directories:
+            self._spawn(directory)
+
+    async def aclose(self) -> None:
+        """Cancel all subscriptions and end any iteration in progress."""
+        self._running = False
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for queue in [self._merged] if self._merged is not None else self._queues.values():
+            while queue.full():
+                queue.get_nowait()
+            queue.put_nowait(_CLOSED)
+        # a later start() begins with fresh queues
+        self._merged = None
+        self._queues = {}
+        self._open = 0
+
+    async def __aenter__(self) -> "EventMux":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    # ---- Subscriptions ----
+
+    def add(self, directory: str) -> None:
+        """Subscribe to another directory; starts immediately when the mux is running."""
+        if directory in self._directories:
+            return
+        self._directories.append(directory)
+        if self._running:
+            self._spawn(directory)
+
+    async def remove(self, directory: str) -> None:
+        """Stop the subscription for `directory`. Events already queued are still delivered."""
+        if directory not in self._directories:
+            return
+        self._directories.remove(directory)
+        task = self._tasks.pop(directory, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await self._queue_for(directory).put(_End(directory))
+
+    def _queue_for(self, directory: str) -> asyncio.Queue:
+        if self._merged is not None:
+            return self._merged
+        queue = self._queues.get(directory)
+        if queue is None:
+            queue = self._queues[directory] = asyncio.Queue(self._maxsize)
+        return queue
+
+    def _spawn(self, directory: str) -> None:
+        self._open += 1
+        self._tasks[directory] = asyncio.ensure_future(self._pump(directory, self._queue_for(directory)))
+
+    async def _pump(self, directory: str, queue: asyncio.Queue) -> None:
+        error: Optional[BaseException] = None
+        try:
+            async for event in self._client._aiter_events(directory, self._reconnect, self._max_reconnect_delay):
+                await queue.put(TaggedEvent(directory, event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        self._tasks.pop(directory, None)
+        await queue.put(_End(directory, error))
+
+    # ---- Consuming ----
+
+    def __aiter__(self) -> AsyncIterator[TaggedEvent]:
+        if not self._merge:
+            raise TypeError("EventMux(merge=False) is read per directory with events(directory)")
+        return self._drain(self._merged, None)
+
+    def events(self, directory: str) -> AsyncIterator[TaggedEvent]:
+        """Iterate one directory's events (requires `merge=False`)."""
+        if self._merge:
+            raise TypeError("EventMux(merge=True) is read by iterating the mux itself")
+        return self._drain(self._queue_for(directory), directory)
+
+    async def _drain(self, queue: Optional[asyncio.Queue], directory: Optional[str]) -> AsyncIterator[TaggedEvent]:
+        if queue is None:
+            raise RuntimeError("EventMux is not started; use `async with EventMux(...)` or await start()")
+        while True:
+            item = await queue.get()
+            if type(item) is TaggedEvent:
+                yield item
+                continue
+            if item is _CLOSED:
+                return
+            if directory is None:
+                self._open -= 1
+            if item.error is not None:
+                if directory is None:
+                    await self.aclose()
+                raise item.error
+            if directory is not None or not self._open:
+                return
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# snapshot column -> generated endpoint module fetching it for one session id
+SNAPSHOT_ENDPOINTS = {
+    "session": "session_get",
+    "children": "session_children",
+    "todo": "session_todo",
+    "diff": "session_diff",
+}
+SNAPSHOT_PARTS: Tuple[str, ...] = tuple(SNAPSHOT_ENDPOINTS)
+
+
+class SessionSnapshot:
+    """One row of a `snapshot_sessions()` result.
+
+    `session` is a Session, `children` a list of Session, `todo` a list of Todo and `diff` a list of
+    FileDiff. Columns that were not requested, or whose request failed, are None; failures are kept
+    in `errors` by column name.
+    """
+
+    __slots__ = ("id", "session", "children", "todo", "diff", "errors")
+
+    def __init__(self, id: str) -> None:
+        self.id = id
+        self.session: Any = None
+        self.children: Optional[List[Any]] = None
+        self.todo: Optional[List[Any]] = None
+        self.diff: Optional[List[Any]] = None
+        self.errors: Dict[str, BaseException] = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __repr__(self) -> str:
+        filled = [part for part in SNAPSHOT_PARTS if getattr(self, part) is not None]
+        return f"SessionSnapshot(id={self.id!r}, parts={filled}, errors={sorted(self.errors)})"
+
+
+class SnapshotTable(Mapping[str, SessionSnapshot]):
+    """Result of `snapshot_sessions()`: a SessionSnapshot per session id, in request order."""
+
+    __slots__ = ("include", "_rows")
+
+    def __init__(self, ids: Iterable[str], include: Sequence[str] = SNAPSHOT_PARTS) -> None:
+        unknown = [part for part in include if part not in SNAPSHOT_ENDPOINTS]
+        if unknown:
+            raise ValueError(f"Unknown snapshot parts {unknown}, expected some of {list(SNAPSHOT_PARTS)}")
+        self.include = tuple(dict.fromkeys(include))
+        self._rows = {id: SessionSnapshot(id) for id in ids}
+
+    def jobs(self) -> List[Tuple[SessionSnapshot, str]]:
+        """Every (row, column) pair to fetch."""
+        return [(row, part) for row in self._rows.values() for part in self.include]
+
+    def rows(self) -> List[Tuple[Any, ...]]:
+        """Plain tuples of (id, *included columns), e.g. for tabulating."""
+        return [(row.id, *(getattr(row, part) for part in self.include)) for row in self._rows.values()]
+
+    @property
+    def failed(self) -> List[SessionSnapshot]:
+        return [row for row in self._rows.values() if row.errors]
+
+    def __getitem__(self, id: str) -> SessionSnapshot:
+        return self._rows[id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"SnapshotTable({len(self._rows)} sessions, include={list(self.include)}, failed={len(self.failed)})"
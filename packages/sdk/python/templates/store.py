@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
+
+from .events import EventEnvelope
+from .models._discriminators import MESSAGE, PART
+from .types import UNSET, Unset
+
+if TYPE_CHECKING:
+    from .extras import AsyncOpenCodeClient, OpenCodeClient
+    from .models.session import Session
+
+
+def _is_running_tool(part: Any) -> bool:
+    return getattr(part, "type_", None) == "tool" and part.state.status == "running"
+
+
+def _session_list(sessions: Any) -> List["Session"]:
+    # list_sessions returns None (or an error model) for a response it could not read
+    if not isinstance(sessions, list):
+        raise RuntimeError(f"list_sessions did not return a session list ({sessions!r}); the store was not seeded")
+    return sessions
+
+
+class SessionStore:
+    """In-memory mirror of sessions, messages and parts kept current from the event stream.
+
+    Seed it once with `seed()` (list_sessions plus each session's message history), then feed it
+    events with `apply()`, or let `follow()` do both, reseeding on every (re)connect. Lookups such
+    as the latest assistant message of a session or all running tool parts read local indexes
+    instead of calling the server.
+
+    Objects are the generated models (Session, UserMessage/AssistantMessage, TextPart, ToolPart, ...).
+    All methods take an internal lock, so one thread can apply events while others query.
+    """
+
+    # events that change the store; everything else is ignored by apply()
+    EVENT_TYPES = frozenset(
+        (
+            "session.updated",
+            "session.deleted",
+            "message.updated",
+            "message.removed",
+            "message.part.updated",
+            "message.part.removed",
+        )
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._sessions: Dict[str, "Session"] = {}
+        # session id -> message id -> message, in arrival order
+        self._messages: Dict[str, Dict[str, Any]] = {}
+        # message id -> part id -> part
+        self._parts: Dict[str, Dict[str, Any]] = {}
+        # session id -> newest assistant message
+        self._latest_assistant: Dict[str, Any] = {}
+        # part id -> ToolPart whose state is running
+        self._running_tools: Dict[str, Any] = {}
+
+    # ---- Seeding ----
+
+    def seed(
+        self, client: "OpenCodeClient", *, directory: str | Unset = UNSET, messages: bool = True, concurrency: int = 8
+    ) -> None:
+        """Replace the store's contents with the server's current sessions and message history.
+
+        Message histories are streamed with `iter_messages`, `concurrency` sessions at a time. When
+        the session list cannot be read, RuntimeError is raised and the contents are left as they were.
+        """
+        sessions = _session_list(client.list_sessions(directory=directory))
+        histories: List[List[Any]] = []
+        if messages and sessions:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(sessions)))) as pool:
+                histories = list(pool.map(lambda s: list(client.iter_messages(s.id, directory=directory)), sessions))
+        self._load(sessions, histories)
+
+    async def aseed(
+        self,
+        client: "AsyncOpenCodeClient",
+        *,
+        directory: str | Unset = UNSET,
+        messages: bool = True,
+        concurrency: int = 8,
+    ) -> None:
+        """Async variant of seed()."""
+        import asyncio
+
+        sessions = _session_list(await client.list_sessions(directory=directory))
+        histories: List[List[Any]] = []
+        if messages and sessions:
+            limit = asyncio.Semaphore(max(1, concurrency))
+
+            async def history(session_id: str) -> List[Any]:
+                async with limit:
+                    return [item async for item in client.iter_messages(session_id, directory=directory)]
+
+            histories = list(await asyncio.gather(*(history(s.id) for s in sessions)))
+        self._load(sessions, histories)
+
+    def _load(self, sessions: List["Session"], histories: List[List[Any]]) -> None:
+        with self._lock:
+            self._reset()
+            for session in sessions:
+                self._sessions[session.id] = session
+            for history in histories:
+                for item in history:
+                    self._put_message(item.info)
+                    for part in item.parts:
+                        self._put_part(part)
+
+    # ---- Applying events ----
+
+    def apply(self, event: Union[Dict[str, Any], EventEnvelope]) -> bool:
+        """Apply one event (a decoded dict or an EventEnvelope); return False if it was ignored.
+
+        Sessions, messages and parts this SDK cannot decode (of a type it does not know, from a newer
+        server) are ignored too, so they cannot stop `follow()`.
+        """
+        raw = event.raw if isinstance(event, EventEnvelope) else event
+        kind = raw.get("type")
+        if kind not in self.EVENT_TYPES:
+            return False
+        props = raw.get("properties") or {}
+        try:
+            if kind == "message.part.updated":
+                part = PART.decode(props["part"])
+            elif kind == "message.updated":
+                message = MESSAGE.decode(props["info"])
+            elif kind == "session.updated":
+                from .models.session import Session
+
+                session = Session.from_dict(props["info"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        with self._lock:
+            if kind == "message.part.updated":
+                self._put_part(part)
+            elif kind == "message.updated":
+                self._put_message(message)
+            elif kind == "message.part.removed":
+                self._drop_part(props["messageID"], props["partID"])
+            elif kind == "message.removed":
+                self._drop_message(props["sessionID"], props["messageID"])
+            elif kind == "session.updated":
+                self._sessions[session.id] = session
+            else:
+                self._drop_session(props["info"]["id"])
+        return True
+
+    def follow(
+        self, client: "OpenCodeClient", *, directory: str | Unset = UNSET, messages: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Subscribe to events, keep the store in sync and yield every event.
+
+        The store is (re)seeded on each `server.connected`, so it starts consistent and recovers
+        from the events missed while a reconnecting subscription was down. Updates that race with
+        seeding are harmless: they carry complete objects and are applied after the snapshot.
+        """
+        for event in client.subscribe_events(directory=directory, reconnect=True):
+            if event.get("type") == "server.connected":
+                self.seed(client, directory=directory, messages=messages)
+            else:
+                self.apply(event)
+            yield event
+
+    def _put_message(self, message: Any) -> None:
+        session_id = message.session_id
+        self._messages.setdefault(session_id, {})[message.id] = message
+        if message.role == "assistant":
+            latest = self._latest_assistant.get(session_id)
+            if latest is None or message.id >= latest.id:
+                self._latest_assistant[session_id] = message
+
+    def _put_part(self, part: Any) -> None:
+        self._parts.setdefault(part.message_id, {})[part.id] = part
+        if _is_running_tool(part):
+            self._running_tools[part.id] = part
+        else:
+            self._running_tools.pop(part.id, None)
+
+    def _drop_part(self, message_id: str, part_id: str) -> None:
+        parts = self._parts.get(message_id)
+        if parts is not None:
+            parts.pop(part_id, None)
+        self._running_tools.pop(part_id, None)
+
+    def _drop_message(self, session_id: str, message_id: str) -> None:
+        for part_id in self._parts.pop(message_id, {}):
+            self._running_tools.pop(part_id, None)
+        messages = self._messages.get(session_id, {})
+        messages.pop(message_id, None)
+        latest = self._latest_assistant.get(session_id)
+        if latest is not None and latest.id == message_id:
+            assistants = [m for m in messages.values() if m.role == "assistant"]
+            if assistants:
+                self._latest_assistant[session_id] = max(assistants, key=lambda m: m.id)
+            else:
+                del self._latest_assistant[session_id]
+
+    def _drop_session(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+        for message_id in list(self._messages.get(session_id, ())):
+            self._drop_message(session_id, message_id)
+        self._messages.pop(session_id, None)
+
+    # ---- Queries ----
+
+    def session(self, session_id: str) -> Optional["Session"]:
+        return self._sessions.get(session_id)
+
+    def sessions(self) -> List["Session"]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def messages(self, session_id: str) -> List[Any]:
+        """Messages of a session (UserMessage/AssistantMessage) in arrival order."""
+        with self._lock:
+            return list(self._messages.get(session_id, {}).values())
+
+    def message(self, session_id: str, message_id: str) -> Optional[Any]:
+        return self._messages.get(session_id, {}).get(message_id)
+
+    def parts(self, message_id: str) -> List[Any]:
+        """Parts of a message in arrival order."""
+        with self._lock:
+            return list(self._parts.get(message_id, {}).values())
+
+    def latest_assistant_message(self, session_id: str) -> Optional[Any]:
+        return self._latest_assistant.get(session_id)
+
+    def running_tool_parts(self, session_id: Optional[str] = None) -> List[Any]:
+        """ToolParts whose state is currently `running`, optionally for one session."""
+        with self._lock:
+            parts = list(self._running_tools.values())
+        if session_id is not None:
+            parts = [p for p in parts if p.session_id == session_id]
+        return parts
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def __repr__(self) -> str:
+        return f"SessionStore({len(self._sessions)} sessions, {len(self._running_tools)} running tools)"
@@ -0,0 +1,82 @@
+import inspect
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+
+_PATH = {"state": "ok", "config": "/tmp/config", "worktree": "/repo", "directory": "/repo/project"}
+
+
+def _client(handler, **kwargs) -> AsyncOpenCodeClient:
+    w = AsyncOpenCodeClient(base_url="http://test", **kwargs)
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    return w
+
+
+def test_async_client_mirrors_sync_wrappers() -> None:
+    public = {name for name in dir(OpenCodeClient) if not name.startswith("_") and not name.endswith("_async")}
+    for name in public - {"client", "cache"}:
+        fn = getattr(AsyncOpenCodeClient, name)
+        if name.startswith(("subscribe_", "iter_")):
+            assert inspect.isasyncgenfunction(fn), name
+        else:
+            assert inspect.iscoroutinefunction(fn), name
+
+
+@pytest.mark.asyncio
+async def test_async_get_path_and_lifecycle() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/path"
+        assert request.url.params["directory"] == "/repo/project"
+        return httpx.Response(200, json=_PATH)
+
+    async with _client(handler) as w:
+        result = await w.get_path(directory="/repo/project")
+        assert result.directory == "/repo/project"
+    assert w.client.get_async_httpx_client().is_closed
+
+
+@pytest.mark.asyncio
+async def test_async_retries_do_not_block_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) < 3:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(200, json=_PATH)
+
+    def no_blocking_sleep(seconds: float) -> None:
+        raise AssertionError("time.sleep must not be used by the async client")
+
+    monkeypatch.setattr("time.sleep", no_blocking_sleep)
+    w = _client(handler, retries=2, backoff_factor=0)
+    result = await w.get_path()
+    assert result.directory == "/repo/project"
+    assert len(calls) == 3
+    await w.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_retries_exhausted_reraises() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("down", request=request)
+
+    w = _client(handler, retries=1, backoff_factor=0)
+    with pytest.raises(httpx.ConnectError):
+        await w.get_path()
+
+
+@pytest.mark.asyncio
+async def test_async_subscribe_events() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=b'data: {"type":"server.connected","properties":{}}\n\n',
+        )
+
+    w = _client(handler)
+    events = [e async for e in w.subscribe_typed_events()]
+    assert [e.type for e in events] == ["server.connected"]
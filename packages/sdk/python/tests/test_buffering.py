@@ -0,0 +1,130 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, EventBuffer, OpenCodeClient
+
+
+def _part(part_id: str, text: str) -> dict:
+    return {"type": "message.part.updated", "properties": {"part": {"id": part_id, "text": text}}}
+
+
+def _fill(buffer: EventBuffer, events) -> list:
+    accepted = [buffer._offer(e) for e in events]
+    drained = []
+    while len(buffer):
+        drained.append(buffer._take())
+    return accepted, drained
+
+
+def test_drop_oldest() -> None:
+    buffer = EventBuffer(2, "drop_oldest")
+    accepted, drained = _fill(buffer, [{"type": str(i)} for i in range(5)])
+    assert all(accepted)
+    assert [e["type"] for e in drained] == ["3", "4"]
+    assert buffer.dropped == 3
+
+
+def test_drop_by_type_sheds_listed_types_first() -> None:
+    buffer = EventBuffer(3, "drop_by_type", shed_types=("file.watcher.updated", "lsp.updated"))
+    events = [
+        {"type": "lsp.updated"},
+        {"type": "session.idle", "n": 1},
+        {"type": "file.watcher.updated"},
+        {"type": "session.idle", "n": 2},  # sheds the watcher event
+        {"type": "session.idle", "n": 3},  # then the lsp event
+        {"type": "file.watcher.updated"},  # nothing left to shed: the incoming one goes
+        {"type": "session.idle", "n": 4},  # falls back to the oldest
+    ]
+    accepted, drained = _fill(buffer, events)
+    assert all(accepted)
+    assert [e.get("n") for e in drained] == [2, 3, 4]
+    assert buffer.dropped == 4
+
+
+def test_coalesce_keeps_newest_state_per_part() -> None:
+    buffer = EventBuffer(3, "coalesce")
+    events = [_part("a", "H"), {"type": "session.status"}, _part("b", "x"), _part("a", "He"), _part("a", "Hel")]
+    accepted, drained = _fill(buffer, events)
+    assert all(accepted)
+    assert drained == [{"type": "session.status"}, _part("b", "x"), _part("a", "Hel")]
+    assert buffer.coalesced == 2
+    # distinct events still block once full
+    buffer = EventBuffer(1, "coalesce")
+    assert buffer._offer(_part("a", "1"))
+    assert not buffer._offer(_part("b", "1"))
+
+
+def test_reused_buffer_starts_empty() -> None:
+    buffer = EventBuffer(2, "coalesce")
+    # left behind by a subscription the consumer abandoned
+    _fill(buffer, [_part("a", "1"), _part("a", "2")])
+    buffer._offer(_part("b", "1"))
+    buffer._offer({"type": "session.idle"})
+    assert list(buffer.relay([_part("b", "2")])) == [_part("b", "2")]
+    assert (buffer.dropped, buffer.coalesced, len(buffer)) == (0, 0, 0)
+
+
+def test_unknown_policy() -> None:
+    with pytest.raises(ValueError):
+        EventBuffer(overflow="lossy")
+
+
+def _sse(*events: str) -> bytes:
+    return b"".join(f"data: {e}\n\n".encode() for e in events)
+
+
+def test_sync_subscription_reads_ahead_on_a_thread() -> None:
+    payload = _sse(*(f'{{"type":"file.watcher.updated","n":{i}}}' for i in range(50)), '{"type":"session.idle"}')
+    reader_done = threading.Event()
+
+    def stream():
+        yield payload
+        reader_done.set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream())
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    buffer = EventBuffer(4, "drop_by_type")
+    events = w.subscribe_events(buffer=buffer)
+    next(events)
+    # the whole stream was read while the consumer held the first event
+    assert reader_done.wait(5)
+    rest = list(events)
+    assert rest[-1] == {"type": "session.idle"}
+    assert 1 + len(rest) + buffer.dropped == 51
+
+
+def test_sync_subscription_reraises_reader_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    with pytest.raises(httpx.HTTPStatusError):
+        list(w.subscribe_events(buffer=EventBuffer()))
+
+
+@pytest.mark.asyncio
+async def test_async_subscription_coalesces_behind_slow_consumer() -> None:
+    payload = _sse(
+        *(f'{{"type":"message.part.updated","properties":{{"part":{{"id":"p","n":{i}}}}}}}' for i in range(20))
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=payload)
+
+    w = AsyncOpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    buffer = EventBuffer(8, "coalesce")
+    seen = []
+    async for envelope in w.subscribe_typed_events(buffer=buffer):
+        seen.append(envelope.properties["part"]["n"])
+        await asyncio.sleep(0.01)
+    assert seen[-1] == 19
+    assert len(seen) + buffer.coalesced == 20
+    assert buffer.coalesced > 0
@@ -0,0 +1,160 @@
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.cache import ResponseCache
+
+_PATH = {"state": "s", "config": "c", "worktree": "w", "directory": "d"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(handler, cache) -> OpenCodeClient:
+    w = OpenCodeClient(base_url="http://test", cache=cache)
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    return w
+
+
+def test_cache_is_opt_in() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=["bash"])
+
+    w = _client(handler, None)
+    w.tool_ids()
+    w.tool_ids()
+    assert w.cache is None and len(requests) == 2
+
+
+def test_ttl_and_per_directory_memo() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={**_PATH, "directory": request.url.params.get("directory", "d")})
+
+    clock = FakeClock()
+    w = _client(handler, ResponseCache(ttl=10, clock=clock))
+    first = w.get_path()
+    assert w.get_path() is first
+    assert w.get_path(directory="/a").directory == "/a"
+    assert w.get_path(directory="/a").directory == "/a"
+    assert len(requests) == 2
+    assert (w.cache.hits, w.cache.misses) == (2, 2)
+
+    clock.now = 11
+    assert w.get_path() is not first
+    assert len(requests) == 3
+    assert "If-None-Match" not in requests[-1].headers
+
+
+def test_conditional_revalidation() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=["bash", "read"], headers={"ETag": '"v1"'})
+
+    clock = FakeClock()
+    w = _client(handler, ResponseCache(ttl=5, clock=clock))
+    first = w.tool_ids()
+    clock.now = 6
+    assert w.tool_ids() is first
+    assert requests[-1].headers["If-None-Match"] == '"v1"'
+    assert w.cache.revalidated == 1
+    # revalidation refreshed the TTL
+    clock.now = 10
+    w.tool_ids()
+    assert len(requests) == 2
+
+
+def test_errors_are_not_cached() -> None:
+    statuses = [500, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(status, json=_PATH if status == 200 else {})
+
+    w = _client(handler, True)
+    assert w.get_path() is None
+    assert w.get_path().directory == "d"
+
+
+def test_events_invalidate_entries() -> None:
+    events = [
+        b'data: {"type":"server.connected","properties":{}}\n\n',
+        b'data: {"type":"file.edited","properties":{"file":"/repo/src/main.py"}}\n\n',
+        b'data: {"type":"file.edited","properties":{"file":"/repo/opencode.json"}}\n\n',
+        b'data: {"type":"installation.updated","properties":{"version":"2"}}\n\n',
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/event":
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=b"".join(events))
+        if request.url.path == "/path":
+            return httpx.Response(200, json=_PATH)
+        return httpx.Response(200, json=["bash"])
+
+    w = _client(handler, True)
+    w.get_path()
+    w.tool_ids()
+    stream = w.subscribe_events()
+    next(stream)
+    next(stream)
+    assert len(w.cache) == 2
+    next(stream)
+    assert {key[0] for key in w.cache._entries} == {"path_get"}
+    next(stream)
+    assert len(w.cache) == 0
+
+
+@pytest.mark.parametrize("filters", [{"types": ["session.idle"]}, {"session_id": "ses_1"}])
+def test_filtered_subscriptions_still_invalidate(filters) -> None:
+    events = [
+        b'data: {"type":"server.connected","properties":{}}\n\n',
+        b'data: {"type":"file.edited","properties":{"file":"/repo/opencode.json"}}\n\n',
+        b'data: {"type":"session.idle","properties":{"sessionID":"ses_1"}}\n\n',
+    ]
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/event":
+            requested.append(request.url.params.get_list("type"))
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=b"".join(events))
+        return httpx.Response(200, json={})
+
+    w = _client(handler, True)
+    w.get_config()
+    assert len(w.cache) == 1
+    stream = w.subscribe_events(**filters)
+    assert [next(stream)["type"], next(stream)["type"]] == ["server.connected", "session.idle"]
+    assert len(w.cache) == 0
+    if "types" in filters:
+        # the server is asked for the invalidating events too
+        assert set(requested[0]) == {"session.idle"} | ResponseCache.EVENT_TYPES
+
+
+@pytest.mark.asyncio
+async def test_async_cache() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=_PATH)
+
+    w = AsyncOpenCodeClient(base_url="http://test", cache=True)
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    async with w:
+        first = await w.get_path()
+        assert await w.get_path() is first
+    assert len(requests) == 1
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient, PartCoalescer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _part(part_id: str, text: str, kind: str = "text") -> dict:
+    return {"type": "message.part.updated", "properties": {"part": {"id": part_id, "type": kind, "text": text}}}
+
+
+def test_burst_is_delivered_once_with_latest_state() -> None:
+    clock = _Clock()
+    c = PartCoalescer(0.05, clock=clock)
+    assert c.push(_part("a", "H")) == []
+    assert c.push({"type": "session.status"}) == [{"type": "session.status"}]
+    clock.now = 0.03
+    assert c.push(_part("a", "He")) == []
+    assert c.push(_part("b", "x")) == []
+    assert c.timeout() == pytest.approx(0.02)
+    assert c.due() == []
+    clock.now = 0.05
+    # the window runs from the first update of a burst
+    assert c.due() == [_part("a", "He")]
+    assert c.timeout() == pytest.approx(0.03)
+    assert c.coalesced == 1
+
+
+def test_step_finish_and_idle_flush_ahead_of_trigger() -> None:
+    c = PartCoalescer(10)
+    c.push(_part("a", "1"))
+    c.push(_part("a", "12"))
+    finish = _part("f", "", kind="step-finish")
+    assert c.push(finish) == [_part("a", "12"), finish]
+    c.push(_part("b", "1"))
+    idle = {"type": "session.idle", "properties": {"sessionID": "s"}}
+    assert c.push(idle) == [_part("b", "1"), idle]
+    c.push(_part("c", "1"))
+    removed = {"type": "message.part.removed", "properties": {"partID": "c"}}
+    assert c.push(removed) == [removed]
+    assert len(c) == 0
+
+
+def _sse(events) -> bytes:
+    import json
+
+    return b"".join(f"data: {json.dumps(e)}\n\n".encode() for e in events)
+
+
+def test_sync_subscription_releases_held_update_without_new_events() -> None:
+    release = threading.Event()
+
+    def stream():
+        yield _sse([_part("a", "H"), _part("a", "He"), _part("a", "Hel")])
+        release.wait(5)
+        yield _sse([{"type": "session.idle"}])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream())
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    coalesce = PartCoalescer(0.02)
+    events = w.subscribe_events(coalesce=coalesce)
+    # delivered when the window elapses, while the stream is quiet
+    assert next(events) == _part("a", "Hel")
+    release.set()
+    assert list(events) == [{"type": "session.idle"}]
+    assert coalesce.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_async_subscription_coalesces() -> None:
+    events = [_part("a", "x" * i) for i in range(1, 30)] + [_part("s", "", kind="step-finish")]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=_sse(events))
+
+    w = AsyncOpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    seen = [e.properties["part"]["id"] async for e in w.subscribe_typed_events(coalesce=PartCoalescer(60))]
+    assert seen == ["a", "s"]
+
+
+@pytest.mark.asyncio
+async def test_async_relay_loses_nothing_across_flush_ticks() -> None:
+    async def trickle():
+        for i in range(300):
+            yield _part(f"p{i}", "x")
+            if i % 3 == 0:
+                await asyncio.sleep(0)
+            if i % 50 == 0:
+                await asyncio.sleep(0.002)
+
+    # a window shorter than the gaps, so the relay keeps waking up between events
+    seen = [e["properties"]["part"]["id"] async for e in PartCoalescer(0.0005).arelay(trickle())]
+    assert sorted(seen) == sorted(f"p{i}" for i in range(300))
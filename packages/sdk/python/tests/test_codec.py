@@ -0,0 +1,58 @@
+import importlib.util
+
+import httpx
+import pytest
+
+from opencode_ai import OpenCodeClient, codec
+
+INSTALLED = [name for name in codec.BACKENDS if importlib.util.find_spec(name) is not None]
+
+
+@pytest.fixture
+def restore_backend():
+    previous = codec.BACKEND
+    yield
+    codec.set_backend(previous)
+
+
+def test_default_prefers_fast_backend() -> None:
+    assert codec.BACKEND == INSTALLED[0]
+
+
+@pytest.mark.parametrize("name", INSTALLED)
+def test_backend_round_trip(name: str, restore_backend: None) -> None:
+    assert codec.set_backend(name) == name
+    doc = {"text": "héllo ✓", "n": [1, 2.5, None, True], "nested": {"a": {}}}
+    encoded = codec.dumps(doc)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == codec.loads(encoded.decode()) == doc
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        codec.set_backend("yaml")
+
+
+def test_endpoints_and_events_decode_through_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen = []
+    loads = codec.loads
+
+    def recording_loads(data):
+        seen.append(type(data))
+        return loads(data)
+
+    monkeypatch.setattr(codec, "loads", recording_loads)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/event":
+            return httpx.Response(
+                200, headers={"Content-Type": "text/event-stream"}, content=b'data: {"type":"session.idle"}\n\n'
+            )
+        return httpx.Response(200, json=["bash", "read"])
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    assert w.tool_ids() == ["bash", "read"]
+    assert list(w.subscribe_events()) == [{"type": "session.idle"}]
+    # response bodies are handed over as bytes, SSE data as already-decoded text
+    assert seen == [bytes, str]
@@ -0,0 +1,95 @@
+import pytest
+
+from opencode_ai.models import EventMessagePartUpdated, EventServerConnected, EventSessionIdle
+from opencode_ai.models._discriminators import EVENT
+
+
+def _part_updated() -> dict:
+    return {
+        "type": "message.part.updated",
+        "properties": {
+            "part": {
+                "id": "prt_1",
+                "sessionID": "ses_1",
+                "messageID": "msg_1",
+                "type": "text",
+                "text": "hello",
+            }
+        },
+    }
+
+
+def test_event_registry_maps_type_to_model() -> None:
+    assert EVENT.key == "type"
+    assert EVENT["message.part.updated"] is EventMessagePartUpdated
+    assert EVENT["server.connected"] is EventServerConnected
+    assert "session.idle" in EVENT
+    assert len(EVENT) == 17
+
+
+def _record_calls(monkeypatch: pytest.MonkeyPatch, cls: type) -> list:
+    # the generated cascade swallows exceptions, so record attempts instead of raising
+    calls: list = []
+    original = cls.from_dict.__func__
+
+    def from_dict(klass, src_dict):
+        calls.append(src_dict)
+        return original(klass, src_dict)
+
+    monkeypatch.setattr(cls, "from_dict", classmethod(from_dict))
+    return calls
+
+
+def test_event_registry_decodes_with_single_constructor(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _record_calls(monkeypatch, EventSessionIdle)
+
+    evt = EVENT.decode(_part_updated())
+    assert isinstance(evt, EventMessagePartUpdated)
+    assert evt.properties.part.text == "hello"
+    assert calls == []
+
+
+def test_event_registry_unknown_type() -> None:
+    assert EVENT.match({"type": "nope"}) is None
+    assert EVENT.match({"type": ["not", "hashable"]}) is None
+    with pytest.raises(ValueError):
+        EVENT.decode({"type": "nope", "properties": {}})
+
+
+def test_part_and_tool_state_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
+    from opencode_ai.models import (
+        EventMessagePartUpdatedProperties,
+        TextPart,
+        ToolPart,
+        ToolStateCompleted,
+        ToolStatePending,
+    )
+
+    # TextPart is first in the Part cascade, ToolStatePending first in the ToolState one
+    text_calls = _record_calls(monkeypatch, TextPart)
+    pending_calls = _record_calls(monkeypatch, ToolStatePending)
+
+    props = EventMessagePartUpdatedProperties.from_dict(
+        {
+            "part": {
+                "id": "prt_1",
+                "sessionID": "ses_1",
+                "messageID": "msg_1",
+                "type": "tool",
+                "callID": "call_1",
+                "tool": "bash",
+                "state": {
+                    "status": "completed",
+                    "input": {"command": "ls"},
+                    "output": "ok",
+                    "title": "ls",
+                    "metadata": {},
+                    "time": {"start": 1, "end": 2},
+                },
+            }
+        }
+    )
+    assert isinstance(props.part, ToolPart)
+    assert isinstance(props.part.state, ToolStateCompleted)
+    assert props.part.state.output == "ok"
+    assert text_calls == [] and pending_calls == []
@@ -0,0 +1,88 @@
+"""Import-time regression checks based on `python -X importtime`."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# Budget for the SDK's own modules (self time, dependencies like httpx excluded). Eagerly importing
+# the models package alone used to cost several times this.
+OWN_IMPORT_BUDGET_US = 100_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, *args, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+
+def _importtime(code: str) -> dict[str, int]:
+    """Return {module: self time in microseconds} for every module imported by `code`."""
+    modules: dict[str, int] = {}
+    for line in _run(code, "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def test_import_loads_no_models_or_endpoints() -> None:
+    modules = _importtime("import opencode_ai")
+    eager = [
+        m
+        for m in modules
+        if m.startswith("opencode_ai.api.")
+        or (m.startswith("opencode_ai.models.") and m != "opencode_ai.models._discriminators")
+    ]
+    assert eager == []
+
+
+def test_import_loads_no_heavy_stdlib_modules() -> None:
+    code = """
+import sys
+import opencode_ai
+print(" ".join(m for m in ("asyncio", "subprocess", "concurrent.futures") if m in sys.modules))
+"""
+    assert _run(code).stdout.split() == []
+    # names are still importable from the package, and listed by dir()
+    code = "import opencode_ai; print(opencode_ai.OpenCodeClient.__name__, 'SessionStore' in dir(opencode_ai))"
+    assert _run(code).stdout.split() == ["OpenCodeClient", "True"]
+
+
+def test_import_time_budget() -> None:
+    modules = _importtime("import opencode_ai")
+    own = sum(us for name, us in modules.items() if name.split(".")[0] == "opencode_ai")
+    print(f"opencode_ai import self time: {own / 1000:.1f} ms")
+    assert own < OWN_IMPORT_BUDGET_US
+
+
+def test_wrapper_call_loads_only_its_endpoint() -> None:
+    code = """
+import sys
+import httpx
+from opencode_ai import OpenCodeClient
+
+def handler(request):
+    return httpx.Response(200, json={"state": "s", "config": "c", "worktree": "w", "directory": "d"})
+
+w = OpenCodeClient(base_url="http://test")
+w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+assert w.get_path().directory == "d"
+print(" ".join(sorted(m for m in sys.modules if m.startswith(("opencode_ai.api.default.", "opencode_ai.models.")))))
+"""
+    loaded = set(_run(code).stdout.split())
+    assert loaded == {
+        "opencode_ai.api.default.path_get",
+        "opencode_ai.models._discriminators",
+        "opencode_ai.models.path",
+    }
+
+
+def test_lazy_models_namespace() -> None:
+    import opencode_ai.models as models
+
+    assert models.Session.__name__ == "Session"
+    assert "ToolPart" in dir(models)
+    assert set(models.__all__) == set(models._MODULES)
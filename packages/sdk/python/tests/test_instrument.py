@@ -0,0 +1,242 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.api.default import session_get
+from opencode_ai.cache import ResponseCache
+from opencode_ai.client import Client
+from opencode_ai.instrument import (
+    Histogram,
+    HistogramRecorder,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusExporter,
+    combine,
+)
+
+_PATH = {"state": "s", "config": "c", "worktree": "w", "directory": "d"}
+_SESSION = {
+    "id": "ses_1",
+    "projectID": "p",
+    "directory": "/d",
+    "title": "t",
+    "version": "1",
+    "time": {"created": 1, "updated": 2},
+}
+
+
+class Samples(Instrumentation):
+    def __init__(self) -> None:
+        self.requests = []
+        self.events = []
+
+    def on_request(self, sample) -> None:
+        self.requests.append(sample)
+
+    def on_event(self, sample) -> None:
+        self.events.append(sample)
+
+
+def _client(handler, hooks, **kwargs) -> OpenCodeClient:
+    w = OpenCodeClient(base_url="http://test", instrumentation=hooks, **kwargs)
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    return w
+
+
+def test_histogram_percentiles_within_precision() -> None:
+    h = Histogram(significant_digits=2)
+    for ms in range(1, 1001):
+        h.record(ms / 1000)
+    assert h.count == 1000 and h.max == 1.0
+    for p, expected in ((50, 0.5), (90, 0.9), (99, 0.99), (100, 1.0)):
+        assert h.percentile(p) == pytest.approx(expected, rel=0.01)
+    assert h.count_at_most(0.1) == pytest.approx(100, abs=1)
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_endpoint_sample() -> None:
+    hooks = Samples()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_SESSION)
+
+    client = Client(base_url="http://test", instrumentation=hooks)
+    client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    assert session_get.sync("ses_1", client=client).id == "ses_1"
+    (sample,) = hooks.requests
+    assert (sample.endpoint, sample.method, sample.status, sample.error) == ("/session/{id}", "GET", 200, None)
+    assert sample.bytes == len(httpx.Response(200, json=_SESSION).content)
+    assert sample.total > 0 and sample.decode > 0 and sample.build >= 0
+    # MockTransport emits no trace events
+    assert sample.connect is None and sample.ttfb is None
+
+
+def test_errors_are_reported() -> None:
+    hooks = Samples()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    w = _client(handler, hooks)
+    with pytest.raises(httpx.ConnectError):
+        w.get_path()
+    (sample,) = hooks.requests
+    assert (sample.endpoint, sample.status, sample.error, sample.bytes) == ("/path", None, "ConnectError", 0)
+
+
+def test_cached_endpoints_are_instrumented() -> None:
+    hooks = Samples()
+    w = _client(lambda request: httpx.Response(200, json=_PATH), hooks, cache=ResponseCache())
+    w.get_path()
+    w.get_path()
+    assert [s.endpoint for s in hooks.requests] == ["/path"]
+
+
+def test_event_stream_samples() -> None:
+    hooks = Samples()
+    body = b"".join(
+        b"data: " + json.dumps(e).encode() + b"\n\n"
+        for e in ({"type": "server.connected", "properties": {}}, {"type": "session.idle", "properties": {}})
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=body)
+
+    w = _client(handler, hooks)
+    assert len(list(w.subscribe_events())) == 2
+    assert [e.type for e in hooks.events] == ["server.connected", "session.idle"]
+    (stream,) = hooks.requests
+    assert (stream.endpoint, stream.status) == ("/event", 200)
+    assert stream.bytes == sum(e.bytes for e in hooks.events)
+    assert stream.decode == pytest.approx(sum(e.decode for e in hooks.events))
+
+
+@pytest.mark.asyncio
+async def test_async_client() -> None:
+    recorder = HistogramRecorder()
+    w = AsyncOpenCodeClient(base_url="http://test", instrumentation=recorder)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[_SESSION]))
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=transport))
+    await w.list_sessions()
+    await w.list_sessions()
+    summary = recorder.summary()
+    assert summary["/session"]["total"]["count"] == 2
+    assert recorder.requests == {("/session", "GET", "200"): 2}
+
+
+def test_connect_and_ttfb_over_a_socket() -> None:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            payload = json.dumps(_PATH).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        hooks = Samples()
+        w = OpenCodeClient(base_url=f"http://127.0.0.1:{server.server_port}", instrumentation=hooks)
+        w.get_path()
+        w.get_path()
+    finally:
+        server.shutdown()
+        server.server_close()
+    first, second = hooks.requests
+    assert first.connect is not None and 0 < first.connect <= first.ttfb <= first.total
+    # the second request reuses the pooled connection
+    assert second.connect is None and second.ttfb is not None
+
+
+def test_prometheus_exposition() -> None:
+    exporter = PrometheusExporter(buckets=(0.5, 60))
+    w = _client(lambda request: httpx.Response(200, json=_PATH), exporter)
+    w.get_path()
+    text = exporter.render()
+    assert "# TYPE opencode_sdk_request_duration_seconds histogram" in text
+    assert 'opencode_sdk_request_duration_seconds_bucket{endpoint="/path",phase="total",le="60"} 1' in text
+    assert 'opencode_sdk_request_duration_seconds_count{endpoint="/path",phase="decode"} 1' in text
+    assert 'opencode_sdk_requests_total{endpoint="/path",method="GET",outcome="200"} 1' in text
+    assert (
+        f'opencode_sdk_response_bytes_total{{endpoint="/path"}} {len(httpx.Response(200, json=_PATH).content)}' in text
+    )
+
+
+def test_opentelemetry_spans() -> None:
+    class Span:
+        def __init__(self, name, kwargs) -> None:
+            self.name = name
+            self.kwargs = kwargs
+            self.end_time = None
+
+        def end(self, end_time=None) -> None:
+            self.end_time = end_time
+
+    class Tracer:
+        def __init__(self) -> None:
+            self.spans = []
+
+        def start_span(self, name, **kwargs):
+            self.spans.append(Span(name, kwargs))
+            return self.spans[-1]
+
+    tracer = Tracer()
+    hooks = Samples()
+    w = _client(lambda request: httpx.Response(200, json=_PATH), combine(OpenTelemetryInstrumentation(tracer), hooks))
+    w.get_path()
+    (span,) = tracer.spans
+    assert span.name == "GET /path"
+    attributes = span.kwargs["attributes"]
+    assert attributes["http.route"] == "/path" and attributes["http.response.status_code"] == 200
+    assert span.end_time > span.kwargs["start_time"]
+    assert len(hooks.requests) == 1
+
+
+def test_streamed_message_history_is_instrumented() -> None:
+    hooks = Samples()
+    history = [{"info": {"id": f"msg_{i}"}, "parts": []} for i in range(3)]
+    w = _client(lambda request: httpx.Response(200, json=history), hooks, parse_mode="dict")
+    assert [item["info"]["id"] for item in w.iter_messages("ses_1")] == ["msg_0", "msg_1", "msg_2"]
+    (sample,) = hooks.requests
+    assert (sample.endpoint, sample.method, sample.status, sample.error) == ("/session/{id}/message", "GET", 200, None)
+    # the elements' own bytes, without the array's brackets and commas
+    assert sample.bytes == sum(len(httpx.Response(200, json=item).content) for item in history)
+    assert sample.decode > 0 and hooks.events == []
+
+
+def test_failed_message_history_is_reported() -> None:
+    hooks = Samples()
+    w = _client(lambda request: httpx.Response(404), hooks)
+    with pytest.raises(httpx.HTTPStatusError):
+        list(w.iter_messages("ses_1"))
+    (sample,) = hooks.requests
+    assert (sample.endpoint, sample.error) == ("/session/{id}/message", "HTTPStatusError")
+
+
+@pytest.mark.asyncio
+async def test_async_streams_are_instrumented() -> None:
+    hooks = Samples()
+    stream = b'data: {"type":"server.connected","properties":{}}\n\n'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/event":
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream)
+        return httpx.Response(200, json=[{"info": {"id": "msg_1"}, "parts": []}])
+
+    w = AsyncOpenCodeClient(base_url="http://test", instrumentation=hooks, parse_mode="dict")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    assert [e["type"] async for e in w.subscribe_events()] == ["server.connected"]
+    assert [item["info"]["id"] async for item in w.iter_messages("ses_1")] == ["msg_1"]
+    assert [(s.endpoint, s.status) for s in hooks.requests] == [("/event", 200), ("/session/{id}/message", 200)]
+    assert [e.type for e in hooks.events] == ["server.connected"]
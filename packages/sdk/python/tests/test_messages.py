@@ -0,0 +1,134 @@
+import json
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.jsonstream import JSONArrayDecoder, iter_json_array
+from opencode_ai.models import AssistantMessage, TextPart, ToolPart, UserMessage
+
+
+def _user(i: int) -> dict:
+    return {
+        "info": {"id": f"msg_{i}", "sessionID": "ses_1", "role": "user", "time": {"created": i}},
+        "parts": [
+            {
+                "id": f"prt_{i}",
+                "sessionID": "ses_1",
+                "messageID": f"msg_{i}",
+                "type": "text",
+                "text": 'tricky "[{,}]" \\" text',
+            }
+        ],
+    }
+
+
+def _assistant(i: int) -> dict:
+    return {
+        "info": {
+            "id": f"msg_{i}",
+            "sessionID": "ses_1",
+            "role": "assistant",
+            "time": {"created": i},
+            "system": [],
+            "modelID": "model",
+            "providerID": "provider",
+            "mode": "build",
+            "path": {"cwd": "/w", "root": "/w"},
+            "cost": 0,
+            "tokens": {"input": 1, "output": 2, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+        },
+        "parts": [
+            {
+                "id": f"prt_{i}",
+                "sessionID": "ses_1",
+                "messageID": f"msg_{i}",
+                "type": "tool",
+                "callID": "call_1",
+                "tool": "bash",
+                "state": {"status": "pending"},
+            }
+        ],
+    }
+
+
+MESSAGES = [_user(0), _assistant(1), _user(2)]
+BODY = json.dumps(MESSAGES, indent=1).encode()
+
+
+def test_array_decoder_handles_any_chunking() -> None:
+    whole = list(iter_json_array([BODY]))
+    assert [json.loads(item) for item in whole] == MESSAGES
+    bytewise = list(iter_json_array(BODY[i : i + 1] for i in range(len(BODY))))
+    assert bytewise == whole
+
+
+def test_array_decoder_edge_cases() -> None:
+    assert list(iter_json_array([b" [ ] "])) == []
+    assert list(iter_json_array([b'[1, "a\\\\", [2]', b", {}]"])) == [b"1", b'"a\\\\"', b"[2]", b"{}"]
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'{"a": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+
+def test_array_decoder_drops_consumed_bytes() -> None:
+    decoder = JSONArrayDecoder()
+    decoder.feed(BODY[: len(BODY) - 10])
+    assert len(decoder._buf) < len(json.dumps(MESSAGES[-1], indent=1)) + 20
+
+
+def _client(handler) -> OpenCodeClient:
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    return w
+
+
+def test_iter_messages_streams_typed_messages() -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        chunks = (BODY[i : i + 7] for i in range(0, len(BODY), 7))
+        return httpx.Response(200, headers={"Content-Type": "application/json"}, content=chunks)
+
+    items = list(_client(handler).iter_messages("ses_1", limit=50))
+    assert requests[0].url.path == "/session/ses_1/message"
+    assert requests[0].url.params["limit"] == "50"
+    assert [type(item.info) for item in items] == [UserMessage, AssistantMessage, UserMessage]
+    assert isinstance(items[0].parts[0], TextPart)
+    assert items[0].parts[0].text == 'tricky "[{,}]" \\" text'
+    assert isinstance(items[1].parts[0], ToolPart)
+    assert [item.to_dict() for item in items] == MESSAGES
+
+
+def test_iter_messages_raises_for_status() -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        list(_client(lambda request: httpx.Response(404)).iter_messages("missing"))
+
+
+def test_get_message() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/session/ses_1/message/msg_1"
+        return httpx.Response(200, json=_assistant(1))
+
+    message = _client(handler).get_message("ses_1", "msg_1")
+    assert isinstance(message.info, AssistantMessage)
+    assert message.parts[0].tool == "bash"
+
+
+@pytest.mark.asyncio
+async def test_async_iter_messages() -> None:
+    async def content():
+        for i in range(0, len(BODY), 5):
+            yield BODY[i : i + 5]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=content())
+
+    client = AsyncOpenCodeClient(base_url="http://test")
+    client.client.set_async_httpx_client(
+        httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler))
+    )
+    async with client:
+        assert [item.info.id async for item in client.iter_messages("ses_1")] == ["msg_0", "msg_1", "msg_2"]
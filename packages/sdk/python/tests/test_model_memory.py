@@ -0,0 +1,135 @@
+"""Per-instance memory checks for the compact (slotted, lazily allocated extras) models."""
+
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+from opencode_ai.models import (
+    AssistantMessage,
+    ConfigProvidersResponse200Default,
+    Session,
+    TextPart,
+    ToolPart,
+    ToolStateErrorInput,
+)
+
+SESSION = {
+    "id": "ses_1",
+    "projectID": "prj_1",
+    "directory": "/tmp/project",
+    "title": "Session",
+    "version": "0.1.0",
+    "time": {"created": 1, "updated": 2},
+}
+TEXT_PART = {"id": "prt_1", "sessionID": "ses_1", "messageID": "msg_1", "type": "text", "text": "hello"}
+TOOL_PART = {
+    "id": "prt_2",
+    "sessionID": "ses_1",
+    "messageID": "msg_1",
+    "type": "tool",
+    "callID": "call_1",
+    "tool": "bash",
+    "state": {"status": "pending"},
+}
+ASSISTANT_MESSAGE = {
+    "id": "msg_1",
+    "sessionID": "ses_1",
+    "role": "assistant",
+    "time": {"created": 1},
+    "system": [],
+    "modelID": "model",
+    "providerID": "provider",
+    "mode": "build",
+    "path": {"cwd": "/tmp/project", "root": "/tmp/project"},
+    "cost": 0,
+    "tokens": {"input": 1, "output": 2, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+}
+MODELS: list[tuple[type, dict[str, Any]]] = [
+    (Session, SESSION),
+    (TextPart, TEXT_PART),
+    (ToolPart, TOOL_PART),
+    (AssistantMessage, ASSISTANT_MESSAGE),
+]
+
+
+def _bytes_per_instance(build: Callable[[], Any], count: int = 2000) -> float:
+    build()  # warm up lazy imports and caches
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        kept = [build() for _ in range(count)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del kept
+    return size / count
+
+
+@pytest.mark.parametrize(("cls", "data"), MODELS, ids=[cls.__name__ for cls, _ in MODELS])
+def test_models_are_slotted_without_extras(cls: type, data: dict[str, Any]) -> None:
+    model = cls.from_dict(data)
+    assert not hasattr(model, "__dict__")
+    assert model._additional_properties is None
+    assert model.additional_keys == []
+    assert "unknown" not in model
+    assert model.to_dict() == data
+
+
+def test_additional_properties_allocated_on_demand() -> None:
+    session = Session.from_dict({**SESSION, "extra": 1})
+    assert session._additional_properties == {"extra": 1}
+    assert session["extra"] == 1
+    assert session.to_dict()["extra"] == 1
+
+    plain = Session.from_dict(SESSION)
+    with pytest.raises(KeyError):
+        plain["extra"]
+    plain["extra"] = 2
+    assert plain.additional_properties == {"extra": 2}
+
+
+def test_models_without_properties_copy_the_mapping() -> None:
+    source = {"anthropic": "claude", "openai": "gpt"}
+    defaults = ConfigProvidersResponse200Default.from_dict(source)
+    assert defaults.additional_properties == source and defaults.additional_properties is not source
+    assert ToolStateErrorInput.from_dict({})._additional_properties is None
+    assert ToolStateErrorInput.from_dict({"path": "a"})["path"] == "a"
+
+
+def test_missing_and_empty_extras_compare_equal() -> None:
+    a = Session.from_dict(SESSION)
+    b = Session.from_dict(SESSION)
+    b.additional_properties.clear()
+    assert a._additional_properties is None and b._additional_properties == {}
+    assert a == b
+
+
+def test_per_instance_size() -> None:
+    rows = []
+    for cls, data in MODELS:
+        compact = _bytes_per_instance(lambda: cls.from_dict(data))
+
+        def with_extras() -> Any:
+            model = cls.from_dict(data)
+            model.additional_properties  # noqa: B018 - forces the allocation the old layout always made
+            return model
+
+        eager = _bytes_per_instance(with_extras)
+        rows.append((cls.__name__, compact, eager))
+        assert compact < eager
+
+    for name, compact, eager in rows:
+        print(f"{name:<18} {compact:>8.0f} B/instance  (with extras dict: {eager:.0f} B)")
+
+
+def test_from_dict_reads_source_without_copying() -> None:
+    from types import MappingProxyType
+
+    # from_dict only reads its input, so a read-only mapping works and values are not copied
+    src = MappingProxyType({**TOOL_PART, "extra": [1]})
+    part = ToolPart.from_dict(src)
+    assert dict(src) == {**TOOL_PART, "extra": [1]}
+    assert part.additional_properties == {"extra": [1]}
+    assert part.additional_properties["extra"] is src["extra"]
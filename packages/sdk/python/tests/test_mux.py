@@ -0,0 +1,118 @@
+import asyncio
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, EventMux
+
+
+def _client(handler) -> AsyncOpenCodeClient:
+    w = AsyncOpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+    return w
+
+
+def _stream(directory: str, count: int) -> bytes:
+    return b"".join(
+        f'data: {{"type":"session.idle","properties":{{"sessionID":"{directory}-{i}"}}}}\n\n'.encode()
+        for i in range(count)
+    )
+
+
+@pytest.mark.asyncio
+async def test_merged_events_are_tagged_and_share_one_client() -> None:
+    clients = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        directory = request.url.params["directory"]
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=_stream(directory, 3))
+
+    w = _client(handler)
+    clients.add(id(w.client.get_async_httpx_client()))
+    async with EventMux(w, ["a", "b", "c"], reconnect=False, maxsize=2) as mux:
+        seen = [(t.directory, t.event["properties"]["sessionID"]) async for t in mux]
+    clients.add(id(w.client.get_async_httpx_client()))
+    assert len(clients) == 1
+    assert sorted(seen) == sorted((d, f"{d}-{i}") for d in "abc" for i in range(3))
+    # per-directory order is preserved through the shared queue
+    assert [s for d, s in seen if d == "b"] == ["b-0", "b-1", "b-2"]
+
+
+@pytest.mark.asyncio
+async def test_per_directory_queues_and_remove() -> None:
+    release = asyncio.Event()
+
+    async def endless(directory: str):
+        yield _stream(directory, 1)
+        await release.wait()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        directory = request.url.params["directory"]
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=endless(directory))
+
+    async with EventMux(_client(handler), ["a"], merge=False, reconnect=False) as mux:
+        mux.add("b")
+        assert mux.directories == ["a", "b"]
+        b = mux.events("b")
+        first = await b.__anext__()
+        assert (first.directory, first.type) == ("b", "session.idle")
+        await mux.remove("b")
+        assert [t async for t in b] == []
+        a = mux.events("a")
+        assert (await a.__anext__()).directory == "a"
+    # closing ends iteration of the remaining directory
+    assert [t async for t in a] == []
+    with pytest.raises(TypeError):
+        mux.__aiter__()
+
+
+@pytest.mark.asyncio
+async def test_subscription_error_is_raised_after_other_events() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["directory"] == "bad":
+            return httpx.Response(404)
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=_stream("ok", 1))
+
+    seen = []
+    async with EventMux(_client(handler), ["ok", "bad"]) as mux:
+        with pytest.raises(httpx.HTTPStatusError):
+            async for tagged in mux:
+                seen.append(tagged.directory)
+    assert seen in ([], ["ok"])
+
+
+@pytest.mark.asyncio
+async def test_merged_error_cancels_the_other_subscriptions_and_allows_a_restart() -> None:
+    cancelled = asyncio.Event()
+    failures = ["bad"]
+
+    async def endless(directory: str):
+        yield _stream(directory, 1)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            cancelled.set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        directory = request.url.params["directory"]
+        if directory in failures:
+            failures.remove(directory)
+            return httpx.Response(404)
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=endless(directory))
+
+    mux = EventMux(_client(handler), ["ok", "bad"], reconnect=False)
+    await mux.start()
+    with pytest.raises(httpx.HTTPStatusError):
+        async for _ in mux:
+            pass
+    # fail-fast: the healthy subscription was stopped rather than left running
+    assert cancelled.is_set()
+
+    cancelled.clear()
+    async with mux:
+        seen = set()
+        async for tagged in mux:
+            seen.add(tagged.directory)
+            if seen == {"ok", "bad"}:
+                break
+    assert cancelled.is_set()
@@ -0,0 +1,176 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from opencode_ai import OpenCodeClient
+from opencode_ai.api.default import path_get
+from opencode_ai.client import Client
+from opencode_ai.pool import PoolStats, environment_proxies, pool_limits
+
+_PATH = {"state": "s", "config": "c", "worktree": "w", "directory": "d"}
+
+
+@pytest.fixture
+def server():
+    release = threading.Event()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            if self.path.startswith("/event"):
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                self.wfile.write(b'data: {"type":"server.connected","properties":{}}\n\n')
+                self.wfile.flush()
+                release.wait(5)
+                return
+            body = json.dumps(_PATH).encode()
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _subscribe(client: OpenCodeClient) -> threading.Event:
+    """Hold an event subscription open on a thread; set the returned event to let it go."""
+    connected = threading.Event()
+    done = threading.Event()
+
+    def run() -> None:
+        for _ in client.subscribe_events():
+            connected.set()
+            done.wait(5)
+            return
+
+    threading.Thread(target=run, daemon=True).start()
+    assert connected.wait(5)
+    return done
+
+
+def test_pool_limits_defaults() -> None:
+    limits = pool_limits()
+    assert (limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry) == (100, 20, 5.0)
+    assert pool_limits(4).max_keepalive_connections == 4
+    assert pool_limits(4, 2, 30).keepalive_expiry == 30
+
+
+class _Body(httpx.SyncByteStream):
+    def __iter__(self):
+        yield json.dumps(_PATH).encode()
+
+
+def test_stats_count_requests_until_the_body_is_closed() -> None:
+    stats = PoolStats(2)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=_Body()))
+    client = Client(base_url="http://test", httpx_args={"transport": transport}, pool_stats=stats)
+    with client.get_httpx_client().stream("GET", "/path") as response:
+        assert (stats.in_flight, stats.saturation) == (1, 0.5)
+        response.read()
+    path_get.sync(client=client)
+    assert stats.snapshot() == {
+        "max_connections": 2,
+        "in_flight": 0,
+        "peak": 1,
+        "requests": 2,
+        "saturated": 0,
+        "pool_timeouts": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_stats() -> None:
+    stats = PoolStats(1)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=_PATH))
+    client = Client(base_url="http://test", httpx_args={"transport": transport}, pool_stats=stats)
+    assert (await path_get.asyncio(client=client)).state == "s"
+    assert (stats.requests, stats.in_flight) == (1, 0)
+
+
+def test_stream_starves_a_shared_pool(server) -> None:
+    w = OpenCodeClient(base_url=server, max_connections=1, pool_timeout=0.2)
+    done = _subscribe(w)
+    try:
+        with pytest.raises(httpx.PoolTimeout):
+            w.get_path()
+        assert w.pool_stats.saturated == 1 and w.pool_stats.pool_timeouts == 1
+        assert w.pool_stats.saturation == 1.0
+    finally:
+        done.set()
+
+
+def test_dedicated_stream_pool(server) -> None:
+    w = OpenCodeClient(base_url=server, max_connections=1, pool_timeout=0.2, stream_connections=1)
+    done = _subscribe(w)
+    try:
+        assert w.get_path().state == "s"
+        assert w.stream_pool_stats.in_flight == 1
+        assert w.pool_stats.saturated == 0 and w.pool_stats.requests == 1
+    finally:
+        done.set()
+        w.close()
+
+
+def test_http2_needs_h2() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match=r"opencode-ai\[http2\]"):
+            OpenCodeClient(http2=True)
+    else:
+        w = OpenCodeClient(http2=True)
+        assert w.client.get_httpx_client() is not None
+
+
+@pytest.fixture
+def proxy_env(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+def test_environment_proxies_are_kept(server, proxy_env) -> None:
+    # the test server answers absolute-form requests too, so it stands in for the proxy
+    proxy_env.setenv("HTTP_PROXY", server)
+    client = OpenCodeClient(base_url="http://opencode.invalid")
+    httpx_client = client.client.get_httpx_client()
+    assert [t for t in httpx_client._mounts.values() if t is not None]
+    assert client.get_path().directory == "d"
+    # requests through the proxy count into the pool stats as well
+    assert client.pool_stats.requests == 1
+
+    proxy_env.setenv("NO_PROXY", "opencode.invalid")
+    with pytest.raises(httpx.ConnectError):
+        OpenCodeClient(base_url="http://opencode.invalid").get_path()
+    proxy_env.setenv("NO_PROXY", "")
+    untrusting = Client(base_url="http://opencode.invalid", httpx_args={"trust_env": False}, pool_stats=PoolStats())
+    assert untrusting.get_httpx_client()._mounts == {}
+
+
+def test_environment_proxy_patterns(proxy_env) -> None:
+    proxy_env.setenv("HTTPS_PROXY", "proxy.internal:3128")
+    proxy_env.setenv("NO_PROXY", ".example.com, example.org,::1,localhost,10.0.0.0/8,http://plain.test")
+    assert environment_proxies() == {
+        "https://": "http://proxy.internal:3128",
+        "all://*.example.com": None,
+        "all://*example.org": None,
+        "all://[::1]": None,
+        "all://localhost": None,
+        "all://10.0.0.0/8": None,
+        "http://plain.test": None,
+    }
+    proxy_env.setenv("NO_PROXY", "example.org,*")
+    assert environment_proxies() == {}
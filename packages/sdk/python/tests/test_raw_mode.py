@@ -0,0 +1,83 @@
+import json
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.api.default import config_get, session_get, session_list
+from opencode_ai.client import Client
+from opencode_ai.models.session import Session
+
+_SESSION = {
+    "id": "ses_1",
+    "projectID": "p",
+    "directory": "/d",
+    "title": "t",
+    "version": "1",
+    "time": {"created": 1, "updated": 2},
+}
+
+
+def _transport(body) -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=body, headers={"X-Upstream": "1"}))
+
+
+def _client(body, **kwargs) -> Client:
+    client = Client(base_url="http://test", **kwargs)
+    client.set_httpx_client(httpx.Client(base_url="http://test", transport=_transport(body)))
+    return client
+
+
+def test_raw_returns_the_httpx_response() -> None:
+    response = session_get.raw("ses_1", client=_client(_SESSION), directory="/d")
+    assert isinstance(response, httpx.Response)
+    assert response.request.url.path == "/session/ses_1"
+    assert response.request.url.params["directory"] == "/d"
+    assert response.headers["X-Upstream"] == "1"
+    assert json.loads(response.content) == _SESSION
+
+
+def test_raw_skips_parsing_of_invalid_bodies() -> None:
+    client = Client(base_url="http://test", raise_on_unexpected_status=True)
+    transport = httpx.MockTransport(lambda request: httpx.Response(418, content=b"not json"))
+    client.set_httpx_client(httpx.Client(base_url="http://test", transport=transport))
+    assert config_get.raw(client=client).status_code == 418
+
+
+@pytest.mark.asyncio
+async def test_araw() -> None:
+    client = Client(base_url="http://test")
+    client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=_transport([_SESSION])))
+    response = await session_list.araw(client=client)
+    assert response.json() == [_SESSION]
+
+
+@pytest.mark.parametrize(
+    "parse_mode, expected",
+    [("model", Session), ("dict", dict), ("bytes", bytes)],
+)
+def test_parse_mode(parse_mode, expected) -> None:
+    response = session_get.sync_detailed("ses_1", client=_client(_SESSION, parse_mode=parse_mode))
+    assert isinstance(response.parsed, expected)
+    if parse_mode == "bytes":
+        assert response.parsed is response.content
+
+
+def test_parse_mode_is_validated() -> None:
+    with pytest.raises(ValueError):
+        Client(base_url="http://test", parse_mode="json")
+
+
+def test_wrappers_honour_parse_mode() -> None:
+    w = OpenCodeClient(base_url="http://test", parse_mode="dict")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=_transport([_SESSION])))
+    assert w.list_sessions() == [_SESSION]
+    assert list(w.iter_messages("ses_1")) == [_SESSION]
+
+
+@pytest.mark.asyncio
+async def test_async_wrappers_honour_parse_mode() -> None:
+    w = AsyncOpenCodeClient(base_url="http://test", parse_mode="bytes")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=_transport([_SESSION])))
+    assert json.loads(await w.list_sessions()) == [_SESSION]
+    assert [json.loads(item) async for item in w.iter_messages("ses_1")] == [_SESSION]
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.recording import EventRecorder, iter_recording, main, replay_transport
+
+EVENTS = [
+    {"type": "server.connected", "properties": {}},
+    {"type": "message.part.updated", "properties": {"part": {"id": "p", "text": "héllo"}}},
+    {"type": "session.idle", "properties": {"sessionID": "s"}},
+]
+
+
+class _Clock:
+    def __init__(self, *times: float) -> None:
+        self._times = list(times)
+
+    def __call__(self) -> float:
+        return self._times.pop(0)
+
+
+@pytest.mark.parametrize("framing", ["ndjson", "length"])
+@pytest.mark.parametrize("name", ["events.rec", "events.rec.gz"])
+def test_round_trip_and_append(tmp_path, framing: str, name: str) -> None:
+    path = tmp_path / name
+    with EventRecorder(path, framing=framing, clock=_Clock(10.0, 10.0, 10.5, 11.25)) as rec:
+        assert rec.record(EVENTS) == 3
+    # appending continues from the last recorded time
+    with EventRecorder(path, framing=framing, clock=_Clock(50.0, 50.1)) as rec:
+        rec.write(EVENTS[2])
+    if name.endswith(".gz"):
+        assert path.read_bytes()[:2] == b"\x1f\x8b"
+    records = list(iter_recording(path))
+    assert [t for t, _ in records] == pytest.approx([0.0, 0.5, 1.25, 1.35])
+    assert [e for _, e in records] == EVENTS + [EVENTS[2]]
+
+
+def test_zstd_round_trip(tmp_path) -> None:
+    pytest.importorskip("zstandard")
+    path = tmp_path / "events.rec.zst"
+    for _ in range(2):
+        with EventRecorder(path, framing="length") as rec:
+            rec.record(EVENTS)
+    assert [e for _, e in iter_recording(path)] == EVENTS * 2
+
+
+def test_record_count_limit(tmp_path) -> None:
+    with EventRecorder(tmp_path / "events.ndjson") as rec:
+        assert rec.record(iter(EVENTS), count=2) == 2
+    assert len(list(iter_recording(tmp_path / "events.ndjson"))) == 2
+
+
+def test_replay_through_sync_client_at_accelerated_speed() -> None:
+    recording = [(0.0, EVENTS[0]), (0.2, EVENTS[1]), (0.4, EVENTS[2])]
+    w = OpenCodeClient(base_url="http://replay")
+    w.client.set_httpx_client(httpx.Client(base_url="http://replay", transport=replay_transport(recording, speed=4)))
+    started = time.monotonic()
+    assert list(w.subscribe_events()) == EVENTS
+    elapsed = time.monotonic() - started
+    assert 0.09 <= elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_replay_through_async_client(tmp_path) -> None:
+    with EventRecorder(tmp_path / "events.ndjson") as rec:
+        rec.record(EVENTS)
+    w = AsyncOpenCodeClient(base_url="http://replay")
+    transport = replay_transport(tmp_path / "events.ndjson", speed=None)
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://replay", transport=transport))
+    got = await asyncio.wait_for(_collect(w), 5)
+    assert got == EVENTS
+
+
+async def _collect(w: AsyncOpenCodeClient) -> list:
+    return [e async for e in w.subscribe_events()]
+
+
+def test_info_command(tmp_path, capsys) -> None:
+    path = tmp_path / "events.ndjson"
+    with EventRecorder(path) as rec:
+        rec.record(EVENTS + [EVENTS[2]])
+    assert main(["info", str(path)]) == 0
+    out = capsys.readouterr().out
+    assert out.splitlines()[0].startswith("4 events")
+    assert "       2  session.idle" in out
+
+
+def test_record_command_stops_after_duration_on_a_silent_stream(tmp_path, monkeypatch, capsys) -> None:
+    done = threading.Event()
+
+    def silent(self, **kwargs):
+        yield EVENTS[0]
+        done.wait(10)
+
+    monkeypatch.setattr(OpenCodeClient, "subscribe_events", silent)
+    path = tmp_path / "events.ndjson"
+    started = time.monotonic()
+    try:
+        assert main(["record", str(path), "--duration", "0.2"]) == 0
+    finally:
+        done.set()
+    assert time.monotonic() - started < 2
+    assert [e for _, e in iter_recording(path)] == EVENTS[:1]
+    assert "recorded 1 events" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ({"framing": "ndjson"}, {"framing": "length"}),
+        ({"framing": "length"}, {"framing": "ndjson"}),
+        ({"compression": "gzip"}, {"compression": None}),
+        ({"compression": None}, {"compression": "gzip"}),
+    ],
+)
+def test_append_with_another_format_is_rejected(tmp_path, first: dict, second: dict) -> None:
+    path = tmp_path / "events.rec"
+    with EventRecorder(path, **first) as rec:
+        rec.record(EVENTS)
+    with pytest.raises(ValueError, match="cannot append"):
+        EventRecorder(path, **second)
+    assert [e for _, e in iter_recording(path)] == EVENTS
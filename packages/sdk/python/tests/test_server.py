@@ -0,0 +1,165 @@
+import json
+import socketserver
+import sys
+import textwrap
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, LocalServer, OpenCodeClient
+from opencode_ai.api.default import path_get
+from opencode_ai.client import Client
+from opencode_ai.instrument import Instrumentation
+from opencode_ai.server import ServerError
+
+# stand-in for `opencode serve`: answers GET /path with the config it was given, over TCP or a socket
+STAND_IN = textwrap.dedent("""
+    import argparse, json, os, socketserver
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hostname")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--socket")
+    parser.add_argument("--fail", action="store_true")
+    args = parser.parse_args()
+    if args.fail:
+        print("boom", flush=True)
+        raise SystemExit(3)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = json.dumps(
+                {"state": os.environ["OPENCODE_CONFIG_CONTENT"], "config": "c", "worktree": "w", "directory": "d"}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def address_string(self):
+            return "local"
+
+    if args.socket:
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+        server = Server(args.socket, Handler)
+    else:
+        server = ThreadingHTTPServer((args.hostname, args.port), Handler)
+        print("starting", flush=True)
+        print(f"opencode server listening on http://{args.hostname}:{server.server_port}", flush=True)
+    server.serve_forever()
+    """)
+
+_PATH = {"state": "s", "config": "c", "worktree": "w", "directory": "d"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps({**_PATH, "directory": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        return "local"
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "opencode.sock")
+    server = _UnixServer(path, _Handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    script = tmp_path / "serve.py"
+    script.write_text(STAND_IN)
+    return [sys.executable, str(script)]
+
+
+def test_client_over_unix_socket(socket_path) -> None:
+    client = OpenCodeClient(uds=socket_path)
+    assert client.get_path(directory="/repo").directory == "/path?directory=%2Frepo"
+
+
+@pytest.mark.asyncio
+async def test_async_client_over_unix_socket(socket_path) -> None:
+    async with AsyncOpenCodeClient(uds=socket_path) as client:
+        assert (await client.get_path()).directory == "/path"
+
+
+def test_generated_client_uds_reports_socket_connect(socket_path) -> None:
+    samples = []
+
+    class Hooks(Instrumentation):
+        def on_request(self, sample) -> None:
+            samples.append(sample)
+
+    client = Client(base_url="http://localhost", uds=socket_path, instrumentation=Hooks())
+    assert path_get.sync(client=client).state == "s"
+    assert samples[0].connect is not None
+
+
+def test_attach_leaves_the_server_alone(socket_path) -> None:
+    server = LocalServer.attach(uds=socket_path)
+    with server.client() as client:
+        assert client.get_path().state == "s"
+    server.stop()
+    assert OpenCodeClient(uds=socket_path).get_path().state == "s"
+
+
+def test_attach_times_out(tmp_path) -> None:
+    with pytest.raises(ServerError, match="not reachable"):
+        LocalServer.attach(uds=str(tmp_path / "missing.sock"), timeout=0.2)
+
+
+def test_spawn_and_stop(stand_in) -> None:
+    server = LocalServer(command=stand_in, config={"model": "m"})
+    with OpenCodeClient.spawn(server) as client:
+        assert client.server is server and server.running
+        assert server.url.startswith("http://127.0.0.1:")
+        assert json.loads(client.get_path().state) == {"model": "m"}
+        process = server.process
+    assert process.poll() is not None and not server.running
+
+
+def test_spawn_over_a_socket(stand_in, tmp_path) -> None:
+    path = str(tmp_path / "child.sock")
+    with LocalServer(command=[*stand_in, f"--socket={path}"], uds=path) as server:
+        assert json.loads(server.client().get_path().state) == {}
+
+
+def test_spawn_reports_early_exit(stand_in) -> None:
+    with pytest.raises(ServerError, match="exited with code 3(.|\n)*boom"):
+        LocalServer(command=[*stand_in, "--fail"]).start()
+
+
+def test_spawn_reports_missing_command() -> None:
+    with pytest.raises(ServerError, match="Could not run"):
+        LocalServer(command=["/nonexistent/opencode", "serve"]).start()
+
+
+@pytest.mark.asyncio
+async def test_async_spawn(stand_in) -> None:
+    client = await AsyncOpenCodeClient.spawn(LocalServer(command=stand_in))
+    async with client:
+        assert (await client.get_path()).config == "c"
+    assert client.server.process is None
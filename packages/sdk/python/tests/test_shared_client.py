@@ -0,0 +1,188 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from opencode_ai.api.default import path_get
+from opencode_ai.client import AuthenticatedClient, Client
+from opencode_ai.pool import PoolStats
+
+_PATH = {"state": "s", "config": "c", "worktree": "w", "directory": "d"}
+
+
+class CountingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answers every request, recording the headers it was sent with and whether it was closed."""
+
+    def __init__(self) -> None:
+        self.seen = []
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.seen.append(dict(request.headers))
+        return httpx.Response(200, json=_PATH)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self._respond(request)
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def constructed(monkeypatch):
+    """Every httpx.Client built while the test runs."""
+    clients = []
+    original = httpx.Client.__init__
+
+    def init(self, *args, **kwargs) -> None:
+        original(self, *args, **kwargs)
+        clients.append(self)
+
+    monkeypatch.setattr(httpx.Client, "__init__", init)
+    return clients
+
+
+def test_lazy_creation_is_locked(constructed) -> None:
+    client = Client(base_url="http://test", httpx_args={"transport": CountingTransport()})
+    barrier = threading.Barrier(32)
+
+    def first_request(_) -> httpx.Client:
+        barrier.wait()
+        return client.get_httpx_client()
+
+    with ThreadPoolExecutor(32) as pool:
+        created = set(map(id, pool.map(first_request, range(32))))
+    assert len(created) == 1 and len(constructed) == 1
+
+
+def test_derived_clients_do_not_mutate_the_original() -> None:
+    transport = CountingTransport()
+    parent = Client(base_url="http://test", headers={"x-base": "1"}, httpx_args={"transport": transport})
+    parent.get_httpx_client()
+    child = parent.with_headers({"x-tenant": "a"}).with_timeout(httpx.Timeout(1.0))
+
+    path_get.sync(client=child)
+    path_get.sync(client=parent)
+    assert "x-tenant" not in parent.get_httpx_client().headers
+    assert parent.get_httpx_client().timeout != httpx.Timeout(1.0)
+    child_headers, parent_headers = transport.seen
+    assert (child_headers["x-base"], child_headers["x-tenant"]) == ("1", "a")
+    assert "x-tenant" not in parent_headers
+
+
+def test_derived_clients_share_the_owners_pool(constructed) -> None:
+    transport = CountingTransport()
+    stats = PoolStats()
+    parent = AuthenticatedClient(
+        base_url="http://test", token="root", httpx_args={"transport": transport}, pool_stats=stats
+    )
+    # derived from a derived client, before the owner has made a request
+    child = parent.with_cookies({"c": "1"}).with_headers({"x-tenant": "a"})
+    path_get.sync(client=child)
+    path_get.sync(client=parent)
+
+    assert [(seen["authorization"], seen.get("x-tenant")) for seen in transport.seen] == [
+        ("Bearer root", "a"),
+        ("Bearer root", None),
+    ]
+    assert transport.seen[0]["cookie"] == "c=1"
+    assert stats.requests == 2
+    # the owner's client and one for the derived client; the intermediate one never made a request
+    assert len(constructed) == 2
+
+    child.get_httpx_client().close()
+    assert not transport.closed
+    path_get.sync(client=parent)
+    parent.get_httpx_client().close()
+    assert transport.closed
+
+
+@pytest.mark.asyncio
+async def test_async_derived_clients_share_the_owners_pool() -> None:
+    transport = CountingTransport()
+    parent = Client(base_url="http://test", httpx_args={"transport": transport})
+    child = parent.with_headers({"x-tenant": "a"})
+    async with child:
+        await path_get.asyncio(client=child)
+    assert not transport.closed
+    await path_get.asyncio(client=parent)
+    assert [seen.get("x-tenant") for seen in transport.seen] == ["a", None]
+    await parent.get_async_httpx_client().aclose()
+    assert transport.closed
+
+
+def test_threads_hammering_derived_clients(constructed) -> None:
+    transport = CountingTransport()
+    stats = PoolStats()
+    parent = Client(base_url="http://test", httpx_args={"transport": transport}, pool_stats=stats)
+    tenants = [parent.with_headers({"x-tenant": str(n)}) for n in range(8)]
+    threads, calls = 32, 50
+
+    def work(worker: int) -> None:
+        for call in range(calls):
+            tenant = (worker + call) % (len(tenants) + 1)
+            client = parent if tenant == len(tenants) else tenants[tenant]
+            # a derived client of its own now and then, sharing the pool as well
+            if call % 10 == 0:
+                client = client.with_headers({"x-call": str(call)})
+            path_get.sync(client=client)
+
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(work, range(threads)))
+
+    assert len(transport.seen) == stats.requests == threads * calls
+    assert stats.in_flight == 0
+    by_tenant = {}
+    for seen in transport.seen:
+        by_tenant[seen.get("x-tenant")] = by_tenant.get(seen.get("x-tenant"), 0) + 1
+    assert sum(by_tenant.values()) == threads * calls and len(by_tenant) == len(tenants) + 1
+    assert "x-tenant" not in parent.get_httpx_client().headers
+    # one httpx client per client that made requests, never a duplicate for the same one
+    assert len(constructed) == 1 + len(tenants) + threads * calls // 10
+    assert not transport.closed
+
+
+def test_derived_clients_use_the_owners_proxies() -> None:
+    proxied = CountingTransport()
+    direct = CountingTransport()
+    mounts = {"http://proxied.test": proxied}
+    parent = Client(base_url="http://proxied.test", httpx_args={"transport": direct, "mounts": mounts})
+    child = parent.with_headers({"x-tenant": "a"})
+    path_get.sync(client=child)
+    path_get.sync(client=parent)
+    assert [seen.get("x-tenant") for seen in proxied.seen] == ["a", None] and direct.seen == []
+    child.get_httpx_client().close()
+    assert not proxied.closed
+
+
+def test_environment_proxies_are_shared(monkeypatch) -> None:
+    for name in ("HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    parent = Client(base_url="http://opencode.test")
+    child = parent.with_headers({"x-tenant": "a"})
+    parent_mounts = parent.get_httpx_client()._mounts
+    child_mounts = child.get_httpx_client()._mounts
+    assert list(child_mounts) == list(parent_mounts) and all(t is not None for t in parent_mounts.values())
+
+
+def test_clients_derived_from_a_set_client_build_their_own_pool() -> None:
+    given, built = CountingTransport(), CountingTransport()
+    parent = Client(base_url="http://test", httpx_args={"transport": built})
+    parent.set_httpx_client(httpx.Client(base_url="http://test", transport=given))
+    child = parent.with_headers({"x-tenant": "a"})
+    path_get.sync(client=child)
+    path_get.sync(client=parent)
+    # the child builds from the settings; the given httpx client is the parent's alone
+    assert [seen.get("x-tenant") for seen in built.seen] == ["a"]
+    assert [seen.get("x-tenant") for seen in given.seen] == [None]
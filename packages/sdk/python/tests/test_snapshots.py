@@ -0,0 +1,124 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+from opencode_ai import AsyncOpenCodeClient, OpenCodeClient
+from opencode_ai.errors import UnexpectedStatus
+from opencode_ai.models import FileDiff, Session, Todo
+
+
+def _session(id: str) -> dict:
+    return {
+        "id": id,
+        "projectID": "prj_1",
+        "directory": "/w",
+        "title": f"title {id}",
+        "version": "1",
+        "time": {"created": 1, "updated": 2},
+    }
+
+
+TODO = {"id": "t1", "content": "write tests", "status": "pending", "priority": "high"}
+DIFF = {"file": "a.py", "before": "", "after": "x", "additions": 1, "deletions": 0}
+
+
+def _route(request: httpx.Request) -> httpx.Response:
+    parts = request.url.path.strip("/").split("/")
+    id = parts[1]
+    if id == "ses_missing":
+        return httpx.Response(404, json={"name": "NotFoundError", "data": {"message": "missing"}})
+    if len(parts) == 2:
+        return httpx.Response(200, json=_session(id))
+    return httpx.Response(200, json={"children": [_session(f"{id}_child")], "todo": [TODO], "diff": [DIFF]}[parts[2]])
+
+
+def test_snapshot_sessions_fills_table_with_limited_concurrency() -> None:
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight.append(request)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(request)
+        return _route(request)
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    ids = [f"ses_{i}" for i in range(10)]
+    table = w.snapshot_sessions(ids, concurrency=4)
+
+    assert list(table) == ids
+    assert len(peak) == 40
+    assert 1 < max(peak) <= 4
+    row = table["ses_3"]
+    assert isinstance(row.session, Session) and row.session.title == "title ses_3"
+    assert [c.id for c in row.children] == ["ses_3_child"]
+    assert isinstance(row.todo[0], Todo) and row.todo[0].content == "write tests"
+    assert isinstance(row.diff[0], FileDiff) and row.diff[0].additions == 1
+    assert table.failed == []
+    assert table.rows()[0][0] == "ses_0" and len(table.rows()[0]) == 5
+
+
+@pytest.mark.parametrize("raise_on_unexpected_status", [False, True])
+def test_snapshot_sessions_records_failures_per_row(raise_on_unexpected_status: bool) -> None:
+    w = OpenCodeClient(base_url="http://test", retries=0)
+    w.client.raise_on_unexpected_status = raise_on_unexpected_status
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(_route)))
+    table = w.snapshot_sessions(["ses_1", "ses_missing"], include=["session", "todo"])
+
+    assert table.include == ("session", "todo")
+    assert table["ses_1"].ok and table["ses_1"].diff is None
+    missing = table["ses_missing"]
+    assert table.failed == [missing]
+    assert missing.session is None and set(missing.errors) == {"session", "todo"}
+    assert all(isinstance(e, UnexpectedStatus) and e.status_code == 404 for e in missing.errors.values())
+
+
+def test_snapshot_sessions_retries_server_errors() -> None:
+    failures = {"todo": 1, "diff": 5}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        part = request.url.path.rsplit("/", 1)[-1]
+        if failures.get(part):
+            failures[part] -= 1
+            return httpx.Response(500, json={"error": "busy"})
+        return _route(request)
+
+    w = OpenCodeClient(base_url="http://test", retries=2, backoff_factor=0)
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    row = w.snapshot_sessions(["ses_1"], include=["todo", "diff"])["ses_1"]
+
+    assert row.todo[0].content == "write tests"
+    assert row.diff is None and row.errors["diff"].status_code == 500
+
+
+def test_snapshot_sessions_rejects_unknown_parts() -> None:
+    with pytest.raises(ValueError):
+        OpenCodeClient(base_url="http://test").snapshot_sessions(["ses_1"], include=["messages"])
+
+
+@pytest.mark.asyncio
+async def test_async_snapshot_sessions() -> None:
+    w = AsyncOpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(_route)))
+    async with w:
+        table = await w.snapshot_sessions(["ses_1", "ses_2"], include=["session", "diff"], concurrency=2)
+    assert [row.session.id for row in table.values()] == ["ses_1", "ses_2"]
+    assert table["ses_2"].diff[0].file == "a.py"
+    assert table["ses_2"].children is None
+
+
+@pytest.mark.asyncio
+async def test_async_snapshot_sessions_records_failures() -> None:
+    w = AsyncOpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(_route)))
+    async with w:
+        table = await w.snapshot_sessions(["ses_1", "ses_missing"], include=["session"])
+    assert table.failed == [table["ses_missing"]]
+    assert table["ses_missing"].errors["session"].status_code == 404
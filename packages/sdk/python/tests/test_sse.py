@@ -0,0 +1,146 @@
+import json
+
+import httpx
+import pytest
+
+from opencode_ai import OpenCodeClient
+from opencode_ai.sse import SSEDecoder, iter_sse
+
+
+def _decode(*chunks: bytes):
+    return list(iter_sse(chunks))
+
+
+def test_fields_and_multiline_data() -> None:
+    events = _decode(b"event: update\nid: 7\nretry: 1500\ndata: line one\ndata: line two\n\n")
+    assert len(events) == 1
+    evt = events[0]
+    assert evt.event == "update"
+    assert evt.id == "7"
+    assert evt.retry == 1500
+    assert evt.data == "line one\nline two"
+
+
+def test_line_endings_split_across_chunks() -> None:
+    payload = b'data: {"a":1}\r\n\r\ndata: {"b":2}\r\rdata: {"c":3}\n\n'
+    whole = [e.data for e in _decode(payload)]
+    bytewise = [e.data for e in _decode(*(payload[i : i + 1] for i in range(len(payload))))]
+    assert whole == bytewise == ['{"a":1}', '{"b":2}', '{"c":3}']
+
+
+def test_comments_bom_and_field_edge_cases() -> None:
+    decoder = SSEDecoder()
+    events = decoder.feed(b"\xef\xbb")
+    events += decoder.feed(b"\xbf: heartbeat\ndata\nretry: soon\nid: x\x00y\n\ndata:no-space\n\n")
+    assert [e.data for e in events] == ["", "no-space"]
+    assert decoder.retry is None
+    assert decoder.last_event_id == ""
+    # an event without data is not dispatched
+    assert decoder.feed(b"event: ping\n\n") == []
+
+
+def test_last_event_id_persists() -> None:
+    events = _decode(b"id: 1\ndata: a\n\ndata: b\n\n")
+    assert [e.id for e in events] == ["1", "1"]
+
+
+def test_large_event_in_many_chunks() -> None:
+    body = json.dumps({"type": "message.part.updated", "properties": {"output": "x" * 200_000}})
+    payload = f"data: {body}\n\n".encode()
+    events = _decode(*(payload[i : i + 1024] for i in range(0, len(payload), 1024)))
+    assert len(events) == 1
+    assert json.loads(events[0].data)["properties"]["output"] == "x" * 200_000
+
+
+def test_subscribe_events_keeps_named_and_multiline_events() -> None:
+    payload = b'event: message\nid: 3\ndata: {"type":\ndata: "session.idle"}\n\n'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=payload)
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    assert list(w.subscribe_events()) == [{"type": "session.idle"}]
+
+
+def test_reconnect_emits_gap_and_honors_retry() -> None:
+    calls = []
+
+    def first_stream():
+        yield b'retry: 0\ndata: {"type":"server.connected","properties":{}}\n\n'
+        yield b'data: {"type":"session.idle","properties":{"sessionID":"s"}}\n\ndata: {"type":'
+        raise httpx.ReadError("connection reset")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=first_stream())
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=b'data: {"type":"server.connected","properties":{}}\n\n'
+            b'data: {"type":"session.deleted","properties":{}}\n\n',
+        )
+
+    w = OpenCodeClient(base_url="http://test", backoff_factor=10)
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+
+    events = []
+    for event in w.subscribe_events(reconnect=True):
+        events.append(event)
+        if len(events) == 5:
+            break
+
+    assert [e["type"] for e in events] == [
+        "server.connected",
+        "session.idle",
+        "client.gap",
+        "server.connected",
+        "session.deleted",
+    ]
+    assert "ReadError" in events[2]["properties"]["reason"]
+    assert len(calls) == 3
+
+
+def test_reconnect_does_not_retry_client_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    w = OpenCodeClient(base_url="http://test", backoff_factor=0)
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    with pytest.raises(httpx.HTTPStatusError):
+        next(w.subscribe_events(reconnect=True))
+
+
+def test_filtered_subscription_sends_params_and_filters_locally(monkeypatch: pytest.MonkeyPatch) -> None:
+    from opencode_ai import codec
+
+    events = [
+        {"type": "server.connected", "properties": {}},
+        {"type": "file.watcher.updated", "properties": {"file": "a.py", "event": "change"}},
+        {"type": "session.idle", "properties": {"sessionID": "ses_other"}},
+        {"type": "message.part.updated", "properties": {"part": {"id": "p", "sessionID": "ses_1", "type": "text"}}},
+        {"type": "session.idle", "properties": {"sessionID": "ses_1"}},
+        {"type": "session.updated", "properties": {"info": {"id": "ses_1", "title": "session.idle"}}},
+    ]
+    payload = b"".join(f"data: {json.dumps(e)}\n\n".encode() for e in events)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=payload)
+
+    decoded = []
+    loads = codec.loads
+    monkeypatch.setattr(codec, "loads", lambda data: decoded.append(data) or loads(data))
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    got = list(w.subscribe_events(types=["session.idle", "session.updated"], session_id="ses_1"))
+    assert requests[0].url.params.get_list("type") == ["session.idle", "session.updated"]
+    assert requests[0].url.params["sessionID"] == "ses_1"
+    assert [e["type"] for e in got] == ["server.connected", "session.idle", "session.updated"]
+    # events that cannot match are skipped before decoding
+    assert len(decoded) == 3
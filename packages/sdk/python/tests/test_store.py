@@ -0,0 +1,176 @@
+import json
+
+import httpx
+import pytest
+
+from opencode_ai import OpenCodeClient, SessionStore
+from opencode_ai.models import AssistantMessage, ToolPart
+
+
+def _session(id: str, title: str = "t") -> dict:
+    return {
+        "id": id,
+        "projectID": "prj_1",
+        "directory": "/w",
+        "title": title,
+        "version": "1",
+        "time": {"created": 1, "updated": 2},
+    }
+
+
+def _assistant(id: str, session_id: str = "ses_1") -> dict:
+    return {
+        "id": id,
+        "sessionID": session_id,
+        "role": "assistant",
+        "time": {"created": 1},
+        "system": [],
+        "modelID": "m",
+        "providerID": "p",
+        "mode": "build",
+        "path": {"cwd": "/w", "root": "/w"},
+        "cost": 0,
+        "tokens": {"input": 0, "output": 0, "reasoning": 0, "cache": {"read": 0, "write": 0}},
+    }
+
+
+def _user(id: str, session_id: str = "ses_1") -> dict:
+    return {"id": id, "sessionID": session_id, "role": "user", "time": {"created": 1}}
+
+
+def _tool(id: str, message_id: str, status: str, session_id: str = "ses_1") -> dict:
+    state = {"status": status}
+    if status == "running":
+        state.update({"input": {}, "time": {"start": 1}})
+    elif status == "completed":
+        state.update({"input": {}, "output": "ok", "title": "ls", "metadata": {}, "time": {"start": 1, "end": 2}})
+    return {
+        "id": id,
+        "sessionID": session_id,
+        "messageID": message_id,
+        "type": "tool",
+        "callID": f"call_{id}",
+        "tool": "bash",
+        "state": state,
+    }
+
+
+def _event(type: str, **properties) -> dict:
+    return {"type": type, "properties": properties}
+
+
+def test_apply_maintains_indexes() -> None:
+    store = SessionStore()
+    assert store.apply(_event("session.updated", info=_session("ses_1")))
+    store.apply(_event("message.updated", info=_user("msg_1")))
+    store.apply(_event("message.updated", info=_assistant("msg_2")))
+    store.apply(_event("message.updated", info=_assistant("msg_3")))
+    store.apply(_event("message.part.updated", part=_tool("prt_1", "msg_3", "running")))
+    store.apply(_event("message.part.updated", part=_tool("prt_2", "msg_2", "running")))
+
+    assert store.session("ses_1").title == "t"
+    assert [m.id for m in store.messages("ses_1")] == ["msg_1", "msg_2", "msg_3"]
+    latest = store.latest_assistant_message("ses_1")
+    assert isinstance(latest, AssistantMessage) and latest.id == "msg_3"
+    assert {p.id for p in store.running_tool_parts()} == {"prt_1", "prt_2"}
+    assert all(isinstance(p, ToolPart) for p in store.parts("msg_3"))
+
+    store.apply(_event("message.part.updated", part=_tool("prt_1", "msg_3", "completed")))
+    assert [p.id for p in store.running_tool_parts("ses_1")] == ["prt_2"]
+    assert store.parts("msg_3")[0].state.status == "completed"
+
+    store.apply(_event("message.removed", sessionID="ses_1", messageID="msg_2"))
+    assert store.running_tool_parts() == []
+    store.apply(_event("message.removed", sessionID="ses_1", messageID="msg_3"))
+    assert store.latest_assistant_message("ses_1") is None
+
+    store.apply(_event("message.updated", info=_assistant("msg_4")))
+    store.apply(_event("message.part.updated", part=_tool("prt_3", "msg_4", "running")))
+    store.apply(_event("message.part.removed", sessionID="ses_1", messageID="msg_4", partID="prt_3"))
+    assert store.parts("msg_4") == [] and store.running_tool_parts() == []
+
+    store.apply(_event("message.part.updated", part=_tool("prt_4", "msg_4", "running")))
+    store.apply(_event("session.deleted", info=_session("ses_1")))
+    assert "ses_1" not in store and len(store) == 0
+    assert store.messages("ses_1") == [] and store.running_tool_parts() == []
+    assert not store.apply(_event("session.idle", sessionID="ses_1"))
+
+
+def test_follow_seeds_on_connect_and_applies_events() -> None:
+    history = [{"info": _assistant("msg_1"), "parts": [_tool("prt_1", "msg_1", "running")]}]
+    stream = b"".join(
+        f"data: {json.dumps(e)}\n\n".encode()
+        for e in [
+            _event("server.connected"),
+            _event("message.part.updated", part=_tool("prt_1", "msg_1", "completed")),
+            _event("session.updated", info=_session("ses_1", "renamed")),
+        ]
+    )
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path == "/event":
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream)
+        if request.url.path == "/session":
+            return httpx.Response(200, json=[_session("ses_1")])
+        return httpx.Response(200, json=history)
+
+    client = OpenCodeClient(base_url="http://test")
+    client.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    store = SessionStore()
+    events = store.follow(client)
+
+    assert next(events)["type"] == "server.connected"
+    assert calls == ["/event", "/session", "/session/ses_1/message"]
+    assert [p.id for p in store.running_tool_parts()] == ["prt_1"]
+    assert store.latest_assistant_message("ses_1").id == "msg_1"
+
+    next(events)
+    assert store.running_tool_parts() == []
+    next(events)
+    assert store.session("ses_1").title == "renamed"
+    events.close()
+
+
+def test_follow_skips_unknown_part_and_message_types() -> None:
+    stream = b"".join(
+        f"data: {json.dumps(e)}\n\n".encode()
+        for e in [
+            _event("server.connected"),
+            _event("message.part.updated", part={**_tool("prt_1", "msg_1", "running"), "type": "hologram"}),
+            _event("message.updated", info={**_user("msg_2"), "role": "narrator"}),
+            _event("session.updated", info={"id": "ses_2"}),
+            _event("message.part.updated", part=_tool("prt_2", "msg_1", "running")),
+        ]
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/event":
+            return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=stream)
+        return httpx.Response(200, json=[])
+
+    client = OpenCodeClient(base_url="http://test")
+    client.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    store = SessionStore()
+    events = store.follow(client, messages=False)
+    seen = [next(events)["type"] for _ in range(5)]
+    events.close()
+    # the stream keeps going past the events the store cannot decode
+    assert seen[1:] == ["message.part.updated", "message.updated", "session.updated", "message.part.updated"]
+    assert [p.id for p in store.running_tool_parts()] == ["prt_2"]
+    assert store.messages("ses_1") == []
+    assert store.sessions() == []
+
+
+def test_failed_seed_keeps_the_contents() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, json={"error": "down"})
+
+    client = OpenCodeClient(base_url="http://test")
+    client.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+    store = SessionStore()
+    store.apply(_event("session.updated", info=_session("ses_1")))
+    with pytest.raises(RuntimeError, match="not seeded"):
+        store.seed(client)
+    assert [s.id for s in store.sessions()] == ["ses_1"]
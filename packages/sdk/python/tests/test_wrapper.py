@@ -4,9 +4,10 @@ from typing import Iterator
 import httpx
 import pytest
 
-from opencode_ai import OpenCodeClient
+from opencode_ai import EventEnvelope, OpenCodeClient
 from opencode_ai.api.default import config_get
 from opencode_ai.client import Client
+from opencode_ai.models import EventSessionIdle
 
 
 class _State:
@@ -114,3 +115,47 @@ def test_sse_streaming_parses_events() -> None:
     first = next(it)
     assert isinstance(first, dict)
     assert first.get("type") == "server.connected"
+
+
+def test_typed_event_stream_builds_models_lazily() -> None:
+    payload = (
+        b'data: {"type":"server.connected","properties":{}}\n\n'
+        b'data: {"type":"session.idle","properties":{"sessionID":"ses_1"}}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=payload)
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_httpx_client(httpx.Client(base_url="http://test", transport=httpx.MockTransport(handler)))
+
+    events = list(w.subscribe_typed_events())
+    assert [e.type for e in events] == ["server.connected", "session.idle"]
+    idle = events[1]
+    assert idle.properties == {"sessionID": "ses_1"}
+    assert idle._model is None
+
+    model = idle.model
+    assert isinstance(model, EventSessionIdle)
+    assert model.properties.session_id == "ses_1"
+    assert idle.model is model
+
+
+def test_typed_event_unknown_type_has_no_model() -> None:
+    assert EventEnvelope({"type": "from.the.future", "properties": {"x": 1}}).model is None
+
+
+@pytest.mark.asyncio
+async def test_typed_event_stream_async() -> None:
+    payload = b'data: {"type":"session.idle","properties":{"sessionID":"ses_1"}}\n\n'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=payload)
+
+    w = OpenCodeClient(base_url="http://test")
+    w.client.set_async_httpx_client(httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(handler)))
+
+    async for event in w.subscribe_typed_events_async():
+        assert event.type == "session.idle"
+        assert isinstance(event.model, EventSessionIdle)
+        break